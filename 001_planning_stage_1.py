@@ -7,6 +7,7 @@ This script runs the initial planning phase with proper task separation and outp
 
 from improved_twitter_config import technical_lead, business_analyst
 from crewai import Task, Crew, Process
+from src.model_router import model_router
 
 def run_planning_stage_1():
     """Execute the first planning stage with proper task separation"""
@@ -118,6 +119,10 @@ def run_planning_stage_1():
     print("📊 STEP 3: Sprint Retrospective")
     print("=" * 60)
     
+    # Retrospectives summarise finished work, so they run on the cheap tier
+    retro_tier = model_router.tier_for(task_type='retrospective')
+    retro_lead = model_router.route_agent(technical_lead, tier=retro_tier)
+    
     sprint_retro_task = Task(
         description=f'''
         Conduct a sprint retrospective analysis of the planning phase that was just completed.
@@ -164,18 +169,18 @@ def run_planning_stage_1():
         Be honest and constructive in the analysis. Focus on continuous improvement and team learning.
         Reference specific aspects of the requirements and technical planning deliverables.
         ''',
-        agent=technical_lead,
+        agent=retro_lead,
         expected_output='Comprehensive sprint retrospective report with what went well, what didn\'t go well, improvement recommendations, and concrete action items for the planning phase'
     )
     
     retro_crew = Crew(
-        agents=[technical_lead],
+        agents=[retro_lead],
         tasks=[sprint_retro_task],
         process=Process.sequential,
         verbose=True
     )
     
-    retro_result = retro_crew.kickoff()
+    retro_result = model_router.kickoff(retro_crew, retro_tier, 'sprint retrospective')
     
     # Combine and save all results
     print("\n" + "=" * 80)
@@ -220,6 +225,8 @@ def run_planning_stage_1():
     print("    - iOS (Swift/SwiftUI)")
     print("    - Android (Kotlin/Jetpack Compose)")
     print("    - Web Frontend (React.js)")
+    print("")
+    print(model_router.report())
     
     return {
         'requirements': requirements_result,
@@ -6,10 +6,11 @@ This script generates actual Kotlin Spring Boot implementation code based on the
 comprehensive planning from previous phases. Creates real project files and structure.
 """
 
-from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer, api_testing_engineer
+from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer, api_testing_engineer, knowledge_digests
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
 import os
+from src.dependency_graph import validate_layout
 
 def run_backend_implementation():
     """Execute backend implementation code generation"""
@@ -22,9 +23,15 @@ def run_backend_implementation():
     print("Generating actual production-ready code!")
     print("")
 
+    # Compact digest of the earlier planning phases (cached by content hash)
+    planning_digest = knowledge_digests.summarize_many([
+        'TwitterClone_Architecture_Phase2.md',
+        'TwitterClone_BackendDevelopment_Phase3.md',
+    ], level='decisions', max_chars_per_doc=2500)
+
     # Core Project Structure Task
     project_structure_task = Task(
-        description='''
+        description=f'''
         Generate the complete Kotlin Spring Boot project structure for the Twitter clone backend.
         
         IMPLEMENTATION REQUIREMENTS:
@@ -35,6 +42,9 @@ def run_backend_implementation():
         - Database integration (PostgreSQL + Redis)
         - Security configuration with JWT
         
+        KEY DECISIONS FROM PLANNING PHASES (digest):
+        {planning_digest}
+        
         Generate the following project structure and configuration files:
         1. **Root Project Configuration:**
            - build.gradle.kts (root)
@@ -415,6 +425,12 @@ def run_backend_implementation():
     create_api_files(backend_dir)
     print("✅ Created controllers, services, and configurations")
     
+    # Catch module cycles and layering violations now rather than at the first Gradle build
+    layout_ok, dependency_graph = validate_layout(backend_dir)
+    print(dependency_graph.format_report())
+    if not layout_ok:
+        print("❌ Generated module layout has dependency errors - fix before running Gradle")
+    
     print("\n" + "=" * 60)
     print("🧪 STEP 4: Testing Implementation")
     print("=" * 60)
@@ -510,6 +526,7 @@ def run_backend_implementation():
     print("  • TwitterClone_TestingImplementation_Phase4.md (Comprehensive testing)")
     print("  • TwitterClone_DeploymentConfiguration_Phase4.md (Docker & Kubernetes)")
     print("  • TwitterClone_CodeReview_Phase4.md (Quality review & roadmap)")
+    print(f"  • {knowledge_digests.report()}")
     print("")
     print("🎯 Next Steps:")
     print("  • Review all generated code and configurations")
@@ -9,6 +9,7 @@ class and configuration to run alongside the user-service.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
 
 def create_post_service_application():
     """Use CrewAI agents to create post-service Spring Boot application"""
@@ -76,10 +77,16 @@ def create_post_service_application():
         The configuration must include:
         - Spring application name: post-service
         - PostgreSQL database connection (same database as user-service)
-        - JPA/Hibernate configuration with ddl-auto: create-drop
+        - Flyway migrations from classpath:db/migration with their own history
+          table (flyway_schema_history_post), since the database is shared
+        - JPA/Hibernate configuration with ddl-auto: validate (never create-drop)
         - Redis configuration
         - Server port: 8082 (different from user-service)
-        - SQL logging enabled for debugging
+        - SQL statement logging (DEBUG) for local development only; never TRACE
+          bind-parameter logging
+        - A separate application-prod.yml profile: SQL logging off, explicit
+          HikariCP pool size and timeouts, hibernate.jdbc.batch_size with
+          order_inserts/order_updates, and spring.jpa.open-in-view: false
         - Proper PostgreSQL dialect
         
         CRITICAL: Provide complete YAML configuration.
@@ -87,7 +94,8 @@ def create_post_service_application():
         Key settings needed:
         - spring.datasource.url: jdbc:postgresql://localhost:5432/twitterclone
         - server.port: 8082
-        - jpa.hibernate.ddl-auto: create-drop
+        - spring.flyway.table: flyway_schema_history_post
+        - jpa.hibernate.ddl-auto: validate
         - jpa.show-sql: true
         
         OUTPUT: Complete application.yml file content.
@@ -144,6 +152,7 @@ def create_post_service_application():
         print("\n🎯 CrewAI agents have created:")
         print("  • PostServiceApplication.kt - Main Spring Boot class")
         print("  • application.yml - Database and server configuration")
+        print("  • application-prod.yml - Production profile (SPRING_PROFILES_ACTIVE=prod)")
         print("  • Startup verification guide")
         
         print("\n🚀 Next Steps:")
@@ -165,6 +174,7 @@ def create_post_service_application():
             "message": f"Post service creation failed: {str(e)}"
         }
 
+@profiled
 def apply_post_service_files(crew_result):
     """Create the actual post-service application files"""
     
@@ -203,9 +213,19 @@ fun main(args: Array<String>) {
     password: password
     driver-class-name: org.postgresql.Driver
   
+  # Schema is owned by the versioned migrations in src/main/resources/db/migration;
+  # Hibernate only checks that the entities match it
+  flyway:
+    enabled: true
+    locations: classpath:db/migration
+    # Both services share the twitterclone database, so each keeps its own history
+    table: flyway_schema_history_post
+    baseline-on-migrate: true
+    baseline-version: 0
+  
   jpa:
     hibernate:
-      ddl-auto: create-drop
+      ddl-auto: validate
     show-sql: true
     properties:
       hibernate:
@@ -222,14 +242,59 @@ server:
 
 logging:
   level:
+    # Development logging; the prod profile (application-prod.yml) turns SQL logging off.
+    # Bind-parameter TRACE logging is never committed (scripts/validate_spring_config.py).
     org.hibernate.SQL: DEBUG
-    org.hibernate.type.descriptor.sql.BasicBinder: TRACE
+'''
+    
+    # Create application-prod.yml: quiet logging, sized pool, batched writes
+    post_prod_config_content = '''# Production profile (SPRING_PROFILES_ACTIVE=prod), layered over application.yml.
+# No per-statement SQL logging in the request path, a fixed-size connection
+# pool with short timeouts, and batched, ordered JDBC writes.
+spring:
+  datasource:
+    hikari:
+      pool-name: post-service
+      # Fixed-size pool: minimum-idle = maximum-pool-size avoids connection churn under load
+      maximum-pool-size: ${DB_POOL_SIZE:10}
+      minimum-idle: ${DB_POOL_SIZE:10}
+      connection-timeout: 3000
+      validation-timeout: 1000
+      idle-timeout: 600000
+      max-lifetime: 1800000
+      data-source-properties:
+        # Lets the Postgres driver send a JDBC batch as multi-row INSERTs
+        reWriteBatchedInserts: true
+  
+  jpa:
+    open-in-view: false
+    show-sql: false
+    properties:
+      hibernate:
+        format_sql: false
+        generate_statistics: false
+        jdbc:
+          batch_size: 50
+          batch_versioned_data: true
+        order_inserts: true
+        order_updates: true
+        query:
+          # Pads IN lists to powers of two so batched lookups reuse cached plans
+          in_clause_parameter_padding: true
+
+logging:
+  level:
+    root: INFO
+    org.hibernate.SQL: WARN
+    org.hibernate.orm.jdbc.bind: WARN
+    org.hibernate.type.descriptor.sql.BasicBinder: WARN
 '''
     
     # Write the files
     files_to_create = [
         ("post-service/src/main/kotlin/com/twitterclone/post/PostServiceApplication.kt", post_app_content),
-        ("post-service/src/main/resources/application.yml", post_config_content)
+        ("post-service/src/main/resources/application.yml", post_config_content),
+        ("post-service/src/main/resources/application-prod.yml", post_prod_config_content)
     ]
     
     for file_path, content in files_to_create:
@@ -245,7 +310,7 @@ logging:
     print("\n📋 Verification Steps:")
     print("1. Start post-service: ./gradlew :post-service:bootRun")
     print("2. Check it runs on port 8082")
-    print("3. Verify 'posts' table is created in database")
+    print("3. Verify Flyway applied the migrations: SELECT * FROM flyway_schema_history_post")
     print("4. Insert test post data")
 
 if __name__ == "__main__":
@@ -327,6 +327,7 @@ def save_database_results(crew_result):
     
     # Now create the actual entity files since CrewAI didn't generate them
     create_actual_entity_files()
+    create_schema_migrations()
 
 def create_actual_entity_files():
     """Create the actual JPA entity files that CrewAI should have generated"""
@@ -615,6 +616,91 @@ interface PostRepository : JpaRepository<Post, UUID> {
     
     print("\n✅ Successfully created all JPA entity files!")
 
+def create_schema_migrations():
+    """Create the baseline Flyway migrations and add Flyway to both services"""
+    
+    backend_dir = Path("generated_code/backend")
+    
+    users_migration = '''-- Baseline users table, matching entity/User.kt
+-- Hibernate only validates the schema (ddl-auto: validate); every change to
+-- the entity needs a new versioned migration here.
+
+CREATE TABLE IF NOT EXISTS users (
+    id            UUID PRIMARY KEY,
+    username      VARCHAR(255) NOT NULL,
+    email         VARCHAR(255) NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    display_name  VARCHAR(255),
+    bio           TEXT,
+    is_active     BOOLEAN NOT NULL DEFAULT true,
+    created_at    TIMESTAMP(6) NOT NULL DEFAULT now(),
+    CONSTRAINT uk_users_username UNIQUE (username),
+    CONSTRAINT uk_users_email UNIQUE (email)
+);
+'''
+    
+    posts_migration = '''-- Baseline posts and post_likes tables, matching entity/Post.kt and entity/PostLike.kt
+-- Hibernate only validates the schema (ddl-auto: validate); the timeline
+-- indexes follow in V004.
+--
+-- uk_post_like_user makes a like unique per (post, user). It is the conflict
+-- target of PostLikeRepository.insertIfAbsent and, leading with post_id,
+-- also serves lookups and counts by post, so no separate post_id index.
+
+CREATE TABLE IF NOT EXISTS posts (
+    id         UUID PRIMARY KEY,
+    user_id    UUID NOT NULL,
+    content    VARCHAR(280) NOT NULL,
+    like_count INTEGER NOT NULL DEFAULT 0,
+    is_deleted BOOLEAN NOT NULL DEFAULT false,
+    created_at TIMESTAMP(6) NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS post_likes (
+    id         UUID PRIMARY KEY,
+    post_id    UUID NOT NULL REFERENCES posts (id) ON DELETE CASCADE,
+    user_id    UUID NOT NULL,
+    created_at TIMESTAMP(6) NOT NULL DEFAULT now(),
+    CONSTRAINT uk_post_like_user UNIQUE (post_id, user_id)
+);
+
+-- "Posts liked by user X", newest first
+CREATE INDEX IF NOT EXISTS idx_like_user_created_at
+    ON post_likes (user_id, created_at DESC);
+'''
+    
+    migrations = [
+        ("user-service/src/main/resources/db/migration/V001__create_users.sql", users_migration),
+        ("post-service/src/main/resources/db/migration/V002__create_posts.sql", posts_migration)
+    ]
+    
+    for file_path, content in migrations:
+        full_path = backend_dir / file_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(full_path, 'w') as f:
+            f.write(content)
+        
+        print(f"✅ Created: {file_path}")
+    
+    # Services run Flyway at startup; Hibernate only validates (ddl-auto: validate)
+    for service in ("user-service", "post-service"):
+        build_file = backend_dir / service / "build.gradle.kts"
+        if not build_file.exists():
+            continue
+        
+        with open(build_file, 'r') as f:
+            content = f.read()
+        
+        if "flyway-core" not in content:
+            content = content.replace(
+                '    runtimeOnly("org.postgresql:postgresql")',
+                '    implementation("org.flywaydb:flyway-core")\n    runtimeOnly("org.postgresql:postgresql")'
+            )
+            with open(build_file, 'w') as f:
+                f.write(content)
+            print(f"✅ Added Flyway to {service}/build.gradle.kts")
+
 def create_generated_code_structure():
     """Create the directory structure for generated code"""
     
@@ -635,7 +721,8 @@ def create_generated_code_structure():
         "post-service/src/main/kotlin/com/twitterclone/post/config",
         "post-service/src/main/resources",
         "post-service/src/test/kotlin/com/twitterclone/post",
-        "db/migrations"
+        "user-service/src/main/resources/db/migration",
+        "post-service/src/main/resources/db/migration"
     ]
     
     for directory in directories:
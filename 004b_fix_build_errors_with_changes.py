@@ -9,6 +9,7 @@ apply the fixes to the actual project files.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
 
 def analyze_and_auto_fix_build_errors():
     """Use CrewAI agents to analyze build errors and auto-apply fixes"""
@@ -182,6 +183,7 @@ def analyze_and_auto_fix_build_errors():
             "message": f"Automated fix failed: {str(e)}"
         }
 
+@profiled
 def apply_fixes_to_files(crew_result, backend_dir):
     """Actually apply the CrewAI-generated fixes to the project files"""
     
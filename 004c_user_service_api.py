@@ -9,6 +9,7 @@ specifically for the user-service only, building on the working database layer.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
 
 def create_user_service_api():
     """Use CrewAI agents to create REST API for user-service only"""
@@ -38,6 +39,7 @@ def create_user_service_api():
           * POST /api/users - Create new user
           * PUT /api/users/{id} - Update user profile
           * GET /api/users/search?q={query} - Search users
+          * GET /api/users/autocomplete?prefix={prefix}&limit=10 - Username autocomplete
         - Proper HTTP status codes (200, 201, 404, 400)
         - Request/Response DTOs usage
         - Basic error handling
@@ -74,8 +76,13 @@ def create_user_service_api():
           * findByUsername(username: String): UserDto?  
           * createUser(request: CreateUserRequest): UserDto
           * updateUser(id: UUID, request: UpdateUserProfileRequest): UserDto
-          * searchUsers(query: String, pageable: Pageable): Page<UserDto>
-        - Entity to DTO mapping
+          * searchUsers(query: String, pageable: Pageable): Slice<UserDto>
+          * autocompleteUsernames(prefix: String, limit: Int): List<UserDto>
+        - Search must stay index-backed: lower-case and LIKE-escape the query,
+          match LOWER(username)/LOWER(display_name) (pg_trgm GIN indexes) and
+          rank exact username, then username prefix, then other matches
+        - Entity to DTO mapping for single-user reads; search and autocomplete
+          return the repository's UserDto constructor projections unmapped
         - Password hashing (simple for now)
         - Validation and error handling
         - @Transactional where needed
@@ -245,6 +252,7 @@ def create_user_service_api():
         print("  • POST /api/users")
         print("  • PUT /api/users/{id}")
         print("  • GET /api/users/search?q={query}")
+        print("  • GET /api/users/autocomplete?prefix={prefix}")
         
         return {
             "status": "success", 
@@ -259,6 +267,7 @@ def create_user_service_api():
             "message": f"User service API creation failed: {str(e)}"
         }
 
+@profiled
 def apply_user_api_files(crew_result):
     """Create the actual user-service API files"""
     
@@ -269,13 +278,13 @@ def apply_user_api_files(crew_result):
     # 1. Create UserController.kt
     user_controller_content = '''package com.twitterclone.user.controller
 
-import com.twitterclone.common.dto.UserDto
-import com.twitterclone.common.dto.CreateUserRequest
-import com.twitterclone.common.dto.UpdateUserProfileRequest
+import com.twitterclone.user.dto.CreateUserRequest
+import com.twitterclone.user.dto.UpdateUserProfileRequest
+import com.twitterclone.user.dto.UserDto
 import com.twitterclone.user.service.UserService
 import jakarta.validation.Valid
-import org.springframework.data.domain.Page
 import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
 import org.springframework.http.HttpStatus
 import org.springframework.http.ResponseEntity
 import org.springframework.web.bind.annotation.*
@@ -319,23 +328,34 @@ class UserController(
     fun searchUsers(
         @RequestParam q: String,
         pageable: Pageable
-    ): ResponseEntity<Page<UserDto>> {
+    ): ResponseEntity<Slice<UserDto>> {
         val users = userService.searchUsers(q, pageable)
         return ResponseEntity.ok(users)
     }
+    
+    @GetMapping("/autocomplete")
+    fun autocompleteUsernames(
+        @RequestParam prefix: String,
+        @RequestParam(defaultValue = "10") limit: Int
+    ): ResponseEntity<List<UserDto>> {
+        val users = userService.autocompleteUsernames(prefix, limit)
+        return ResponseEntity.ok(users)
+    }
 }
 '''
     
     # 2. Create UserService.kt
     user_service_content = '''package com.twitterclone.user.service
 
-import com.twitterclone.common.dto.UserDto
-import com.twitterclone.common.dto.CreateUserRequest
-import com.twitterclone.common.dto.UpdateUserProfileRequest
+import com.twitterclone.user.dto.CreateUserRequest
+import com.twitterclone.user.dto.UpdateUserProfileRequest
+import com.twitterclone.user.dto.UserDto
 import com.twitterclone.user.entity.User
 import com.twitterclone.user.repository.UserRepository
-import org.springframework.data.domain.Page
+import org.springframework.data.domain.PageRequest
 import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
+import org.springframework.data.domain.SliceImpl
 import org.springframework.stereotype.Service
 import org.springframework.transaction.annotation.Transactional
 import java.util.*
@@ -384,18 +404,35 @@ class UserService(
         
         request.displayName?.let { user.displayName = it }
         request.bio?.let { user.bio = it }
-        request.profileImageUrl?.let { user.profileImageUrl = it }
         
         val savedUser = userRepository.save(user)
         return mapToDto(savedUser)
     }
     
     @Transactional(readOnly = true)
-    fun searchUsers(query: String, pageable: Pageable): Page<UserDto> {
-        return userRepository.searchUsers(query, pageable)
-            .map { mapToDto(it) }
+    fun searchUsers(query: String, pageable: Pageable): Slice<UserDto> {
+        val normalized = query.trim().lowercase()
+        if (normalized.isEmpty()) {
+            return SliceImpl(emptyList(), pageable, false)
+        }
+        val escaped = escapeLike(normalized)
+        return userRepository.searchUsers(normalized, "$escaped%", "%$escaped%", pageable)
+    }
+    
+    @Transactional(readOnly = true)
+    fun autocompleteUsernames(prefix: String, limit: Int): List<UserDto> {
+        val normalized = prefix.trim().lowercase()
+        if (normalized.isEmpty()) {
+            return emptyList()
+        }
+        val size = limit.coerceIn(1, MAX_AUTOCOMPLETE_RESULTS)
+        return userRepository.findByUsernamePrefix("${escapeLike(normalized)}%", PageRequest.of(0, size))
     }
     
+    // Treat user input literally in LIKE patterns; '!' is the ESCAPE character in UserRepository
+    private fun escapeLike(value: String): String =
+        value.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+    
     private fun mapToDto(user: User): UserDto {
         return UserDto(
             id = user.id,
@@ -403,14 +440,8 @@ class UserService(
             email = user.email,
             displayName = user.displayName,
             bio = user.bio,
-            profileImageUrl = user.profileImageUrl,
-            followerCount = user.followerCount,
-            followingCount = user.followingCount,
-            postCount = user.postCount,
-            isVerified = user.isVerified,
             isActive = user.isActive,
-            createdAt = user.createdAt,
-            updatedAt = user.updatedAt
+            createdAt = user.createdAt
         )
     }
     
@@ -418,6 +449,10 @@ class UserService(
         // Simple password hashing - in production use BCrypt
         return "hashed_$password"
     }
+    
+    companion object {
+        const val MAX_AUTOCOMPLETE_RESULTS = 20
+    }
 }
 '''
     
@@ -482,11 +517,146 @@ data class ErrorResponse(
 )
 '''
     
+    # 4. Create UserRepository.kt with index-backed search queries
+    user_repository_content = '''package com.twitterclone.user.repository
+
+import com.twitterclone.user.dto.UserDto
+import com.twitterclone.user.entity.User
+import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
+import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Query
+import org.springframework.data.repository.query.Param
+import org.springframework.stereotype.Repository
+import java.util.*
+
+@Repository
+interface UserRepository : JpaRepository<User, UUID> {
+    
+    fun findByUsername(username: String): User?
+    
+    fun findByEmail(email: String): User?
+    
+    fun existsByUsername(username: String): Boolean
+    
+    fun existsByEmail(email: String): Boolean
+    
+    // List reads select straight into UserDto (constructor projection), so the
+    // password hash is never loaded and no entities are hydrated; Slice fetches
+    // one extra row instead of running a COUNT(*).
+    @Query("""
+        SELECT new com.twitterclone.user.dto.UserDto(u.id, u.username, u.email, u.displayName, u.bio, u.isActive, u.createdAt)
+        FROM User u
+        WHERE u.isActive = true
+        ORDER BY u.createdAt DESC, u.id DESC
+    """)
+    fun findActiveUsers(pageable: Pageable): Slice<UserDto>
+    
+    // Substring match served by the pg_trgm GIN indexes on LOWER(username) and
+    // LOWER(display_name) (V006); ranked exact username, then prefix, then the rest.
+    // Callers pass lower-cased, LIKE-escaped patterns (see UserService.searchUsers).
+    @Query("""
+        SELECT new com.twitterclone.user.dto.UserDto(u.id, u.username, u.email, u.displayName, u.bio, u.isActive, u.createdAt)
+        FROM User u
+        WHERE u.isActive = true
+        AND (LOWER(u.username) LIKE :pattern ESCAPE '!'
+        OR LOWER(u.displayName) LIKE :pattern ESCAPE '!')
+        ORDER BY CASE
+            WHEN LOWER(u.username) = :query THEN 0
+            WHEN LOWER(u.username) LIKE :prefix ESCAPE '!' THEN 1
+            WHEN LOWER(u.username) LIKE :pattern ESCAPE '!' THEN 2
+            ELSE 3
+        END, LENGTH(u.username), u.username
+    """)
+    fun searchUsers(
+        @Param("query") query: String,
+        @Param("prefix") prefix: String,
+        @Param("pattern") pattern: String,
+        pageable: Pageable
+    ): Slice<UserDto>
+
+    // Username autocomplete: a prefix range scan on idx_users_username_prefix (text_pattern_ops)
+    @Query("""
+        SELECT new com.twitterclone.user.dto.UserDto(u.id, u.username, u.email, u.displayName, u.bio, u.isActive, u.createdAt)
+        FROM User u
+        WHERE u.isActive = true
+        AND LOWER(u.username) LIKE :prefix ESCAPE '!'
+        ORDER BY LOWER(u.username)
+    """)
+    fun findByUsernamePrefix(@Param("prefix") prefix: String, pageable: Pageable): List<UserDto>
+}
+'''
+    
+    # 5. Create the search index migration (pg_trgm GIN + prefix index)
+    user_search_migration_content = '''-- Indexes for user search and username autocomplete
+-- Search matches LOWER(username) / LOWER(display_name) LIKE '%q%'; a B-tree
+-- cannot serve a leading wildcard, pg_trgm GIN indexes on the same
+-- expressions can. Autocomplete is LOWER(username) LIKE 'q%', a range scan
+-- on a text_pattern_ops index (independent of the database collation).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_users_username_trgm
+    ON users USING gin (lower(username) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_users_display_name_trgm
+    ON users USING gin (lower(display_name) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_users_username_prefix
+    ON users (lower(username) text_pattern_ops);
+'''
+    
+    # 6. Create the production profile: quiet logging, sized pool, batched writes
+    user_prod_config_content = '''# Production profile (SPRING_PROFILES_ACTIVE=prod), layered over application.yml.
+# No per-statement SQL logging in the request path, a fixed-size connection
+# pool with short timeouts, and batched, ordered JDBC writes.
+spring:
+  datasource:
+    hikari:
+      pool-name: user-service
+      # Fixed-size pool: minimum-idle = maximum-pool-size avoids connection churn under load
+      maximum-pool-size: ${DB_POOL_SIZE:10}
+      minimum-idle: ${DB_POOL_SIZE:10}
+      connection-timeout: 3000
+      validation-timeout: 1000
+      idle-timeout: 600000
+      max-lifetime: 1800000
+      data-source-properties:
+        # Lets the Postgres driver send a JDBC batch as multi-row INSERTs
+        reWriteBatchedInserts: true
+  
+  jpa:
+    open-in-view: false
+    show-sql: false
+    properties:
+      hibernate:
+        format_sql: false
+        generate_statistics: false
+        jdbc:
+          batch_size: 50
+          batch_versioned_data: true
+        order_inserts: true
+        order_updates: true
+        query:
+          # Pads IN lists to powers of two so batched lookups reuse cached plans
+          in_clause_parameter_padding: true
+
+logging:
+  level:
+    root: INFO
+    org.hibernate.SQL: WARN
+    org.hibernate.orm.jdbc.bind: WARN
+    org.hibernate.type.descriptor.sql.BasicBinder: WARN
+'''
+    
     # Write the files
     files_to_create = [
         ("user-service/src/main/kotlin/com/twitterclone/user/controller/UserController.kt", user_controller_content),
         ("user-service/src/main/kotlin/com/twitterclone/user/service/UserService.kt", user_service_content),
-        ("user-service/src/main/kotlin/com/twitterclone/user/exception/GlobalExceptionHandler.kt", exception_handler_content)
+        ("user-service/src/main/kotlin/com/twitterclone/user/exception/GlobalExceptionHandler.kt", exception_handler_content),
+        ("user-service/src/main/kotlin/com/twitterclone/user/repository/UserRepository.kt", user_repository_content),
+        ("user-service/src/main/resources/db/migration/V006__user_search_indexes.sql", user_search_migration_content),
+        ("user-service/src/main/resources/application-prod.yml", user_prod_config_content)
     ]
     
     for file_path, content in files_to_create:
@@ -503,6 +673,7 @@ data class ErrorResponse(
     print("1. Restart user-service: ./gradlew :user-service:bootRun")
     print("2. Test endpoint: curl http://localhost:8081/api/users/search?q=test")
     print("3. Create user: POST to http://localhost:8081/api/users")
+    print("4. Autocomplete: curl 'http://localhost:8081/api/users/autocomplete?prefix=jo'")
 
 if __name__ == "__main__":
     print("🌐 Twitter Clone - User Service REST API Creation")
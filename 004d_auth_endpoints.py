@@ -9,6 +9,7 @@ authentication endpoints to fix the 401 Unauthorized issue.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
 
 def create_auth_endpoints():
     """Use CrewAI agents to create login and register endpoints only"""
@@ -159,6 +160,7 @@ def create_auth_endpoints():
         print(f"\n❌ Error creating auth endpoints: {str(e)}")
         return {"status": "error", "message": f"Failed: {str(e)}"}
 
+@profiled
 def apply_simple_auth_files(crew_result):
     """Create the basic auth files"""
     
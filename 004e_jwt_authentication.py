@@ -9,6 +9,7 @@ to the existing working auth endpoints.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
 
 def add_jwt_authentication():
     """Use CrewAI agents to add JWT tokens to existing auth system"""
@@ -29,7 +30,8 @@ def add_jwt_authentication():
         Create a complete JWT utility class that will be written to disk.
         
         The JwtUtil must include:
-        - generateToken(username: String): String method
+        - generateToken(username: String, userId: UUID): String method that puts the
+          user's id in a "uid" claim (post-service reads authorship from it)
         - validateToken(token: String): Boolean method  
         - getUsernameFromToken(token: String): String method
         - isTokenExpired(token: String): Boolean method
@@ -42,8 +44,9 @@ def add_jwt_authentication():
         
         Example generateToken method:
         ```kotlin
-        fun generateToken(username: String): String {
+        fun generateToken(username: String, userId: UUID): String {
             return Jwts.builder()
+                .claim("uid", userId.toString())
                 .setSubject(username)
                 .setIssuedAt(Date())
                 .setExpiration(Date(System.currentTimeMillis() + 86400000)) // 24 hours
@@ -78,7 +81,7 @@ def add_jwt_authentication():
         @PostMapping("/login")
         fun login(@Valid @RequestBody request: LoginRequest): ResponseEntity<AuthResponse> {
             val user = authService.login(request.usernameOrEmail, request.password)
-            val token = jwtUtil.generateToken(user.username)
+            val token = jwtUtil.generateToken(user.username, requireNotNull(user.id))
             val response = AuthResponse(token = token, user = user)
             return ResponseEntity.ok(response)
         }
@@ -162,6 +165,7 @@ def add_jwt_authentication():
         print(f"\n❌ Error adding JWT authentication: {str(e)}")
         return {"status": "error", "message": f"Failed: {str(e)}"}
 
+@profiled
 def apply_jwt_files(crew_result):
     """Create the JWT authentication files"""
     
@@ -190,8 +194,9 @@ class JwtUtil {
     
     private val key: Key by lazy { Keys.hmacShaKeyFor(jwtSecret.toByteArray()) }
     
-    fun generateToken(username: String): String {
-        return createToken(mapOf(), username)
+    /** The [userId] travels as the uid claim so other services use the same id as user-service */
+    fun generateToken(username: String, userId: UUID): String {
+        return createToken(mapOf(USER_ID_CLAIM to userId.toString()), username)
     }
     
     private fun createToken(claims: Map<String, Any>, subject: String): String {
@@ -245,6 +250,10 @@ class JwtUtil {
             false
         }
     }
+    
+    companion object {
+        const val USER_ID_CLAIM = "uid"
+    }
 }
 '''
     
@@ -273,7 +282,7 @@ class AuthController(
     @PostMapping("/register")
     fun register(@Valid @RequestBody request: RegisterRequest): ResponseEntity<AuthResponse> {
         val user = authService.register(request)
-        val token = jwtUtil.generateToken(user.username)
+        val token = jwtUtil.generateToken(user.username, requireNotNull(user.id))
         val response = AuthResponse(
             token = token,
             tokenType = "Bearer",
@@ -286,7 +295,7 @@ class AuthController(
     @PostMapping("/login")
     fun login(@Valid @RequestBody request: LoginRequest): ResponseEntity<AuthResponse> {
         val user = authService.login(request.usernameOrEmail, request.password)
-        val token = jwtUtil.generateToken(user.username)
+        val token = jwtUtil.generateToken(user.username, requireNotNull(user.id))
         val response = AuthResponse(
             token = token,
             tokenType = "Bearer",
@@ -9,6 +9,7 @@ on protected endpoints while keeping auth endpoints public.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
 
 def secure_endpoints_with_jwt():
     """Use CrewAI agents to enable JWT security on endpoints"""
@@ -190,6 +191,7 @@ def secure_endpoints_with_jwt():
         print(f"\n❌ Error enabling JWT security: {str(e)}")
         return {"status": "error", "message": f"Failed: {str(e)}"}
 
+@profiled
 def apply_security_files(crew_result):
     """Create the JWT security files"""
     
@@ -9,6 +9,8 @@ specifically for the post-service, building on the existing database entities.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+import re
+from src.profiling import profiled
 
 def create_post_service_api():
     """Use CrewAI agents to create REST API for post-service"""
@@ -39,6 +41,7 @@ def create_post_service_api():
           * POST /api/posts/{id}/like - Like a post
           * DELETE /api/posts/{id}/like - Unlike a post
           * GET /api/posts/{id}/comments - Get post comments
+          * GET /api/posts/search?q={query} - Ranked full-text search
         - Proper HTTP status codes (200, 201, 404, 400)
         - Request/Response DTOs usage
         - Basic error handling
@@ -78,6 +81,10 @@ def create_post_service_api():
           * likePost(postId: UUID, userId: UUID): PostDto
           * unlikePost(postId: UUID, userId: UUID): PostDto
           * getComments(postId: UUID, pageable: Pageable): Page<PostDto>
+          * searchPosts(query: String, page: Int, size: Int): List<PostDto>
+        - Search must use the full-text index, never LIKE '%...%':
+          to_tsvector('english', content) @@ websearch_to_tsquery('english', :query),
+          ordered by ts_rank_cd
         - Entity to DTO mapping
         - Validation and error handling
         - @Transactional where needed
@@ -212,6 +219,7 @@ def create_post_service_api():
         print("  • GET /api/posts/user/{userId} - Get user's posts")
         print("  • POST /api/posts/{id}/like - Like a post")
         print("  • DELETE /api/posts/{id}/like - Unlike a post")
+        print("  • GET /api/posts/search?q={query} - Search posts")
         print("  • GET /api/timeline/home - Home feed")
         print("  • GET /api/timeline/user/{userId} - User timeline")
         
@@ -228,6 +236,7 @@ def create_post_service_api():
             "message": f"Post service API creation failed: {str(e)}"
         }
 
+@profiled
 def apply_post_api_files(crew_result):
     """Create the actual post-service API files"""
     
@@ -263,6 +272,16 @@ class PostController(
         return ResponseEntity.status(HttpStatus.CREATED).body(post)
     }
     
+    @GetMapping("/search")
+    fun searchPosts(
+        @RequestParam q: String,
+        @RequestParam(defaultValue = "0") page: Int,
+        @RequestParam(defaultValue = "20") size: Int
+    ): ResponseEntity<List<PostDto>> {
+        val posts = postService.searchPosts(q, page, size)
+        return ResponseEntity.ok(posts)
+    }
+    
     @GetMapping("/{id}")
     fun getPostById(@PathVariable id: UUID): ResponseEntity<PostDto> {
         val post = postService.findById(id)
@@ -518,6 +537,9 @@ class TimelineController(
     # Add missing method to PostService
     add_missing_post_service_method()
     
+    # Replace the LIKE search with indexed full-text search
+    add_post_fulltext_search()
+    
     print("\n✅ Post service REST API files created successfully!")
     print("\n📋 Ready to test:")
     print("1. Start post-service: ./gradlew :post-service:bootRun")
@@ -552,6 +574,75 @@ def add_missing_post_service_method():
     
     print("✅ Added missing getPublicTimeline method")
 
+def add_post_fulltext_search():
+    """Swap the LIKE-based searchPosts for ranked full-text search and emit its index"""
+    
+    backend_dir = Path("generated_code/backend")
+    repository_file = backend_dir / "post-service/src/main/kotlin/com/twitterclone/post/repository/PostRepository.kt"
+    service_file = backend_dir / "post-service/src/main/kotlin/com/twitterclone/post/service/PostService.kt"
+    
+    # LOWER(content) LIKE '%q%' cannot use an index; this matches idx_posts_content_fts
+    fulltext_query = '''    @Query(
+        value = """
+            SELECT p.* FROM posts p
+            WHERE p.is_deleted = false
+            AND to_tsvector('english', p.content) @@ websearch_to_tsquery('english', :query)
+            ORDER BY ts_rank_cd(to_tsvector('english', p.content), websearch_to_tsquery('english', :query)) DESC,
+                p.created_at DESC
+        """,
+        nativeQuery = true
+    )
+    fun searchPosts(@Param("query") query: String, pageable: Pageable): List<Post>'''
+    
+    if repository_file.exists():
+        content = repository_file.read_text()
+        like_query = re.compile(
+            r'    @Query\("""(?:(?!""").)*?LIKE(?:(?!""").)*?"""\)\s*fun searchPosts\([^\n]*', re.DOTALL
+        )
+        content, replaced = like_query.subn(lambda _: fulltext_query, content)
+        if replaced:
+            repository_file.write_text(content)
+            print("✅ Switched PostRepository.searchPosts to full-text search")
+    
+    search_method = '''    
+    @Transactional(readOnly = true)
+    fun searchPosts(query: String, page: Int, size: Int): List<PostDto> {
+        if (query.isBlank()) {
+            return emptyList()
+        }
+        val pageable = PageRequest.of(page.coerceAtLeast(0), size.coerceIn(1, 100))
+        return postRepository.searchPosts(query.trim(), pageable).map { mapToDto(it) }
+    }
+'''
+    
+    content = service_file.read_text()
+    if "fun searchPosts(" not in content:
+        content = content.replace(
+            "    private fun mapToDto(post: Post): PostDto {",
+            search_method + "\n    private fun mapToDto(post: Post): PostDto {"
+        )
+        if "import org.springframework.data.domain.PageRequest" not in content:
+            content = content.replace(
+                "import org.springframework.data.domain.Pageable\n",
+                "import org.springframework.data.domain.PageRequest\nimport org.springframework.data.domain.Pageable\n"
+            )
+        service_file.write_text(content)
+        print("✅ Added searchPosts to PostService")
+    
+    migration = backend_dir / "post-service/src/main/resources/db/migration/V007__post_fulltext_search.sql"
+    migration.parent.mkdir(parents=True, exist_ok=True)
+    migration.write_text('''-- Full-text search over post content
+-- PostRepository.searchPosts filters on to_tsvector('english', content) @@
+-- websearch_to_tsquery(...) and ranks with ts_rank_cd; the expression index
+-- must use exactly the same expression. Deleted posts are never searched, so
+-- they are left out of the index.
+
+CREATE INDEX IF NOT EXISTS idx_posts_content_fts
+    ON posts USING gin (to_tsvector('english', content))
+    WHERE is_deleted = false;
+''')
+    print(f"✅ Created: {migration.relative_to(backend_dir)}")
+
 if __name__ == "__main__":
     print("📝 Twitter Clone - Post Service REST API Creation")
     print("Using CrewAI agents to create REST controllers for post-service")
@@ -9,6 +9,7 @@ to the post-service, mirroring the user-service security setup.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
 
 def secure_post_service():
     """Use CrewAI agents to add JWT security to post-service"""
@@ -36,12 +37,17 @@ def secure_post_service():
         The JwtUtil must include:
         - validateToken(token: String): Boolean method
         - getUsernameFromToken(token: String): String method
+        - parseAndValidate(token: String): Claims? that verifies signature and
+          expiry in ONE parse; the filter calls it through JwtClaimsCache, a
+          bounded Caffeine LRU whose entries expire with the token
         - Same secret key and algorithm as user-service
         - Proper error handling for invalid tokens
         
         The JwtAuthenticationFilter must include:
         - Extract JWT from Authorization header
-        - Validate token and set authentication context
+        - Validate token and set authentication context with an AuthenticatedUser
+          principal (username = subject, id = the "uid" claim user-service puts in
+          every token); controllers take the caller's id from AuthenticatedUser.current()
         - Skip filter for public endpoints (if any)
         - Handle invalid tokens gracefully
         
@@ -180,6 +186,7 @@ def secure_post_service():
         print(f"\n❌ Error securing post service: {str(e)}")
         return {"status": "error", "message": f"Failed: {str(e)}"}
 
+@profiled
 def apply_post_security_files(crew_result):
     """Create the post-service security files"""
     
@@ -208,6 +215,24 @@ class JwtUtil {
     
     private val key: Key by lazy { Keys.hmacShaKeyFor(jwtSecret.toByteArray()) }
     
+    /**
+     * Verify the signature and expiry in a single parse; returns the claims,
+     * or null for any invalid, tampered or expired token.
+     */
+    fun parseAndValidate(token: String): Claims? {
+        return try {
+            Jwts.parserBuilder()
+                .setSigningKey(key)
+                .build()
+                .parseClaimsJws(token)
+                .body
+        } catch (e: JwtException) {
+            null
+        } catch (e: IllegalArgumentException) {
+            null
+        }
+    }
+    
     fun getUsernameFromToken(token: String): String {
         return getClaimFromToken(token, Claims::getSubject)
     }
@@ -267,7 +292,7 @@ import org.springframework.web.filter.OncePerRequestFilter
 
 @Component
 class JwtAuthenticationFilter(
-    private val jwtUtil: JwtUtil
+    private val claimsCache: JwtClaimsCache
 ) : OncePerRequestFilter() {
     
     override fun doFilterInternal(
@@ -277,38 +302,117 @@ class JwtAuthenticationFilter(
     ) {
         val authorizationHeader = request.getHeader("Authorization")
         
-        var username: String? = null
-        var jwt: String? = null
-        
-        // Extract JWT token from Authorization header
-        if (authorizationHeader != null && authorizationHeader.startsWith("Bearer ")) {
-            jwt = authorizationHeader.substring(7)
-            try {
-                username = jwtUtil.getUsernameFromToken(jwt)
-            } catch (e: Exception) {
-                logger.warn("Unable to get JWT Token or token expired", e)
-            }
-        }
-        
-        // Validate token and set authentication context
-        if (username != null && SecurityContextHolder.getContext().authentication == null) {
-            try {
-                if (jwt != null && jwtUtil.validateToken(jwt)) {
-                    val authorities = listOf(SimpleGrantedAuthority("USER"))
-                    val authToken = UsernamePasswordAuthenticationToken(
-                        username, null, authorities
-                    )
-                    authToken.details = WebAuthenticationDetailsSource().buildDetails(request)
-                    SecurityContextHolder.getContext().authentication = authToken
-                }
-            } catch (e: Exception) {
-                logger.warn("Authentication failed for user: $username", e)
+        // One cached parse-and-verify per token instead of a parse per claim on every request
+        if (authorizationHeader != null && authorizationHeader.startsWith("Bearer ") &&
+            SecurityContextHolder.getContext().authentication == null
+        ) {
+            val claims = claimsCache.claimsFor(authorizationHeader.substring(7))
+            if (claims?.subject != null) {
+                val authorities = listOf(SimpleGrantedAuthority("USER"))
+                val authToken = UsernamePasswordAuthenticationToken(
+                    AuthenticatedUser.from(claims), null, authorities
+                )
+                authToken.details = WebAuthenticationDetailsSource().buildDetails(request)
+                SecurityContextHolder.getContext().authentication = authToken
+            } else {
+                logger.warn("Invalid or expired JWT token")
             }
         }
         
         filterChain.doFilter(request, response)
     }
 }
+'''
+    
+    # 2a. Principal carrying the user-service id from the token's uid claim
+    authenticated_user_content = '''package com.twitterclone.post.security
+
+import io.jsonwebtoken.Claims
+import org.springframework.security.core.context.SecurityContextHolder
+import java.security.Principal
+import java.util.*
+
+/**
+ * Principal set by [JwtAuthenticationFilter]: the token's subject and the
+ * user-service id of the caller, so posts, likes and follow-driven timelines
+ * all use the ids user-service hands out.
+ */
+data class AuthenticatedUser(
+    val username: String,
+    val id: UUID
+) : Principal {
+
+    override fun getName(): String = username
+
+    companion object {
+        const val USER_ID_CLAIM = "uid"
+
+        fun from(claims: Claims): AuthenticatedUser {
+            val username = claims.subject
+            // Tokens issued before user-service added the uid claim keep the old derived id until they expire
+            val id = (claims[USER_ID_CLAIM] as? String)?.let(UUID::fromString)
+                ?: UUID.nameUUIDFromBytes(username.toByteArray())
+            return AuthenticatedUser(username, id)
+        }
+
+        fun current(): AuthenticatedUser {
+            return SecurityContextHolder.getContext().authentication?.principal as? AuthenticatedUser
+                ?: throw RuntimeException("No authenticated user")
+        }
+    }
+}
+'''
+    
+    # 2b. Cache of verified tokens so repeat requests skip the parse and HMAC check
+    jwt_claims_cache_content = '''package com.twitterclone.post.security
+
+import com.github.benmanes.caffeine.cache.Cache
+import com.github.benmanes.caffeine.cache.Caffeine
+import com.github.benmanes.caffeine.cache.Expiry
+import io.jsonwebtoken.Claims
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+import java.time.Duration
+import java.time.Instant
+
+/**
+ * Bounded LRU of verified tokens to their claims, so a client's repeat
+ * requests skip the JWT parse and HMAC check.
+ *
+ * Entries live until the token's own expiry, capped at jwt.claims-cache.max-ttl,
+ * so an expired token is never served from the cache. Only valid tokens are
+ * cached; garbage tokens cannot push real ones out.
+ */
+@Component
+class JwtClaimsCache(
+    private val jwtUtil: JwtUtil,
+    @Value("\${jwt.claims-cache.max-size:10000}") maxSize: Long,
+    @Value("\${jwt.claims-cache.max-ttl:PT5M}") private val maxTtl: Duration
+) {
+
+    private val cache: Cache<String, Claims> = Caffeine.newBuilder()
+        .maximumSize(maxSize)
+        .expireAfter(object : Expiry<String, Claims> {
+            override fun expireAfterCreate(token: String, claims: Claims, currentTime: Long): Long =
+                ttl(claims).toNanos()
+
+            override fun expireAfterUpdate(token: String, claims: Claims, currentTime: Long, currentDuration: Long): Long =
+                ttl(claims).toNanos()
+
+            override fun expireAfterRead(token: String, claims: Claims, currentTime: Long, currentDuration: Long): Long =
+                currentDuration
+        })
+        .build()
+
+    /** Claims of a valid, unexpired token; null otherwise */
+    fun claimsFor(token: String): Claims? =
+        cache.getIfPresent(token) ?: jwtUtil.parseAndValidate(token)?.also { cache.put(token, it) }
+
+    private fun ttl(claims: Claims): Duration {
+        val untilExpiry = claims.expiration?.let { Duration.between(Instant.now(), it.toInstant()) } ?: maxTtl
+        return minOf(untilExpiry, maxTtl).coerceAtLeast(Duration.ZERO)
+    }
+}
 '''
     
     # 3. Create SecurityConfig.kt for post-service
@@ -366,18 +470,18 @@ class SecurityConfig(
 }
 '''
     
-    # 4. Update PostController.kt to use authentication context
+    # 4. Update PostController.kt to take the caller's id from AuthenticatedUser
     updated_post_controller_content = '''package com.twitterclone.post.controller
 
 import com.twitterclone.post.dto.PostDto
 import com.twitterclone.post.dto.CreatePostRequest
 import com.twitterclone.post.service.PostService
 import jakarta.validation.Valid
-import org.springframework.data.domain.Page
 import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
 import org.springframework.http.HttpStatus
 import org.springframework.http.ResponseEntity
-import org.springframework.security.core.context.SecurityContextHolder
+import com.twitterclone.post.security.AuthenticatedUser
 import org.springframework.web.bind.annotation.*
 import java.util.*
 
@@ -390,11 +494,21 @@ class PostController(
     
     @PostMapping
     fun createPost(@Valid @RequestBody request: CreatePostRequest): ResponseEntity<PostDto> {
-        val username = getCurrentUsername()
-        val post = postService.createPost(request, username)
+        val userId = getCurrentUserId()
+        val post = postService.createPost(request, userId)
         return ResponseEntity.status(HttpStatus.CREATED).body(post)
     }
     
+    @GetMapping("/search")
+    fun searchPosts(
+        @RequestParam q: String,
+        @RequestParam(defaultValue = "0") page: Int,
+        @RequestParam(defaultValue = "20") size: Int
+    ): ResponseEntity<List<PostDto>> {
+        val posts = postService.searchPosts(q, page, size)
+        return ResponseEntity.ok(posts)
+    }
+    
     @GetMapping("/{id}")
     fun getPostById(@PathVariable id: UUID): ResponseEntity<PostDto> {
         val post = postService.findById(id)
@@ -405,38 +519,27 @@ class PostController(
     fun getPostsByUser(
         @PathVariable userId: UUID,
         pageable: Pageable
-    ): ResponseEntity<Page<PostDto>> {
+    ): ResponseEntity<Slice<PostDto>> {
         val posts = postService.findByUserId(userId, pageable)
         return ResponseEntity.ok(posts)
     }
     
     @PostMapping("/{id}/like")
     fun likePost(@PathVariable id: UUID): ResponseEntity<PostDto> {
-        val username = getCurrentUsername()
-        val post = postService.likePost(id, username)
+        val userId = getCurrentUserId()
+        val post = postService.likePost(id, userId)
         return ResponseEntity.ok(post)
     }
     
     @DeleteMapping("/{id}/like")
     fun unlikePost(@PathVariable id: UUID): ResponseEntity<PostDto> {
-        val username = getCurrentUsername()
-        val post = postService.unlikePost(id, username)
+        val userId = getCurrentUserId()
+        val post = postService.unlikePost(id, userId)
         return ResponseEntity.ok(post)
     }
     
-    @GetMapping("/{id}/comments")
-    fun getComments(
-        @PathVariable id: UUID,
-        pageable: Pageable
-    ): ResponseEntity<Page<PostDto>> {
-        val comments = postService.getComments(id, pageable)
-        return ResponseEntity.ok(comments)
-    }
-    
-    private fun getCurrentUsername(): String {
-        val authentication = SecurityContextHolder.getContext().authentication
-        return authentication.name ?: throw RuntimeException("No authenticated user")
-    }
+    // The user-service id from the token's uid claim, the same id the follow graph uses
+    private fun getCurrentUserId(): UUID = AuthenticatedUser.current().id
 }
 '''
     
@@ -444,6 +547,8 @@ class PostController(
     files = [
         ("post-service/src/main/kotlin/com/twitterclone/post/security/JwtUtil.kt", jwt_util_content),
         ("post-service/src/main/kotlin/com/twitterclone/post/security/JwtAuthenticationFilter.kt", jwt_filter_content),
+        ("post-service/src/main/kotlin/com/twitterclone/post/security/AuthenticatedUser.kt", authenticated_user_content),
+        ("post-service/src/main/kotlin/com/twitterclone/post/security/JwtClaimsCache.kt", jwt_claims_cache_content),
         ("post-service/src/main/kotlin/com/twitterclone/post/config/SecurityConfig.kt", security_config_content),
         ("post-service/src/main/kotlin/com/twitterclone/post/controller/PostController.kt", updated_post_controller_content)
     ]
@@ -476,7 +581,10 @@ def add_jwt_dependencies_to_post_service():
     // JWT dependencies
     implementation("io.jsonwebtoken:jjwt-api:0.11.5")
     implementation("io.jsonwebtoken:jjwt-impl:0.11.5")
-    implementation("io.jsonwebtoken:jjwt-jackson:0.11.5")'''
+    implementation("io.jsonwebtoken:jjwt-jackson:0.11.5")
+    
+    // Verified-token cache in the JWT filter
+    implementation("com.github.ben-manes.caffeine:caffeine")'''
         
         # Insert before the testing section
         content = content.replace(
@@ -8,6 +8,8 @@ then conducts a sprint retrospective to analyze what worked and what didn't.
 
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
+from src.model_router import model_router
+from src.profiling import profiled
 from pathlib import Path
 
 def create_unit_tests_with_retrospective():
@@ -115,7 +117,9 @@ def create_unit_tests_with_retrospective():
         expected_output='Complete unit test files: PostServiceTest.kt, PostControllerTest.kt, JwtUtilTest.kt, TimelineControllerTest.kt'
     )
 
-    # Task 3: Conduct Sprint Retrospective
+    # Task 3: Conduct Sprint Retrospective (cheap model tier)
+    retro_tier = model_router.tier_for(task_type='retrospective')
+    retro_lead = model_router.route_agent(technical_lead, tier=retro_tier)
     sprint_retrospective_task = Task(
         description='''
         You must conduct a comprehensive sprint retrospective on our Twitter Clone development process.
@@ -159,14 +163,22 @@ def create_unit_tests_with_retrospective():
         
         OUTPUT: Comprehensive sprint retrospective with actionable insights.
         ''',
-        agent=technical_lead,
+        agent=retro_lead,
+        context=[user_service_tests_task, post_service_tests_task],
         expected_output='Detailed sprint retrospective analyzing successes, failures, lessons learned, and action items'
     )
 
-    # Create the crew
+    # Create the crews: the retrospective is kicked off on its own so its
+    # latency and cost are recorded against its tier, not the default one
     unit_test_crew = Crew(
-        agents=[kotlin_api_developer, kotlin_api_architect, technical_lead],
-        tasks=[user_service_tests_task, post_service_tests_task, sprint_retrospective_task],
+        agents=[kotlin_api_developer, kotlin_api_architect],
+        tasks=[user_service_tests_task, post_service_tests_task],
+        process=Process.sequential,
+        verbose=True
+    )
+    retro_crew = Crew(
+        agents=[retro_lead],
+        tasks=[sprint_retrospective_task],
         process=Process.sequential,
         verbose=True
     )
@@ -176,13 +188,14 @@ def create_unit_tests_with_retrospective():
     print("⏳ This includes reflection on our entire development process...")
     
     try:
-        result = unit_test_crew.kickoff()
+        result = model_router.kickoff(unit_test_crew, model_router.default_tier, 'unit tests')
         
         # Apply the generated files
         apply_unit_test_files(result)
         
         # Extract and display retrospective
-        display_sprint_retrospective(result)
+        retro_result = model_router.kickoff(retro_crew, retro_tier, 'sprint retrospective')
+        display_sprint_retrospective(retro_result)
         
         print("\n" + "=" * 80)
         print("✅ UNIT TESTS CREATED & RETROSPECTIVE COMPLETE!")
@@ -198,6 +211,7 @@ def create_unit_tests_with_retrospective():
         print("  • Review retrospective insights")
         print("  • Apply lessons learned to next development phase")
         print("  • Consider integration tests for next sprint")
+        print(f"\n{model_router.report()}")
         
         return {
             "status": "success", 
@@ -208,6 +222,7 @@ def create_unit_tests_with_retrospective():
         print(f"\n❌ Error during unit test creation: {str(e)}")
         return {"status": "error", "message": f"Failed: {str(e)}"}
 
+@profiled
 def apply_unit_test_files(crew_result):
     """Create the unit test files"""
     
@@ -8,6 +8,8 @@ then conduct a retrospective on how they wrote tests for non-existent code.
 
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
+from src.model_router import model_router
+from src.profiling import profiled
 from pathlib import Path
 
 def fix_missing_entities_with_retrospective():
@@ -87,7 +89,9 @@ def fix_missing_entities_with_retrospective():
         expected_output='Complete list of missing dependencies identified and resolved'
     )
 
-    # Task 3: Conduct Development Process Retrospective
+    # Task 3: Conduct Development Process Retrospective (cheap model tier)
+    retro_tier = model_router.tier_for(task_type='retrospective')
+    retro_lead = model_router.route_agent(technical_lead, tier=retro_tier)
     process_retrospective_task = Task(
         description='''
         You must conduct a detailed retrospective on how you wrote tests for non-existent code.
@@ -125,14 +129,22 @@ def fix_missing_entities_with_retrospective():
         
         OUTPUT: Comprehensive process analysis with specific recommendations.
         ''',
-        agent=technical_lead,
+        agent=retro_lead,
+        context=[missing_entities_task, missing_dependencies_task],
         expected_output='Detailed analysis of how tests were written for non-existent code and process improvement recommendations'
     )
 
-    # Create the crew
+    # Create the crews: the retrospective is kicked off on its own so its
+    # latency and cost are recorded against its tier, not the default one
     missing_code_crew = Crew(
-        agents=[kotlin_api_developer, kotlin_api_architect, technical_lead],
-        tasks=[missing_entities_task, missing_dependencies_task, process_retrospective_task],
+        agents=[kotlin_api_developer, kotlin_api_architect],
+        tasks=[missing_entities_task, missing_dependencies_task],
+        process=Process.sequential,
+        verbose=True
+    )
+    retro_crew = Crew(
+        agents=[retro_lead],
+        tasks=[process_retrospective_task],
         process=Process.sequential,
         verbose=True
     )
@@ -142,13 +154,14 @@ def fix_missing_entities_with_retrospective():
     print("⏳ This includes deep analysis of how they wrote tests for non-existent entities...")
     
     try:
-        result = missing_code_crew.kickoff()
+        result = model_router.kickoff(missing_code_crew, model_router.default_tier, 'missing entities')
         
         # Apply the fixes
         apply_missing_entity_fixes(result)
         
         # Display the process retrospective
-        display_process_retrospective(result)
+        retro_result = model_router.kickoff(retro_crew, retro_tier, 'process retrospective')
+        display_process_retrospective(retro_result)
         
         print("\n" + "=" * 80)
         print("✅ MISSING ENTITIES FIXED & PROCESS RETROSPECTIVE COMPLETE!")
@@ -171,6 +184,7 @@ def fix_missing_entities_with_retrospective():
         print("  • Review process retrospective insights")
         print("  • Implement recommended validation steps")
         print("  • Apply lessons to future AI development workflows")
+        print(f"\n{model_router.report()}")
         
         return {
             "status": "success", 
@@ -181,6 +195,7 @@ def fix_missing_entities_with_retrospective():
         print(f"\n❌ Error during missing entity fix: {str(e)}")
         return {"status": "error", "message": f"Failed: {str(e)}"}
 
+@profiled
 def apply_missing_entity_fixes(crew_result):
     """Create the missing entity files"""
     
@@ -9,6 +9,10 @@ in PostLike entity and reflect on repeating the same mistake.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.patch_engine import PATCH_FORMAT_INSTRUCTIONS, patch_applier
+from src.profiling import profiled
+
+post_like_file = Path("generated_code/backend/post-service/src/main/kotlin/com/twitterclone/post/entity/PostLike.kt")
 
 def fix_inheritance_error():
     """Use CrewAI agents to fix Kotlin inheritance issue"""
@@ -19,6 +23,9 @@ def fix_inheritance_error():
     print("=" * 80)
     print("CrewAI agents will fix the supertype initialization error...")
     print("")
+    
+    # The developer patches against the real file instead of re-emitting it
+    current_post_like = post_like_file.read_text() if post_like_file.exists() else "(PostLike.kt not found)"
 
     # Task 1: Fix PostLike Inheritance Error
     inheritance_fix_task = Task(
@@ -51,10 +58,13 @@ def fix_inheritance_error():
         Update the PostLike.kt file with the correct Kotlin inheritance syntax.
         Ensure the file compiles without the supertype initialization error.
         
-        OUTPUT: Corrected PostLike.kt file content.
-        ''',
+        CURRENT PostLike.kt:
+        ```kotlin
+        ''' + current_post_like + '''
+        ```
+        ''' + PATCH_FORMAT_INSTRUCTIONS,
         agent=kotlin_api_developer,
-        expected_output='Fixed PostLike.kt with correct Kotlin inheritance syntax'
+        expected_output='Search/replace blocks for PostLike.kt with correct Kotlin inheritance syntax'
     )
 
     # Task 2: Pattern Recognition and Learning Analysis
@@ -139,37 +149,34 @@ def fix_inheritance_error():
         print(f"\n❌ Error during inheritance fix: {str(e)}")
         return {"status": "error", "message": f"Failed: {str(e)}"}
 
+def known_inheritance_fix(content, reason=None):
+    """Deterministic inheritance fix, used when the developer's patch conflicts"""
+    return content.replace(
+        "class PostLike : BaseEntity() {",
+        "class PostLike : BaseEntity {"
+    ).replace(
+        "constructor() : super()",
+        "constructor()"
+    )
+
+@profiled
 def apply_inheritance_fix(crew_result):
     """Apply the inheritance fix to PostLike.kt"""
     
     print("\n🔧 Fixing PostLike inheritance syntax...")
     
-    # Read current PostLike.kt
-    post_like_file = Path("generated_code/backend/post-service/src/main/kotlin/com/twitterclone/post/entity/PostLike.kt")
+    # The first task's output holds the developer's patch; later outputs are analysis
+    tasks_output = getattr(crew_result, 'tasks_output', None)
+    patch_output = tasks_output[0] if tasks_output else crew_result
     
-    if post_like_file.exists():
-        with open(post_like_file, 'r') as f:
-            content = f.read()
-        
-        # Fix the inheritance syntax
-        fixed_content = content.replace(
-            "class PostLike : BaseEntity() {",
-            "class PostLike : BaseEntity {"
-        ).replace(
-            "constructor() : super()",
-            "constructor()"
-        ).replace(
-            ") : this() {",
-            ") : this() {"
-        )
-        
-        # Write the fixed content
-        with open(post_like_file, 'w') as f:
-            f.write(fixed_content)
-        
-        print("✅ Fixed PostLike inheritance syntax")
-    else:
-        print("❌ PostLike.kt file not found")
+    if not patch_applier.apply(post_like_file, patch_output, rewrite=known_inheritance_fix):
+        return
+    
+    if "BaseEntity()" in post_like_file.read_text():
+        post_like_file.write_text(known_inheritance_fix(post_like_file.read_text()))
+    
+    print("✅ Fixed PostLike inheritance syntax")
+    print(patch_applier.report())
 
 def display_pattern_analysis(crew_result):
     """Display the pattern analysis"""
@@ -9,6 +9,7 @@ the updated service methods, and reflect on maintaining test consistency.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
 
 def fix_test_signatures():
     """Use CrewAI agents to fix test method signature mismatches"""
@@ -172,6 +173,7 @@ def fix_test_signatures():
         print(f"\n❌ Error during test signature fix: {str(e)}")
         return {"status": "error", "message": f"Failed: {str(e)}"}
 
+@profiled
 def apply_test_signature_fixes(crew_result):
     """Apply test signature fixes"""
     
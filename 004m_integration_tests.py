@@ -9,6 +9,7 @@ that validate end-to-end workflows across services, database, and authentication
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
 
 def create_integration_tests():
     """Use CrewAI agents to create comprehensive integration tests"""
@@ -278,6 +279,7 @@ def create_integration_tests():
             "message": f"Integration test creation failed: {str(e)}"
         }
 
+@profiled
 def apply_integration_test_files(crew_result):
     """Create the integration test files"""
     
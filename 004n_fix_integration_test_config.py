@@ -18,6 +18,8 @@ The agents need to fix TestContainer configuration and Spring Boot property bind
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 def fix_integration_test_configuration():
     """Use CrewAI agents to analyze and fix integration test configuration issues"""
@@ -258,7 +260,7 @@ def fix_integration_test_configuration():
         print("  • Updated UserServiceIntegrationTest.kt with proper configuration")
         
         print("\n🚀 Test Integration Tests:")
-        print("  cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend")
+        print(f"  cd {PROJECT_ROOT}/generated_code/backend")
         print("  ./gradlew :user-service:test --tests '*IntegrationTest*'")
         print("  ./gradlew :post-service:test --tests '*IntegrationTest*'")
         
@@ -281,6 +283,7 @@ def fix_integration_test_configuration():
             "message": f"Integration test configuration fix failed: {str(e)}"
         }
 
+@profiled
 def apply_integration_test_fixes(crew_result):
     """Apply the integration test configuration fixes generated by CrewAI agents"""
     
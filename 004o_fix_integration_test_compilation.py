@@ -19,6 +19,8 @@ The agents need to fix import issues and ensure all test classes are properly cr
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 def fix_integration_test_compilation():
     """Use CrewAI agents to fix integration test compilation errors"""
@@ -284,7 +286,7 @@ def fix_integration_test_compilation():
         print("  • Updated build.gradle.kts with proper test dependencies")
         
         print("\n🚀 Test Compilation:")
-        print("  cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend")
+        print(f"  cd {PROJECT_ROOT}/generated_code/backend")
         print("  ./gradlew :user-service:compileTestKotlin")
         print("  ./gradlew :user-service:test --tests '*IntegrationTest*'")
         
@@ -307,6 +309,7 @@ def fix_integration_test_compilation():
             "message": f"Integration test compilation fix failed: {str(e)}"
         }
 
+@profiled
 def apply_compilation_fixes(crew_result):
     """Apply the integration test compilation fixes generated by CrewAI agents"""
     
@@ -16,6 +16,8 @@ The agents need to fix missing Jackson dependencies in the common module.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 def fix_common_module_dependencies():
     """Use CrewAI agents to fix common module dependency issues"""
@@ -321,7 +323,7 @@ def fix_common_module_dependencies():
         print("  • Validated cross-module dependency resolution")
         
         print("\n🚀 Test Compilation:")
-        print("  cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend")
+        print(f"  cd {PROJECT_ROOT}/generated_code/backend")
         print("  ./gradlew :common:compileKotlin")
         print("  ./gradlew :user-service:compileKotlin")
         print("  ./gradlew build")
@@ -345,6 +347,7 @@ def fix_common_module_dependencies():
             "message": f"Common module dependencies fix failed: {str(e)}"
         }
 
+@profiled
 def apply_dependency_fixes(crew_result):
     """Apply the common module dependency fixes generated by CrewAI agents"""
     
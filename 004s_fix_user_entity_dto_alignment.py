@@ -19,6 +19,12 @@ The User entity and UserDto have misaligned properties that need to be fixed.
 from improved_twitter_config import technical_lead, kotlin_api_architect, kotlin_api_developer
 from crewai import Agent, Task, Crew, Process
 from pathlib import Path
+from src.kotlin_alignment import check_alignment
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
+
+# Static alignment findings this phase is responsible for
+ALIGNMENT_KINDS = ('unresolved-property', 'type-mismatch', 'nullability-mismatch', 'unknown-parameter', 'missing-argument')
 
 def fix_user_entity_dto_alignment():
     """Use CrewAI agents to fix User entity and DTO alignment issues"""
@@ -30,69 +36,15 @@ def fix_user_entity_dto_alignment():
     print("CrewAI agents will fix alignment between User entity and UserDto...")
     print("")
 
-    # Task 1: Analyze User Entity vs UserDto Property Mismatch
-    analyze_entity_dto_mismatch_task = Task(
-        description='''
-        ENTITY-DTO ALIGNMENT ANALYSIS:
-        The UserDtoMapper is failing because it expects properties on the User entity
-        that don't exist or have wrong types.
-        
-        ERRORS IDENTIFIED:
-        1. line 19: Unresolved reference: location (User.location doesn't exist)
-        2. line 20: Unresolved reference: website (User.website doesn't exist)
-        3. line 21: Unresolved reference: followersCount (User.followersCount doesn't exist)
-        4. line 22: Type mismatch Long vs Int for followingCount
-        
-        YOU MUST ANALYZE:
-        
-        1. EXAMINE CURRENT User.kt ENTITY:
-           - Check what properties actually exist in the User entity
-           - Identify property names and types
-           - Compare with what UserDto expects
-        
-        2. EXAMINE CURRENT UserDto.kt:
-           - Check what properties UserDto expects
-           - Note required vs optional properties
-           - Check property types (Int vs Long, nullable vs non-null)
-        
-        3. IDENTIFY MISMATCHES:
-           - Properties UserDto expects but User entity doesn't have
-           - Type mismatches between User entity and UserDto
-           - Nullable vs non-nullable differences
-           - Naming differences (followerCount vs followersCount)
-        
-        EXPECTED UserDto STRUCTURE (from previous fixes):
-        ```kotlin
-        data class UserDto(
-            val id: UUID?,
-            val username: String,
-            val email: String,
-            val displayName: String?,
-            val bio: String?,
-            val location: String?,      // Does User entity have this?
-            val website: String?,       // Does User entity have this?
-            val followersCount: Int = 0, // Does User entity have this?
-            val followingCount: Int = 0, // What type is this in User entity?
-            val createdAt: LocalDateTime?,
-            val updatedAt: LocalDateTime?
-        )
-        ```
-        
-        4. DETERMINE ALIGNMENT STRATEGY:
-           Option A: Add missing properties to User entity
-           Option B: Modify UserDto to match User entity
-           Option C: Use default values for missing properties in mapper
-        
-        CRITICAL: Determine the exact properties available in User entity and align
-        the mapping logic accordingly.
-        
-        OUTPUT: Complete analysis of User entity properties and UserDto alignment strategy.
-        ''',
-        agent=kotlin_api_architect,
-        expected_output='Complete analysis of User entity vs UserDto property mismatches and alignment strategy'
-    )
+    # Static check first: the crew only runs for errors the checker actually finds
+    alignment = check_alignment(Path("generated_code/backend"))
+    print(alignment.format_report())
+    if not alignment.errors(ALIGNMENT_KINDS):
+        print("\n✅ No entity/DTO alignment errors found by the static check - skipping the crew")
+        return {"status": "success", "message": "No entity/DTO alignment errors found by static check"}
+    findings = alignment.fix_prompt(ALIGNMENT_KINDS)
 
-    # Task 2: Fix User Entity to Include Required Properties
+    # Task 1: Fix User Entity to Include Required Properties
     fix_user_entity_task = Task(
         description='''
         Fix the User entity to include all properties that UserDto expects, with correct types.
@@ -169,7 +121,7 @@ def fix_user_entity_dto_alignment():
         expected_output='Fixed User entity with all properties required by UserDto mapping'
     )
 
-    # Task 3: Fix UserDtoMapper with Correct Property Access
+    # Task 2: Fix UserDtoMapper with Correct Property Access
     fix_mapper_properties_task = Task(
         description='''
         Fix the UserDtoMapper to correctly access User entity properties and handle type conversions.
@@ -250,7 +202,7 @@ def fix_user_entity_dto_alignment():
         expected_output='Fixed UserDtoMapper with correct property access and safe type conversions'
     )
 
-    # Task 4: Validate Entity-DTO Alignment and Test Compilation
+    # Task 3: Validate Entity-DTO Alignment and Test Compilation
     validate_alignment_task = Task(
         description='''
         Validate the complete alignment between User entity and UserDto mapping.
@@ -323,10 +275,14 @@ def fix_user_entity_dto_alignment():
         expected_output='Complete validation of User entity and UserDto alignment with successful compilation'
     )
 
+    # The static findings replace the discovery task
+    fix_user_entity_task.description = findings + "\n\n" + fix_user_entity_task.description
+    fix_mapper_properties_task.description = findings + "\n\n" + fix_mapper_properties_task.description
+
     # Create the crew
     alignment_fix_crew = Crew(
         agents=[kotlin_api_architect, kotlin_api_developer, technical_lead],
-        tasks=[analyze_entity_dto_mismatch_task, fix_user_entity_task, fix_mapper_properties_task, validate_alignment_task],
+        tasks=[fix_user_entity_task, fix_mapper_properties_task, validate_alignment_task],
         process=Process.sequential,
         verbose=True
     )
@@ -341,6 +297,12 @@ def fix_user_entity_dto_alignment():
         # Apply the fixes
         apply_alignment_fixes(result)
         
+        remaining = check_alignment(Path("generated_code/backend")).errors(ALIGNMENT_KINDS)
+        if remaining:
+            print(f"\n⚠️  Static check still reports {len(remaining)} entity/DTO alignment error(s):")
+            for issue in remaining:
+                print(f"  • {issue.location()}: {issue.message}")
+        
         print("\n" + "=" * 80)
         print("✅ USER ENTITY DTO ALIGNMENT FIXED!")
         print("=" * 80)
@@ -366,7 +328,7 @@ def fix_user_entity_dto_alignment():
         print("  • Safe property access with null handling")
         
         print("\n🚀 Test Compilation:")
-        print("  cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend")
+        print(f"  cd {PROJECT_ROOT}/generated_code/backend")
         print("  ./gradlew :user-service:compileKotlin")
         print("  ./gradlew build")
         
@@ -389,6 +351,7 @@ def fix_user_entity_dto_alignment():
             "message": f"User entity DTO alignment fix failed: {str(e)}"
         }
 
+@profiled
 def apply_alignment_fixes(crew_result):
     """Apply the User entity DTO alignment fixes generated by CrewAI agents"""
     
@@ -486,7 +449,7 @@ object UserDtoMapper {
 
     # Step 3: Create database migration for new properties (optional)
     database_migration = '''-- Migration script to add new User entity properties
--- This would be used with Flyway or similar migration tool
+-- Applied by Flyway when user-service starts
 
 ALTER TABLE users 
 ADD COLUMN IF NOT EXISTS location VARCHAR(255),
@@ -508,7 +471,7 @@ WHERE location IS NULL OR website IS NULL OR followers_count IS NULL OR followin
     files_to_create = [
         ("user-service/src/main/kotlin/com/twitterclone/user/entity/User.kt", updated_user_entity),
         ("user-service/src/main/kotlin/com/twitterclone/user/mapper/UserDtoMapper.kt", fixed_user_dto_mapper),
-        ("db/migrations/V003__add_user_profile_fields.sql", database_migration),
+        ("user-service/src/main/resources/db/migration/V003__add_user_profile_fields.sql", database_migration),
     ]
     
     for file_path, content in files_to_create:
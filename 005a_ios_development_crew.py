@@ -7,10 +7,13 @@ Builds a Twitter Clone iOS app using MVVM architecture
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
-backend_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
+backend_path = f"{PROJECT_ROOT}/generated_code/backend"
 
 # =============================================================================
 # AGENTS
@@ -234,6 +237,7 @@ retrospective_task = Task(
 # MANUAL FILE WRITING FUNCTION
 # =============================================================================
 
+@profiled
 def apply_ios_files(crew_result):
     """Extract Swift code from crew result and write to actual files"""
     
@@ -246,9 +250,10 @@ def apply_ios_files(crew_result):
     result_text = str(crew_result)
     
     # DEBUG: Save the full result to a file so we can see what the agents actually generated
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "debug_agent_output.txt"
+    debug_file = PROJECT_ROOT / "debug_agent_output.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'debug_agent_output')
     print(f"🔍 Full agent output saved to: debug_agent_output.txt")
     
     # Look for Swift code blocks with FILENAME comments
@@ -356,7 +361,7 @@ def save_retrospective(crew_result):
     import datetime
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     retro_filename = f"iOS_Development_Retrospective_{timestamp}.md"
-    retro_path = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / retro_filename
+    retro_path = PROJECT_ROOT / retro_filename
     
     # For now, just save the last part of the output (likely contains retrospective)
     lines = result_text.split('\n')
@@ -7,9 +7,12 @@ Creates the networking foundation for the Twitter Clone iOS app
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
 
 # =============================================================================
 # AGENTS
@@ -148,6 +151,7 @@ network_testing_task = Task(
 # MANUAL FILE WRITING FUNCTION
 # =============================================================================
 
+@profiled
 def apply_networking_files(crew_result):
     """Extract Swift networking code and write to files"""
     
@@ -159,9 +163,10 @@ def apply_networking_files(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "networking_debug_output.txt"
+    debug_file = PROJECT_ROOT / "networking_debug_output.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'networking_debug_output')
     print(f"🔍 Full output saved to: networking_debug_output.txt")
     
     # Look for Swift files with FILE: markers
@@ -7,9 +7,12 @@ No more empty files! No more excuses! DELIVER REAL CODE!
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
 
 # =============================================================================
 # TOUGH LOVE AGENTS - NO MORE MR. NICE GUY
@@ -80,12 +83,12 @@ architecture_demands = Task(
 )
 
 implementation_demands = Task(
-    description="""
+    description=f"""
     TIME TO DELIVER! Write COMPLETE, FUNCTIONAL Swift networking code. NO EMPTY FILES!
     
     **PROJECT STRUCTURE - PAY ATTENTION:**
-    - Main app code goes in: /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/
-    - Tests go in EXISTING folder: /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests/ 
+    - Main app code goes in: {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/
+    - Tests go in EXISTING folder: {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests/ 
     - DO NOT create new test folders!
     
     **MANDATORY FILES WITH COMPLETE IMPLEMENTATION:**
@@ -133,12 +136,12 @@ implementation_demands = Task(
 )
 
 testing_demands = Task(
-    description="""
+    description=f"""
     TEST EVERYTHING! Write REAL unit tests that actually validate functionality!
     
     **TESTING REQUIREMENTS - NON-NEGOTIABLE:**
     
-    Put ALL test files in: /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests/
+    Put ALL test files in: {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests/
     DO NOT create new test directories!
     
     **MANDATORY TEST FILES:**
@@ -202,9 +205,10 @@ def create_networking_files_properly(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "strict_networking_debug.txt"
+    debug_file = PROJECT_ROOT / "strict_networking_debug.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'strict_networking_debug')
     print(f"🔍 Debug output: strict_networking_debug.txt")
     
     # Extract Swift files
@@ -258,6 +262,7 @@ def create_networking_files_properly(crew_result):
     
     return files_created
 
+@profiled
 def create_proper_networking_fallback(main_dir, tests_dir):
     """Create REAL networking files, not empty shells"""
     
@@ -8,10 +8,13 @@ NO EMPTY TEST METHODS! NO PLACEHOLDER TESTS!
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
-test_output_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
+test_output_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests"
 
 # =============================================================================
 # TESTING-OBSESSED AGENTS - ONLY ONE MISSION
@@ -164,10 +167,10 @@ mock_creation_task = Task(
 )
 
 test_implementation_task = Task(
-    description="""
+    description=f"""
     WRITE COMPLETE UNIT TESTS - Every test must actually test something!
     
-    **FILES TO CREATE IN:** /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests/
+    **FILES TO CREATE IN:** {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests/
     
     **MANDATORY TEST FILES:**
     
@@ -217,16 +220,16 @@ test_implementation_task = Task(
     import XCTest
     @testable import TwitterClone
     
-    final class NetworkManagerTests: XCTestCase {
+    final class NetworkManagerTests: XCTestCase {{
         var networkManager: NetworkManager!
         var mockURLSession: MockURLSession!
         
-        override func setUp() {
+        override func setUp() {{
             super.setUp()
             // COMPLETE SETUP HERE
-        }
+        }}
         
-        func testSuccessfulAPIRequest() async {
+        func testSuccessfulAPIRequest() async {{
             // Arrange
             // COMPLETE IMPLEMENTATION
             
@@ -235,8 +238,8 @@ test_implementation_task = Task(
             
             // Assert
             // COMPLETE IMPLEMENTATION
-        }
-    }
+        }}
+    }}
     ```
     
     NO EMPTY TEST BODIES! Every test must have real implementation!
@@ -261,9 +264,10 @@ def create_test_files_aggressively(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "focused_testing_debug.txt"
+    debug_file = PROJECT_ROOT / "focused_testing_debug.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'focused_testing_debug')
     print(f"🔍 Debug output: focused_testing_debug.txt")
     
     # Extract Swift test files
@@ -319,6 +323,7 @@ def create_test_files_aggressively(crew_result):
     
     return files_created
 
+@profiled
 def create_professional_test_fallbacks(tests_dir):
     """Create professional-grade test files as fallback"""
     
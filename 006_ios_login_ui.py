@@ -8,10 +8,12 @@ NO PLACEHOLDER VIEWS! NO EMPTY FORMS! REAL SWIFTUI COMPONENTS!
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # UI-FOCUSED AGENTS - LOGIN SCREEN SPECIALISTS
@@ -154,14 +156,14 @@ form_implementation_task = Task(
 )
 
 layout_implementation_task = Task(
-    description="""
+    description=f"""
     CREATE THE COMPLETE LOGIN SCREEN LAYOUT
     
     **LAYOUT IMPLEMENTATION:**
     
     Create complete SwiftUI view file: LoginView.swift
     
-    **FILE LOCATION:** /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/Views/
+    **FILE LOCATION:** {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/Views/
     
     **MANDATORY COMPONENTS:**
     
@@ -212,23 +214,23 @@ layout_implementation_task = Task(
     // FILE: LoginView.swift
     import SwiftUI
     
-    struct LoginView: View {
+    struct LoginView: View {{
         @State private var username: String = ""
         @State private var password: String = ""
         @State private var isLoading: Bool = false
         @State private var errorMessage: String = ""
         @State private var showError: Bool = false
         
-        var body: some View {
+        var body: some View {{
             // COMPLETE IMPLEMENTATION HERE
-        }
-    }
+        }}
+    }}
     
-    struct LoginView_Previews: PreviewProvider {
-        static var previews: some View {
+    struct LoginView_Previews: PreviewProvider {{
+        static var previews: some View {{
             LoginView()
-        }
-    }
+        }}
+    }}
     ```
     
     EVERY COMPONENT MUST BE FULLY IMPLEMENTED! NO PLACEHOLDER VIEWS!
@@ -253,9 +255,10 @@ def create_login_ui_files(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "login_ui_debug.txt"
+    debug_file = PROJECT_ROOT / "login_ui_debug.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'login_ui_debug')
     print(f"🔍 Debug output: login_ui_debug.txt")
     
     # Extract Swift UI files
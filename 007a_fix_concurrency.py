@@ -9,10 +9,20 @@ import os
 import re
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.patch_engine import PATCH_FORMAT_INSTRUCTIONS, file_excerpt, patch_applier
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
-viewmodel_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/ViewModels/LoginViewModel.swift"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
+viewmodel_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/ViewModels/LoginViewModel.swift"
+
+# The expert patches against the real init, so include it (with context) in the task
+current_init = (
+    file_excerpt(viewmodel_path, r'^\s*init\(networkManager:.*?^    \}', context=4)
+    if os.path.exists(viewmodel_path) else "(LoginViewModel.swift not found)"
+)
 
 # =============================================================================
 # SWIFT CONCURRENCY SPECIALISTS
@@ -35,7 +45,7 @@ concurrency_expert = Agent(
 # =============================================================================
 
 fix_mainactor_task = Task(
-    description="""
+    description=f"""
     FIX THE SPECIFIC SWIFT 6 CONCURRENCY ERROR IN LOGINVIEWMODEL
     
     **EXACT ERROR TO FIX:**
@@ -44,9 +54,9 @@ fix_mainactor_task = Task(
     **LOCATION:** LoginViewModel.swift, line 32 (approximately)
     **PROBLEM CODE:**
     ```swift
-    init(networkManager: NetworkManager = NetworkManager.shared) {
+    init(networkManager: NetworkManager = NetworkManager.shared) {{
         self.networkManager = networkManager
-    }
+    }}
     ```
     
     **PROBLEM ANALYSIS:**
@@ -58,36 +68,36 @@ fix_mainactor_task = Task(
     
     **Option 1 - Remove Default Parameter (RECOMMENDED):**
     ```swift
-    init(networkManager: NetworkManager) {
+    init(networkManager: NetworkManager) {{
         self.networkManager = networkManager
-    }
+    }}
     ```
     Then update the usage to explicitly pass NetworkManager.shared
     
     **Option 2 - Static Factory Method:**
     ```swift
-    private init(networkManager: NetworkManager) {
+    private init(networkManager: NetworkManager) {{
         self.networkManager = networkManager
-    }
+    }}
     
     @MainActor
-    static func create() -> LoginViewModel {
+    static func create() -> LoginViewModel {{
         return LoginViewModel(networkManager: NetworkManager.shared)
-    }
+    }}
     ```
     
     **Option 3 - Async Init:**
     ```swift
     private let networkManager: NetworkManager
     
-    private init(networkManager: NetworkManager) {
+    private init(networkManager: NetworkManager) {{
         self.networkManager = networkManager  
-    }
+    }}
     
     @MainActor
-    static func create() async -> LoginViewModel {
+    static func create() async -> LoginViewModel {{
         return LoginViewModel(networkManager: NetworkManager.shared)
-    }
+    }}
     ```
     
     **REQUIREMENTS:**
@@ -97,22 +107,16 @@ fix_mainactor_task = Task(
     4. Use minimal changes
     5. Don't break existing functionality
     
-    **FILE TO MODIFY:** /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/ViewModels/LoginViewModel.swift
+    **FILE TO MODIFY:** {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/ViewModels/LoginViewModel.swift
     
-    **OUTPUT FORMAT:**
+    **CURRENT CODE (LoginViewModel.swift):**
     ```swift
-    // FILE: LoginViewModel.swift
-    // ONLY SHOW THE CHANGED SECTIONS, NOT THE ENTIRE FILE
-    
-    // MARK: - Initialization (FIXED)
-    init(networkManager: NetworkManager) {
-        self.networkManager = networkManager
-    }
+    """ + current_init + """
     ```
-    
+    """ + PATCH_FORMAT_INSTRUCTIONS + """
     Choose the cleanest solution and implement it properly!
     """,
-    expected_output="Fixed LoginViewModel.swift with Swift 6 concurrency error resolved",
+    expected_output="Search/replace blocks for LoginViewModel.swift resolving the Swift 6 concurrency error",
     agent=concurrency_expert
 )
 
@@ -120,6 +124,7 @@ fix_mainactor_task = Task(
 # CONCURRENCY FIX IMPLEMENTATION
 # =============================================================================
 
+@profiled
 def apply_concurrency_fixes(crew_result):
     """Apply the concurrency fixes to LoginViewModel"""
     
@@ -128,53 +133,30 @@ def apply_concurrency_fixes(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "concurrency_fix_debug.txt"
+    debug_file = PROJECT_ROOT / "concurrency_fix_debug.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'concurrency_fix_debug')
     print(f"🔍 Debug output: concurrency_fix_debug.txt")
     
-    # Read current LoginViewModel
-    try:
-        with open(viewmodel_path, 'r') as f:
-            current_content = f.read()
-        print(f"📖 Read current LoginViewModel ({len(current_content)} chars)")
-    except Exception as e:
-        print(f"❌ Failed to read LoginViewModel: {str(e)}")
-        return False
+    # Apply the expert's hunks; the known good fix replaces the rewrite on conflict
+    def professional_rewrite(current_content, reason):
+        print("\n🔥 APPLYING PROFESSIONAL FALLBACK FIX...")
+        return professional_concurrency_content(current_content)
     
-    # Extract fix from crew result
+    if not patch_applier.apply(viewmodel_path, result_text, rewrite=professional_rewrite):
+        return False
     
-    # Look for the fixed init method
-    fix_pattern = r'// MARK: - Initialization.*?\n(.*?init.*?\{[\s\S]*?\})'
-    fix_match = re.search(fix_pattern, result_text, re.MULTILINE | re.DOTALL)
+    if "= NetworkManager.shared)" in Path(viewmodel_path).read_text():
+        print("⚠️  Patch left the MainActor default argument in place")
+        return apply_professional_concurrency_fix(Path(viewmodel_path).read_text())
     
-    if fix_match:
-        new_init = fix_match.group(1).strip()
-        print(f"🔧 Found init fix: {new_init[:50]}...")
-        
-        # Replace the problematic init in current content
-        old_init_pattern = r'init\(networkManager: NetworkManager = NetworkManager\.shared\) \{[\s\S]*?\n    \}'
-        
-        if re.search(old_init_pattern, current_content):
-            fixed_content = re.sub(old_init_pattern, new_init, current_content)
-            
-            try:
-                with open(viewmodel_path, 'w') as f:
-                    f.write(fixed_content)
-                print("✅ Applied concurrency fix to LoginViewModel.swift")
-                return True
-            except Exception as e:
-                print(f"❌ Failed to write fixed file: {str(e)}")
-                return False
-        else:
-            print("⚠️  Could not find the problematic init pattern to replace")
-            
-    # Fallback: Apply known good fix
-    print("\n🔥 APPLYING PROFESSIONAL FALLBACK FIX...")
-    return apply_professional_concurrency_fix(current_content)
+    print("✅ Applied concurrency fix to LoginViewModel.swift")
+    print(patch_applier.report())
+    return True
 
-def apply_professional_concurrency_fix(current_content):
-    """Apply the known good concurrency fix"""
+def professional_concurrency_content(current_content):
+    """Return LoginViewModel content with the known good concurrency fix"""
     
     # Replace the problematic init
     old_pattern = r'init\(networkManager: NetworkManager = NetworkManager\.shared\) \{\s*self\.networkManager = networkManager\s*\}'
@@ -198,6 +180,14 @@ def apply_professional_concurrency_fix(current_content):
     if insertion_point != -1:
         fixed_content = fixed_content[:insertion_point] + factory_method + '\n    ' + fixed_content[insertion_point:]
     
+    return fixed_content
+
+@profiled
+def apply_professional_concurrency_fix(current_content):
+    """Apply the known good concurrency fix"""
+    
+    fixed_content = professional_concurrency_content(current_content)
+    
     try:
         with open(viewmodel_path, 'w') as f:
             f.write(fixed_content)
@@ -9,11 +9,14 @@ SOLUTION: Protocol-based dependency injection
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
-test_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
+test_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests"
 
 # =============================================================================
 # DEPENDENCY INJECTION SPECIALISTS
@@ -36,7 +39,7 @@ protocol_architect = Agent(
 # =============================================================================
 
 protocol_injection_task = Task(
-    description="""
+    description=f"""
     FIX THE MOCK INJECTION ISSUE WITH PROTOCOL-BASED DEPENDENCY INJECTION
     
     **EXACT ERROR TO FIX:**
@@ -57,27 +60,27 @@ protocol_injection_task = Task(
     **SOLUTION ARCHITECTURE:**
     
     **Step 1: Create NetworkManagerProtocol**
-    Create file: /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/Networking/NetworkManagerProtocol.swift
+    Create file: {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/Networking/NetworkManagerProtocol.swift
     
     ```swift
     // FILE: NetworkManagerProtocol.swift
     import Foundation
     
-    protocol NetworkManagerProtocol {
+    protocol NetworkManagerProtocol {{
         func request<T: Codable>(
             endpoint: APIEndpoint,
             responseType: T.Type,
             token: String?
         ) async throws -> T
-    }
+    }}
     ```
     
     **Step 2: Make NetworkManager conform to protocol**
     Update NetworkManager.swift to add protocol conformance:
     ```swift
-    extension NetworkManager: NetworkManagerProtocol {
+    extension NetworkManager: NetworkManagerProtocol {{
         // Already has the required method, just add conformance
-    }
+    }}
     ```
     
     **Step 3: Update LoginViewModel to use protocol**
@@ -85,17 +88,17 @@ protocol_injection_task = Task(
     ```swift
     private let networkManager: NetworkManagerProtocol  // Changed from NetworkManager
     
-    init(networkManager: NetworkManagerProtocol) {      // Changed parameter type
+    init(networkManager: NetworkManagerProtocol) {{      // Changed parameter type
         self.networkManager = networkManager
-    }
+    }}
     ```
     
     **Step 4: Make MockNetworkManager conform to protocol**
     Update MockNetworkManager.swift:
     ```swift
-    class MockNetworkManager: NetworkManagerProtocol {
+    class MockNetworkManager: NetworkManagerProtocol {{
         // Already has the required method, just add conformance
-    }
+    }}
     ```
     
     **Step 5: Fix test setup**
@@ -124,25 +127,25 @@ protocol_injection_task = Task(
     // FILE: NetworkManagerProtocol.swift
     import Foundation
     
-    protocol NetworkManagerProtocol {
+    protocol NetworkManagerProtocol {{
         // COMPLETE PROTOCOL DEFINITION
-    }
+    }}
     ```
     
     ```swift
     // FILE: NetworkManager.swift - ADD THIS EXTENSION
-    extension NetworkManager: NetworkManagerProtocol {
+    extension NetworkManager: NetworkManagerProtocol {{
         // Protocol conformance (method already exists)
-    }
+    }}
     ```
     
     ```swift
     // FILE: LoginViewModel.swift - CHANGE THESE LINES
     private let networkManager: NetworkManagerProtocol  // Changed type
     
-    init(networkManager: NetworkManagerProtocol) {      // Changed parameter
+    init(networkManager: NetworkManagerProtocol) {{      // Changed parameter
         self.networkManager = networkManager
-    }
+    }}
     ```
     
     Show ALL required changes for complete solution!
@@ -155,6 +158,7 @@ protocol_injection_task = Task(
 # DEPENDENCY INJECTION IMPLEMENTATION
 # =============================================================================
 
+@profiled
 def apply_protocol_injection_fixes(crew_result):
     """Apply the protocol-based dependency injection fixes"""
     
@@ -163,9 +167,10 @@ def apply_protocol_injection_fixes(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "protocol_injection_debug.txt"
+    debug_file = PROJECT_ROOT / "protocol_injection_debug.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'protocol_injection_debug')
     print(f"🔍 Debug output: protocol_injection_debug.txt")
     
     # Extract file changes from crew result
@@ -324,6 +329,7 @@ def fix_test_setup(content):
         print(f"❌ Failed to fix test setup: {str(e)}")
         return False
 
+@profiled
 def apply_professional_protocol_injection():
     """Apply professional protocol-based dependency injection solution"""
     
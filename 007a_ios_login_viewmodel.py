@@ -8,10 +8,12 @@ NO DIRECT UI-TO-NETWORK CALLS! PROPER MVVM SEPARATION!
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # MVVM SPECIALISTS - VIEWMODEL LAYER EXPERTS
@@ -157,12 +159,12 @@ state_management_task = Task(
 )
 
 networking_integration_task = Task(
-    description="""
+    description=f"""
     IMPLEMENT NETWORKING INTEGRATION AND API CALLS
     
     **NETWORKING REQUIREMENTS:**
     
-    Create complete LoginViewModel.swift file in: /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/ViewModels/
+    Create complete LoginViewModel.swift file in: {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/ViewModels/
     
     **API INTEGRATION:**
     
@@ -174,15 +176,15 @@ networking_integration_task = Task(
     
     2. **Login Method Implementation:**
        ```swift
-       func login() async {
-           guard canSubmit else { return }
+       func login() async {{
+           guard canSubmit else {{ return }}
            
-           await MainActor.run {
+           await MainActor.run {{
                isLoading = true
                clearError()
-           }
+           }}
            
-           do {
+           do {{
                let response: AuthResponse = try await networkManager.request(
                    endpoint: .login(username: username, password: password),
                    responseType: AuthResponse.self
@@ -190,10 +192,10 @@ networking_integration_task = Task(
                
                await handleLoginSuccess(response)
                
-           } catch {
+           }} catch {{
                await handleLoginError(error)
-           }
-       }
+           }}
+       }}
        ```
     
     3. **Response Handling:**
@@ -220,9 +222,9 @@ networking_integration_task = Task(
     import SwiftUI
     
     @MainActor
-    class LoginViewModel: ObservableObject {
+    class LoginViewModel: ObservableObject {{
         // COMPLETE IMPLEMENTATION HERE
-    }
+    }}
     ```
     
     **INTEGRATION REQUIREMENTS:**
@@ -254,9 +256,10 @@ def create_viewmodel_files(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "login_viewmodel_debug.txt"
+    debug_file = PROJECT_ROOT / "login_viewmodel_debug.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'login_viewmodel_debug')
     print(f"🔍 Debug output: login_viewmodel_debug.txt")
     
     # Extract Swift ViewModel files
@@ -8,10 +8,12 @@ NO EMPTY TEST METHODS! NO PLACEHOLDER TESTS! REAL VALIDATION!
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
-test_output_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
+test_output_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests"
 
 # =============================================================================
 # VIEWMODEL TESTING SPECIALISTS
@@ -118,14 +120,14 @@ test_strategy_task = Task(
 )
 
 mock_implementation_task = Task(
-    description="""
+    description=f"""
     CREATE MOCK NETWORKMANAGER FOR VIEWMODEL TESTING
     
     **MOCK NETWORKMANAGER REQUIREMENTS:**
     
     Create MockNetworkManager.swift for testing LoginViewModel in isolation.
     
-    **FILE LOCATION:** /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests/
+    **FILE LOCATION:** {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests/
     
     **MOCK CAPABILITIES:**
     
@@ -157,7 +159,7 @@ mock_implementation_task = Task(
     import Foundation
     @testable import TwitterClone
     
-    class MockNetworkManager {
+    class MockNetworkManager {{
         // Configuration properties
         var shouldSucceed: Bool = true
         var mockAuthResponse: AuthResponse?
@@ -172,10 +174,10 @@ mock_implementation_task = Task(
             endpoint: APIEndpoint,
             responseType: T.Type,
             token: String? = nil
-        ) async throws -> T {
+        ) async throws -> T {{
             // COMPLETE IMPLEMENTATION
-        }
-    }
+        }}
+    }}
     ```
     
     **MOCK BEHAVIOR:**
@@ -192,10 +194,10 @@ mock_implementation_task = Task(
 )
 
 viewmodel_tests_implementation = Task(
-    description="""
+    description=f"""
     IMPLEMENT COMPREHENSIVE LOGINVIEWMODEL UNIT TESTS
     
-    **TEST FILE TO CREATE:** /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests/LoginViewModelTests.swift
+    **TEST FILE TO CREATE:** {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests/LoginViewModelTests.swift
     
     **MANDATORY TEST METHODS:**
     
@@ -245,7 +247,7 @@ viewmodel_tests_implementation = Task(
     
     **ASYNC TESTING PATTERN:**
     ```swift
-    func testLoginSuccess() async {
+    func testLoginSuccess() async {{
         // Arrange
         mockNetworkManager.shouldSucceed = true
         mockNetworkManager.mockAuthResponse = AuthResponse(...)
@@ -259,7 +261,7 @@ viewmodel_tests_implementation = Task(
         XCTAssertTrue(viewModel.isLoggedIn)
         XCTAssertFalse(viewModel.isLoading)
         XCTAssertEqual(mockNetworkManager.callCount, 1)
-    }
+    }}
     ```
     
     **OUTPUT FORMAT:**
@@ -270,17 +272,17 @@ viewmodel_tests_implementation = Task(
     @testable import TwitterClone
     
     @MainActor
-    final class LoginViewModelTests: XCTestCase {
+    final class LoginViewModelTests: XCTestCase {{
         var viewModel: LoginViewModel!
         var mockNetworkManager: MockNetworkManager!
         
-        override func setUp() {
+        override func setUp() {{
             super.setUp()
             // COMPLETE SETUP
-        }
+        }}
         
         // ALL TEST METHODS WITH COMPLETE IMPLEMENTATION
-    }
+    }}
     ```
     
     EVERY TEST METHOD MUST HAVE REAL IMPLEMENTATION! NO EMPTY BODIES!
@@ -305,9 +307,10 @@ def create_viewmodel_test_files(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "viewmodel_tests_debug.txt"
+    debug_file = PROJECT_ROOT / "viewmodel_tests_debug.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'viewmodel_tests_debug')
     print(f"🔍 Debug output: viewmodel_tests_debug.txt")
     
     # Extract Swift test files
@@ -8,11 +8,14 @@ FOLLOW THE TEST SPECIFICATIONS EXACTLY!
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
-test_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
+test_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests"
 
 # =============================================================================
 # JWT INTEGRATION SPECIALISTS
@@ -107,12 +110,12 @@ auth_integration_task = Task(
 )
 
 secure_storage_task = Task(
-    description="""
+    description=f"""
     IMPLEMENT SECURE JWT STORAGE AND AUTHMANAGER ENHANCEMENTS
     
     **AUTHMANAGER SECURITY REQUIREMENTS:**
     
-    File to enhance: /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/Networking/AuthManager.swift
+    File to enhance: {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/Networking/AuthManager.swift
     
     **REQUIRED ENHANCEMENTS:**
     
@@ -131,36 +134,36 @@ secure_storage_task = Task(
     3. **Enhanced Methods Needed:**
        ```swift
        // Enhanced login method
-       func login(user: User, token: String) {
+       func login(user: User, token: String) {{
            saveToken(token)
            saveUser(user)
            
-           DispatchQueue.main.async {
+           DispatchQueue.main.async {{
                self.currentUser = user
                self.isAuthenticated = true
-           }
-       }
+           }}
+       }}
        
        // Enhanced logout method
-       func logout() {
+       func logout() {{
            clearToken()
            clearUser()
            
-           DispatchQueue.main.async {
+           DispatchQueue.main.async {{
                self.currentUser = nil
                self.isAuthenticated = false
-           }
-       }
+           }}
+       }}
        
        // Token validation
-       func isTokenValid() -> Bool {
+       func isTokenValid() -> Bool {{
            // Check if token exists and is not expired
-       }
+       }}
        
        // Get current authentication state
-       func checkAuthenticationState() {
+       func checkAuthenticationState() {{
            // Verify stored token and update state accordingly
-       }
+       }}
        ```
     
     4. **Error Handling:**
@@ -184,12 +187,12 @@ secure_storage_task = Task(
 )
 
 viewmodel_integration_task = Task(
-    description="""
+    description=f"""
     INTEGRATE LOGINVIEWMODEL WITH AUTHMANAGER
     
     **LOGINVIEWMODEL INTEGRATION REQUIREMENTS:**
     
-    File to modify: /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/ViewModels/LoginViewModel.swift
+    File to modify: {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/ViewModels/LoginViewModel.swift
     
     **REQUIRED CHANGES:**
     
@@ -197,15 +200,15 @@ viewmodel_integration_task = Task(
        ```swift
        private let authManager: AuthManager
        
-       init(networkManager: NetworkManagerProtocol, authManager: AuthManager = AuthManager()) {
+       init(networkManager: NetworkManagerProtocol, authManager: AuthManager = AuthManager()) {{
            self.networkManager = networkManager
            self.authManager = authManager
-       }
+       }}
        ```
     
     2. **Update handleLoginSuccess Method:**
        ```swift
-       private func handleLoginSuccess(_ response: AuthResponse) async {
+       private func handleLoginSuccess(_ response: AuthResponse) async {{
            // Store authentication data securely
            authManager.login(user: response.user, token: response.token)
            
@@ -218,12 +221,12 @@ viewmodel_integration_task = Task(
            
            print("Login successful! User: \\(response.user.username)")
            // DO NOT print token for security
-       }
+       }}
        
-       private func clearFormData() {
+       private func clearFormData() {{
            username = ""
            password = ""
-       }
+       }}
        ```
     
     3. **Add Authentication State Monitoring:**
@@ -231,22 +234,22 @@ viewmodel_integration_task = Task(
        // Monitor AuthManager state changes
        private var authCancellable: AnyCancellable?
        
-       private func setupAuthStateMonitoring() {
+       private func setupAuthStateMonitoring() {{
            authCancellable = authManager.$isAuthenticated
-               .sink { [weak self] isAuthenticated in
-                   DispatchQueue.main.async {
+               .sink {{ [weak self] isAuthenticated in
+                   DispatchQueue.main.async {{
                        self?.isLoggedIn = isAuthenticated
-                   }
-               }
-       }
+                   }}
+               }}
+       }}
        ```
     
     4. **Add Logout Capability:**
        ```swift
-       func logout() {
+       func logout() {{
            authManager.logout()
            reset()
-       }
+       }}
        ```
     
     5. **Enhanced Error Handling:**
@@ -278,6 +281,7 @@ viewmodel_integration_task = Task(
 # JWT INTEGRATION IMPLEMENTATION
 # =============================================================================
 
+@profiled
 def apply_jwt_integration(crew_result):
     """Apply JWT integration changes to existing files"""
     
@@ -286,9 +290,10 @@ def apply_jwt_integration(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "jwt_integration_debug.txt"
+    debug_file = PROJECT_ROOT / "jwt_integration_debug.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'jwt_integration_debug')
     print(f"🔍 Debug output: jwt_integration_debug.txt")
     
     changes_applied = []
@@ -307,6 +312,7 @@ def apply_jwt_integration(crew_result):
     
     return changes_applied
 
+@profiled
 def apply_professional_jwt_integration():
     """Apply professional JWT integration implementation"""
     
@@ -8,10 +8,12 @@ Test AuthManager integration, state sync, and secure storage patterns!
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
-test_output_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
+test_output_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests"
 
 # =============================================================================
 # JWT INTEGRATION TESTING SPECIALISTS
@@ -120,14 +122,14 @@ jwt_test_strategy_task = Task(
 )
 
 mock_auth_implementation_task = Task(
-    description="""
+    description=f"""
     CREATE MOCKAUTHORMANAGER FOR JWT INTEGRATION TESTING
     
     **MOCK AUTHMANAGER REQUIREMENTS:**
     
     Create MockAuthManager.swift for testing JWT integration that doesn't exist yet.
     
-    **FILE LOCATION:** /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests/
+    **FILE LOCATION:** {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests/
     
     **MOCK CAPABILITIES:**
     
@@ -146,10 +148,10 @@ mock_auth_implementation_task = Task(
        @Published var currentUser: User?
        
        // Simulate state changes
-       func simulateAuthenticationChange(isAuthenticated: Bool, user: User?) {
+       func simulateAuthenticationChange(isAuthenticated: Bool, user: User?) {{
            self.isAuthenticated = isAuthenticated
            self.currentUser = user
-       }
+       }}
        ```
     
     3. **Configurable Behavior:**
@@ -157,27 +159,27 @@ mock_auth_implementation_task = Task(
        var shouldFailLogin: Bool = false
        var loginError: Error?
        
-       func login(user: User, token: String) {
+       func login(user: User, token: String) {{
            loginCallCount += 1
            lastLoginUser = user
            lastLoginToken = token
            
-           if shouldFailLogin {
+           if shouldFailLogin {{
                // Simulate login failure
                return
-           }
+           }}
            
            // Simulate successful login
-           DispatchQueue.main.async {
+           DispatchQueue.main.async {{
                self.currentUser = user
                self.isAuthenticated = true
-           }
-       }
+           }}
+       }}
        ```
     
     4. **Reset Capability:**
        ```swift
-       func reset() {
+       func reset() {{
            loginCallCount = 0
            logoutCallCount = 0
            lastLoginUser = nil
@@ -186,7 +188,7 @@ mock_auth_implementation_task = Task(
            loginError = nil
            isAuthenticated = false
            currentUser = nil
-       }
+       }}
        ```
     
     **COMPLETE MOCK INTERFACE:**
@@ -196,7 +198,7 @@ mock_auth_implementation_task = Task(
     import Combine
     @testable import TwitterClone
     
-    class MockAuthManager: ObservableObject {
+    class MockAuthManager: ObservableObject {{
         // @Published properties to match real AuthManager
         @Published var isAuthenticated: Bool = false
         @Published var currentUser: User?
@@ -212,7 +214,7 @@ mock_auth_implementation_task = Task(
         var loginError: Error?
         
         // COMPLETE IMPLEMENTATION HERE
-    }
+    }}
     ```
     
     **INTEGRATION MATCHING:**
@@ -226,10 +228,10 @@ mock_auth_implementation_task = Task(
 )
 
 jwt_integration_tests_implementation = Task(
-    description="""
+    description=f"""
     IMPLEMENT COMPREHENSIVE JWT INTEGRATION TESTS
     
-    **TEST FILE TO CREATE:** /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterCloneTests/LoginViewModelJWTIntegrationTests.swift
+    **TEST FILE TO CREATE:** {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterCloneTests/LoginViewModelJWTIntegrationTests.swift
     
     **MANDATORY TEST METHODS (PRE-IMPLEMENTATION):**
     
@@ -283,7 +285,7 @@ jwt_integration_tests_implementation = Task(
     
     **TDD TEST PATTERN:**
     ```swift
-    func testSuccessfulLoginCallsAuthManagerLogin() async {
+    func testSuccessfulLoginCallsAuthManagerLogin() async {{
         // Arrange
         let testUser = User(...)
         let testToken = "test-jwt-token"
@@ -303,7 +305,7 @@ jwt_integration_tests_implementation = Task(
         XCTAssertEqual(mockAuthManager.lastLoginUser?.username, testUser.username)
         XCTAssertEqual(viewModel.username, "") // Form should be cleared
         XCTAssertEqual(viewModel.password, "") // Form should be cleared
-    }
+    }}
     ```
     
     **FILE STRUCTURE:**
@@ -314,19 +316,19 @@ jwt_integration_tests_implementation = Task(
     @testable import TwitterClone
     
     @MainActor
-    final class LoginViewModelJWTIntegrationTests: XCTestCase {
+    final class LoginViewModelJWTIntegrationTests: XCTestCase {{
         var viewModel: LoginViewModel!
         var mockNetworkManager: MockNetworkManager!
         var mockAuthManager: MockAuthManager!
         var cancellables: Set<AnyCancellable>!
         
-        override func setUp() {
+        override func setUp() {{
             super.setUp()
             // COMPLETE SETUP WITH MOCKS
-        }
+        }}
         
         // ALL TEST METHODS WITH COMPLETE TDD IMPLEMENTATION
-    }
+    }}
     ```
     
     EVERY TEST MUST TEST FUNCTIONALITY THAT DOESN'T EXIST YET!
@@ -351,9 +353,10 @@ def create_jwt_integration_test_files(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "jwt_integration_tests_debug.txt"
+    debug_file = PROJECT_ROOT / "jwt_integration_tests_debug.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'jwt_integration_tests_debug')
     print(f"🔍 Debug output: jwt_integration_tests_debug.txt")
     
     # Extract Swift test files
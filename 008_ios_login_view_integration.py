@@ -8,10 +8,13 @@ NO HARDCODED UI! NO FAKE BUTTONS! REAL MVVM INTEGRATION!
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
 # Set working directory
-ios_project_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone"
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+ios_project_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # LOGIN VIEW INTEGRATION SPECIALISTS
@@ -177,22 +180,22 @@ ui_states_implementation_task = Task(
 )
 
 view_integration_implementation_task = Task(
-    description="""
+    description=f"""
     IMPLEMENT COMPLETE LOGINVIEW INTEGRATION WITH LOGINVIEWMODEL
     
-    **FILE TO MODIFY:** /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/Views/LoginView.swift
+    **FILE TO MODIFY:** {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/Views/LoginView.swift
     
     **COMPLETE INTEGRATION IMPLEMENTATION:**
     
     1. **ViewModel Integration:**
        ```swift
-       struct LoginView: View {
+       struct LoginView: View {{
            @StateObject private var viewModel = LoginViewModel.createDefault()
            
-           var body: some View {
+           var body: some View {{
                // COMPLETE IMPLEMENTATION
-           }
-       }
+           }}
+       }}
        ```
     
     2. **Form Binding:**
@@ -213,47 +216,47 @@ view_integration_implementation_task = Task(
     
     3. **Login Button Integration:**
        ```swift
-       Button(action: {
-           Task {
+       Button(action: {{
+           Task {{
                await viewModel.login()
-           }
-       }) {
-           HStack {
-               if viewModel.isLoading {
+           }}
+       }}) {{
+           HStack {{
+               if viewModel.isLoading {{
                    ProgressView()
                        .progressViewStyle(CircularProgressViewStyle(tint: .white))
                        .scaleEffect(0.8)
-               }
+               }}
                Text(viewModel.loginButtonTitle)
                    .fontWeight(.semibold)
-           }
+           }}
            .frame(maxWidth: .infinity)
            .padding()
            .background(viewModel.canSubmit ? Color.blue : Color.gray)
            .foregroundColor(.white)
            .cornerRadius(8)
-       }
+       }}
        .disabled(!viewModel.canSubmit)
        ```
     
     4. **Error Handling:**
        ```swift
-       .alert("Login Error", isPresented: $viewModel.showError) {
-           Button("OK") {
+       .alert("Login Error", isPresented: $viewModel.showError) {{
+           Button("OK") {{
                viewModel.clearError()
-           }
-       } message: {
+           }}
+       }} message: {{
            Text(viewModel.errorMessage)
-       }
+       }}
        ```
     
     5. **Navigation Integration:**
        ```swift
-       .fullScreenCover(isPresented: $viewModel.isLoggedIn) {
+       .fullScreenCover(isPresented: $viewModel.isLoggedIn) {{
            // Navigate to main app
            Text("Welcome! You are logged in.")
                .navigationTitle("Dashboard")
-       }
+       }}
        ```
     
     **COMPLETE FILE STRUCTURE:**
@@ -261,44 +264,44 @@ view_integration_implementation_task = Task(
     // FILE: LoginView.swift
     import SwiftUI
     
-    struct LoginView: View {
+    struct LoginView: View {{
         @StateObject private var viewModel = LoginViewModel.createDefault()
         
-        var body: some View {
-            NavigationView {
-                ScrollView {
-                    VStack(spacing: 32) {
+        var body: some View {{
+            NavigationView {{
+                ScrollView {{
+                    VStack(spacing: 32) {{
                         // Header Section
-                        VStack(spacing: 16) {
+                        VStack(spacing: 16) {{
                             // App logo and title
-                        }
+                        }}
                         
                         // Form Section
-                        VStack(spacing: 20) {
+                        VStack(spacing: 20) {{
                             // Username field with ViewModel binding
                             // Password field with ViewModel binding
-                        }
+                        }}
                         
                         // Action Section
-                        VStack(spacing: 16) {
+                        VStack(spacing: 16) {{
                             // Login button with ViewModel integration
                             // Create account button
-                        }
-                    }
+                        }}
+                    }}
                     .padding(.horizontal, 24)
-                }
+                }}
                 .navigationBarHidden(true)
-            }
-            .alert("Login Error", isPresented: $viewModel.showError) {
-                Button("OK") { viewModel.clearError() }
-            } message: {
+            }}
+            .alert("Login Error", isPresented: $viewModel.showError) {{
+                Button("OK") {{ viewModel.clearError() }}
+            }} message: {{
                 Text(viewModel.errorMessage)
-            }
-            .fullScreenCover(isPresented: $viewModel.isLoggedIn) {
+            }}
+            .fullScreenCover(isPresented: $viewModel.isLoggedIn) {{
                 // Main app navigation
-            }
-        }
-    }
+            }}
+        }}
+    }}
     ```
     
     **INTEGRATION REQUIREMENTS:**
@@ -320,6 +323,7 @@ view_integration_implementation_task = Task(
 # LOGIN VIEW INTEGRATION IMPLEMENTATION
 # =============================================================================
 
+@profiled
 def apply_login_view_integration(crew_result):
     """Apply the LoginView integration with LoginViewModel"""
     
@@ -328,9 +332,10 @@ def apply_login_view_integration(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "login_view_integration_debug.txt"
+    debug_file = PROJECT_ROOT / "login_view_integration_debug.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'login_view_integration_debug')
     print(f"🔍 Debug output: login_view_integration_debug.txt")
     
     # Extract and apply LoginView changes
@@ -376,6 +381,7 @@ def update_login_view_integration(content):
         print(f"❌ Failed to update LoginView: {str(e)}")
         return False
 
+@profiled
 def apply_professional_login_view_integration():
     """Apply professional LoginView-LoginViewModel integration"""
     
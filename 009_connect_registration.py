@@ -7,6 +7,8 @@ Fix the RegistrationView to use the RegistrationViewModel like LoginView does
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.workspace import PROJECT_ROOT
 
 # =============================================================================
 # AGENT
@@ -83,8 +85,9 @@ if __name__ == "__main__":
         result = crew.kickoff()
         
         # Save result
-        with open("/Users/garethhallberg/Desktop/twitter-clone-crewai/registration_connection_debug.txt", 'w') as f:
+        with open(f"{PROJECT_ROOT}/registration_connection_debug.txt", 'w') as f:
             f.write(str(result))
+        record_output(str(result), __file__, 'registration_connection_debug')
         
         print("\n✅ Task completed! Check registration_connection_debug.txt for results")
         print("💡 Apply the suggested changes to RegistrationView.swift")
@@ -8,8 +8,9 @@ NO DEBUG FILES! NO EXCUSES! ACTUAL WORKING CODE!
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.workspace import PROJECT_ROOT
 
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # TOUGH LOVE AGENTS - NO NONSENSE
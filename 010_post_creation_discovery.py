@@ -6,7 +6,10 @@ Create a post creation screen for authenticated users
 
 import os
 from pathlib import Path
-from crewai import Agent, Task, Crew, Process
+from crewai import Agent, Task
+from src.artifact_store import record_output
+from src.model_router import model_router
+from src.workspace import PROJECT_ROOT
 
 # =============================================================================
 # PROBLEM-SOLVING AGENTS
@@ -165,6 +168,12 @@ design_integration_strategy_task = Task(
     depends_on=[research_backend_api_task]
 )
 
+DISCOVERY_TASKS = [analyze_existing_structure_task, research_backend_api_task, design_integration_strategy_task]
+
+def is_substantial_strategy(crew_result):
+    """A usable strategy is more than a couple of paragraphs"""
+    return len(str(crew_result).strip()) > 1500
+
 # =============================================================================
 # EXECUTION
 # =============================================================================
@@ -175,24 +184,25 @@ if __name__ == "__main__":
     print("🕵️ Let the agents figure out how to build this feature...")
     print("=" * 60)
     
-    crew = Crew(
-        agents=[ios_architect, backend_analyst, integration_designer],
-        tasks=[analyze_existing_structure_task, research_backend_api_task, design_integration_strategy_task],
-        process=Process.sequential,
-        verbose=True
-    )
-    
     try:
-        result = crew.kickoff()
+        # Discovery starts on the cheap tier and only escalates if the strategy comes back thin
+        result, _ = model_router.kickoff_with_escalation(
+            build_crew=lambda tier: model_router.build_crew(DISCOVERY_TASKS, tier=tier, verbose=True),
+            validate=is_substantial_strategy,
+            start_tier=model_router.tier_for(task_type='discovery'),
+            label='post creation discovery'
+        )
         
         # Save the analysis
-        with open("/Users/garethhallberg/Desktop/twitter-clone-crewai/post_creation_analysis.txt", 'w') as f:
+        with open(f"{PROJECT_ROOT}/post_creation_analysis.txt", 'w') as f:
             f.write(str(result))
+        record_output(str(result), __file__, 'post_creation_analysis')
         
         print("\n" + "=" * 60)
         print("🎯 DISCOVERY COMPLETE!")
         print("📋 Analysis saved to: post_creation_analysis.txt")
         print("💡 Review the agent findings, then we'll move to implementation")
+        print(model_router.report())
         print("=" * 60)
         
     except Exception as e:
@@ -7,8 +7,11 @@ Now implement the post creation feature based on your discovery
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # IMPLEMENTATION AGENTS
@@ -149,15 +152,17 @@ integrate_navigation_task = Task(
 # FILE CREATION
 # =============================================================================
 
+@profiled
 def apply_post_creation_implementation(crew_result):
     """Extract and create the post creation files"""
     
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "post_creation_implementation.txt"
+    debug_file = PROJECT_ROOT / "post_creation_implementation.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'post_creation_implementation')
     print(f"🔍 Implementation saved to: post_creation_implementation.txt")
     
     # Extract Swift files
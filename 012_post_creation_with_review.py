@@ -6,9 +6,13 @@ Agents build PostCreationView/ViewModel with a tough evaluator ensuring quality
 
 import os
 from pathlib import Path
-from crewai import Agent, Task, Crew, Process
+from crewai import Agent, Task
+from src.artifact_store import record_output
+from src.model_router import model_router
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # IMPLEMENTATION + REVIEW AGENTS
@@ -181,15 +185,17 @@ code_review_task = Task(
 # FILE CREATION WITH QUALITY CONTROL
 # =============================================================================
 
+@profiled
 def apply_reviewed_implementation(crew_result):
     """Only create files if they pass code review"""
     
     result_text = str(crew_result)
     
     # Save full output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "post_creation_with_review.txt"
+    debug_file = PROJECT_ROOT / "post_creation_with_review.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'post_creation_with_review')
     print(f"🔍 Full output saved to: post_creation_with_review.txt")
     
     # Check if code review approved
@@ -243,10 +249,9 @@ if __name__ == "__main__":
     print("🔍 Reviewer: Enforce quality and consistency") 
     print("=" * 70)
     
-    crew = Crew(
-        agents=[post_viewmodel_developer, post_view_developer, senior_code_reviewer],
-        tasks=[develop_viewmodel_task, develop_view_task, code_review_task],
-        process=Process.sequential,
+    # Developers stay on the standard tier, the reviewer runs on its ROLE_TIERS tier
+    crew = model_router.build_crew(
+        [develop_viewmodel_task, develop_view_task, code_review_task],
         verbose=True
     )
     
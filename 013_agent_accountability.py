@@ -7,8 +7,10 @@ The agents wrote reviews of imaginary code. Time for accountability.
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.workspace import PROJECT_ROOT
 
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # ACCOUNTABILITY AGENTS
@@ -72,7 +74,7 @@ call_out_failure_task = Task(
 )
 
 write_actual_swift_code_task = Task(
-    description="""
+    description=f"""
     WRITE THE ACTUAL SWIFT FILES THAT SHOULD HAVE BEEN CREATED
     
     **YOUR MISSION:**
@@ -80,8 +82,8 @@ write_actual_swift_code_task = Task(
     
     **REQUIREMENTS:**
     Study the existing files:
-    - /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/ViewModels/LoginViewModel.swift
-    - /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone/Views/LoginView.swift
+    - {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/ViewModels/LoginViewModel.swift
+    - {PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone/Views/LoginView.swift
     
     Follow the EXACT same patterns for PostCreation.
     
@@ -113,9 +115,10 @@ def create_actual_files(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "actual_post_creation_code.txt"
+    debug_file = PROJECT_ROOT / "actual_post_creation_code.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'actual_post_creation_code')
     print(f"🔍 Output saved to: actual_post_creation_code.txt")
     
     # Extract Swift files with FILE: markers
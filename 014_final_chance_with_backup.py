@@ -7,8 +7,11 @@ One final opportunity to deliver actual Swift code or face replacement
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # FINAL CHANCE AGENT
@@ -107,9 +110,10 @@ def final_extraction_attempt(crew_result):
     result_text = str(crew_result)
     
     # Save output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "final_chance_output.txt"
+    debug_file = PROJECT_ROOT / "final_chance_output.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'final_chance_output')
     print(f"🔍 Final chance output saved to: final_chance_output.txt")
     
     files_created = []
@@ -149,6 +153,7 @@ def final_extraction_attempt(crew_result):
     
     return files_created
 
+@profiled
 def create_backup_implementations():
     """Emergency backup implementations when agents fail"""
     
@@ -5,8 +5,10 @@ Agents investigate the codebase and backend to understand timeline requirements
 """
 
 import os
-from pathlib import Path
-from crewai import Agent, Task, Crew, Process
+from crewai import Agent, Task
+from src.artifact_store import record_output, record_extracted_files, reuse_output
+from src.model_router import model_router
+from src.workspace import PROJECT_ROOT
 
 # =============================================================================
 # DISCOVERY AGENTS
@@ -239,9 +241,10 @@ def save_timeline_specification(crew_result):
     result_text = str(crew_result)
     
     # Save full output for debugging
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "timeline_discovery_full_output.txt"
+    debug_file = PROJECT_ROOT / "timeline_discovery_full_output.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    output_hash = record_output(result_text, __file__, 'timeline_discovery_full_output')
     
     # Extract and save the markdown specification
     import re
@@ -277,16 +280,20 @@ def save_timeline_specification(crew_result):
             specification_content = "# Timeline/Feed Feature Specification\n\n" + specification_content
         
         # Save the specification document
-        spec_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "TIMELINE_SPECIFICATION.md"
+        spec_file = PROJECT_ROOT / "TIMELINE_SPECIFICATION.md"
         with open(spec_file, 'w') as f:
             f.write(specification_content)
         
         print("📋 Timeline specification saved to: TIMELINE_SPECIFICATION.md")
+        record_extracted_files(output_hash, [str(spec_file)], good=True)
         return True
     else:
         print("⚠️  No substantial markdown specification found in output")
+        record_extracted_files(output_hash, [], good=False)
         return False
 
+DISCOVERY_TASKS = [analyze_ios_patterns_task, research_backend_api_task, create_timeline_specification_task]
+
 # =============================================================================
 # DISCOVERY EXECUTION
 # =============================================================================
@@ -298,18 +305,18 @@ if __name__ == "__main__":
     print("📋 Output: Comprehensive markdown specification")
     print("=" * 60)
     
-    crew = Crew(
-        agents=[ios_pattern_analyst, backend_api_researcher, technical_documentation_writer],
-        tasks=[analyze_ios_patterns_task, research_backend_api_task, create_timeline_specification_task],
-        process=Process.sequential,
-        verbose=True
-    )
-    
     try:
-        result = crew.kickoff()
-        
-        # Save the specification document
-        success = save_timeline_specification(result)
+        # Discovery starts on the cheap tier and only escalates if no usable specification comes back
+        archived = reuse_output(__file__, 'timeline_discovery_full_output')
+        if archived is not None:
+            result, success = archived, save_timeline_specification(archived)
+        else:
+            result, success = model_router.kickoff_with_escalation(
+                build_crew=lambda tier: model_router.build_crew(DISCOVERY_TASKS, tier=tier, verbose=True),
+                validate=save_timeline_specification,
+                start_tier=model_router.tier_for(task_type='discovery'),
+                label='timeline discovery'
+            )
         
         print("\n" + "=" * 60)
         print("🎯 TIMELINE DISCOVERY RESULTS:")
@@ -320,6 +327,7 @@ if __name__ == "__main__":
         else:
             print("⚠️  Specification extraction failed")
             print("📋 Check: timeline_discovery_full_output.txt for raw output")
+        print(model_router.report())
         print("=" * 60)
         
     except Exception as e:
@@ -7,8 +7,10 @@ Build timeline feature with correct backend endpoints
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output, record_extracted_files, reuse_output
+from src.workspace import PROJECT_ROOT
 
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # IMPLEMENTATION AGENTS
@@ -21,8 +23,13 @@ timeline_implementation_lead = Agent(
     
     CORRECT ENDPOINTS (verified in backend):
     - /api/timeline/public - Public timeline with all posts
-    - /api/timeline/home - Home timeline (currently same as public)
-    - Returns Page<PostDto> with pagination
+    - /api/timeline/home - Home timeline: posts of followed users (public timeline for users who follow nobody)
+    - Cursor pagination: ?cursor=<nextCursor>&size=20, no page numbers
+    - Returns TimelinePage { posts: [PostDto], nextCursor: String?, hasMore: Bool }
+    - ?includeAuthors=true adds authors: { userId: { id, username, displayName } }
+      for the page's posts, so the client never looks authors up one by one
+    - Post userIds are user-service ids, so /api/users/batch?ids=a,b,c resolves
+      them too; it is the one fallback when a page arrives without some authors
     
     ESTABLISHED PATTERNS (from existing code):
     - Same MVVM as LoginViewModel, RegistrationViewModel, PostCreationViewModel
@@ -46,7 +53,18 @@ build_complete_timeline_task = Task(
     
     **BACKEND ENDPOINTS (VERIFIED):**
     - Use `/api/timeline/public` for public timeline
-    - Endpoint returns Page<PostDto> with posts array and pagination
+    - Cursor pagination keyed on (createdAt, id): first page has no cursor,
+      next pages send `?cursor=<nextCursor from the previous page>&size=20`
+    - Response is TimelinePage: `{ "posts": [PostDto], "nextCursor": "opaque string or absent", "hasMore": true }`
+    - There is NO totalElements/totalPages/page number; stop when hasMore is false
+    - Treat nextCursor as opaque: never parse or build it on the client
+    - Always send `includeAuthors=true`; the page then carries
+      `"authors": { "<userId>": { "id", "username", "displayName" } }` for every
+      post on it. Never call the user-service per post or per author
+    - `authors` is absent when the user-service was unavailable, and may miss
+      an id; fetch every missing author of the page in ONE
+      `GET /api/users/batch?ids=<comma-separated userIds>` call (user-service),
+      and if that fails too, render the rows without author names
     - No authentication required for public timeline
     - Posts are sorted by createdAt descending (newest first)
     
@@ -61,7 +79,10 @@ build_complete_timeline_task = Task(
         @Published var isLoading: Bool = false
         @Published var errorMessage: String = ""
         @Published var showError: Bool = false
+        @Published var hasMore: Bool = true
+        @Published var authors: [String: AuthorSummary] = [:]
         
+        private var nextCursor: String?
         private let networkManager: NetworkManagerProtocol
         
         init(networkManager: NetworkManagerProtocol) {
@@ -73,11 +94,25 @@ build_complete_timeline_task = Task(
         }
         
         func loadTimeline() async {
-            // Use .publicTimeline endpoint that calls /api/timeline/public
-            // Handle Page<PostDto> response
-            // Extract posts array from response
+            // First page: reset nextCursor, call .publicTimeline(cursor: nil)
+            // Decode TimelinePage, replace posts and authors, store nextCursor and hasMore
+            // then await resolveMissingAuthors(for: page.posts)
             // Same error handling as other ViewModels
         }
+        
+        func loadMoreIfNeeded(currentPost: Post) async {
+            // When currentPost is the last loaded post, hasMore is true and
+            // nothing is loading, call .publicTimeline(cursor: nextCursor)
+            // and append the returned posts; merge page.authors into authors,
+            // then await resolveMissingAuthors(for: page.posts)
+        }
+        
+        private func resolveMissingAuthors(for posts: [Post]) async {
+            // Fallback for pages served without (some) authors: one
+            // .usersBatch(ids:) call for every userId not in authors yet,
+            // merged into authors. Errors are ignored (rows render without
+            // a name), never shown to the user, never retried per post
+        }
     }
     ```
     
@@ -90,7 +125,10 @@ build_complete_timeline_task = Task(
         var body: some View {
             NavigationView {
                 List(viewModel.posts, id: \\.id) { post in
-                    PostRowView(post: post)
+                    PostRowView(post: post, author: viewModel.authors[post.userId])
+                        .task {
+                            await viewModel.loadMoreIfNeeded(currentPost: post)
+                        }
                 }
                 .navigationTitle("Timeline")
                 .refreshable {
@@ -114,9 +152,20 @@ build_complete_timeline_task = Task(
     ```swift
     struct PostRowView: View {
         let post: Post
+        let author: AuthorSummary?
         
         var body: some View {
             VStack(alignment: .leading, spacing: 8) {
+                if let author = author {
+                    Text(author.displayName ?? "@\\(author.username)")
+                        .font(.headline)
+                } else {
+                    // Author not resolved (user-service unavailable): keep the row layout stable
+                    Text("Unknown author")
+                        .font(.headline)
+                        .foregroundColor(.secondary)
+                }
+                
                 Text(post.content)
                     .font(.body)
                 
@@ -138,16 +187,21 @@ build_complete_timeline_task = Task(
     ```
     
     4. **Update APIEndpoint.swift**
-    Add timeline endpoint:
+    Add timeline endpoint and response model:
     ```swift
-    case publicTimeline
+    case publicTimeline(cursor: String?)
+    case usersBatch(ids: [String])
     
-    // In path:
-    case .publicTimeline:
-        return "/api/timeline/public"
+    // In path (percent-encode the cursor as a query item):
+    case .publicTimeline(let cursor):
+        guard let cursor = cursor else { return "/api/timeline/public?size=20&includeAuthors=true" }
+        return "/api/timeline/public?size=20&includeAuthors=true&cursor=\\(cursor)"
+    case .usersBatch(let ids):
+        // user-service, at most 100 ids per call (one timeline page is well below that)
+        return "/api/users/batch?ids=\\(ids.joined(separator: ","))"
     
     // In method:
-    case .publicTimeline:
+    case .publicTimeline, .usersBatch:
         return .GET
     ```
     
@@ -157,7 +211,8 @@ build_complete_timeline_task = Task(
     **KEY REQUIREMENTS:**
     - Use CORRECT endpoint: /api/timeline/public
     - Follow SAME patterns as existing ViewModels/Views
-    - Handle Page<PostDto> response properly
+    - Decode TimelinePage (posts, nextCursor, hasMore, authors) and load more via nextCursor
+    - Missing authors: one .usersBatch call per page, never a request per post
     - Include proper error handling
     - Integrate with existing navigation
     
@@ -165,7 +220,7 @@ build_complete_timeline_task = Task(
     - TimelineViewModel.swift
     - TimelineView.swift  
     - PostRowView.swift
-    - Updated APIEndpoint.swift
+    - Updated APIEndpoint.swift (with Codable TimelinePage and AuthorSummary structs)
     - Updated AuthenticatedView navigation
     
     Build complete, working timeline feature following established patterns.
@@ -184,9 +239,10 @@ def create_timeline_files(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "timeline_implementation_output.txt"
+    debug_file = PROJECT_ROOT / "timeline_implementation_output.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    output_hash = record_output(result_text, __file__, 'timeline_implementation_output')
     print(f"🔍 Implementation output saved to: timeline_implementation_output.txt")
     
     # Extract Swift files
@@ -231,6 +287,7 @@ def create_timeline_files(crew_result):
                 files_created.append("PostRowView.swift") 
                 print(f"✅ Created PostRowView.swift ({len(code)} chars)")
     
+    record_extracted_files(output_hash, files_created, good=len(files_created) >= 2)
     return files_created
 
 # =============================================================================
@@ -252,7 +309,8 @@ if __name__ == "__main__":
     )
     
     try:
-        result = crew.kickoff()
+        # CREW_REUSE_OUTPUTS=1 replays the last good archived output instead of regenerating
+        result = reuse_output(__file__, 'timeline_implementation_output') or crew.kickoff()
         
         # Create timeline files
         files_created = create_timeline_files(result)
@@ -7,8 +7,10 @@ Build TimelineView and PostRowView following established patterns
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.workspace import PROJECT_ROOT
 
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # WORKING AGENTS - NO EXCUSES
@@ -83,7 +85,11 @@ build_timeline_view_task = Task(
        - Same pattern as other views
     
     2. **Displays Posts in List:**
-       - Use List(viewModel.posts, id: \\.id) { post in PostRowView(post: post) }
+       - Use List(viewModel.posts, id: \\.id) { post in
+             PostRowView(post: post, author: viewModel.authors[post.userId]) }
+       - Authors come embedded in each TimelinePage (includeAuthors=true);
+         the ViewModel fills any gaps with one /api/users/batch call per page.
+         Never fetch users per row
        - Shows timeline data from ViewModel
     
     3. **Handles Loading/Error States:**
@@ -121,6 +127,9 @@ create_post_row_task = Task(
     Build PostRowView.swift that displays a single post nicely:
     
     1. **Post Data Display:**
+       - Accept `author: AuthorSummary?` from the page's authors map and show
+         author.displayName (falling back to @username) above the content;
+         when author is nil, show a secondary "Unknown author" line instead
        - Show post.content (main text)
        - Show post.createdAt (formatted timestamp)
        - Show post.likeCount (number of likes)
@@ -158,7 +167,7 @@ create_post_row_task = Task(
        ```
     
     **REQUIREMENTS:**
-    - Accept Post object as parameter
+    - Accept Post object and optional AuthorSummary as parameters
     - Display content, timestamp, like count
     - Use clean, readable formatting
     - Follow visual patterns from existing views
@@ -270,9 +279,10 @@ def extract_and_create_timeline_files(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "timeline_view_implementation.txt"
+    debug_file = PROJECT_ROOT / "timeline_view_implementation.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'timeline_view_implementation')
     print(f"🔍 Output saved to: timeline_view_implementation.txt")
     
     files_created = []
@@ -7,8 +7,10 @@ The agents keep failing to deliver actual Swift files. Time for consequences.
 import os
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.workspace import PROJECT_ROOT
 
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 # =============================================================================
 # ACCOUNTABILITY TEAM
@@ -198,9 +200,10 @@ def force_create_swift_files(crew_result):
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "team_talk_output.txt"
+    debug_file = PROJECT_ROOT / "team_talk_output.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'team_talk_output')
     print(f"🔍 Team talk output saved to: team_talk_output.txt")
     
     files_created = []
@@ -5,10 +5,22 @@ The button exists but doesn't actually navigate to TimelineView
 """
 
 import os
+import re
 from pathlib import Path
 from crewai import Agent, Task, Crew, Process
+from src.artifact_store import record_output
+from src.patch_engine import PATCH_FORMAT_INSTRUCTIONS, file_excerpt, patch_applier
+from src.profiling import profiled
+from src.workspace import PROJECT_ROOT
 
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
+login_file = Path(main_app_path) / "Views" / "LoginView.swift"
+authenticated_view_pattern = r'struct AuthenticatedView: View \{.*?^\}'
+
+# Agents patch against the real code, so they need to see it
+current_authenticated_view = (
+    file_excerpt(login_file, authenticated_view_pattern) if login_file.exists() else "(LoginView.swift not found)"
+)
 
 # =============================================================================
 # NAVIGATION FIX AGENTS
@@ -83,6 +95,11 @@ debug_timeline_navigation_task = Task(
     - Clear fix requirements
     
     Study the code and identify exactly what's broken with timeline navigation.
+    
+    **CURRENT CODE (LoginView.swift):**
+    ```swift
+    """ + current_authenticated_view + """
+    ```
     """,
     expected_output="Analysis of why timeline navigation is broken and what needs to be fixed",
     agent=navigation_debugger
@@ -125,13 +142,11 @@ fix_timeline_navigation_task = Task(
     - Add .sheet(isPresented: $showTimeline) { TimelineView() }
     - Follow the EXACT same pattern as "Create Post" button
     
-    **OUTPUT FORMAT:**
+    **CURRENT CODE (LoginView.swift):**
     ```swift
-    UPDATED_AUTHENTICATEDVIEW_START
-    // Complete updated AuthenticatedView struct with working timeline navigation
-    UPDATED_AUTHENTICATEDVIEW_END
+    """ + current_authenticated_view + """
     ```
-    
+    """ + PATCH_FORMAT_INSTRUCTIONS + """
     **FAILURE CONDITIONS:**
     - If you don't follow the exact same pattern as Create Post: FAILED
     - If you don't include all three required pieces: FAILED
@@ -139,7 +154,7 @@ fix_timeline_navigation_task = Task(
     
     Fix the navigation properly using the established working pattern.
     """,
-    expected_output="Fixed AuthenticatedView with working timeline navigation",
+    expected_output="Search/replace blocks for LoginView.swift that fix timeline navigation",
     agent=navigation_fixer,
     depends_on=[debug_timeline_navigation_task]
 )
@@ -148,52 +163,73 @@ fix_timeline_navigation_task = Task(
 # NAVIGATION FIX IMPLEMENTATION
 # =============================================================================
 
+def rewrite_authenticated_view(current_content, reason):
+    """Full-rewrite fallback: only used when the agent's patch conflicts with LoginView.swift"""
+    
+    rewrite_task = Task(
+        description="""
+        Your earlier patch for AuthenticatedView could not be applied: """ + reason + """
+        
+        Rewrite the complete AuthenticatedView struct with working timeline navigation:
+        - @State private var showTimeline = false
+        - "View Timeline" button action sets showTimeline = true
+        - .sheet(isPresented: $showTimeline) { TimelineView() }
+        
+        **CURRENT CODE:**
+        ```swift
+        """ + file_excerpt(login_file, authenticated_view_pattern, context=0) + """
+        ```
+        
+        **OUTPUT FORMAT:**
+        ```swift
+        UPDATED_AUTHENTICATEDVIEW_START
+        // Complete updated AuthenticatedView struct with working timeline navigation
+        UPDATED_AUTHENTICATEDVIEW_END
+        ```
+        """,
+        expected_output="Fixed AuthenticatedView with working timeline navigation",
+        agent=navigation_fixer
+    )
+    result_text = str(Crew(agents=[navigation_fixer], tasks=[rewrite_task], verbose=True).kickoff())
+    record_output(result_text, __file__, 'timeline_navigation_rewrite')
+    
+    match = re.search(r'UPDATED_AUTHENTICATEDVIEW_START\n(.*?)\nUPDATED_AUTHENTICATEDVIEW_END', result_text, re.DOTALL)
+    if not match:
+        print("❌ No AuthenticatedView found in rewrite output")
+        return None
+    
+    updated_code = match.group(1).strip()
+    if len(updated_code) < 500 or "showTimeline" not in updated_code:
+        print("❌ Invalid or incomplete navigation rewrite")
+        return None
+    
+    # Replace the AuthenticatedView struct
+    return re.sub(authenticated_view_pattern, lambda _: updated_code, current_content, flags=re.DOTALL | re.MULTILINE)
+
+@profiled
 def apply_navigation_fix(crew_result):
     """Apply the timeline navigation fix"""
     
     result_text = str(crew_result)
     
     # Save debug output
-    debug_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai") / "timeline_navigation_fix.txt"
+    debug_file = PROJECT_ROOT / "timeline_navigation_fix.txt"
     with open(debug_file, 'w') as f:
         f.write(result_text)
+    record_output(result_text, __file__, 'timeline_navigation_fix')
     print(f"🔍 Navigation fix output saved to: timeline_navigation_fix.txt")
     
-    # Extract the fixed AuthenticatedView
-    import re
-    
-    fix_pattern = r'UPDATED_AUTHENTICATEDVIEW_START\n(.*?)\nUPDATED_AUTHENTICATEDVIEW_END'
-    match = re.search(fix_pattern, result_text, re.DOTALL)
+    # Apply the agent's hunks; a full rewrite is only requested if they conflict
+    if not patch_applier.apply(login_file, result_text, rewrite=rewrite_authenticated_view):
+        return False
     
-    if match:
-        updated_code = match.group(1).strip()
-        
-        if len(updated_code) > 500 and "showTimeline" in updated_code:
-            # Read current LoginView.swift
-            login_file = Path(main_app_path) / "Views" / "LoginView.swift"
-            
-            if login_file.exists():
-                with open(login_file, 'r') as f:
-                    current_content = f.read()
-                
-                # Replace the AuthenticatedView struct
-                pattern = r'struct AuthenticatedView: View \{.*?^\}'
-                updated_content = re.sub(pattern, updated_code, current_content, flags=re.DOTALL | re.MULTILINE)
-                
-                with open(login_file, 'w') as f:
-                    f.write(updated_content)
-                
-                print("✅ Fixed timeline navigation in AuthenticatedView")
-                return True
-            else:
-                print("❌ LoginView.swift not found")
-                return False
-        else:
-            print("❌ Invalid or incomplete navigation fix")
-            return False
-    else:
-        print("❌ No navigation fix found in agent output")
+    if "showTimeline" not in login_file.read_text():
+        print("❌ Patched LoginView.swift still has no showTimeline navigation")
         return False
+    
+    print("✅ Fixed timeline navigation in AuthenticatedView")
+    print(patch_applier.report())
+    return True
 
 # =============================================================================
 # EXECUTION
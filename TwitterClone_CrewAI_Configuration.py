@@ -4,25 +4,30 @@ Comprehensive team setup for Twitter clone development
 """
 
 from crewai import Agent, Task, Crew, Process
-from crewai_tools import CodeDocsSearchTool, CodeInterpreterTool, FileReadTool, DirectoryReadTool
+from crewai_tools import CodeDocsSearchTool, CodeInterpreterTool
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-from typing import Type
+from typing import Optional, Type
 import os
+from src.read_cache import ReadCache
+from src.model_router import model_router
+from src.delegation_planner import DelegationPlanner
+from src.code_review import code_review_engine
+from src.coverage_report import coverage_analyzer
 
 # Custom tools for development - Using CrewAI BaseTool with proper input schemas
 class CodeReviewToolInput(BaseModel):
     """Input schema for CodeReviewTool."""
-    code: str = Field(..., description="The code to review for best practices and optimization.")
+    code: str = Field(..., description="The code to review, or a file, directory or glob of source files to review.")
 
 class CodeReviewTool(BaseTool):
     name: str = "Code Review Tool"
-    description: str = "Reviews code for best practices, security issues, and optimization opportunities."
+    description: str = "Runs rule-based review (N+1 queries, missing pagination, blocking calls in coroutines, @MainActor misuse, oversized functions) over code or source paths and returns compact findings."
     args_schema: Type[BaseModel] = CodeReviewToolInput
     
     def _run(self, code: str) -> str:
-        """Reviews code for best practices, security issues, and optimization opportunities."""
-        return f"Code review completed for: {code[:100]}..."
+        """Reviews a snippet or source files with the local rule engine; only what rules can't judge is left to the agent."""
+        return code_review_engine.review(code)
 
 class ArchitectureValidationToolInput(BaseModel):
     """Input schema for ArchitectureValidationTool."""
@@ -39,22 +44,67 @@ class ArchitectureValidationTool(BaseTool):
 
 class TestCoverageToolInput(BaseModel):
     """Input schema for TestCoverageTool."""
-    test_code: str = Field(..., description="The test code to analyze for coverage.")
+    test_code: str = Field(..., description="Test code, class names (e.g. UserService, AuthService) or a module name (user-service) to report coverage for.")
 
 class TestCoverageTool(BaseTool):
     name: str = "Test Coverage Tool"
-    description: str = "Analyzes test coverage and suggests additional test cases."
+    description: str = "Reports real per-class line and branch coverage with uncovered line ranges from the backend JaCoCo reports (regenerated only when sources changed)."
     args_schema: Type[BaseModel] = TestCoverageToolInput
     
     def _run(self, test_code: str) -> str:
-        """Analyzes test coverage and suggests additional test cases."""
-        return f"Test coverage analysis completed for: {test_code[:100]}..."
+        """Returns JaCoCo coverage for the modules and classes the input refers to."""
+        return coverage_analyzer.analyze(test_code)
+
+# Shared read cache: per run by default, cross-run (mtime-validated) when CREW_READ_CACHE_DIR is set
+read_cache = ReadCache(
+    max_entries=int(os.getenv('CREW_READ_CACHE_ENTRIES', '256')),
+    max_chars=int(os.getenv('CREW_READ_CACHE_CHARS', '8000000')),
+    persist_dir=os.getenv('CREW_READ_CACHE_DIR'),
+    persist_max_bytes=int(os.getenv('CREW_READ_CACHE_DIR_MB', '256')) * 1_000_000,
+    persist_max_age=float(os.getenv('CREW_READ_CACHE_DIR_DAYS', '7')) * 24 * 3600
+)
+
+class CachedFileReadToolInput(BaseModel):
+    """Input schema for CachedFileReadTool."""
+    file_path: str = Field(..., description="Mandatory file full path to read the file")
+    start_line: Optional[int] = Field(1, description="Line number to start reading from (1-indexed)")
+    line_count: Optional[int] = Field(None, description="Number of lines to read. If None, reads the entire file")
+
+class CachedFileReadTool(BaseTool):
+    name: str = "Read a file's content"
+    description: str = "A tool that reads the content of a file. Repeated reads of unchanged files are served from memory."
+    args_schema: Type[BaseModel] = CachedFileReadToolInput
+    max_chars: int = 20000
+    
+    def _run(self, file_path: str, start_line: Optional[int] = 1, line_count: Optional[int] = None) -> str:
+        """Reads a file (or a slice of its lines) through the shared read cache."""
+        try:
+            return read_cache.read_file(file_path, start_line, line_count, self.max_chars)
+        except Exception as e:
+            return f"Error: Failed to read file {file_path}. {str(e)}"
+
+class CachedDirectoryReadToolInput(BaseModel):
+    """Input schema for CachedDirectoryReadTool."""
+    directory: str = Field(..., description="Mandatory directory to list content")
+
+class CachedDirectoryReadTool(BaseTool):
+    name: str = "List files in directory"
+    description: str = "A tool that recursively lists a directory's content. Unchanged directories are served from memory."
+    args_schema: Type[BaseModel] = CachedDirectoryReadToolInput
+    max_chars: int = 20000
+    
+    def _run(self, directory: str) -> str:
+        """Lists a directory through the shared read cache."""
+        try:
+            return read_cache.list_directory(directory, self.max_chars)
+        except Exception as e:
+            return f"Error: Failed to list directory {directory}. {str(e)}"
 
 # Initialize tools
 code_docs_tool = CodeDocsSearchTool()
 code_interpreter = CodeInterpreterTool()
-file_reader = FileReadTool()
-directory_reader = DirectoryReadTool()
+file_reader = CachedFileReadTool()
+directory_reader = CachedDirectoryReadTool()
 
 # Initialize custom tools
 code_review_tool = CodeReviewTool()
@@ -300,7 +350,11 @@ def create_project_planning_tasks():
     return [technical_planning_task, requirements_analysis_task]
 
 def create_ios_development_tasks():
-    """Create tasks for iOS development team"""
+    """Create tasks for iOS development team
+    
+    UI components and the networking layer only build on the architecture, so they
+    run asynchronously side by side; the testing task joins on all three.
+    """
     
     ios_architecture_task = Task(
         description="""
@@ -330,7 +384,9 @@ def create_ios_development_tasks():
         8. Implement dark mode support
         """,
         agent=swiftui_developer,
-        expected_output="Complete SwiftUI implementation for all core screens with reusable components and design system"
+        expected_output="Complete SwiftUI implementation for all core screens with reusable components and design system",
+        context=[ios_architecture_task],
+        async_execution=True
     )
     
     ios_networking_task = Task(
@@ -345,7 +401,9 @@ def create_ios_development_tasks():
         7. Create data synchronization layer
         """,
         agent=ios_backend_specialist,
-        expected_output="Complete networking layer with API integration, real-time features, and offline support"
+        expected_output="Complete networking layer with API integration, real-time features, and offline support",
+        context=[ios_architecture_task],
+        async_execution=True
     )
     
     ios_testing_task = Task(
@@ -360,13 +418,18 @@ def create_ios_development_tasks():
         7. Set up CI/CD testing pipeline
         """,
         agent=ios_testing_engineer,
-        expected_output="Complete testing suite with unit tests, UI tests, integration tests, and CI/CD integration"
+        expected_output="Complete testing suite with unit tests, UI tests, integration tests, and CI/CD integration",
+        context=[ios_architecture_task, swiftui_implementation_task, ios_networking_task]
     )
     
     return [ios_architecture_task, swiftui_implementation_task, ios_networking_task, ios_testing_task]
 
 def create_android_development_tasks():
-    """Create tasks for Android development team"""
+    """Create tasks for Android development team
+    
+    Compose UI and networking only build on the architecture, so they run
+    asynchronously side by side; the testing task joins on all three.
+    """
     
     android_architecture_task = Task(
         description="""
@@ -396,7 +459,9 @@ def create_android_development_tasks():
         8. Implement dynamic theming
         """,
         agent=kotlin_compose_developer,
-        expected_output="Complete Jetpack Compose implementation for all screens with Material Design 3 components"
+        expected_output="Complete Jetpack Compose implementation for all screens with Material Design 3 components",
+        context=[android_architecture_task],
+        async_execution=True
     )
     
     android_networking_task = Task(
@@ -411,7 +476,9 @@ def create_android_development_tasks():
         7. Create data synchronization with WorkManager
         """,
         agent=android_backend_specialist,
-        expected_output="Complete networking implementation with offline support, real-time features, and push notifications"
+        expected_output="Complete networking implementation with offline support, real-time features, and push notifications",
+        context=[android_architecture_task],
+        async_execution=True
     )
     
     android_testing_task = Task(
@@ -426,13 +493,18 @@ def create_android_development_tasks():
         7. Set up CI/CD with GitHub Actions
         """,
         agent=android_testing_engineer,
-        expected_output="Complete testing suite with unit tests, Compose tests, integration tests, and automated CI/CD"
+        expected_output="Complete testing suite with unit tests, Compose tests, integration tests, and automated CI/CD",
+        context=[android_architecture_task, compose_implementation_task, android_networking_task]
     )
     
     return [android_architecture_task, compose_implementation_task, android_networking_task, android_testing_task]
 
 def create_backend_development_tasks():
-    """Create tasks for backend API development team"""
+    """Create tasks for backend API development team
+    
+    These form a real chain (architecture -> implementation -> tests), so they stay
+    sequential but only receive the outputs they actually depend on.
+    """
     
     api_architecture_task = Task(
         description="""
@@ -463,7 +535,8 @@ def create_backend_development_tasks():
         8. Implement real-time features
         """,
         agent=kotlin_api_developer,
-        expected_output="Complete Spring Boot Kotlin API implementation with all microservices and real-time features"
+        expected_output="Complete Spring Boot Kotlin API implementation with all microservices and real-time features",
+        context=[api_architecture_task]
     )
     
     api_testing_task = Task(
@@ -478,7 +551,8 @@ def create_backend_development_tasks():
         7. Set up CI/CD pipeline with automated testing
         """,
         agent=api_testing_engineer,
-        expected_output="Complete testing suite with unit tests, integration tests, performance tests, and security tests"
+        expected_output="Complete testing suite with unit tests, integration tests, performance tests, and security tests",
+        context=[api_architecture_task, api_implementation_task]
     )
     
     return [api_architecture_task, api_implementation_task, api_testing_task]
@@ -487,6 +561,30 @@ def create_backend_development_tasks():
 # CREW CONFIGURATIONS
 # =============================================================================
 
+# Planners built for the current run, reported in the run summary
+delegation_planners = []
+
+def plan_delegation(agents, tasks, platform_roles=None, delegation_budget=0, **crew_kwargs):
+    """Build a crew from a static delegation plan with technical_lead as the integrating manager
+
+    platform_roles maps 'api'/'ios'/'android' to the agent that implements that platform's
+    steps of technical_lead's umbrella tasks; without it every task keeps its declared agent.
+    """
+    planner = DelegationPlanner(agents, manager=technical_lead, platform_roles=platform_roles,
+                                delegation_budget=delegation_budget)
+    crew = planner.build_crew(tasks, verbose=True, **crew_kwargs)
+    print("🗺️  Delegation plan:")
+    print(planner.describe_plan())
+    delegation_planners.append(planner)
+    return crew
+
+def kickoff(crew):
+    """Kick off a crew; planned crews go through their planner so agent turns are timed from kickoff"""
+    for planner in delegation_planners:
+        if planner.crew is crew:
+            return planner.kickoff()
+    return crew.kickoff()
+
 def create_planning_crew():
     """Create crew for initial project planning"""
     planning_tasks = create_project_planning_tasks()
@@ -553,52 +651,59 @@ def create_full_development_crew():
         android_architect, kotlin_compose_developer, android_backend_specialist, android_testing_engineer
     ]
     
-    return Crew(
-        agents=all_agents,
-        tasks=all_tasks,
-        process=Process.hierarchical,
-        manager_agent=technical_lead,
-        verbose=True,
-        memory=True
-    )
+    # Every task already names its owner; the plan keeps those instead of a manager re-deciding them
+    return plan_delegation(all_agents, all_tasks, memory=True)
 
 # =============================================================================
 # USAGE EXAMPLES
 # =============================================================================
 
+def print_run_summary():
+    """Print resource savings collected during the crew run"""
+    print("\n📊 Run Summary:")
+    print(f"  • {read_cache.report()}")
+    print(f"  • {model_router.report()}")
+    for planner in delegation_planners:
+        print(f"  • {planner.report()}")
+
 def run_planning_phase():
     """Run only the planning phase"""
     print("=== Running Planning Crew ===")
     planning_crew = create_planning_crew()
-    planning_result = planning_crew.kickoff()
+    planning_result = kickoff(planning_crew)
+    print_run_summary()
     return planning_result
 
 def run_ios_development():
     """Run iOS development crew"""
     print("=== Running iOS Development Crew ===")
     ios_crew = create_ios_crew()
-    ios_result = ios_crew.kickoff()
+    ios_result = kickoff(ios_crew)
+    print_run_summary()
     return ios_result
 
 def run_android_development():
     """Run Android development crew"""
     print("=== Running Android Development Crew ===")
     android_crew = create_android_crew()
-    android_result = android_crew.kickoff()
+    android_result = kickoff(android_crew)
+    print_run_summary()
     return android_result
 
 def run_backend_development():
     """Run backend development crew"""
     print("=== Running Backend Development Crew ===")
     backend_crew = create_backend_crew()
-    backend_result = backend_crew.kickoff()
+    backend_result = kickoff(backend_crew)
+    print_run_summary()
     return backend_result
 
 def run_full_development():
     """Run complete development process"""
     print("=== Running Full Development Crew ===")
     full_crew = create_full_development_crew()
-    full_result = full_crew.kickoff()
+    full_result = kickoff(full_crew)
+    print_run_summary()
     return full_result
 
 # =============================================================================
@@ -621,12 +726,10 @@ def create_authentication_feature_crew():
         expected_output="Complete authentication system implemented across API, iOS, and Android with security best practices"
     )
     
-    return Crew(
-        agents=[technical_lead, kotlin_api_developer, swiftui_developer, kotlin_compose_developer],
-        tasks=[auth_task],
-        process=Process.hierarchical,
-        manager_agent=technical_lead,
-        verbose=True
+    return plan_delegation(
+        [technical_lead, kotlin_api_developer, swiftui_developer, kotlin_compose_developer],
+        [auth_task],
+        platform_roles={'api': kotlin_api_developer, 'ios': swiftui_developer, 'android': kotlin_compose_developer}
     )
 
 def create_realtime_features_crew():
@@ -645,12 +748,12 @@ def create_realtime_features_crew():
         expected_output="Complete real-time system with WebSocket implementation across all platforms"
     )
     
-    return Crew(
-        agents=[technical_lead, kotlin_api_developer, ios_backend_specialist, android_backend_specialist],
-        tasks=[realtime_task],
-        process=Process.hierarchical,
-        manager_agent=technical_lead,
-        verbose=True
+    return plan_delegation(
+        [technical_lead, kotlin_api_developer, ios_backend_specialist, android_backend_specialist],
+        [realtime_task],
+        platform_roles={
+            'api': kotlin_api_developer, 'ios': ios_backend_specialist, 'android': android_backend_specialist
+        }
     )
 
 # =============================================================================
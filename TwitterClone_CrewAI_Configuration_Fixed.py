@@ -9,20 +9,22 @@ from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Type
 import os
+from src.code_review import code_review_engine
+from src.coverage_report import coverage_analyzer
 
 # Custom tools for development - Using CrewAI BaseTool
 class CodeReviewToolInput(BaseModel):
     """Input schema for CodeReviewTool."""
-    code: str = Field(..., description="The code to review for best practices and optimization.")
+    code: str = Field(..., description="The code to review, or a file, directory or glob of source files to review.")
 
 class CodeReviewTool(BaseTool):
     name: str = "Code Review Tool"
-    description: str = "Reviews code for best practices, security issues, and optimization opportunities."
+    description: str = "Runs rule-based review (N+1 queries, missing pagination, blocking calls in coroutines, @MainActor misuse, oversized functions) over code or source paths and returns compact findings."
     args_schema: Type[BaseModel] = CodeReviewToolInput
     
     def _run(self, code: str) -> str:
-        """Reviews code for best practices, security issues, and optimization opportunities."""
-        return f"Code review completed for: {code[:100]}..."
+        """Reviews a snippet or source files with the local rule engine; only what rules can't judge is left to the agent."""
+        return code_review_engine.review(code)
 
 class ArchitectureValidationToolInput(BaseModel):
     """Input schema for ArchitectureValidationTool."""
@@ -39,16 +41,16 @@ class ArchitectureValidationTool(BaseTool):
 
 class TestCoverageToolInput(BaseModel):
     """Input schema for TestCoverageTool."""
-    test_code: str = Field(..., description="The test code to analyze for coverage.")
+    test_code: str = Field(..., description="Test code, class names (e.g. UserService, AuthService) or a module name (user-service) to report coverage for.")
 
 class TestCoverageTool(BaseTool):
     name: str = "Test Coverage Tool"
-    description: str = "Analyzes test coverage and suggests additional test cases."
+    description: str = "Reports real per-class line and branch coverage with uncovered line ranges from the backend JaCoCo reports (regenerated only when sources changed)."
     args_schema: Type[BaseModel] = TestCoverageToolInput
     
     def _run(self, test_code: str) -> str:
-        """Analyzes test coverage and suggests additional test cases."""
-        return f"Test coverage analysis completed for: {test_code[:100]}..."
+        """Returns JaCoCo coverage for the modules and classes the input refers to."""
+        return coverage_analyzer.analyze(test_code)
 
 # Initialize tools
 code_docs_tool = CodeDocsSearchTool()
@@ -0,0 +1,57 @@
+"""
+Model Routing Configuration
+Which model tier each agent role / task type runs on
+
+Retrospectives, reviews and discovery work are summarising or reading, so
+they start on the cheap tier. Code generation stays on the standard tier.
+A task only moves up ESCALATION_ORDER after its output fails validation.
+Model names can be overridden per tier with CREW_MODEL_<TIER> env vars.
+"""
+
+import os
+
+# Prices are USD per 1K tokens and only used for the run report estimate
+MODEL_TIERS = {
+    'cheap': {
+        'model': os.getenv('CREW_MODEL_CHEAP', 'gpt-4o-mini'),
+        'input_cost_per_1k': 0.00015,
+        'output_cost_per_1k': 0.0006,
+    },
+    'standard': {
+        'model': os.getenv('CREW_MODEL_STANDARD', 'gpt-4o'),
+        'input_cost_per_1k': 0.0025,
+        'output_cost_per_1k': 0.01,
+    },
+    'strong': {
+        'model': os.getenv('CREW_MODEL_STRONG', 'o1'),
+        'input_cost_per_1k': 0.015,
+        'output_cost_per_1k': 0.06,
+    },
+}
+
+DEFAULT_TIER = os.getenv('CREW_MODEL_DEFAULT_TIER', 'standard')
+
+ESCALATION_ORDER = ['cheap', 'standard', 'strong']
+
+# Task types take precedence over roles
+TASK_TYPE_TIERS = {
+    'retrospective': 'cheap',
+    'review': 'cheap',
+    'discovery': 'cheap',
+    'documentation': 'cheap',
+    'planning': 'standard',
+    'implementation': 'standard',
+    'fix': 'standard',
+}
+
+# Matched case-insensitively as substrings of the agent role
+ROLE_TIERS = {
+    'reviewer': 'cheap',
+    'analyst': 'cheap',
+    'researcher': 'cheap',
+    'documentation writer': 'cheap',
+    'business analyst': 'cheap',
+    'architect': 'standard',
+    'developer': 'standard',
+    'technical lead': 'standard',
+}
@@ -3,7 +3,7 @@
 echo "🔍 Debugging the 401 Test Failure"
 echo "================================="
 
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 
 echo "Running integration tests with detailed output..."
 ./gradlew :user-service:test --tests '*IntegrationTest*' --info --stacktrace 2>&1 | grep -A 20 -B 5 "should return 401"
@@ -7,13 +7,14 @@ The review passed but files weren't extracted properly
 import os
 import re
 from pathlib import Path
+from src.workspace import PROJECT_ROOT
 
-main_app_path = "/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/ios/TwitterClone/TwitterClone"
+main_app_path = f"{PROJECT_ROOT}/generated_code/ios/TwitterClone/TwitterClone"
 
 def extract_and_create_files():
     """Read the review file and extract the actual code"""
     
-    review_file = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai/post_creation_with_review.txt")
+    review_file = PROJECT_ROOT / "post_creation_with_review.txt"
     
     if not review_file.exists():
         print("❌ Review file not found")
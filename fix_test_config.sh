@@ -6,7 +6,7 @@
 echo "Fixing Spring Boot test configuration issue..."
 
 # Navigate to the backend directory
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 
 # Clean all build directories to remove cached config files
 echo "Cleaning build directories..."
@@ -19,6 +19,7 @@ subprojects {
     apply(plugin = "kotlin")
     apply(plugin = "kotlin-spring")
     apply(plugin = "io.spring.dependency-management")
+    apply(plugin = "jacoco")
     
     tasks.withType<org.jetbrains.kotlin.gradle.tasks.KotlinCompile> {
         kotlinOptions {
@@ -30,6 +31,15 @@ subprojects {
     tasks.withType<Test> {
         useJUnitPlatform()
     }
+    
+    // XML coverage report read by the crews' TestCoverageTool (src/coverage_report.py)
+    tasks.withType<JacocoReport> {
+        dependsOn(tasks.withType<Test>())
+        reports {
+            xml.required.set(true)
+            html.required.set(false)
+        }
+    }
 }
 
 // Custom tasks for convenience
@@ -13,12 +13,16 @@ dependencies {
     implementation("org.springframework.boot:spring-boot-starter-security")
     implementation("org.springframework.boot:spring-boot-starter-validation")
     implementation("org.springframework.boot:spring-boot-starter-json")
+    implementation("org.springframework.boot:spring-boot-starter-data-redis")
     
     // JWT
     implementation("io.jsonwebtoken:jjwt-api:0.11.5")
     implementation("io.jsonwebtoken:jjwt-impl:0.11.5")
     implementation("io.jsonwebtoken:jjwt-jackson:0.11.5")
     
+    // Verified-token cache in the JWT filter
+    implementation("com.github.ben-manes.caffeine:caffeine")
+    
     // Jackson
     implementation("com.fasterxml.jackson.module:jackson-module-kotlin")
     
@@ -26,6 +30,7 @@ dependencies {
     implementation("org.jetbrains.kotlin:kotlin-reflect")
     
     // Database
+    implementation("org.flywaydb:flyway-core")
     runtimeOnly("org.postgresql:postgresql")
     
     // Test dependencies
@@ -41,4 +46,6 @@ dependencies {
 
 tasks.withType<Test> {
     useJUnitPlatform()
+    // ./gradlew test -Dbenchmark=true also runs the *Benchmark classes
+    systemProperty("benchmark", System.getProperty("benchmark", "false"))
 }
@@ -0,0 +1,69 @@
+package com.twitterclone.post.author
+
+import com.twitterclone.post.dto.AuthorSummary
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.core.ParameterizedTypeReference
+import org.springframework.http.HttpHeaders
+import org.springframework.http.client.SimpleClientHttpRequestFactory
+import org.springframework.stereotype.Component
+import org.springframework.web.client.RestClient
+import org.springframework.web.client.RestClientException
+import org.springframework.web.context.request.RequestContextHolder
+import org.springframework.web.context.request.ServletRequestAttributes
+import java.time.Duration
+import java.util.*
+
+/**
+ * Author summaries from user-service for embedding in timeline pages.
+ *
+ * One GET /api/users/batch?ids=... per page (timeline pages hold at most
+ * MAX_TIMELINE_PAGE_SIZE posts, the batch endpoint's limit), so clients no
+ * longer fetch every distinct author separately. The caller's bearer token is
+ * forwarded. When user-service is slow or down the page is served without
+ * authors rather than failing.
+ */
+@Component
+@ConditionalOnProperty(prefix = "user-service.authors", name = ["enabled"], havingValue = "true", matchIfMissing = true)
+class AuthorDirectory(
+    restClientBuilder: RestClient.Builder,
+    @Value("\${user-service.url:http://localhost:8081}") baseUrl: String,
+    @Value("\${user-service.connect-timeout:PT0.5S}") connectTimeout: Duration,
+    @Value("\${user-service.read-timeout:PT1S}") readTimeout: Duration
+) {
+
+    private val logger = LoggerFactory.getLogger(AuthorDirectory::class.java)
+
+    private val restClient = restClientBuilder
+        .baseUrl(baseUrl)
+        .requestFactory(SimpleClientHttpRequestFactory().apply {
+            setConnectTimeout(connectTimeout.toMillis().toInt())
+            setReadTimeout(readTimeout.toMillis().toInt())
+        })
+        .build()
+
+    /** Summaries keyed by user id, or null when user-service could not be reached */
+    fun lookup(userIds: Collection<UUID>): Map<UUID, AuthorSummary>? {
+        val ids = userIds.distinct()
+        if (ids.isEmpty()) {
+            return emptyMap()
+        }
+        return try {
+            restClient.get()
+                .uri { it.path("/api/users/batch").queryParam("ids", ids.joinToString(",")).build() }
+                .headers { headers -> callerAuthorization()?.let { headers.set(HttpHeaders.AUTHORIZATION, it) } }
+                .retrieve()
+                .body(object : ParameterizedTypeReference<List<AuthorSummary>>() {})
+                .orEmpty()
+                .associateBy { it.id }
+        } catch (e: RestClientException) {
+            logger.warn("Author lookup failed, serving the page without authors: ${e.message}")
+            null
+        }
+    }
+
+    private fun callerAuthorization(): String? =
+        (RequestContextHolder.getRequestAttributes() as? ServletRequestAttributes)
+            ?.request?.getHeader(HttpHeaders.AUTHORIZATION)
+}
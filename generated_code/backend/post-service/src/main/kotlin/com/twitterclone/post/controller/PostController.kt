@@ -4,11 +4,11 @@ import com.twitterclone.post.dto.PostDto
 import com.twitterclone.post.dto.CreatePostRequest
 import com.twitterclone.post.service.PostService
 import jakarta.validation.Valid
-import org.springframework.data.domain.Page
 import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
 import org.springframework.http.HttpStatus
 import org.springframework.http.ResponseEntity
-import org.springframework.security.core.context.SecurityContextHolder
+import com.twitterclone.post.security.AuthenticatedUser
 import org.springframework.web.bind.annotation.*
 import java.util.*
 
@@ -26,6 +26,16 @@ class PostController(
         return ResponseEntity.status(HttpStatus.CREATED).body(post)
     }
     
+    @GetMapping("/search")
+    fun searchPosts(
+        @RequestParam q: String,
+        @RequestParam(defaultValue = "0") page: Int,
+        @RequestParam(defaultValue = "20") size: Int
+    ): ResponseEntity<List<PostDto>> {
+        val posts = postService.searchPosts(q, page, size)
+        return ResponseEntity.ok(posts)
+    }
+    
     @GetMapping("/{id}")
     fun getPostById(@PathVariable id: UUID): ResponseEntity<PostDto> {
         val post = postService.findById(id)
@@ -36,7 +46,7 @@ class PostController(
     fun getPostsByUser(
         @PathVariable userId: UUID,
         pageable: Pageable
-    ): ResponseEntity<Page<PostDto>> {
+    ): ResponseEntity<Slice<PostDto>> {
         val posts = postService.findByUserId(userId, pageable)
         return ResponseEntity.ok(posts)
     }
@@ -55,12 +65,6 @@ class PostController(
         return ResponseEntity.ok(post)
     }
     
-    private fun getCurrentUserId(): UUID {
-        val authentication = SecurityContextHolder.getContext().authentication
-        val username = authentication.name ?: throw RuntimeException("No authenticated user")
-        
-        // For now, we'll create a deterministic UUID based on username
-        // In production, you'd query the user service to get the actual UUID
-        return UUID.nameUUIDFromBytes(username.toByteArray())
-    }
+    // The user-service id from the token's uid claim, the same id the follow graph uses
+    private fun getCurrentUserId(): UUID = AuthenticatedUser.current().id
 }
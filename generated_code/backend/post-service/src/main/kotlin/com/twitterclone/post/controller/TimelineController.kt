@@ -1,49 +1,78 @@
 package com.twitterclone.post.controller
 
+import com.twitterclone.post.author.AuthorDirectory
 import com.twitterclone.post.dto.PostDto
+import com.twitterclone.post.dto.TimelinePage
 import com.twitterclone.post.service.PostService
-import org.springframework.data.domain.Page
-import org.springframework.data.domain.Pageable
-import org.springframework.data.domain.Sort
-import org.springframework.data.web.PageableDefault
+import org.springframework.http.HttpStatus
 import org.springframework.http.ResponseEntity
+import com.twitterclone.post.security.AuthenticatedUser
 import org.springframework.web.bind.annotation.*
+import org.springframework.web.server.ResponseStatusException
 import java.util.*
 
+/**
+ * Timelines are cursor-paginated on (created_at, id): pass the previous page's
+ * nextCursor to get the next one. There is no total count and no page number,
+ * so a deep page costs the same as the first.
+ *
+ * With includeAuthors=true the page also carries an authors map (user id to
+ * username/display name), fetched from user-service in one batch per page.
+ */
 @RestController
 @RequestMapping("/api/timeline")
 @CrossOrigin(origins = ["*"])
 class TimelineController(
-    private val postService: PostService
+    private val postService: PostService,
+    // Absent when user-service.authors.enabled=false; includeAuthors is then ignored
+    private val authorDirectory: AuthorDirectory?
 ) {
     
     @GetMapping("/home")
     fun getHomeTimeline(
-        @PageableDefault(size = 20, sort = ["createdAt"], direction = Sort.Direction.DESC)
-        pageable: Pageable
-    ): ResponseEntity<Page<PostDto>> {
-        // For now, return public timeline
-        // In future, this would be personalized based on followed users
-        val timeline = postService.getPublicTimeline(pageable)
-        return ResponseEntity.ok(timeline)
+        @RequestParam(required = false) cursor: String?,
+        @RequestParam(defaultValue = "20") size: Int,
+        @RequestParam(defaultValue = "false") includeAuthors: Boolean
+    ): ResponseEntity<TimelinePage<PostDto>> {
+        val timeline = withCursor { postService.getHomeTimeline(getCurrentUserId(), cursor, size) }
+        return ResponseEntity.ok(withAuthors(timeline, includeAuthors))
     }
     
     @GetMapping("/user/{userId}")
     fun getUserTimeline(
         @PathVariable userId: UUID,
-        @PageableDefault(size = 20, sort = ["createdAt"], direction = Sort.Direction.DESC)
-        pageable: Pageable
-    ): ResponseEntity<Page<PostDto>> {
-        val timeline = postService.findByUserId(userId, pageable)
-        return ResponseEntity.ok(timeline)
+        @RequestParam(required = false) cursor: String?,
+        @RequestParam(defaultValue = "20") size: Int,
+        @RequestParam(defaultValue = "false") includeAuthors: Boolean
+    ): ResponseEntity<TimelinePage<PostDto>> {
+        val timeline = withCursor { postService.getUserTimeline(userId, cursor, size) }
+        return ResponseEntity.ok(withAuthors(timeline, includeAuthors))
     }
     
     @GetMapping("/public")
     fun getPublicTimeline(
-        @PageableDefault(size = 20, sort = ["createdAt"], direction = Sort.Direction.DESC)
-        pageable: Pageable
-    ): ResponseEntity<Page<PostDto>> {
-        val timeline = postService.getPublicTimeline(pageable)
-        return ResponseEntity.ok(timeline)
+        @RequestParam(required = false) cursor: String?,
+        @RequestParam(defaultValue = "20") size: Int,
+        @RequestParam(defaultValue = "false") includeAuthors: Boolean
+    ): ResponseEntity<TimelinePage<PostDto>> {
+        val timeline = withCursor { postService.getPublicTimeline(cursor, size) }
+        return ResponseEntity.ok(withAuthors(timeline, includeAuthors))
     }
+
+    // Outside PostService's transaction, so no connection is held during the HTTP call
+    private fun withAuthors(page: TimelinePage<PostDto>, includeAuthors: Boolean): TimelinePage<PostDto> {
+        if (!includeAuthors || authorDirectory == null) {
+            return page
+        }
+        return page.copy(authors = authorDirectory.lookup(page.posts.map { it.userId }))
+    }
+
+    private fun getCurrentUserId(): UUID = AuthenticatedUser.current().id
+
+    private fun <T> withCursor(block: () -> T): T =
+        try {
+            block()
+        } catch (e: IllegalArgumentException) {
+            throw ResponseStatusException(HttpStatus.BAD_REQUEST, e.message, e)
+        }
 }
@@ -26,3 +26,19 @@ data class PostLikeDto(
     val userId: UUID,
     val createdAt: LocalDateTime?
 )
+
+@JsonInclude(JsonInclude.Include.NON_NULL)
+data class TimelinePage<T>(
+    val posts: List<T>,
+    val nextCursor: String?,
+    val hasMore: Boolean,
+    // Authors of the page's posts keyed by user id, only with ?includeAuthors=true
+    val authors: Map<UUID, AuthorSummary>? = null
+)
+
+@JsonInclude(JsonInclude.Include.NON_NULL)
+data class AuthorSummary(
+    val id: UUID,
+    val username: String,
+    val displayName: String?
+)
@@ -0,0 +1,31 @@
+package com.twitterclone.post.dto
+
+import java.nio.charset.StandardCharsets
+import java.time.LocalDateTime
+import java.util.*
+
+/**
+ * Position of the last post on a timeline page, keyed on (created_at, id).
+ * Clients treat the encoded form as opaque and send it back as ?cursor=.
+ */
+data class TimelineCursor(
+    val createdAt: LocalDateTime,
+    val id: UUID
+) {
+    fun encode(): String =
+        Base64.getUrlEncoder().withoutPadding()
+            .encodeToString("$createdAt|$id".toByteArray(StandardCharsets.UTF_8))
+
+    companion object {
+        /** @throws IllegalArgumentException if the cursor was not produced by [encode] */
+        fun decode(cursor: String): TimelineCursor {
+            try {
+                val decoded = String(Base64.getUrlDecoder().decode(cursor), StandardCharsets.UTF_8)
+                val (createdAt, id) = decoded.split('|', limit = 2)
+                return TimelineCursor(LocalDateTime.parse(createdAt), UUID.fromString(id))
+            } catch (e: Exception) {
+                throw IllegalArgumentException("Invalid timeline cursor", e)
+            }
+        }
+    }
+}
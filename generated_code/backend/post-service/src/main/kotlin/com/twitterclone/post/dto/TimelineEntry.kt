@@ -0,0 +1,13 @@
+package com.twitterclone.post.dto
+
+import java.time.LocalDateTime
+import java.util.*
+
+/**
+ * A post's position on a timeline, without its content: what the Redis home
+ * timelines store and what PostRepository projects when rebuilding them.
+ */
+data class TimelineEntry(
+    val postId: UUID,
+    val createdAt: LocalDateTime
+)
@@ -8,8 +8,8 @@ import java.util.*
 @Table(
     name = "posts",
     indexes = [
-        Index(name = "idx_post_user", columnList = "user_id"),
-        Index(name = "idx_post_created_at", columnList = "created_at")
+        Index(name = "idx_post_user_created_at_id", columnList = "user_id, created_at DESC, id DESC"),
+        Index(name = "idx_post_created_at_id", columnList = "created_at DESC, id DESC")
     ]
 )
 data class Post(
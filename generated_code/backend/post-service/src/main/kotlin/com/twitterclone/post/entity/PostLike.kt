@@ -8,8 +8,8 @@ import java.util.*
 @Table(
     name = "post_likes",
     indexes = [
-        Index(name = "idx_like_post", columnList = "post_id"),
-        Index(name = "idx_like_user", columnList = "user_id")
+        // Lookups by post use uk_post_like_user, which leads with post_id
+        Index(name = "idx_like_user_created_at", columnList = "user_id, created_at DESC")
     ],
     uniqueConstraints = [
         UniqueConstraint(
@@ -2,7 +2,11 @@ package com.twitterclone.post.repository
 
 import com.twitterclone.post.entity.PostLike
 import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Modifying
+import org.springframework.data.jpa.repository.Query
+import org.springframework.data.repository.query.Param
 import org.springframework.stereotype.Repository
+import java.time.LocalDateTime
 import java.util.*
 
 @Repository
@@ -15,4 +19,30 @@ interface PostLikeRepository : JpaRepository<PostLike, UUID> {
     fun countByPostId(postId: UUID): Long
     
     fun findByPostIdAndUserId(postId: UUID, userId: UUID): PostLike?
+    
+    /**
+     * Records the like unless uk_post_like_user already has it.
+     * Returns 1 when a row was inserted, 0 for a repeated like; concurrent
+     * likes by the same user cannot both insert.
+     */
+    @Modifying
+    @Query(
+        value = """
+            INSERT INTO post_likes (id, post_id, user_id, created_at)
+            VALUES (:id, :postId, :userId, :createdAt)
+            ON CONFLICT DO NOTHING
+        """,
+        nativeQuery = true
+    )
+    fun insertIfAbsent(
+        @Param("id") id: UUID,
+        @Param("postId") postId: UUID,
+        @Param("userId") userId: UUID,
+        @Param("createdAt") createdAt: LocalDateTime
+    ): Int
+    
+    /** Returns the number of likes removed (0 or 1) */
+    @Modifying
+    @Query("DELETE FROM PostLike l WHERE l.postId = :postId AND l.userId = :userId")
+    fun deleteLike(@Param("postId") postId: UUID, @Param("userId") userId: UUID): Int
 }
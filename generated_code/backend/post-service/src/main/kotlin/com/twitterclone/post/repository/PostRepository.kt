@@ -1,26 +1,124 @@
 package com.twitterclone.post.repository
 
+import com.twitterclone.post.dto.PostDto
+import com.twitterclone.post.dto.TimelineEntry
 import com.twitterclone.post.entity.Post
-import org.springframework.data.domain.Page
 import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
 import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Modifying
 import org.springframework.data.jpa.repository.Query
 import org.springframework.data.repository.query.Param
 import org.springframework.stereotype.Repository
+import java.time.LocalDateTime
 import java.util.*
 
 @Repository
 interface PostRepository : JpaRepository<Post, UUID> {
     
-    fun findByUserIdOrderByCreatedAtDesc(userId: UUID, pageable: Pageable): Page<Post>
+    // Read paths select straight into PostDto (constructor projection): no entity
+    // hydration or persistence-context bookkeeping, and Slice instead of Page
+    // fetches one extra row rather than running a COUNT(*).
+    @Query("""
+        SELECT new com.twitterclone.post.dto.PostDto(p.id, p.userId, p.content, p.likeCount, p.isDeleted, p.createdAt)
+        FROM Post p
+        WHERE p.userId = :userId
+        ORDER BY p.createdAt DESC, p.id DESC
+    """)
+    fun findPostsByUser(@Param("userId") userId: UUID, pageable: Pageable): Slice<PostDto>
     
-    fun findAllByIsDeletedFalseOrderByCreatedAtDesc(pageable: Pageable): Page<Post>
+    @Query("""
+        SELECT new com.twitterclone.post.dto.PostDto(p.id, p.userId, p.content, p.likeCount, p.isDeleted, p.createdAt)
+        FROM Post p
+        WHERE p.id IN :ids
+        AND p.isDeleted = false
+    """)
+    fun findPostsByIds(@Param("ids") ids: Collection<UUID>): List<PostDto>
     
+    // Keyset (cursor) timeline queries: ordered on (created_at, id) so they walk
+    // idx_post_created_at_id / idx_post_user_created_at_id without OFFSET or COUNT(*).
+    // "createdAt <= :createdAt" bounds the index range; the OR breaks ties on id.
+    @Query("""
+        SELECT new com.twitterclone.post.dto.PostDto(p.id, p.userId, p.content, p.likeCount, p.isDeleted, p.createdAt)
+        FROM Post p
+        WHERE p.isDeleted = false
+        ORDER BY p.createdAt DESC, p.id DESC
+    """)
+    fun findPublicTimeline(pageable: Pageable): List<PostDto>
+
+    @Query("""
+        SELECT new com.twitterclone.post.dto.PostDto(p.id, p.userId, p.content, p.likeCount, p.isDeleted, p.createdAt)
+        FROM Post p
+        WHERE p.isDeleted = false
+        AND p.createdAt <= :createdAt
+        AND (p.createdAt < :createdAt OR p.id < :id)
+        ORDER BY p.createdAt DESC, p.id DESC
+    """)
+    fun findPublicTimelineBefore(
+        @Param("createdAt") createdAt: LocalDateTime,
+        @Param("id") id: UUID,
+        pageable: Pageable
+    ): List<PostDto>
+
     @Query("""
-        SELECT p FROM Post p 
-        WHERE LOWER(p.content) LIKE LOWER(CONCAT('%', :query, '%'))
+        SELECT new com.twitterclone.post.dto.PostDto(p.id, p.userId, p.content, p.likeCount, p.isDeleted, p.createdAt)
+        FROM Post p
+        WHERE p.userId = :userId
         AND p.isDeleted = false
-        ORDER BY p.createdAt DESC
+        ORDER BY p.createdAt DESC, p.id DESC
     """)
-    fun searchPosts(@Param("query") query: String, pageable: Pageable): Page<Post>
+    fun findUserTimeline(@Param("userId") userId: UUID, pageable: Pageable): List<PostDto>
+
+    // Home timeline rebuilds only need (id, created_at) for the sorted-set members
+    @Query("""
+        SELECT new com.twitterclone.post.dto.TimelineEntry(p.id, p.createdAt)
+        FROM Post p
+        WHERE p.userId IN :userIds
+        AND p.isDeleted = false
+        ORDER BY p.createdAt DESC, p.id DESC
+    """)
+    fun findRecentEntriesByAuthors(@Param("userIds") userIds: Collection<UUID>, pageable: Pageable): List<TimelineEntry>
+
+    @Query("""
+        SELECT new com.twitterclone.post.dto.PostDto(p.id, p.userId, p.content, p.likeCount, p.isDeleted, p.createdAt)
+        FROM Post p
+        WHERE p.userId = :userId
+        AND p.isDeleted = false
+        AND p.createdAt <= :createdAt
+        AND (p.createdAt < :createdAt OR p.id < :id)
+        ORDER BY p.createdAt DESC, p.id DESC
+    """)
+    fun findUserTimelineBefore(
+        @Param("userId") userId: UUID,
+        @Param("createdAt") createdAt: LocalDateTime,
+        @Param("id") id: UUID,
+        pageable: Pageable
+    ): List<PostDto>
+    
+    /**
+     * Adjusts the denormalized like counter in place: one row update under the
+     * row lock, no read-modify-write of the entity. Returns 0 if the post does
+     * not exist (or the count is already 0 when decrementing).
+     */
+    @Modifying(clearAutomatically = true)
+    @Query("UPDATE Post p SET p.likeCount = p.likeCount + 1 WHERE p.id = :postId")
+    fun incrementLikeCount(@Param("postId") postId: UUID): Int
+
+    @Modifying(clearAutomatically = true)
+    @Query("UPDATE Post p SET p.likeCount = p.likeCount - 1 WHERE p.id = :postId AND p.likeCount > 0")
+    fun decrementLikeCount(@Param("postId") postId: UUID): Int
+
+    // Ranked full-text search. The to_tsvector expression must match the
+    // idx_posts_content_fts GIN expression index (V007) for the planner to use it.
+    @Query(
+        value = """
+            SELECT p.* FROM posts p
+            WHERE p.is_deleted = false
+            AND to_tsvector('english', p.content) @@ websearch_to_tsquery('english', :query)
+            ORDER BY ts_rank_cd(to_tsvector('english', p.content), websearch_to_tsquery('english', :query)) DESC,
+                p.created_at DESC
+        """,
+        nativeQuery = true
+    )
+    fun searchPosts(@Param("query") query: String, pageable: Pageable): List<Post>
 }
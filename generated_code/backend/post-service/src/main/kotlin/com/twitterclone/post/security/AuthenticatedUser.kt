@@ -0,0 +1,36 @@
+package com.twitterclone.post.security
+
+import io.jsonwebtoken.Claims
+import org.springframework.security.core.context.SecurityContextHolder
+import java.security.Principal
+import java.util.*
+
+/**
+ * Principal set by [JwtAuthenticationFilter]: the token's subject and the
+ * user-service id of the caller, so posts, likes and follow-driven timelines
+ * all use the ids user-service hands out.
+ */
+data class AuthenticatedUser(
+    val username: String,
+    val id: UUID
+) : Principal {
+
+    override fun getName(): String = username
+
+    companion object {
+        const val USER_ID_CLAIM = "uid"
+
+        fun from(claims: Claims): AuthenticatedUser {
+            val username = claims.subject
+            // Tokens issued before user-service added the uid claim keep the old derived id until they expire
+            val id = (claims[USER_ID_CLAIM] as? String)?.let(UUID::fromString)
+                ?: UUID.nameUUIDFromBytes(username.toByteArray())
+            return AuthenticatedUser(username, id)
+        }
+
+        fun current(): AuthenticatedUser {
+            return SecurityContextHolder.getContext().authentication?.principal as? AuthenticatedUser
+                ?: throw RuntimeException("No authenticated user")
+        }
+    }
+}
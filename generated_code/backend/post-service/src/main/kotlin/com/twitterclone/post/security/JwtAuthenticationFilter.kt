@@ -12,7 +12,7 @@ import org.springframework.web.filter.OncePerRequestFilter
 
 @Component
 class JwtAuthenticationFilter(
-    private val jwtUtil: JwtUtil
+    private val claimsCache: JwtClaimsCache
 ) : OncePerRequestFilter() {
     
     override fun doFilterInternal(
@@ -22,32 +22,20 @@ class JwtAuthenticationFilter(
     ) {
         val authorizationHeader = request.getHeader("Authorization")
         
-        var username: String? = null
-        var jwt: String? = null
-        
-        // Extract JWT token from Authorization header
-        if (authorizationHeader != null && authorizationHeader.startsWith("Bearer ")) {
-            jwt = authorizationHeader.substring(7)
-            try {
-                username = jwtUtil.getUsernameFromToken(jwt)
-            } catch (e: Exception) {
-                logger.warn("Unable to get JWT Token or token expired", e)
-            }
-        }
-        
-        // Validate token and set authentication context
-        if (username != null && SecurityContextHolder.getContext().authentication == null) {
-            try {
-                if (jwt != null && jwtUtil.validateToken(jwt)) {
-                    val authorities = listOf(SimpleGrantedAuthority("USER"))
-                    val authToken = UsernamePasswordAuthenticationToken(
-                        username, null, authorities
-                    )
-                    authToken.details = WebAuthenticationDetailsSource().buildDetails(request)
-                    SecurityContextHolder.getContext().authentication = authToken
-                }
-            } catch (e: Exception) {
-                logger.warn("Authentication failed for user: $username", e)
+        // One cached parse-and-verify per token instead of a parse per claim on every request
+        if (authorizationHeader != null && authorizationHeader.startsWith("Bearer ") &&
+            SecurityContextHolder.getContext().authentication == null
+        ) {
+            val claims = claimsCache.claimsFor(authorizationHeader.substring(7))
+            if (claims?.subject != null) {
+                val authorities = listOf(SimpleGrantedAuthority("USER"))
+                val authToken = UsernamePasswordAuthenticationToken(
+                    AuthenticatedUser.from(claims), null, authorities
+                )
+                authToken.details = WebAuthenticationDetailsSource().buildDetails(request)
+                SecurityContextHolder.getContext().authentication = authToken
+            } else {
+                logger.warn("Invalid or expired JWT token")
             }
         }
         
@@ -0,0 +1,49 @@
+package com.twitterclone.post.security
+
+import com.github.benmanes.caffeine.cache.Cache
+import com.github.benmanes.caffeine.cache.Caffeine
+import com.github.benmanes.caffeine.cache.Expiry
+import io.jsonwebtoken.Claims
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+import java.time.Duration
+import java.time.Instant
+
+/**
+ * Bounded LRU of verified tokens to their claims, so a client's repeat
+ * requests skip the JWT parse and HMAC check.
+ *
+ * Entries live until the token's own expiry, capped at jwt.claims-cache.max-ttl,
+ * so an expired token is never served from the cache. Only valid tokens are
+ * cached; garbage tokens cannot push real ones out.
+ */
+@Component
+class JwtClaimsCache(
+    private val jwtUtil: JwtUtil,
+    @Value("\${jwt.claims-cache.max-size:10000}") maxSize: Long,
+    @Value("\${jwt.claims-cache.max-ttl:PT5M}") private val maxTtl: Duration
+) {
+
+    private val cache: Cache<String, Claims> = Caffeine.newBuilder()
+        .maximumSize(maxSize)
+        .expireAfter(object : Expiry<String, Claims> {
+            override fun expireAfterCreate(token: String, claims: Claims, currentTime: Long): Long =
+                ttl(claims).toNanos()
+
+            override fun expireAfterUpdate(token: String, claims: Claims, currentTime: Long, currentDuration: Long): Long =
+                ttl(claims).toNanos()
+
+            override fun expireAfterRead(token: String, claims: Claims, currentTime: Long, currentDuration: Long): Long =
+                currentDuration
+        })
+        .build()
+
+    /** Claims of a valid, unexpired token; null otherwise */
+    fun claimsFor(token: String): Claims? =
+        cache.getIfPresent(token) ?: jwtUtil.parseAndValidate(token)?.also { cache.put(token, it) }
+
+    private fun ttl(claims: Claims): Duration {
+        val untilExpiry = claims.expiration?.let { Duration.between(Instant.now(), it.toInstant()) } ?: maxTtl
+        return minOf(untilExpiry, maxTtl).coerceAtLeast(Duration.ZERO)
+    }
+}
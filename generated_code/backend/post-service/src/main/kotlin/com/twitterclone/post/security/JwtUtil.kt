@@ -18,6 +18,24 @@ class JwtUtil {
     
     private val key: Key by lazy { Keys.hmacShaKeyFor(jwtSecret.toByteArray()) }
     
+    /**
+     * Verify the signature and expiry in a single parse; returns the claims,
+     * or null for any invalid, tampered or expired token.
+     */
+    fun parseAndValidate(token: String): Claims? {
+        return try {
+            Jwts.parserBuilder()
+                .setSigningKey(key)
+                .build()
+                .parseClaimsJws(token)
+                .body
+        } catch (e: JwtException) {
+            null
+        } catch (e: IllegalArgumentException) {
+            null
+        }
+    }
+    
     fun getUsernameFromToken(token: String): String {
         return getClaimFromToken(token, Claims::getSubject)
     }
@@ -2,21 +2,28 @@ package com.twitterclone.post.service
 
 import com.twitterclone.post.dto.PostDto
 import com.twitterclone.post.dto.CreatePostRequest
+import com.twitterclone.post.dto.TimelineCursor
+import com.twitterclone.post.dto.TimelinePage
 import com.twitterclone.post.entity.Post
-import com.twitterclone.post.entity.PostLike
 import com.twitterclone.post.repository.PostRepository
 import com.twitterclone.post.repository.PostLikeRepository
-import org.springframework.data.domain.Page
+import com.twitterclone.post.timeline.HomeTimelineCache
+import org.springframework.dao.DataAccessException
+import org.springframework.data.domain.PageRequest
 import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
 import org.springframework.stereotype.Service
 import org.springframework.transaction.annotation.Transactional
+import java.time.LocalDateTime
 import java.util.*
 
 @Service
 @Transactional
 class PostService(
     private val postRepository: PostRepository,
-    private val postLikeRepository: PostLikeRepository
+    private val postLikeRepository: PostLikeRepository,
+    // Absent when timeline.cache.enabled=false (e.g. tests without Redis)
+    private val homeTimelineCache: HomeTimelineCache?
 ) {
     
     fun createPost(request: CreatePostRequest, userId: UUID): PostDto {
@@ -26,6 +33,7 @@ class PostService(
         )
         
         val savedPost = postRepository.save(post)
+        homeTimelineCache?.onPostCreated(savedPost)
         return mapToDto(savedPost)
     }
     
@@ -36,53 +44,109 @@ class PostService(
     }
     
     @Transactional(readOnly = true)
-    fun findByUserId(userId: UUID, pageable: Pageable): Page<PostDto> {
-        return postRepository.findByUserIdOrderByCreatedAtDesc(userId, pageable)
-            .map { mapToDto(it) }
+    fun findByUserId(userId: UUID, pageable: Pageable): Slice<PostDto> {
+        return postRepository.findPostsByUser(userId, pageable)
     }
     
+    /**
+     * Likes are idempotent and race-free: the insert is a no-op when the like
+     * exists, and the counter is bumped in the same transaction only when a row
+     * was actually inserted.
+     */
     fun likePost(postId: UUID, userId: UUID): PostDto {
-        val post = postRepository.findById(postId)
-            .orElseThrow { RuntimeException("Post not found") }
-        
-        // Check if already liked
-        if (!postLikeRepository.existsByPostIdAndUserId(postId, userId)) {
-            val postLike = PostLike(
-                postId = postId,
-                userId = userId
-            )
-            postLikeRepository.save(postLike)
-            
-            // Update like count - we'll need to create a new Post instance since it's immutable
-            val updatedPost = post.copy(likeCount = post.likeCount + 1)
-            postRepository.save(updatedPost)
-            return mapToDto(updatedPost)
+        val inserted = postLikeRepository.insertIfAbsent(UUID.randomUUID(), postId, userId, LocalDateTime.now())
+        if (inserted == 1 && postRepository.incrementLikeCount(postId) == 0) {
+            // No such post: throwing rolls the like back
+            throw RuntimeException("Post not found")
         }
-        
-        return mapToDto(post)
+        return findLikedPost(postId)
     }
     
     fun unlikePost(postId: UUID, userId: UUID): PostDto {
+        if (postLikeRepository.deleteLike(postId, userId) == 1) {
+            postRepository.decrementLikeCount(postId)
+        }
+        return findLikedPost(postId)
+    }
+    
+    private fun findLikedPost(postId: UUID): PostDto {
         val post = postRepository.findById(postId)
             .orElseThrow { RuntimeException("Post not found") }
-        
-        // Remove like if exists
-        if (postLikeRepository.existsByPostIdAndUserId(postId, userId)) {
-            postLikeRepository.deleteByPostIdAndUserId(postId, userId)
-            
-            // Update like count
-            val updatedPost = post.copy(likeCount = maxOf(0, post.likeCount - 1))
-            postRepository.save(updatedPost)
-            return mapToDto(updatedPost)
-        }
-        
         return mapToDto(post)
     }
     
     @Transactional(readOnly = true)
-    fun getPublicTimeline(pageable: Pageable): Page<PostDto> {
-        return postRepository.findAllByIsDeletedFalseOrderByCreatedAtDesc(pageable)
-            .map { mapToDto(it) }
+    fun getPublicTimeline(cursor: String?, size: Int): TimelinePage<PostDto> {
+        val limit = timelineLimit(size)
+        val position = cursor?.let { TimelineCursor.decode(it) }
+        val posts = if (position == null) {
+            postRepository.findPublicTimeline(limit)
+        } else {
+            postRepository.findPublicTimelineBefore(position.createdAt, position.id, limit)
+        }
+        return toTimelinePage(posts, limit.pageSize - 1)
+    }
+
+    @Transactional(readOnly = true)
+    fun getUserTimeline(userId: UUID, cursor: String?, size: Int): TimelinePage<PostDto> {
+        val limit = timelineLimit(size)
+        val position = cursor?.let { TimelineCursor.decode(it) }
+        val posts = if (position == null) {
+            postRepository.findUserTimeline(userId, limit)
+        } else {
+            postRepository.findUserTimelineBefore(userId, position.createdAt, position.id, limit)
+        }
+        return toTimelinePage(posts, limit.pageSize - 1)
+    }
+
+    /**
+     * Posts from the accounts the user follows, read from the Redis home timeline.
+     * Users who follow nobody (or deployments without Redis) get the public timeline.
+     */
+    @Transactional(readOnly = true)
+    fun getHomeTimeline(userId: UUID, cursor: String?, size: Int): TimelinePage<PostDto> {
+        if (homeTimelineCache == null || !homeTimelineCache.followsAnyoneOrFalse(userId)) {
+            return getPublicTimeline(cursor, size)
+        }
+        val pageSize = timelineLimit(size).pageSize - 1
+        val entries = try {
+            homeTimelineCache.readPage(userId, cursor?.let { TimelineCursor.decode(it) }, pageSize + 1)
+        } catch (e: DataAccessException) {
+            // Any Redis failure (connection, timeout, command error) degrades to the public timeline
+            return getPublicTimeline(cursor, size)
+        }
+        val page = entries.take(pageSize)
+        // One primary-key lookup for the whole page; deleted posts drop out
+        val posts = postRepository.findPostsByIds(page.map { it.postId }).associateBy { it.id }
+        val hasMore = entries.size > pageSize
+        return TimelinePage(
+            posts = page.mapNotNull { posts[it.postId] },
+            nextCursor = page.lastOrNull()?.takeIf { hasMore }?.let { TimelineCursor(it.createdAt, it.postId).encode() },
+            hasMore = hasMore
+        )
+    }
+
+    @Transactional(readOnly = true)
+    fun searchPosts(query: String, page: Int, size: Int): List<PostDto> {
+        if (query.isBlank()) {
+            return emptyList()
+        }
+        val pageable = PageRequest.of(page.coerceAtLeast(0), size.coerceIn(1, MAX_TIMELINE_PAGE_SIZE))
+        return postRepository.searchPosts(query.trim(), pageable).map { mapToDto(it) }
+    }
+
+    // One extra row tells us whether another page exists without a COUNT(*)
+    private fun timelineLimit(size: Int): Pageable =
+        PageRequest.of(0, size.coerceIn(1, MAX_TIMELINE_PAGE_SIZE) + 1)
+
+    private fun toTimelinePage(posts: List<PostDto>, size: Int): TimelinePage<PostDto> {
+        val page = posts.take(size)
+        val hasMore = posts.size > size
+        return TimelinePage(
+            posts = page,
+            nextCursor = page.lastOrNull()?.takeIf { hasMore }?.let { TimelineCursor(it.createdAt!!, it.id!!).encode() },
+            hasMore = hasMore
+        )
     }
 
     private fun mapToDto(post: Post): PostDto {
@@ -95,4 +159,8 @@ class PostService(
             createdAt = post.createdAt
         )
     }
+
+    companion object {
+        const val MAX_TIMELINE_PAGE_SIZE = 100
+    }
 }
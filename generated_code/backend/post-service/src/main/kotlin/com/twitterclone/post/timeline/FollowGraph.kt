@@ -0,0 +1,47 @@
+package com.twitterclone.post.timeline
+
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.data.redis.core.StringRedisTemplate
+import org.springframework.stereotype.Component
+import java.util.*
+
+/**
+ * Who follows whom, as seen by the timeline fan-out.
+ *
+ * The user-service owns the follow graph and mirrors it into Redis sets:
+ *   follow:followers:{userId}  ids of the users following userId
+ *   follow:following:{userId}  ids of the users userId follows
+ */
+interface FollowGraph {
+    fun followersOf(userId: UUID): Set<UUID>
+    fun followingOf(userId: UUID): Set<UUID>
+    fun followerCount(userId: UUID): Long
+    fun followingCount(userId: UUID): Long
+}
+
+@Component
+@ConditionalOnProperty(prefix = "timeline.cache", name = ["enabled"], havingValue = "true", matchIfMissing = true)
+class RedisFollowGraph(
+    private val redis: StringRedisTemplate
+) : FollowGraph {
+
+    override fun followersOf(userId: UUID): Set<UUID> =
+        toIds(redis.opsForSet().members(followersKey(userId)))
+
+    override fun followingOf(userId: UUID): Set<UUID> =
+        toIds(redis.opsForSet().members(followingKey(userId)))
+
+    override fun followerCount(userId: UUID): Long =
+        redis.opsForSet().size(followersKey(userId)) ?: 0
+
+    override fun followingCount(userId: UUID): Long =
+        redis.opsForSet().size(followingKey(userId)) ?: 0
+
+    private fun toIds(members: Set<String>?): Set<UUID> =
+        members.orEmpty().mapNotNullTo(HashSet()) { runCatching { UUID.fromString(it) }.getOrNull() }
+
+    companion object {
+        fun followersKey(userId: UUID) = "follow:followers:$userId"
+        fun followingKey(userId: UUID) = "follow:following:$userId"
+    }
+}
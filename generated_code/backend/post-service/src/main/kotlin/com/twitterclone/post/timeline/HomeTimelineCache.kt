@@ -0,0 +1,205 @@
+package com.twitterclone.post.timeline
+
+import com.twitterclone.post.dto.TimelineCursor
+import com.twitterclone.post.dto.TimelineEntry
+import com.twitterclone.post.entity.Post
+import com.twitterclone.post.repository.PostRepository
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.dao.DataAccessException
+import org.springframework.data.domain.PageRequest
+import org.springframework.data.redis.connection.zset.Aggregate
+import org.springframework.data.redis.core.RedisCallback
+import org.springframework.data.redis.core.StringRedisTemplate
+import org.springframework.data.redis.core.ZSetOperations
+import org.springframework.stereotype.Component
+import org.springframework.transaction.support.TransactionSynchronization
+import org.springframework.transaction.support.TransactionSynchronizationManager
+import java.time.Duration
+import java.time.LocalDateTime
+import java.time.ZoneOffset
+import java.util.*
+
+/**
+ * Materialized home timelines in Redis sorted sets (fan-out on write).
+ *
+ * Keys (score = created_at in epoch microseconds, member = post id):
+ *   timeline:home:{userId}        posts of everyone userId follows, capped at timeline.home.max-size
+ *   timeline:home:{userId}:ready  set once the timeline was built from Postgres
+ *   timeline:author:{authorId}    recent posts of an author with too many followers to fan out
+ *   timeline:pull-authors         ids of those authors; readers merge their posts in at read time
+ *
+ * Members with equal scores are ordered by post id, which matches the
+ * (created_at, id) keyset order the Postgres timelines use, so the same
+ * TimelineCursor works against either. A missing :ready key (new reader,
+ * Redis restart, follow change) triggers a rebuild from Postgres.
+ */
+@Component
+@ConditionalOnProperty(prefix = "timeline.cache", name = ["enabled"], havingValue = "true", matchIfMissing = true)
+class HomeTimelineCache(
+    private val redis: StringRedisTemplate,
+    private val followGraph: FollowGraph,
+    private val postRepository: PostRepository,
+    @Value("\${timeline.home.max-size:800}") private val maxSize: Int,
+    @Value("\${timeline.home.ttl:P7D}") private val ttl: Duration,
+    @Value("\${timeline.fanout.max-followers:10000}") private val fanoutMaxFollowers: Long
+) {
+
+    private val logger = LoggerFactory.getLogger(HomeTimelineCache::class.java)
+
+    /** False when Redis is unreachable, so callers fall back to the public timeline */
+    fun followsAnyoneOrFalse(userId: UUID): Boolean =
+        try {
+            followGraph.followingCount(userId) > 0
+        } catch (e: DataAccessException) {
+            logger.warn("Redis unavailable, serving the public timeline: ${e.message}")
+            false
+        }
+
+    /** Fan the post out once the surrounding transaction commits, so readers never see a rolled-back post */
+    fun onPostCreated(post: Post) {
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(object : TransactionSynchronization {
+                override fun afterCommit() = fanOutSafely(post)
+            })
+        } else {
+            fanOutSafely(post)
+        }
+    }
+
+    private fun fanOutSafely(post: Post) {
+        try {
+            fanOut(post)
+        } catch (e: Exception) {
+            // The post is committed; a stale timeline heals on the next rebuild
+            logger.warn("Home timeline fan-out failed for post ${post.id}", e)
+        }
+    }
+
+    fun fanOut(post: Post) {
+        val postId = post.id ?: return
+        val author = post.userId
+        val score = score(post.createdAt)
+        val member = postId.toString()
+
+        if (followGraph.followerCount(author) > fanoutMaxFollowers) {
+            // Just crossed the threshold: home rebuilds skip pull authors from now on, so backfill
+            // their recent posts before readers start merging timeline:author:{id} in
+            if (redis.opsForSet().add(PULL_AUTHORS_KEY, author.toString()) == 1L) {
+                rebuildAuthor(author)
+            }
+            addCapped(listOf(authorKey(author), homeKey(author)), score, member)
+            return
+        }
+        val keys = followGraph.followersOf(author).map { homeKey(it) } + homeKey(author)
+        keys.chunked(FANOUT_BATCH).forEach { addCapped(it, score, member) }
+    }
+
+    private fun addCapped(keys: List<String>, score: Double, member: String) {
+        val rawMember = member.toByteArray()
+        redis.executePipelined(RedisCallback<Any?> { connection ->
+            for (key in keys) {
+                val rawKey = key.toByteArray()
+                connection.zSetCommands().zAdd(rawKey, score, rawMember)
+                connection.zSetCommands().zRemRange(rawKey, 0, -(maxSize + 1).toLong())
+                connection.keyCommands().expire(rawKey, ttl.seconds)
+            }
+            null
+        })
+    }
+
+    /** Up to [limit] entries after [before], newest first, merging in followed pull authors */
+    fun readPage(userId: UUID, before: TimelineCursor?, limit: Int): List<TimelineEntry> {
+        if (redis.hasKey(readyKey(userId)) != true) {
+            rebuild(userId)
+        }
+        val entries = range(homeKey(userId), before, limit).toMutableList()
+        val pullAuthors = redis.opsForSet().intersect(RedisFollowGraph.followingKey(userId), PULL_AUTHORS_KEY).orEmpty()
+        for (author in pullAuthors) {
+            val authorId = UUID.fromString(author)
+            if (redis.hasKey(authorKey(authorId)) != true) {
+                rebuildAuthor(authorId)
+            }
+            entries += range(authorKey(authorId), before, limit)
+        }
+        return entries
+            .distinctBy { it.postId }
+            .sortedWith(compareByDescending<TimelineEntry> { it.createdAt }.thenByDescending { it.postId.toString() })
+            .take(limit)
+    }
+
+    private fun range(key: String, before: TimelineCursor?, limit: Int): List<TimelineEntry> {
+        val max = before?.let { score(it.createdAt) } ?: Double.POSITIVE_INFINITY
+        // Inclusive of the cursor's score; a few extra rows cover posts sharing that microsecond
+        val tuples = redis.opsForZSet()
+            .reverseRangeByScoreWithScores(key, Double.NEGATIVE_INFINITY, max, 0, (limit + TIE_SLACK).toLong())
+            .orEmpty()
+        return tuples.asSequence()
+            .filter { before == null || it.score!! < max || it.value!! < before.id.toString() }
+            .map { TimelineEntry(UUID.fromString(it.value), fromScore(it.score!!)) }
+            .take(limit)
+            .toList()
+    }
+
+    /** Rebuild a reader's home timeline from Postgres: latest posts by pushed followees and themselves */
+    fun rebuild(userId: UUID) {
+        val pullAuthors = redis.opsForSet().members(PULL_AUTHORS_KEY).orEmpty()
+        val authors = followGraph.followingOf(userId).filterNot { it.toString() in pullAuthors } + userId
+        val entries = authors.chunked(AUTHOR_QUERY_BATCH)
+            .flatMap { postRepository.findRecentEntriesByAuthors(it, PageRequest.of(0, maxSize)) }
+            .sortedWith(compareByDescending<TimelineEntry> { it.createdAt }.thenByDescending { it.postId.toString() })
+            .take(maxSize)
+        replace(homeKey(userId), entries)
+        redis.opsForValue().set(readyKey(userId), "1", ttl)
+    }
+
+    fun rebuildAuthor(authorId: UUID) {
+        replace(authorKey(authorId), postRepository.findRecentEntriesByAuthors(listOf(authorId), PageRequest.of(0, maxSize)))
+    }
+
+    /** Forget a reader's timeline, e.g. after a follow or unfollow; the next read rebuilds it */
+    fun invalidate(userId: UUID) {
+        redis.delete(listOf(readyKey(userId), homeKey(userId)))
+    }
+
+    private fun replace(key: String, entries: List<TimelineEntry>) {
+        // Build under a temporary key, then merge it in with one atomic ZUNIONSTORE: unlike a RENAME
+        // this keeps fan-out writes that landed on the key while Postgres was being read. Entries of
+        // unfollowed authors cannot linger, because invalidate() deletes the key before a rebuild
+        val tuples = entries.mapTo(HashSet()) { ZSetOperations.TypedTuple.of(it.postId.toString(), score(it.createdAt)) }
+        if (tuples.isEmpty()) {
+            return
+        }
+        val staging = "$key:rebuild:${UUID.randomUUID()}"
+        try {
+            redis.opsForZSet().add(staging, tuples)
+            redis.opsForZSet().unionAndStore(key, listOf(staging), key, Aggregate.MAX)
+            redis.opsForZSet().removeRange(key, 0, -(maxSize + 1).toLong())
+            redis.expire(key, ttl)
+        } finally {
+            redis.delete(staging)
+        }
+    }
+
+    companion object {
+        const val PULL_AUTHORS_KEY = "timeline:pull-authors"
+        private const val FANOUT_BATCH = 1000
+        private const val AUTHOR_QUERY_BATCH = 1000
+        private const val TIE_SLACK = 16
+
+        fun homeKey(userId: UUID) = "timeline:home:$userId"
+        fun readyKey(userId: UUID) = "timeline:home:$userId:ready"
+        fun authorKey(authorId: UUID) = "timeline:author:$authorId"
+
+        fun score(createdAt: LocalDateTime): Double =
+            (createdAt.toEpochSecond(ZoneOffset.UTC) * 1_000_000 + createdAt.nano / 1_000).toDouble()
+
+        fun fromScore(score: Double): LocalDateTime {
+            val micros = score.toLong()
+            return LocalDateTime.ofEpochSecond(
+                Math.floorDiv(micros, 1_000_000L), (Math.floorMod(micros, 1_000_000L) * 1_000).toInt(), ZoneOffset.UTC
+            )
+        }
+    }
+}
@@ -0,0 +1,47 @@
+package com.twitterclone.post.timeline
+
+import org.slf4j.LoggerFactory
+import org.springframework.boot.ApplicationArguments
+import org.springframework.boot.ApplicationRunner
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.data.redis.core.ScanOptions
+import org.springframework.data.redis.core.StringRedisTemplate
+import org.springframework.stereotype.Component
+import java.util.*
+
+/**
+ * Rebuilds every home timeline from Postgres at startup, e.g. after Redis lost
+ * its data. Readers are found through the follow:following:* sets; timelines
+ * that are missing later are rebuilt lazily on first read anyway.
+ *
+ * Enabled with timeline.rebuild-on-startup=true.
+ */
+@Component
+@ConditionalOnProperty(prefix = "timeline", name = ["rebuild-on-startup"], havingValue = "true")
+class HomeTimelineRebuildJob(
+    private val redis: StringRedisTemplate,
+    private val homeTimelineCache: HomeTimelineCache
+) : ApplicationRunner {
+
+    private val logger = LoggerFactory.getLogger(HomeTimelineRebuildJob::class.java)
+
+    override fun run(args: ApplicationArguments) {
+        val rebuilt = rebuildAll()
+        logger.info("Rebuilt $rebuilt home timelines from Postgres")
+    }
+
+    fun rebuildAll(): Int {
+        var rebuilt = 0
+        val options = ScanOptions.scanOptions().match("follow:following:*").count(1000).build()
+        redis.scan(options).use { keys ->
+            keys.forEach { key ->
+                val userId = runCatching { UUID.fromString(key.removePrefix("follow:following:")) }.getOrNull()
+                if (userId != null) {
+                    homeTimelineCache.rebuild(userId)
+                    rebuilt++
+                }
+            }
+        }
+        return rebuilt
+    }
+}
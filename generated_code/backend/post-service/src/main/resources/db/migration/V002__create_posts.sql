@@ -0,0 +1,28 @@
+-- Baseline posts and post_likes tables, matching entity/Post.kt and entity/PostLike.kt
+-- Hibernate only validates the schema (ddl-auto: validate); the timeline
+-- indexes follow in V004.
+--
+-- uk_post_like_user makes a like unique per (post, user). It is the conflict
+-- target of PostLikeRepository.insertIfAbsent and, leading with post_id,
+-- also serves lookups and counts by post, so no separate post_id index.
+
+CREATE TABLE IF NOT EXISTS posts (
+    id         UUID PRIMARY KEY,
+    user_id    UUID NOT NULL,
+    content    VARCHAR(280) NOT NULL,
+    like_count INTEGER NOT NULL DEFAULT 0,
+    is_deleted BOOLEAN NOT NULL DEFAULT false,
+    created_at TIMESTAMP(6) NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS post_likes (
+    id         UUID PRIMARY KEY,
+    post_id    UUID NOT NULL REFERENCES posts (id) ON DELETE CASCADE,
+    user_id    UUID NOT NULL,
+    created_at TIMESTAMP(6) NOT NULL DEFAULT now(),
+    CONSTRAINT uk_post_like_user UNIQUE (post_id, user_id)
+);
+
+-- "Posts liked by user X", newest first
+CREATE INDEX IF NOT EXISTS idx_like_user_created_at
+    ON post_likes (user_id, created_at DESC);
@@ -0,0 +1,16 @@
+-- Composite indexes for keyset (cursor) timeline pagination
+-- Timelines are read as ORDER BY created_at DESC, id DESC with a
+-- "(created_at, id) < cursor" predicate, so the index must lead with the
+-- same columns in the same order; the partial predicate keeps deleted posts
+-- out of the index the public timeline walks.
+
+CREATE INDEX IF NOT EXISTS idx_post_created_at_id
+    ON posts (created_at DESC, id DESC)
+    WHERE is_deleted = false;
+
+CREATE INDEX IF NOT EXISTS idx_post_user_created_at_id
+    ON posts (user_id, created_at DESC, id DESC);
+
+-- Superseded by the composite indexes above
+DROP INDEX IF EXISTS idx_post_created_at;
+DROP INDEX IF EXISTS idx_post_user;
@@ -0,0 +1,9 @@
+-- Full-text search over post content
+-- PostRepository.searchPosts filters on to_tsvector('english', content) @@
+-- websearch_to_tsquery(...) and ranks with ts_rank_cd; the expression index
+-- must use exactly the same expression. Deleted posts are never searched, so
+-- they are left out of the index.
+
+CREATE INDEX IF NOT EXISTS idx_posts_content_fts
+    ON posts USING gin (to_tsvector('english', content))
+    WHERE is_deleted = false;
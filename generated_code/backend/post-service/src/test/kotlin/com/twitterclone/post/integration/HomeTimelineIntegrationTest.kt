@@ -0,0 +1,124 @@
+package com.twitterclone.post.integration
+
+import com.twitterclone.post.dto.CreatePostRequest
+import com.twitterclone.post.dto.PostDto
+import com.twitterclone.post.dto.TimelinePage
+import com.twitterclone.post.security.testToken
+import com.twitterclone.post.test.IntegrationTestBase
+import com.twitterclone.post.timeline.HomeTimelineCache
+import com.twitterclone.post.timeline.RedisFollowGraph
+import org.junit.jupiter.api.Assertions
+import org.junit.jupiter.api.Test
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.core.ParameterizedTypeReference
+import org.springframework.data.redis.core.StringRedisTemplate
+import org.springframework.http.*
+import org.springframework.test.context.DynamicPropertyRegistry
+import org.springframework.test.context.DynamicPropertySource
+import org.testcontainers.containers.GenericContainer
+import org.testcontainers.junit.jupiter.Container
+import java.util.*
+
+/**
+ * Home timeline end to end: user ids come from the tokens' uid claim, the
+ * follow edges are mirrored into Redis the way user-service does it, and the
+ * follower must see the followee's post both after a rebuild and via fan-out.
+ */
+class HomeTimelineIntegrationTest : IntegrationTestBase() {
+
+    companion object {
+        @Container
+        @JvmStatic
+        val redisContainer: GenericContainer<*> = GenericContainer<Nothing>("redis:7-alpine").apply {
+            withExposedPorts(6379)
+        }
+
+        @DynamicPropertySource
+        @JvmStatic
+        fun redisProperties(registry: DynamicPropertyRegistry) {
+            // application-test.yml switches Redis off; this test needs the real home timeline
+            registry.add("spring.autoconfigure.exclude") { "" }
+            registry.add("spring.data.redis.host", redisContainer::getHost)
+            registry.add("spring.data.redis.port") { redisContainer.getMappedPort(6379) }
+            registry.add("timeline.cache.enabled") { "true" }
+            // Authors with more than one follower are read at query time instead of fanned out
+            registry.add("timeline.fanout.max-followers") { "1" }
+        }
+    }
+
+    @Autowired
+    private lateinit var redis: StringRedisTemplate
+
+    private val followee = UUID.randomUUID()
+    private val follower = UUID.randomUUID()
+    private val stranger = UUID.randomUUID()
+
+    @Test
+    fun `followee's post appears in the follower's home timeline`() {
+        follow(follower, followee)
+        val before = post(stranger, "not followed")
+        // First read builds the follower's timeline from Postgres (and marks it ready)
+        val rebuilt = homeTimeline(follower)
+        Assertions.assertTrue(rebuilt.posts.none { it.id == before.id })
+
+        // Later posts reach the ready timeline through fan-out on write
+        val created = post(followee, "hello followers")
+        val timeline = homeTimeline(follower)
+
+        val first = timeline.posts.first()
+        Assertions.assertEquals(created.id, first.id)
+        Assertions.assertEquals(followee, first.userId)
+        Assertions.assertTrue(timeline.posts.none { it.userId == stranger })
+    }
+
+    @Test
+    fun `earlier posts stay visible when an author becomes a pull author`() {
+        val author = UUID.randomUUID()
+        val reader = UUID.randomUUID()
+        follow(reader, author)
+        val earlier = post(author, "pushed to one follower")
+
+        // A second follower takes the author over the fan-out threshold on the next post
+        follow(UUID.randomUUID(), author)
+        val later = post(author, "read at query time")
+        // Force a home rebuild, which leaves pull authors out
+        redis.delete(HomeTimelineCache.readyKey(reader))
+        redis.delete(HomeTimelineCache.homeKey(reader))
+
+        val ids = homeTimeline(reader).posts.map { it.id }
+        Assertions.assertEquals(listOf(later.id, earlier.id), ids)
+    }
+
+    private fun follow(followerId: UUID, followeeId: UUID) {
+        redis.opsForSet().add(RedisFollowGraph.followersKey(followeeId), followerId.toString())
+        redis.opsForSet().add(RedisFollowGraph.followingKey(followerId), followeeId.toString())
+    }
+
+    private fun post(userId: UUID, content: String): PostDto {
+        val response = restTemplate.postForEntity(
+            "${getBaseUrl()}/api/posts",
+            HttpEntity(CreatePostRequest(content = content), headersFor(userId)),
+            PostDto::class.java
+        )
+        Assertions.assertEquals(HttpStatus.CREATED, response.statusCode)
+        return response.body!!
+    }
+
+    private fun homeTimeline(userId: UUID): TimelinePage<PostDto> {
+        val response = restTemplate.exchange(
+            "${getBaseUrl()}/api/timeline/home?size=20",
+            HttpMethod.GET,
+            HttpEntity<Void>(headersFor(userId)),
+            object : ParameterizedTypeReference<TimelinePage<PostDto>>() {}
+        )
+        Assertions.assertEquals(HttpStatus.OK, response.statusCode)
+        return response.body!!
+    }
+
+    private fun headersFor(userId: UUID): HttpHeaders {
+        val headers = HttpHeaders()
+        headers.setBearerAuth(testToken("user-$userId", userId = userId))
+        headers.contentType = MediaType.APPLICATION_JSON
+        return headers
+    }
+}
@@ -0,0 +1,78 @@
+package com.twitterclone.post.integration
+
+import com.twitterclone.post.dto.CreatePostRequest
+import com.twitterclone.post.repository.PostLikeRepository
+import com.twitterclone.post.repository.PostRepository
+import com.twitterclone.post.service.PostService
+import com.twitterclone.post.test.IntegrationTestBase
+import org.junit.jupiter.api.Assertions
+import org.junit.jupiter.api.Test
+import org.springframework.beans.factory.annotation.Autowired
+import java.util.*
+import java.util.concurrent.Callable
+import java.util.concurrent.CountDownLatch
+import java.util.concurrent.Executors
+import java.util.concurrent.TimeUnit
+
+/**
+ * Hot-post contention against real PostgreSQL: many users like and unlike the
+ * same post at once, and every user repeats the request, yet the counter must
+ * equal the number of distinct likers.
+ */
+class PostLikeConcurrencyTest : IntegrationTestBase() {
+
+    @Autowired
+    private lateinit var postService: PostService
+
+    @Autowired
+    private lateinit var postRepository: PostRepository
+
+    @Autowired
+    private lateinit var postLikeRepository: PostLikeRepository
+
+    private val users = List(50) { UUID.randomUUID() }
+
+    private fun runConcurrently(tasks: List<() -> Unit>) {
+        val pool = Executors.newFixedThreadPool(16)
+        val start = CountDownLatch(1)
+        val futures = tasks.map { task -> pool.submit(Callable { start.await(); task() }) }
+        start.countDown()
+        futures.forEach { it.get(60, TimeUnit.SECONDS) }
+        pool.shutdown()
+    }
+
+    @Test
+    fun `concurrent and repeated likes count each user once`() {
+        val postId = postService.createPost(CreatePostRequest("Hot post"), UUID.randomUUID()).id!!
+
+        // Every user likes three times, all racing
+        runConcurrently(users.flatMap { user -> List(3) { { postService.likePost(postId, user); Unit } } })
+
+        Assertions.assertEquals(users.size, postRepository.findById(postId).get().likeCount)
+        Assertions.assertEquals(users.size.toLong(), postLikeRepository.countByPostId(postId))
+    }
+
+    @Test
+    fun `concurrent unlikes never drive the counter below the remaining likes`() {
+        val postId = postService.createPost(CreatePostRequest("Hot post"), UUID.randomUUID()).id!!
+        users.forEach { postService.likePost(postId, it) }
+
+        // Half the users unlike twice while the other half like again
+        val (leaving, staying) = users.chunked(users.size / 2)
+        runConcurrently(
+            leaving.flatMap { user -> List(2) { { postService.unlikePost(postId, user); Unit } } } +
+                staying.map { user -> { postService.likePost(postId, user); Unit } }
+        )
+
+        Assertions.assertEquals(staying.size, postRepository.findById(postId).get().likeCount)
+        Assertions.assertEquals(staying.size.toLong(), postLikeRepository.countByPostId(postId))
+    }
+
+    @Test
+    fun `liking a missing post leaves no like behind`() {
+        val missing = UUID.randomUUID()
+
+        Assertions.assertThrows(RuntimeException::class.java) { postService.likePost(missing, users.first()) }
+        Assertions.assertEquals(0L, postLikeRepository.countByPostId(missing))
+    }
+}
@@ -39,6 +39,7 @@ class PostServiceIntegrationTest {
         fun generateTestJwtToken(userId: UUID = UUID.randomUUID()): String {
             return Jwts.builder()
                 .setSubject(userId.toString())
+                .claim("uid", userId.toString())
                 .setIssuedAt(Date(System.currentTimeMillis()))
                 .setExpiration(Date(System.currentTimeMillis() + 86400000)) // 24 hours
                 .signWith(key, SignatureAlgorithm.HS512)
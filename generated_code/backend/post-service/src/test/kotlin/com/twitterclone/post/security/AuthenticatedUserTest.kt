@@ -0,0 +1,27 @@
+package com.twitterclone.post.security
+
+import io.jsonwebtoken.Jwts
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Test
+import java.util.*
+
+class AuthenticatedUserTest {
+
+    @Test
+    fun `user id comes from the uid claim issued by user-service`() {
+        val userId = UUID.randomUUID()
+        val claims = testJwtUtil().parseAndValidate(testToken("alice", userId = userId))!!
+
+        val user = AuthenticatedUser.from(claims)
+
+        assertEquals(AuthenticatedUser("alice", userId), user)
+        assertEquals("alice", user.name)
+    }
+
+    @Test
+    fun `token without a uid claim keeps the legacy derived id`() {
+        val claims = Jwts.claims().setSubject("alice")
+
+        assertEquals(UUID.nameUUIDFromBytes("alice".toByteArray()), AuthenticatedUser.from(claims).id)
+    }
+}
@@ -0,0 +1,62 @@
+package com.twitterclone.post.security
+
+import org.junit.jupiter.api.AfterEach
+import org.junit.jupiter.api.Assertions.assertTrue
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.condition.EnabledIfSystemProperty
+import org.springframework.mock.web.MockFilterChain
+import org.springframework.mock.web.MockHttpServletRequest
+import org.springframework.mock.web.MockHttpServletResponse
+import org.springframework.security.core.context.SecurityContextHolder
+import java.time.Duration
+
+/**
+ * Per-request overhead of JWT authentication, before and after the claims cache:
+ *   - parse twice: the previous filter (getUsernameFromToken, then validateToken)
+ *   - parse once:  JwtUtil.parseAndValidate without caching
+ *   - filter:      JwtAuthenticationFilter with a warm JwtClaimsCache
+ *
+ * Opt-in, as timings are machine dependent:
+ *   ./gradlew :post-service:test -Dbenchmark=true --tests '*JwtAuthenticationFilterBenchmark'
+ */
+@EnabledIfSystemProperty(named = "benchmark", matches = "true")
+class JwtAuthenticationFilterBenchmark {
+
+    private val jwtUtil = testJwtUtil()
+    private val filter = JwtAuthenticationFilter(JwtClaimsCache(jwtUtil, 10_000, Duration.ofMinutes(5)))
+    private val token = testToken("bench-user")
+
+    @AfterEach
+    fun clearContext() = SecurityContextHolder.clearContext()
+
+    @Test
+    fun `cached filter is cheaper than parsing the token per request`() {
+        val parseTwice = nanosPerOp {
+            jwtUtil.getUsernameFromToken(token)
+            jwtUtil.validateToken(token)
+        }
+        val parseOnce = nanosPerOp { jwtUtil.parseAndValidate(token) }
+        val filtered = nanosPerOp {
+            val request = MockHttpServletRequest("GET", "/api/timeline/public")
+            request.addHeader("Authorization", "Bearer $token")
+            filter.doFilter(request, MockHttpServletResponse(), MockFilterChain())
+            SecurityContextHolder.clearContext()
+        }
+
+        println("JWT auth per request: parse twice %,d ns | parse once %,d ns | cached filter %,d ns"
+            .format(parseTwice, parseOnce, filtered))
+        assertTrue(filtered < parseOnce, "cached filter ($filtered ns) should beat a single parse ($parseOnce ns)")
+    }
+
+    private fun nanosPerOp(operation: () -> Unit): Long {
+        repeat(WARMUP) { operation() }
+        val started = System.nanoTime()
+        repeat(ITERATIONS) { operation() }
+        return (System.nanoTime() - started) / ITERATIONS
+    }
+
+    companion object {
+        private const val WARMUP = 20_000
+        private const val ITERATIONS = 100_000
+    }
+}
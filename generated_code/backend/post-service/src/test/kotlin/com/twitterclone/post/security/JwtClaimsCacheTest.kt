@@ -0,0 +1,51 @@
+package com.twitterclone.post.security
+
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertNull
+import org.junit.jupiter.api.Assertions.assertSame
+import org.junit.jupiter.api.Test
+import java.time.Duration
+
+class JwtClaimsCacheTest {
+
+    private val claimsCache = JwtClaimsCache(testJwtUtil(), 100, Duration.ofMinutes(5))
+
+    @Test
+    fun `valid token is parsed once and then served from the cache`() {
+        val token = testToken("alice")
+
+        val first = claimsCache.claimsFor(token)
+        val second = claimsCache.claimsFor(token)
+
+        assertEquals("alice", first?.subject)
+        assertSame(first, second)
+    }
+
+    @Test
+    fun `expired token is rejected`() {
+        assertNull(claimsCache.claimsFor(testToken("alice", validFor = Duration.ofMinutes(-1))))
+    }
+
+    @Test
+    fun `token signed with another key is rejected`() {
+        val forged = testToken("alice", secret = TEST_JWT_SECRET.reversed())
+
+        assertNull(claimsCache.claimsFor(forged))
+    }
+
+    @Test
+    fun `malformed token is rejected`() {
+        assertNull(claimsCache.claimsFor("not-a-jwt"))
+    }
+
+    @Test
+    fun `cached entry does not outlive the token`() {
+        // exp is truncated to whole seconds, so a 3s token has 2-3s left: enough for the first parse
+        val token = testToken("alice", validFor = Duration.ofSeconds(3))
+        assertEquals("alice", claimsCache.claimsFor(token)?.subject)
+
+        Thread.sleep(4_000)
+
+        assertNull(claimsCache.claimsFor(token))
+    }
+}
@@ -0,0 +1,31 @@
+package com.twitterclone.post.security
+
+import io.jsonwebtoken.Jwts
+import io.jsonwebtoken.SignatureAlgorithm
+import io.jsonwebtoken.security.Keys
+import org.springframework.test.util.ReflectionTestUtils
+import java.time.Duration
+import java.time.Instant
+import java.util.*
+
+const val TEST_JWT_SECRET =
+    "myVerySecretKeyThatShouldBeAtLeast512BitsLongForHS512AlgorithmSoItNeedsToBeReallyReallyLongToMeetTheRequirements"
+
+fun testJwtUtil(): JwtUtil = JwtUtil().also { ReflectionTestUtils.setField(it, "jwtSecret", TEST_JWT_SECRET) }
+
+/** HS512 token as issued by user-service; a negative [validFor] gives an expired token */
+fun testToken(
+    username: String,
+    validFor: Duration = Duration.ofHours(1),
+    secret: String = TEST_JWT_SECRET,
+    userId: UUID = UUID.nameUUIDFromBytes(username.toByteArray())
+): String {
+    val now = Instant.now()
+    return Jwts.builder()
+        .setSubject(username)
+        .claim(AuthenticatedUser.USER_ID_CLAIM, userId.toString())
+        .setIssuedAt(Date.from(now.minusSeconds(60)))
+        .setExpiration(Date.from(now.plus(validFor)))
+        .signWith(Keys.hmacShaKeyFor(secret.toByteArray()), SignatureAlgorithm.HS512)
+        .compact()
+}
@@ -45,6 +45,10 @@ abstract class IntegrationTestBase {
             registry.add("spring.datasource.username", postgres::getUsername)
             registry.add("spring.datasource.password", postgres::getPassword)
             registry.add("spring.datasource.driver-class-name") { "org.postgresql.Driver" }
+            // Real Postgres: build the schema from the Flyway migrations and validate the entities against it
+            registry.add("spring.flyway.enabled") { "true" }
+            registry.add("spring.jpa.hibernate.ddl-auto") { "validate" }
+            registry.add("spring.jpa.properties.hibernate.dialect") { "org.hibernate.dialect.PostgreSQLDialect" }
         }
     }
 
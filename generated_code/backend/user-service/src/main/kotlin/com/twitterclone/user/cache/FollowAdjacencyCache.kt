@@ -0,0 +1,170 @@
+package com.twitterclone.user.cache
+
+import com.twitterclone.user.dto.FollowEdge
+import com.twitterclone.user.repository.FollowRepository
+import org.slf4j.LoggerFactory
+import org.springframework.boot.ApplicationArguments
+import org.springframework.boot.ApplicationRunner
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.data.domain.PageRequest
+import org.springframework.data.redis.connection.RedisConnection
+import org.springframework.data.redis.core.RedisCallback
+import org.springframework.data.redis.core.ScanOptions
+import org.springframework.data.redis.core.StringRedisTemplate
+import org.springframework.stereotype.Component
+import org.springframework.transaction.support.TransactionSynchronization
+import org.springframework.transaction.support.TransactionSynchronizationManager
+import java.util.*
+
+/**
+ * Mirror of the follows table as Redis sets, shared with post-service:
+ *   follow:followers:{userId}  ids of the users following userId
+ *   follow:following:{userId}  ids of the users userId follows
+ *   follow:graph:warm          set once the whole table has been loaded
+ *
+ * Follows and unfollows are written through after commit, and post-service's
+ * home timeline for the follower (timeline:home:{id}:ready) is invalidated so
+ * it is rebuilt with the new followee. Bulk lookups pipeline one SMEMBERS per
+ * user, so timeline fan-out never runs per-user SQL.
+ *
+ * The mirror is (re)loaded from Postgres at startup when the warm marker is
+ * missing, e.g. after Redis lost its data or a write-through failed. A reload
+ * builds every set under a staging prefix, deletes live sets the table no
+ * longer backs and renames the staged sets over the live ones, so edges
+ * removed while the mirror was stale do not survive it.
+ */
+@Component
+@ConditionalOnProperty(prefix = "follow.cache", name = ["enabled"], havingValue = "true", matchIfMissing = true)
+class FollowAdjacencyCache(
+    private val redis: StringRedisTemplate,
+    private val followRepository: FollowRepository
+) : ApplicationRunner {
+
+    private val logger = LoggerFactory.getLogger(FollowAdjacencyCache::class.java)
+
+    val isWarm: Boolean
+        get() = redis.hasKey(WARM_KEY) == true
+
+    override fun run(args: ApplicationArguments) {
+        try {
+            if (!isWarm) {
+                logger.info("Loaded ${warm()} follow edges into Redis")
+            }
+        } catch (e: Exception) {
+            // Reads fall back to Postgres until the mirror is warm
+            logger.warn("Could not warm the follow adjacency cache", e)
+        }
+    }
+
+    /** Rebuild every set from Postgres; returns the number of edges loaded */
+    fun warm(): Long {
+        val staging = "$STAGING_PREFIX${UUID.randomUUID()}:"
+        var loaded = 0L
+        val batch = PageRequest.of(0, WARM_BATCH)
+        var edges = followRepository.findFirstEdges(batch)
+        while (edges.isNotEmpty()) {
+            write(edges, add = true, prefix = staging)
+            loaded += edges.size
+            val last = edges.last()
+            edges = followRepository.findEdgesAfter(last.followerId, last.followeeId, batch)
+        }
+        // Live sets without a staged replacement only hold edges that no longer exist
+        val live = scanKeys("$FOLLOWERS_PREFIX*") + scanKeys("$FOLLOWING_PREFIX*")
+        live.chunked(WARM_BATCH).forEach { keys ->
+            val staged = pipelined(keys) { connection, key -> connection.keyCommands().exists((staging + key).toByteArray()) }
+            val orphans = keys.filterIndexed { index, _ -> staged[index] != true }
+            if (orphans.isNotEmpty()) redis.delete(orphans)
+        }
+        scanKeys("$staging*").chunked(WARM_BATCH).forEach { keys ->
+            pipelined(keys) { connection, key ->
+                connection.keyCommands().rename(key.toByteArray(), key.removePrefix(staging).toByteArray())
+            }
+        }
+        redis.opsForValue().set(WARM_KEY, "1")
+        return loaded
+    }
+
+    private fun scanKeys(pattern: String): List<String> =
+        redis.scan(ScanOptions.scanOptions().match(pattern).count(WARM_BATCH.toLong()).build()).use { it.asSequence().toList() }
+
+    private fun pipelined(keys: List<String>, command: (RedisConnection, String) -> Unit): List<Any?> =
+        redis.executePipelined(RedisCallback<Any?> { connection ->
+            keys.forEach { command(connection, it) }
+            null
+        })
+
+    fun onFollowed(edge: FollowEdge) = afterCommit { write(listOf(edge), add = true) }
+
+    fun onUnfollowed(edge: FollowEdge) = afterCommit { write(listOf(edge), add = false) }
+
+    fun followersOf(userIds: Collection<UUID>): Map<UUID, Set<UUID>> = members(userIds, ::followersKey)
+
+    fun followingOf(userIds: Collection<UUID>): Map<UUID, Set<UUID>> = members(userIds, ::followingKey)
+
+    private fun members(userIds: Collection<UUID>, key: (UUID) -> String): Map<UUID, Set<UUID>> {
+        val ids = userIds.distinct()
+        val results = redis.executePipelined(RedisCallback<Any?> { connection ->
+            ids.forEach { connection.setCommands().sMembers(key(it).toByteArray()) }
+            null
+        })
+        return ids.zip(results).associate { (id, members) ->
+            @Suppress("UNCHECKED_CAST")
+            id to (members as? Collection<String>).orEmpty().mapTo(HashSet()) { UUID.fromString(it) }
+        }
+    }
+
+    private fun write(edges: List<FollowEdge>, add: Boolean, prefix: String = "") {
+        if (edges.isEmpty()) return
+        redis.executePipelined(RedisCallback<Any?> { connection ->
+            val sets = connection.setCommands()
+            for (edge in edges) {
+                val follower = edge.followerId.toString().toByteArray()
+                val followee = edge.followeeId.toString().toByteArray()
+                val followersKey = (prefix + followersKey(edge.followeeId)).toByteArray()
+                val followingKey = (prefix + followingKey(edge.followerId)).toByteArray()
+                if (add) {
+                    sets.sAdd(followersKey, follower)
+                    sets.sAdd(followingKey, followee)
+                } else {
+                    sets.sRem(followersKey, follower)
+                    sets.sRem(followingKey, followee)
+                }
+            }
+            null
+        })
+    }
+
+    private fun afterCommit(action: () -> Unit) {
+        val safely = {
+            try {
+                action()
+            } catch (e: Exception) {
+                // Postgres stays authoritative; drop the marker so the next start reloads the mirror
+                logger.warn("Follow adjacency cache update failed", e)
+                runCatching { redis.delete(WARM_KEY) }
+            }
+        }
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(object : TransactionSynchronization {
+                override fun afterCommit() = safely()
+            })
+        } else {
+            safely()
+        }
+    }
+
+    fun invalidateHomeTimeline(userId: UUID) = afterCommit {
+        redis.delete("timeline:home:$userId:ready")
+    }
+
+    companion object {
+        const val WARM_KEY = "follow:graph:warm"
+        private const val WARM_BATCH = 10_000
+        private const val FOLLOWERS_PREFIX = "follow:followers:"
+        private const val FOLLOWING_PREFIX = "follow:following:"
+        private const val STAGING_PREFIX = "follow:staging:"
+
+        fun followersKey(userId: UUID) = "$FOLLOWERS_PREFIX$userId"
+        fun followingKey(userId: UUID) = "$FOLLOWING_PREFIX$userId"
+    }
+}
@@ -0,0 +1,86 @@
+package com.twitterclone.user.cache
+
+import com.fasterxml.jackson.databind.ObjectMapper
+import com.twitterclone.user.dto.UserSummaryDto
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.data.redis.connection.RedisStringCommands
+import org.springframework.data.redis.core.RedisCallback
+import org.springframework.data.redis.core.StringRedisTemplate
+import org.springframework.data.redis.core.types.Expiration
+import org.springframework.stereotype.Component
+import org.springframework.transaction.support.TransactionSynchronization
+import org.springframework.transaction.support.TransactionSynchronizationManager
+import java.time.Duration
+import java.util.*
+
+/**
+ * Short-lived cache of user summaries for batch lookups (GET /api/users/batch):
+ *   user:summary:{userId}  UserSummaryDto as JSON, expiring after user.summary-cache.ttl
+ *
+ * Timeline pages ask for the same handful of authors over and over, so a
+ * page's lookup is usually one MGET. Profile updates evict the entry after
+ * commit; the TTL bounds staleness for anything else. Redis failures are
+ * logged and the lookup falls through to Postgres.
+ */
+@Component
+@ConditionalOnProperty(prefix = "user.summary-cache", name = ["enabled"], havingValue = "true", matchIfMissing = true)
+class UserSummaryCache(
+    private val redis: StringRedisTemplate,
+    private val objectMapper: ObjectMapper,
+    @Value("\${user.summary-cache.ttl:PT60S}") private val ttl: Duration
+) {
+
+    private val logger = LoggerFactory.getLogger(UserSummaryCache::class.java)
+
+    /** Cached summaries for [userIds]; misses are simply absent */
+    fun getAll(userIds: List<UUID>): Map<UUID, UserSummaryDto> =
+        try {
+            val values = redis.opsForValue().multiGet(userIds.map(::key)).orEmpty()
+            userIds.zip(values)
+                .mapNotNull { (id, json) -> json?.let { id to objectMapper.readValue(it, UserSummaryDto::class.java) } }
+                .toMap()
+        } catch (e: Exception) {
+            logger.warn("User summary cache read failed", e)
+            emptyMap()
+        }
+
+    fun putAll(users: Collection<UserSummaryDto>) {
+        if (users.isEmpty()) return
+        try {
+            val expiration = Expiration.from(ttl)
+            redis.executePipelined(RedisCallback<Any?> { connection ->
+                for (user in users) {
+                    connection.stringCommands().set(
+                        key(user.id).toByteArray(),
+                        objectMapper.writeValueAsBytes(user),
+                        expiration,
+                        RedisStringCommands.SetOption.upsert()
+                    )
+                }
+                null
+            })
+        } catch (e: Exception) {
+            logger.warn("User summary cache write failed", e)
+        }
+    }
+
+    /** Drop a user's summary once the surrounding transaction commits */
+    fun evict(userId: UUID) {
+        val evict = { runCatching { redis.delete(key(userId)) }.onFailure { logger.warn("User summary eviction failed", it) } }
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(object : TransactionSynchronization {
+                override fun afterCommit() {
+                    evict()
+                }
+            })
+        } else {
+            evict()
+        }
+    }
+
+    companion object {
+        fun key(userId: UUID) = "user:summary:$userId"
+    }
+}
@@ -21,7 +21,7 @@ class AuthController(
     @PostMapping("/register")
     fun register(@Valid @RequestBody request: RegisterRequest): ResponseEntity<AuthResponse> {
         val user = authService.register(request)
-        val token = jwtUtil.generateToken(user.username)
+        val token = jwtUtil.generateToken(user.username, requireNotNull(user.id))
         val response = AuthResponse(
             token = token,
             tokenType = "Bearer",
@@ -34,7 +34,7 @@ class AuthController(
     @PostMapping("/login")
     fun login(@Valid @RequestBody request: LoginRequest): ResponseEntity<AuthResponse> {
         val user = authService.login(request.usernameOrEmail, request.password)
-        val token = jwtUtil.generateToken(user.username)
+        val token = jwtUtil.generateToken(user.username, requireNotNull(user.id))
         val response = AuthResponse(
             token = token,
             tokenType = "Bearer",
@@ -0,0 +1,65 @@
+package com.twitterclone.user.controller
+
+import com.twitterclone.user.dto.BulkAdjacencyRequest
+import com.twitterclone.user.dto.FollowStatsDto
+import com.twitterclone.user.dto.UserDto
+import com.twitterclone.user.repository.UserRepository
+import com.twitterclone.user.service.FollowService
+import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
+import org.springframework.http.ResponseEntity
+import org.springframework.security.core.context.SecurityContextHolder
+import org.springframework.web.bind.annotation.*
+import java.util.*
+
+@RestController
+@RequestMapping("/api/users")
+@CrossOrigin(origins = ["http://localhost:3000"])
+class FollowController(
+    private val followService: FollowService,
+    private val userRepository: UserRepository
+) {
+    
+    @PostMapping("/{id}/follow")
+    fun follow(@PathVariable id: UUID): ResponseEntity<FollowStatsDto> {
+        return ResponseEntity.ok(followService.follow(getCurrentUserId(), id))
+    }
+    
+    @DeleteMapping("/{id}/follow")
+    fun unfollow(@PathVariable id: UUID): ResponseEntity<FollowStatsDto> {
+        return ResponseEntity.ok(followService.unfollow(getCurrentUserId(), id))
+    }
+    
+    @GetMapping("/{id}/follow-stats")
+    fun getFollowStats(@PathVariable id: UUID): ResponseEntity<FollowStatsDto> {
+        return ResponseEntity.ok(followService.stats(id, getCurrentUserId()))
+    }
+    
+    @GetMapping("/{id}/followers")
+    fun getFollowers(@PathVariable id: UUID, pageable: Pageable): ResponseEntity<Slice<UserDto>> {
+        return ResponseEntity.ok(followService.followers(id, pageable))
+    }
+    
+    @GetMapping("/{id}/following")
+    fun getFollowing(@PathVariable id: UUID, pageable: Pageable): ResponseEntity<Slice<UserDto>> {
+        return ResponseEntity.ok(followService.following(id, pageable))
+    }
+    
+    // Bulk adjacency for service-to-service callers such as timeline fan-out
+    @PostMapping("/followers/lookup")
+    fun lookupFollowers(@RequestBody request: BulkAdjacencyRequest): ResponseEntity<Map<UUID, Set<UUID>>> {
+        return ResponseEntity.ok(followService.followerIds(request.userIds))
+    }
+    
+    @PostMapping("/following/lookup")
+    fun lookupFollowing(@RequestBody request: BulkAdjacencyRequest): ResponseEntity<Map<UUID, Set<UUID>>> {
+        return ResponseEntity.ok(followService.followingIds(request.userIds))
+    }
+    
+    private fun getCurrentUserId(): UUID {
+        val username = SecurityContextHolder.getContext().authentication?.name
+            ?: throw RuntimeException("No authenticated user")
+        return userRepository.findByUsername(username)?.id
+            ?: throw RuntimeException("User not found with username: $username")
+    }
+}
@@ -3,10 +3,11 @@ package com.twitterclone.user.controller
 import com.twitterclone.user.dto.CreateUserRequest
 import com.twitterclone.user.dto.UpdateUserProfileRequest
 import com.twitterclone.user.dto.UserDto
+import com.twitterclone.user.dto.UserSummaryDto
 import com.twitterclone.user.service.UserService
 import jakarta.validation.Valid
-import org.springframework.data.domain.Page
 import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
 import org.springframework.http.HttpStatus
 import org.springframework.http.ResponseEntity
 import org.springframework.web.bind.annotation.*
@@ -19,6 +20,17 @@ class UserController(
     private val userService: UserService
 ) {
     
+    @GetMapping
+    fun getActiveUsers(pageable: Pageable): ResponseEntity<Slice<UserDto>> {
+        return ResponseEntity.ok(userService.findActiveUsers(pageable))
+    }
+    
+    // Batch author lookup for timeline pages: /api/users/batch?ids=a,b,c
+    @GetMapping("/batch")
+    fun getUsersBatch(@RequestParam ids: List<UUID>): ResponseEntity<List<UserSummaryDto>> {
+        return ResponseEntity.ok(userService.findSummaries(ids))
+    }
+    
     @GetMapping("/{id}")
     fun getUserById(@PathVariable id: UUID): ResponseEntity<UserDto> {
         val user = userService.findById(id)
@@ -50,8 +62,17 @@ class UserController(
     fun searchUsers(
         @RequestParam q: String,
         pageable: Pageable
-    ): ResponseEntity<Page<UserDto>> {
+    ): ResponseEntity<Slice<UserDto>> {
         val users = userService.searchUsers(q, pageable)
         return ResponseEntity.ok(users)
     }
+    
+    @GetMapping("/autocomplete")
+    fun autocompleteUsernames(
+        @RequestParam prefix: String,
+        @RequestParam(defaultValue = "10") limit: Int
+    ): ResponseEntity<List<UserDto>> {
+        val users = userService.autocompleteUsernames(prefix, limit)
+        return ResponseEntity.ok(users)
+    }
 }
@@ -0,0 +1,22 @@
+package com.twitterclone.user.dto
+
+import com.fasterxml.jackson.annotation.JsonInclude
+import java.util.*
+
+data class FollowEdge(
+    val followerId: UUID,
+    val followeeId: UUID
+)
+
+@JsonInclude(JsonInclude.Include.NON_NULL)
+data class FollowStatsDto(
+    val userId: UUID,
+    val followersCount: Long,
+    val followingCount: Long,
+    val followedByMe: Boolean? = null
+)
+
+@JsonInclude(JsonInclude.Include.NON_NULL)
+data class BulkAdjacencyRequest(
+    val userIds: List<UUID>
+)
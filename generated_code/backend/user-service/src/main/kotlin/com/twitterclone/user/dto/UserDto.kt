@@ -28,3 +28,11 @@ data class UpdateUserProfileRequest(
     val displayName: String?,
     val bio: String?
 )
+
+/** Public author fields for batch lookups, e.g. post-service timeline pages */
+@JsonInclude(JsonInclude.Include.NON_NULL)
+data class UserSummaryDto(
+    val id: UUID,
+    val username: String,
+    val displayName: String?
+)
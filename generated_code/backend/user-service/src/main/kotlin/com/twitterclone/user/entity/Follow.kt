@@ -0,0 +1,34 @@
+package com.twitterclone.user.entity
+
+import jakarta.persistence.*
+import java.io.Serializable
+import java.time.LocalDateTime
+import java.util.*
+
+@Embeddable
+data class FollowId(
+    @Column(name = "follower_id", nullable = false)
+    val followerId: UUID,
+    
+    @Column(name = "followee_id", nullable = false)
+    val followeeId: UUID
+) : Serializable
+
+/**
+ * follower_id follows followee_id. The primary key serves "who does X follow";
+ * idx_follows_followee_follower serves "who follows X".
+ */
+@Entity
+@Table(
+    name = "follows",
+    indexes = [
+        Index(name = "idx_follows_followee_follower", columnList = "followee_id, follower_id")
+    ]
+)
+data class Follow(
+    @EmbeddedId
+    val id: FollowId,
+    
+    @Column(name = "created_at", nullable = false)
+    val createdAt: LocalDateTime = LocalDateTime.now()
+)
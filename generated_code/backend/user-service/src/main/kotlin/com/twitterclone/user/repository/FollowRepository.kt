@@ -0,0 +1,75 @@
+package com.twitterclone.user.repository
+
+import com.twitterclone.user.dto.FollowEdge
+import com.twitterclone.user.entity.Follow
+import com.twitterclone.user.entity.FollowId
+import com.twitterclone.user.dto.UserDto
+import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
+import org.springframework.data.jpa.repository.JpaRepository
+import org.springframework.data.jpa.repository.Query
+import org.springframework.data.repository.query.Param
+import org.springframework.stereotype.Repository
+import java.util.*
+
+@Repository
+interface FollowRepository : JpaRepository<Follow, FollowId> {
+    
+    fun countByIdFollowerId(followerId: UUID): Long
+    
+    fun countByIdFolloweeId(followeeId: UUID): Long
+    
+    // Bulk adjacency lookups: one query for any number of users
+    @Query("""
+        SELECT new com.twitterclone.user.dto.FollowEdge(f.id.followerId, f.id.followeeId)
+        FROM Follow f
+        WHERE f.id.followeeId IN :userIds
+    """)
+    fun findEdgesByFolloweeIds(@Param("userIds") userIds: Collection<UUID>): List<FollowEdge>
+    
+    @Query("""
+        SELECT new com.twitterclone.user.dto.FollowEdge(f.id.followerId, f.id.followeeId)
+        FROM Follow f
+        WHERE f.id.followerId IN :userIds
+    """)
+    fun findEdgesByFollowerIds(@Param("userIds") userIds: Collection<UUID>): List<FollowEdge>
+    
+    // Streams the whole graph into the adjacency cache in primary-key order, one keyset page at a time
+    @Query("""
+        SELECT new com.twitterclone.user.dto.FollowEdge(f.id.followerId, f.id.followeeId)
+        FROM Follow f
+        ORDER BY f.id.followerId, f.id.followeeId
+    """)
+    fun findFirstEdges(pageable: Pageable): List<FollowEdge>
+    
+    @Query("""
+        SELECT new com.twitterclone.user.dto.FollowEdge(f.id.followerId, f.id.followeeId)
+        FROM Follow f
+        WHERE f.id.followerId > :followerId
+           OR (f.id.followerId = :followerId AND f.id.followeeId > :followeeId)
+        ORDER BY f.id.followerId, f.id.followeeId
+    """)
+    fun findEdgesAfter(
+        @Param("followerId") followerId: UUID,
+        @Param("followeeId") followeeId: UUID,
+        pageable: Pageable
+    ): List<FollowEdge>
+    
+    @Query("""
+        SELECT new com.twitterclone.user.dto.UserDto(u.id, u.username, u.email, u.displayName, u.bio, u.isActive, u.createdAt)
+        FROM User u, Follow f
+        WHERE f.id.followeeId = :userId
+        AND u.id = f.id.followerId
+        ORDER BY f.createdAt DESC
+    """)
+    fun findFollowers(@Param("userId") userId: UUID, pageable: Pageable): Slice<UserDto>
+    
+    @Query("""
+        SELECT new com.twitterclone.user.dto.UserDto(u.id, u.username, u.email, u.displayName, u.bio, u.isActive, u.createdAt)
+        FROM User u, Follow f
+        WHERE f.id.followerId = :userId
+        AND u.id = f.id.followeeId
+        ORDER BY f.createdAt DESC
+    """)
+    fun findFollowing(@Param("userId") userId: UUID, pageable: Pageable): Slice<UserDto>
+}
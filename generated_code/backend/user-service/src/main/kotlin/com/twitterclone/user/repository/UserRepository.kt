@@ -1,9 +1,10 @@
 package com.twitterclone.user.repository
 
+import com.twitterclone.user.dto.UserDto
+import com.twitterclone.user.dto.UserSummaryDto
 import com.twitterclone.user.entity.User
-import org.springframework.data.domain.Page
 import org.springframework.data.domain.Pageable
-
+import org.springframework.data.domain.Slice
 import org.springframework.data.jpa.repository.JpaRepository
 import org.springframework.data.jpa.repository.Query
 import org.springframework.data.repository.query.Param
@@ -21,14 +22,56 @@ interface UserRepository : JpaRepository<User, UUID> {
     
     fun existsByEmail(email: String): Boolean
     
-    fun findByIsActiveTrue(pageable: Pageable): Page<User>
+    // List reads select straight into UserDto (constructor projection), so the
+    // password hash is never loaded and no entities are hydrated; Slice fetches
+    // one extra row instead of running a COUNT(*).
+    @Query("""
+        SELECT new com.twitterclone.user.dto.UserDto(u.id, u.username, u.email, u.displayName, u.bio, u.isActive, u.createdAt)
+        FROM User u
+        WHERE u.isActive = true
+        ORDER BY u.createdAt DESC, u.id DESC
+    """)
+    fun findActiveUsers(pageable: Pageable): Slice<UserDto>
     
+    // Batch author lookup (GET /api/users/batch): one primary-key IN query
+    @Query("""
+        SELECT new com.twitterclone.user.dto.UserSummaryDto(u.id, u.username, u.displayName)
+        FROM User u
+        WHERE u.id IN :ids
+        AND u.isActive = true
+    """)
+    fun findSummariesByIds(@Param("ids") ids: Collection<UUID>): List<UserSummaryDto>
+    
+    // Substring match served by the pg_trgm GIN indexes on LOWER(username) and
+    // LOWER(display_name) (V006); ranked exact username, then prefix, then the rest.
+    // Callers pass lower-cased, LIKE-escaped patterns (see UserService.searchUsers).
+    @Query("""
+        SELECT new com.twitterclone.user.dto.UserDto(u.id, u.username, u.email, u.displayName, u.bio, u.isActive, u.createdAt)
+        FROM User u
+        WHERE u.isActive = true
+        AND (LOWER(u.username) LIKE :pattern ESCAPE '!'
+        OR LOWER(u.displayName) LIKE :pattern ESCAPE '!')
+        ORDER BY CASE
+            WHEN LOWER(u.username) = :query THEN 0
+            WHEN LOWER(u.username) LIKE :prefix ESCAPE '!' THEN 1
+            WHEN LOWER(u.username) LIKE :pattern ESCAPE '!' THEN 2
+            ELSE 3
+        END, LENGTH(u.username), u.username
+    """)
+    fun searchUsers(
+        @Param("query") query: String,
+        @Param("prefix") prefix: String,
+        @Param("pattern") pattern: String,
+        pageable: Pageable
+    ): Slice<UserDto>
+
+    // Username autocomplete: a prefix range scan on idx_users_username_prefix (text_pattern_ops)
     @Query("""
-        SELECT u FROM User u 
-        WHERE u.isActive = true 
-        AND (LOWER(u.username) LIKE LOWER(CONCAT('%', :query, '%')) 
-        OR LOWER(u.displayName) LIKE LOWER(CONCAT('%', :query, '%')))
-        ORDER BY u.createdAt DESC
+        SELECT new com.twitterclone.user.dto.UserDto(u.id, u.username, u.email, u.displayName, u.bio, u.isActive, u.createdAt)
+        FROM User u
+        WHERE u.isActive = true
+        AND LOWER(u.username) LIKE :prefix ESCAPE '!'
+        ORDER BY LOWER(u.username)
     """)
-    fun searchUsers(@Param("query") query: String, pageable: Pageable): Page<User>
+    fun findByUsernamePrefix(@Param("prefix") prefix: String, pageable: Pageable): List<UserDto>
 }
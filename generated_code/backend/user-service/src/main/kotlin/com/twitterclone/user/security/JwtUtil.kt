@@ -18,8 +18,9 @@ class JwtUtil {
     
     private val key: Key by lazy { Keys.hmacShaKeyFor(jwtSecret.toByteArray()) }
     
-    fun generateToken(username: String): String {
-        return createToken(mapOf(), username)
+    /** The [userId] travels as the uid claim so other services use the same id as user-service */
+    fun generateToken(username: String, userId: UUID): String {
+        return createToken(mapOf(USER_ID_CLAIM to userId.toString()), username)
     }
     
     private fun createToken(claims: Map<String, Any>, subject: String): String {
@@ -73,4 +74,8 @@ class JwtUtil {
             false
         }
     }
+    
+    companion object {
+        const val USER_ID_CLAIM = "uid"
+    }
 }
@@ -0,0 +1,115 @@
+package com.twitterclone.user.service
+
+import com.twitterclone.user.cache.FollowAdjacencyCache
+import com.twitterclone.user.dto.FollowEdge
+import com.twitterclone.user.dto.FollowStatsDto
+import com.twitterclone.user.dto.UserDto
+import com.twitterclone.user.entity.Follow
+import com.twitterclone.user.entity.FollowId
+import com.twitterclone.user.repository.FollowRepository
+import com.twitterclone.user.repository.UserRepository
+import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
+import org.springframework.stereotype.Service
+import org.springframework.transaction.annotation.Transactional
+import java.util.*
+
+@Service
+@Transactional
+class FollowService(
+    private val followRepository: FollowRepository,
+    private val userRepository: UserRepository,
+    // Absent when follow.cache.enabled=false; lookups then go to Postgres
+    private val adjacencyCache: FollowAdjacencyCache?
+) {
+    
+    fun follow(followerId: UUID, followeeId: UUID): FollowStatsDto {
+        if (followerId == followeeId) {
+            throw IllegalArgumentException("Users cannot follow themselves")
+        }
+        if (!userRepository.existsById(followeeId)) {
+            throw RuntimeException("User not found with id: $followeeId")
+        }
+        
+        val id = FollowId(followerId = followerId, followeeId = followeeId)
+        if (!followRepository.existsById(id)) {
+            followRepository.save(Follow(id = id))
+            adjacencyCache?.onFollowed(FollowEdge(followerId, followeeId))
+            adjacencyCache?.invalidateHomeTimeline(followerId)
+        }
+        return stats(followeeId, followerId)
+    }
+    
+    fun unfollow(followerId: UUID, followeeId: UUID): FollowStatsDto {
+        val id = FollowId(followerId = followerId, followeeId = followeeId)
+        if (followRepository.existsById(id)) {
+            followRepository.deleteById(id)
+            adjacencyCache?.onUnfollowed(FollowEdge(followerId, followeeId))
+            adjacencyCache?.invalidateHomeTimeline(followerId)
+        }
+        return stats(followeeId, followerId)
+    }
+    
+    @Transactional(readOnly = true)
+    fun stats(userId: UUID, viewerId: UUID? = null): FollowStatsDto {
+        return FollowStatsDto(
+            userId = userId,
+            followersCount = followRepository.countByIdFolloweeId(userId),
+            followingCount = followRepository.countByIdFollowerId(userId),
+            followedByMe = viewerId?.takeIf { it != userId }
+                ?.let { followRepository.existsById(FollowId(followerId = it, followeeId = userId)) }
+        )
+    }
+    
+    @Transactional(readOnly = true)
+    fun followers(userId: UUID, pageable: Pageable): Slice<UserDto> {
+        return followRepository.findFollowers(userId, pageable)
+    }
+    
+    @Transactional(readOnly = true)
+    fun following(userId: UUID, pageable: Pageable): Slice<UserDto> {
+        return followRepository.findFollowing(userId, pageable)
+    }
+    
+    /** Follower ids for up to MAX_LOOKUP_IDS users: pipelined Redis reads, or one IN query without the cache */
+    @Transactional(readOnly = true)
+    fun followerIds(userIds: Collection<UUID>): Map<UUID, Set<UUID>> {
+        val ids = lookupIds(userIds)
+        if (adjacencyCache != null && adjacencyCache.isWarm) {
+            return adjacencyCache.followersOf(ids)
+        }
+        return group(ids, followRepository.findEdgesByFolloweeIds(ids)) { it.followeeId to it.followerId }
+    }
+    
+    /** Followee ids for up to MAX_LOOKUP_IDS users */
+    @Transactional(readOnly = true)
+    fun followingIds(userIds: Collection<UUID>): Map<UUID, Set<UUID>> {
+        val ids = lookupIds(userIds)
+        if (adjacencyCache != null && adjacencyCache.isWarm) {
+            return adjacencyCache.followingOf(ids)
+        }
+        return group(ids, followRepository.findEdgesByFollowerIds(ids)) { it.followerId to it.followeeId }
+    }
+    
+    private fun lookupIds(userIds: Collection<UUID>): List<UUID> {
+        val ids = userIds.distinct()
+        if (ids.size > MAX_LOOKUP_IDS) {
+            throw IllegalArgumentException("At most $MAX_LOOKUP_IDS ids per adjacency lookup")
+        }
+        return ids
+    }
+    
+    private fun group(
+        userIds: Collection<UUID>,
+        edges: List<FollowEdge>,
+        pair: (FollowEdge) -> Pair<UUID, UUID>
+    ): Map<UUID, Set<UUID>> {
+        val grouped = userIds.associateWithTo(LinkedHashMap()) { mutableSetOf<UUID>() }
+        edges.map(pair).forEach { (owner, other) -> grouped[owner]?.add(other) }
+        return grouped
+    }
+    
+    companion object {
+        const val MAX_LOOKUP_IDS = 1000
+    }
+}
@@ -1,13 +1,17 @@
 package com.twitterclone.user.service
 
+import com.twitterclone.user.cache.UserSummaryCache
 import com.twitterclone.user.dto.CreateUserRequest
 import com.twitterclone.user.dto.UpdateUserProfileRequest
 import com.twitterclone.user.dto.UserDto
+import com.twitterclone.user.dto.UserSummaryDto
 import com.twitterclone.user.entity.User
 import com.twitterclone.user.repository.UserRepository
 import com.twitterclone.user.mapper.UserDtoMapper
-import org.springframework.data.domain.Page
+import org.springframework.data.domain.PageRequest
 import org.springframework.data.domain.Pageable
+import org.springframework.data.domain.Slice
+import org.springframework.data.domain.SliceImpl
 import org.springframework.security.core.userdetails.UserDetails
 import org.springframework.security.core.userdetails.UserDetailsService
 import org.springframework.security.core.userdetails.UsernameNotFoundException
@@ -20,7 +24,9 @@ import java.util.*
 @Transactional
 class UserService(
     private val userRepository: UserRepository,
-    private val passwordEncoder: PasswordEncoder
+    private val passwordEncoder: PasswordEncoder,
+    // Absent when user.summary-cache.enabled=false; batch lookups then always hit Postgres
+    private val summaryCache: UserSummaryCache?
 ) : UserDetailsService {
     
     override fun loadUserByUsername(username: String): UserDetails {
@@ -82,12 +88,61 @@ class UserService(
         )
         
         val savedUser = userRepository.save(updatedUser)
+        summaryCache?.evict(id)
         return UserDtoMapper.mapToUserDto(savedUser)
     }
     
     @Transactional(readOnly = true)
-    fun searchUsers(query: String, pageable: Pageable): Page<UserDto> {
-        return userRepository.searchUsers(query, pageable)
-            .map { UserDtoMapper.mapToUserDto(it) }
+    fun findActiveUsers(pageable: Pageable): Slice<UserDto> {
+        return userRepository.findActiveUsers(pageable)
+    }
+    
+    /**
+     * Summaries for up to MAX_BATCH_IDS users in request order; unknown or
+     * inactive ids are left out. Cache misses are read with a single IN query.
+     */
+    @Transactional(readOnly = true)
+    fun findSummaries(ids: List<UUID>): List<UserSummaryDto> {
+        val distinct = ids.distinct()
+        if (distinct.size > MAX_BATCH_IDS) {
+            throw IllegalArgumentException("At most $MAX_BATCH_IDS ids per batch lookup")
+        }
+        val found = summaryCache?.getAll(distinct).orEmpty().toMutableMap()
+        val missing = distinct.filterNot { it in found }
+        if (missing.isNotEmpty()) {
+            val loaded = userRepository.findSummariesByIds(missing)
+            summaryCache?.putAll(loaded)
+            loaded.associateByTo(found) { it.id }
+        }
+        return distinct.mapNotNull { found[it] }
+    }
+    
+    @Transactional(readOnly = true)
+    fun searchUsers(query: String, pageable: Pageable): Slice<UserDto> {
+        val normalized = query.trim().lowercase()
+        if (normalized.isEmpty()) {
+            return SliceImpl(emptyList(), pageable, false)
+        }
+        val escaped = escapeLike(normalized)
+        return userRepository.searchUsers(normalized, "$escaped%", "%$escaped%", pageable)
+    }
+    
+    @Transactional(readOnly = true)
+    fun autocompleteUsernames(prefix: String, limit: Int): List<UserDto> {
+        val normalized = prefix.trim().lowercase()
+        if (normalized.isEmpty()) {
+            return emptyList()
+        }
+        val size = limit.coerceIn(1, MAX_AUTOCOMPLETE_RESULTS)
+        return userRepository.findByUsernamePrefix("${escapeLike(normalized)}%", PageRequest.of(0, size))
+    }
+    
+    // Treat user input literally in LIKE patterns; '!' is the ESCAPE character in UserRepository
+    private fun escapeLike(value: String): String =
+        value.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+    
+    companion object {
+        const val MAX_AUTOCOMPLETE_RESULTS = 20
+        const val MAX_BATCH_IDS = 100
     }
 }
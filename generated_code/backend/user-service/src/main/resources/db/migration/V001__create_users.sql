@@ -0,0 +1,16 @@
+-- Baseline users table, matching entity/User.kt
+-- Hibernate only validates the schema (ddl-auto: validate); every change to
+-- the entity needs a new versioned migration here.
+
+CREATE TABLE IF NOT EXISTS users (
+    id            UUID PRIMARY KEY,
+    username      VARCHAR(255) NOT NULL,
+    email         VARCHAR(255) NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    display_name  VARCHAR(255),
+    bio           TEXT,
+    is_active     BOOLEAN NOT NULL DEFAULT true,
+    created_at    TIMESTAMP(6) NOT NULL DEFAULT now(),
+    CONSTRAINT uk_users_username UNIQUE (username),
+    CONSTRAINT uk_users_email UNIQUE (email)
+);
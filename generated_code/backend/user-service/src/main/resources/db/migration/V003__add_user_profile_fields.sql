@@ -1,5 +1,5 @@
 -- Migration script to add new User entity properties
--- This would be used with Flyway or similar migration tool
+-- Applied by Flyway when user-service starts
 
 ALTER TABLE users 
 ADD COLUMN IF NOT EXISTS location VARCHAR(255),
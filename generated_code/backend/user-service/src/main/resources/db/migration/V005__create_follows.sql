@@ -0,0 +1,14 @@
+-- Follow graph: follower_id follows followee_id
+-- The primary key answers "who does X follow"; the reverse index answers
+-- "who follows X". Both are covering, so adjacency reads never touch the heap.
+
+CREATE TABLE IF NOT EXISTS follows (
+    follower_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    followee_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    created_at  TIMESTAMP NOT NULL DEFAULT now(),
+    PRIMARY KEY (follower_id, followee_id),
+    CHECK (follower_id <> followee_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_follows_followee_follower
+    ON follows (followee_id, follower_id);
@@ -0,0 +1,16 @@
+-- Indexes for user search and username autocomplete
+-- Search matches LOWER(username) / LOWER(display_name) LIKE '%q%'; a B-tree
+-- cannot serve a leading wildcard, pg_trgm GIN indexes on the same
+-- expressions can. Autocomplete is LOWER(username) LIKE 'q%', a range scan
+-- on a text_pattern_ops index (independent of the database collation).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_users_username_trgm
+    ON users USING gin (lower(username) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_users_display_name_trgm
+    ON users USING gin (lower(display_name) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_users_username_prefix
+    ON users (lower(username) text_pattern_ops);
@@ -9,7 +9,7 @@ echo "🚀 Starting Twitter Clone Project Maintenance..."
 echo "=================================================="
 
 # Navigate to project root
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}"
 
 # Check if we're in the right directory
 if [ ! -d "generated_code/backend" ]; then
@@ -47,8 +47,23 @@ fi
 echo ""
 
 # 4. Run unit tests
+# With IMPACT_SINCE set (e.g. IMPACT_SINCE=HEAD~1) only the tests affected by
+# files changed since that ref run, and step 5 is folded into this step
 echo "🧪 Step 4: Running unit tests..."
-if ./gradlew test --quiet; then
+if [ -n "$IMPACT_SINCE" ]; then
+    IMPACTED_TESTS=$(cd ../.. && python3 -m src.test_impact --since "$IMPACT_SINCE" --format args)
+    if [ -z "$IMPACTED_TESTS" ]; then
+        echo "✅ No tests affected by changes since $IMPACT_SINCE"
+    fi
+    while read -r gradle_args; do
+        [ -z "$gradle_args" ] && continue
+        if ./gradlew $gradle_args --quiet; then
+            echo "✅ Passed: $gradle_args"
+        else
+            echo "⚠️  Failed: $gradle_args - check test reports"
+        fi
+    done <<< "$IMPACTED_TESTS"
+elif ./gradlew test --quiet; then
     echo "✅ All unit tests passed"
 else
     echo "⚠️  Some unit tests failed - check test reports"
@@ -57,18 +72,22 @@ echo ""
 
 # 5. Run integration tests specifically
 echo "🔬 Step 5: Running integration tests..."
-echo "Testing user-service..."
-if ./gradlew :user-service:test --tests '*IntegrationTest*' --quiet; then
-    echo "✅ User service integration tests passed"
+if [ -n "$IMPACT_SINCE" ]; then
+    echo "ℹ️  Affected integration tests already ran in step 4"
 else
-    echo "❌ User service integration tests failed"
-fi
+    echo "Testing user-service..."
+    if ./gradlew :user-service:test --tests '*IntegrationTest*' --quiet; then
+        echo "✅ User service integration tests passed"
+    else
+        echo "❌ User service integration tests failed"
+    fi
 
-echo "Testing post-service..."
-if ./gradlew :post-service:test --tests '*IntegrationTest*' --quiet; then
-    echo "✅ Post service integration tests passed"
-else
-    echo "❌ Post service integration tests failed"
+    echo "Testing post-service..."
+    if ./gradlew :post-service:test --tests '*IntegrationTest*' --quiet; then
+        echo "✅ Post service integration tests passed"
+    else
+        echo "❌ Post service integration tests failed"
+    fi
 fi
 echo ""
 
@@ -2,7 +2,7 @@
 
 echo "🔄 Rebuilding and restarting backend services..."
 
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 
 echo "📦 Building services..."
 ./gradlew build -x test
@@ -11,10 +11,16 @@ import os
 import yaml
 import subprocess
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
 import re
 
+# Scripts run as python3 scripts/<name>.py; make the repo's src package importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.profiling import profile_phase  # noqa: E402
+from src.workspace import PROJECT_ROOT  # noqa: E402
+
 # Tools for project health monitoring
 @tool
 def scan_project_structure(project_path: str) -> str:
@@ -79,7 +85,7 @@ def check_service_health(project_path: str, service_name: str) -> str:
         # Check configuration files
         test_config = service_path / "src" / "test" / "resources" / "application-test.yml"
         if test_config.exists():
-            with open(test_config, 'r') as f:
+            with profile_phase('yaml scan'), open(test_config, 'r') as f:
                 config = yaml.safe_load(f)
                 if config and 'spring' in config:
                     spring_config = config['spring']
@@ -88,13 +94,14 @@ def check_service_health(project_path: str, service_name: str) -> str:
         
         # Check build status
         try:
-            result = subprocess.run(
-                ["./gradlew", f":{service_name}:compileKotlin", "--quiet"],
-                cwd=backend_path,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            with profile_phase(f"gradle :{service_name}:compileKotlin"):
+                result = subprocess.run(
+                    ["./gradlew", f":{service_name}:compileKotlin", "--quiet"],
+                    cwd=backend_path,
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
             health_report["build_status"] = "success" if result.returncode == 0 else "failed"
         except:
             health_report["build_status"] = "error"
@@ -135,13 +142,14 @@ def run_comprehensive_tests(project_path: str) -> str:
         # Run tests for each service
         for service in services:
             try:
-                result = subprocess.run(
-                    ["./gradlew", f":{service}:test", "--quiet"],
-                    cwd=backend_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=180
-                )
+                with profile_phase(f"gradle :{service}:test"):
+                    result = subprocess.run(
+                        ["./gradlew", f":{service}:test", "--quiet"],
+                        cwd=backend_path,
+                        capture_output=True,
+                        text=True,
+                        timeout=180
+                    )
                 
                 service_status = "passed" if result.returncode == 0 else "failed"
                 test_results["service_results"][service] = service_status
@@ -255,13 +263,14 @@ def auto_fix_common_issues(project_path: str) -> str:
         
         # Clean build directories
         try:
-            result = subprocess.run(
-                ["./gradlew", "clean"],
-                cwd=backend_path,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            with profile_phase("gradle clean"):
+                result = subprocess.run(
+                    ["./gradlew", "clean"],
+                    cwd=backend_path,
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
             if result.returncode == 0:
                 fixes_applied.append("Cleaned build directories")
         except:
@@ -303,7 +312,7 @@ maintenance_expert = Agent(
 
 # Define comprehensive tasks
 architecture_analysis = Task(
-    description="""
+    description=f"""
     Perform a comprehensive analysis of the Twitter clone project architecture:
     1. Scan the entire project structure
     2. Identify all backend services, client applications, and components
@@ -311,7 +320,7 @@ architecture_analysis = Task(
     4. Check for architectural consistency and best practices
     5. Identify potential scalability or maintainability issues
     
-    Project location: /Users/garethhallberg/Desktop/twitter-clone-crewai
+    Project location: {PROJECT_ROOT}
     """,
     agent=project_architect,
     tools=[scan_project_structure]
@@ -382,7 +391,7 @@ if __name__ == "__main__":
     print(result)
     
     # Save results to file
-    with open("/Users/garethhallberg/Desktop/twitter-clone-crewai/project_health_report.md", "w") as f:
+    with open(PROJECT_ROOT / "project_health_report.md", "w") as f:
         f.write(f"# Twitter Clone Project Health Report\n")
         f.write(f"Generated: {datetime.now().isoformat()}\n\n")
         f.write(str(result))
@@ -9,9 +9,16 @@ from crewai.tools import tool
 import os
 import yaml
 import subprocess
+import sys
 from pathlib import Path
 
+# Scripts run as python3 scripts/<name>.py; make the repo's src package importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.profiling import profile_phase, profiled  # noqa: E402
+from src.workspace import PROJECT_ROOT  # noqa: E402
+
 @tool
+@profiled('yaml scan')
 def scan_spring_config_files(project_path: str) -> str:
     """Scan for Spring Boot configuration files and detect issues"""
     try:
@@ -125,13 +132,14 @@ def run_gradle_clean(project_path: str) -> str:
         if not backend_path.exists():
             return "Backend directory not found"
         
-        result = subprocess.run(
-            ["./gradlew", "clean"],
-            cwd=backend_path,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        with profile_phase("gradle clean"):
+            result = subprocess.run(
+                ["./gradlew", "clean"],
+                cwd=backend_path,
+                capture_output=True,
+                text=True,
+                timeout=60
+            )
         
         if result.returncode == 0:
             return "Successfully cleaned build directories"
@@ -149,13 +157,14 @@ def run_integration_tests(project_path: str, service: str = "user-service") -> s
         if not backend_path.exists():
             return "Backend directory not found"
         
-        result = subprocess.run(
-            ["./gradlew", f":{service}:test", "--tests", "*IntegrationTest*", "--info"],
-            cwd=backend_path,
-            capture_output=True,
-            text=True,
-            timeout=300
-        )
+        with profile_phase(f"gradle :{service}:test"):
+            result = subprocess.run(
+                ["./gradlew", f":{service}:test", "--tests", "*IntegrationTest*", "--info"],
+                cwd=backend_path,
+                capture_output=True,
+                text=True,
+                timeout=300
+            )
         
         return f"Test execution completed with exit code {result.returncode}\n\nSTDOUT:\n{result.stdout[-1000:]}\n\nSTDERR:\n{result.stderr[-500:]}"
         
@@ -186,42 +195,42 @@ test_runner = Agent(
 
 # Define tasks
 analysis_task = Task(
-    description="""
+    description=f"""
     Analyze the Spring Boot project configuration files and identify any issues:
     1. Scan all application*.yml files in the project
     2. Identify profile-specific configuration issues
     3. Look for improper use of spring.profiles.active in profile-specific files
     4. Report any parsing errors or malformed configurations
     
-    Project path: /Users/garethhallberg/Desktop/twitter-clone-crewai
+    Project path: {PROJECT_ROOT}
     """,
     agent=config_analyst,
     tools=[scan_spring_config_files]
 )
 
 fix_task = Task(
-    description="""
+    description=f"""
     Fix the identified Spring Boot configuration issues:
     1. Remove spring.profiles.active from profile-specific configuration files
     2. Ensure proper YAML structure after modifications
     3. Clean build directories to remove cached configurations
     4. Verify that @ActiveProfiles annotations are used correctly in test classes
     
-    Project path: /Users/garethhallberg/Desktop/twitter-clone-crewai
+    Project path: {PROJECT_ROOT}
     """,
     agent=config_fixer,
     tools=[fix_spring_config_issues, run_gradle_clean]
 )
 
 test_task = Task(
-    description="""
+    description=f"""
     Run integration tests to validate the configuration fixes:
     1. Execute integration tests for the user-service
     2. Verify that the Spring Boot application context loads correctly
     3. Confirm that the test profile is activated properly
     4. Report the test results and any remaining issues
     
-    Project path: /Users/garethhallberg/Desktop/twitter-clone-crewai
+    Project path: {PROJECT_ROOT}
     """,
     agent=test_runner,
     tools=[run_integration_tests]
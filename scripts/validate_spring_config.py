@@ -9,11 +9,43 @@ import yaml
 import sys
 from pathlib import Path
 
+# Scripts run as python3 scripts/<name>.py; make the repo's src package importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.profiling import profiled  # noqa: E402
+from src.workspace import PROJECT_ROOT  # noqa: E402
+
+# Loggers whose TRACE level writes every SQL statement or bind parameter
+SQL_LOGGERS = (
+    'org.hibernate.SQL',
+    'org.hibernate.type',
+    'org.hibernate.orm.jdbc',
+    'org.hibernate.engine.jdbc',
+    'org.springframework.jdbc',
+    'org.postgresql',
+)
+
+# Issues fix_issues() can repair; everything else is only reported
+FIXABLE_ISSUES = {'INVALID_PROFILE_ACTIVATION'}
+
+
+def flatten_levels(levels, prefix=''):
+    """logging.level as {'org.hibernate.SQL': 'DEBUG'}, whether keys are dotted or nested"""
+    flat = {}
+    for key, value in (levels or {}).items():
+        name = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            flat.update(flatten_levels(value, name))
+        else:
+            flat[name] = str(value)
+    return flat
+
+
 class SpringBootConfigValidator:
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
         self.issues = []
     
+    @profiled('yaml scan')
     def validate_project(self):
         """Validate all Spring Boot configuration files in the project"""
         print("🔍 Validating Spring Boot configuration files...")
@@ -38,6 +70,9 @@ class SpringBootConfigValidator:
             with open(config_file, 'r') as f:
                 content = yaml.safe_load(f)
             
+            issues_before = len(self.issues)
+            self.check_sql_logging(config_file, content)
+            
             # Check if this is a profile-specific file
             filename = config_file.name
             is_profile_specific = '-' in filename and filename != 'application.yml' and filename != 'application.yaml'
@@ -56,9 +91,9 @@ class SpringBootConfigValidator:
                     }
                     self.issues.append(issue)
                     print(f"❌ {config_file.relative_to(self.project_root)}: Invalid profile activation")
-                else:
+                elif len(self.issues) == issues_before:
                     print(f"✅ {config_file.relative_to(self.project_root)}: Valid configuration")
-            else:
+            elif len(self.issues) == issues_before:
                 print(f"✅ {config_file.relative_to(self.project_root)}: Valid configuration")
                 
         except Exception as e:
@@ -71,6 +106,23 @@ class SpringBootConfigValidator:
             self.issues.append(issue)
             print(f"❌ {config_file.relative_to(self.project_root)}: Parse error - {str(e)}")
     
+    def check_sql_logging(self, config_file: Path, content):
+        """Flag TRACE on SQL loggers: it logs every statement and bind parameter in the request path"""
+        levels = flatten_levels(((content or {}).get('logging') or {}).get('level'))
+        traced = sorted(
+            name for name, level in levels.items()
+            if level.upper() in ('TRACE', 'ALL')
+            and (name == 'root' or any(name == logger or name.startswith(logger + '.') for logger in SQL_LOGGERS))
+        )
+        if traced:
+            self.issues.append({
+                'file': str(config_file),
+                'type': 'TRACE_SQL_LOGGING',
+                'message': f"TRACE SQL logging enabled for {', '.join(traced)}",
+                'fix': "Use DEBUG at most outside local debugging; the prod profile should set SQL loggers to WARN"
+            })
+            print(f"❌ {config_file.relative_to(self.project_root)}: TRACE SQL logging ({', '.join(traced)})")
+    
     def fix_issues(self):
         """Automatically fix common configuration issues"""
         print("\n🔧 Fixing configuration issues...")
@@ -147,21 +199,24 @@ class SpringBootConfigValidator:
 
 def main():
     if len(sys.argv) < 2:
-        project_root = "/Users/garethhallberg/Desktop/twitter-clone-crewai"
+        project_root = str(PROJECT_ROOT)
     else:
         project_root = sys.argv[1]
     
     validator = SpringBootConfigValidator(project_root)
     issues = validator.validate_project()
     
-    if issues:
+    if any(issue['type'] in FIXABLE_ISSUES for issue in issues):
         validator.fix_issues()
         print("\n✅ Configuration issues have been fixed!")
         print("You should now run './gradlew clean' to clear build caches.")
-    else:
+    elif not issues:
         print("\n✅ All configuration files are valid!")
     
     validator.generate_report()
+    
+    # Issues that need a manual fix (e.g. TRACE SQL logging) fail the check
+    return 1 if any(issue['type'] not in FIXABLE_ISSUES for issue in issues) else 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
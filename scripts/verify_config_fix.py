@@ -3,9 +3,16 @@
 Simple verification script to check if Spring Boot configuration is fixed.
 """
 
+import sys
 import yaml
 from pathlib import Path
 
+# Scripts run as python3 scripts/<name>.py; make the repo's src package importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.profiling import profiled  # noqa: E402
+from src.workspace import PROJECT_ROOT  # noqa: E402
+
+@profiled('yaml scan')
 def check_config_file(file_path):
     """Check if a config file has the invalid spring.profiles.active setting"""
     try:
@@ -23,7 +30,7 @@ def check_config_file(file_path):
         return False, f"Error reading file: {str(e)}"
 
 def main():
-    project_root = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai")
+    project_root = PROJECT_ROOT
     
     # Check the two main test configuration files
     test_configs = [
@@ -53,7 +60,7 @@ def main():
     if all_valid:
         print("✅ All configuration files are valid!")
         print("You can now run the integration tests with:")
-        print("cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend")
+        print(f"cd {project_root / 'generated_code' / 'backend'}")
         print("./gradlew clean")
         print("./gradlew :user-service:test --tests '*IntegrationTest*'")
     else:
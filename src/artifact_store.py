@@ -0,0 +1,290 @@
+"""
+Artifact Store
+Content-addressed, compressed history of crew outputs with a SQLite index
+
+Every stage used to overwrite a fixed debug file (team_talk_output.txt,
+final_chance_output.txt, ...), losing history. Outputs are now also stored
+zstd-compressed under their SHA-256 (zlib when the zstandard package is not
+installed) and indexed by script, stage, timestamp, model, status and the
+files the stage extracted from them.
+
+CLI:
+    python -m src.artifact_store list [--script 015] [--stage discovery] [--limit 20]
+    python -m src.artifact_store show <hash-prefix>
+    python -m src.artifact_store files <hash-prefix>
+    python -m src.artifact_store diff <hash-prefix> <hash-prefix>
+    python -m src.artifact_store latest <script> <stage>
+"""
+
+import argparse
+import difflib
+import hashlib
+import os
+import sqlite3
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from src.workspace import PROJECT_ROOT
+
+DEFAULT_STORE_DIR = Path(os.getenv('CREW_ARTIFACT_DIR', PROJECT_ROOT / '.crew_artifacts'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    hash TEXT NOT NULL,
+    script TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    model TEXT,
+    status TEXT NOT NULL DEFAULT 'ok',
+    codec TEXT NOT NULL,
+    raw_size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_script_stage ON artifacts (script, stage, created_at);
+CREATE INDEX IF NOT EXISTS idx_artifacts_hash ON artifacts (hash);
+CREATE TABLE IF NOT EXISTS artifact_files (
+    artifact_id INTEGER NOT NULL REFERENCES artifacts (id),
+    path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_artifact_files_path ON artifact_files (path);
+"""
+
+
+def _compress(data):
+    if zstandard is not None:
+        return 'zstd', zstandard.ZstdCompressor(level=10).compress(data)
+    return 'zlib', zlib.compress(data, 9)
+
+
+def _decompress(codec, data):
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("Artifact was stored with zstd; install the 'zstandard' package to read it")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def script_name(path):
+    """Normalise a script path (usually __file__) to its stem, e.g. '015_timeline_discovery'"""
+    return Path(path).stem
+
+
+class ArtifactStore:
+    """Saves crew outputs once per content hash and indexes every run that produced them"""
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR):
+        self.store_dir = Path(store_dir)
+        self.objects_dir = self.store_dir / 'objects'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.store_dir / 'index.sqlite')
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def _object_path(self, content_hash):
+        return self.objects_dir / content_hash[:2] / content_hash
+
+    def save(self, content, script, stage, model=None, status='ok', files=()):
+        """Store an output and index this run; returns the content hash"""
+        data = str(content).encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(content_hash)
+
+        existing = self.db.execute(
+            "SELECT codec, stored_size FROM artifacts WHERE hash = ? LIMIT 1", (content_hash,)
+        ).fetchone()
+        if existing and object_path.exists():
+            codec, stored_size = existing['codec'], existing['stored_size']
+        else:
+            codec, compressed = _compress(data)
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = object_path.with_suffix('.tmp')
+            tmp_path.write_bytes(compressed)
+            tmp_path.replace(object_path)
+            stored_size = len(compressed)
+
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO artifacts (hash, script, stage, created_at, model, status, codec, raw_size, stored_size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (content_hash, script_name(script), stage, datetime.now().isoformat(timespec='seconds'),
+                 model or os.getenv('OPENAI_MODEL_NAME'), status, codec, len(data), stored_size)
+            )
+            self.db.executemany(
+                "INSERT INTO artifact_files (artifact_id, path) VALUES (?, ?)",
+                [(cursor.lastrowid, str(path)) for path in files]
+            )
+        return content_hash
+
+    def add_files(self, content_hash, files):
+        """Attach extracted file paths to the most recent run that produced content_hash"""
+        row = self._latest_row(content_hash)
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO artifact_files (artifact_id, path) VALUES (?, ?)",
+                [(row['id'], str(path)) for path in files]
+            )
+
+    def set_status(self, content_hash, status):
+        """Mark the most recent run of an output as 'ok', 'good' or 'failed'"""
+        row = self._latest_row(content_hash)
+        with self.db:
+            self.db.execute("UPDATE artifacts SET status = ? WHERE id = ?", (status, row['id']))
+
+    def _latest_row(self, hash_prefix):
+        row = self.db.execute(
+            "SELECT * FROM artifacts WHERE hash LIKE ? ORDER BY id DESC LIMIT 1", (hash_prefix + '%',)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"No artifact matches '{hash_prefix}'")
+        return row
+
+    def load(self, hash_prefix):
+        """Return the decompressed text of an artifact"""
+        row = self._latest_row(hash_prefix)
+        return _decompress(row['codec'], self._object_path(row['hash']).read_bytes()).decode('utf-8')
+
+    def query(self, script=None, stage=None, status=None, limit=20):
+        """Return index rows, newest first, filtered by script prefix, stage and status"""
+        clauses, params = [], []
+        if script:
+            clauses.append("script LIKE ?")
+            params.append(script_name(script) + '%')
+        if stage:
+            clauses.append("stage = ?")
+            params.append(stage)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self.db.execute(
+            f"SELECT * FROM artifacts {where} ORDER BY id DESC LIMIT ?", params + [limit]
+        ).fetchall()
+
+    def files(self, hash_prefix):
+        row = self._latest_row(hash_prefix)
+        return [r['path'] for r in self.db.execute(
+            "SELECT path FROM artifact_files WHERE artifact_id = ?", (row['id'],)
+        )]
+
+    def latest_good(self, script, stage):
+        """Return the text of the newest output for a stage that passed its checks, or None"""
+        rows = self.query(script=script, stage=stage, status='good', limit=1)
+        return self.load(rows[0]['hash']) if rows else None
+
+    def diff(self, hash_a, hash_b):
+        """Unified diff between two stored outputs"""
+        a, b = self.load(hash_a), self.load(hash_b)
+        return ''.join(difflib.unified_diff(
+            a.splitlines(keepends=True), b.splitlines(keepends=True),
+            fromfile=hash_a[:12], tofile=hash_b[:12]
+        ))
+
+
+_default_store = None
+
+
+def default_store():
+    """Lazily opened store shared by the stage scripts"""
+    global _default_store
+    if _default_store is None:
+        _default_store = ArtifactStore()
+    return _default_store
+
+
+def record_output(content, script, stage, model=None, files=()):
+    """Store a crew output from a stage script; never lets storage problems break a run"""
+    try:
+        content_hash = default_store().save(content, script, stage, model=model, files=files)
+        print(f"🗄️  Output archived as {content_hash[:12]} ({script_name(script)}/{stage})")
+        return content_hash
+    except Exception as e:
+        print(f"⚠️  Could not archive output: {e}")
+        return None
+
+
+def record_extracted_files(content_hash, files, good=False):
+    """Attach the files a stage extracted from an archived output and mark it 'good' or 'failed'"""
+    if not content_hash:
+        return
+    try:
+        store = default_store()
+        if files:
+            store.add_files(content_hash, files)
+        store.set_status(content_hash, 'good' if good else 'failed')
+    except Exception as e:
+        print(f"⚠️  Could not update archived output: {e}")
+
+
+def reuse_output(script, stage):
+    """Return a prior good output when CREW_REUSE_OUTPUTS=1, so a stage can skip regeneration"""
+    if os.getenv('CREW_REUSE_OUTPUTS') != '1':
+        return None
+    try:
+        content = default_store().latest_good(script, stage)
+    except Exception:
+        return None
+    if content is not None:
+        print(f"♻️  Reusing archived output for {script_name(script)}/{stage}")
+    return content
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query archived crew outputs")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = commands.add_parser('list', help='List archived outputs, newest first')
+    list_parser.add_argument('--script')
+    list_parser.add_argument('--stage')
+    list_parser.add_argument('--status')
+    list_parser.add_argument('--limit', type=int, default=20)
+
+    commands.add_parser('show', help='Print an archived output').add_argument('hash')
+    commands.add_parser('files', help='List files extracted from an output').add_argument('hash')
+
+    diff_parser = commands.add_parser('diff', help='Diff two archived outputs')
+    diff_parser.add_argument('hash_a')
+    diff_parser.add_argument('hash_b')
+
+    latest_parser = commands.add_parser('latest', help='Print the newest good output of a stage')
+    latest_parser.add_argument('script')
+    latest_parser.add_argument('stage')
+
+    mark_parser = commands.add_parser('mark', help="Set an output's status (good/ok/failed)")
+    mark_parser.add_argument('hash')
+    mark_parser.add_argument('status', choices=['good', 'ok', 'failed'])
+
+    args = parser.parse_args(argv)
+    store = ArtifactStore()
+
+    if args.command == 'list':
+        for row in store.query(args.script, args.stage, args.status, args.limit):
+            ratio = row['stored_size'] / row['raw_size'] if row['raw_size'] else 1
+            print(f"{row['hash'][:12]}  {row['created_at']}  {row['script']:<40} {row['stage']:<20} "
+                  f"{row['status']:<6} {row['model'] or '-':<14} {row['raw_size']:>8,}B ({ratio:.0%})")
+    elif args.command == 'show':
+        print(store.load(args.hash))
+    elif args.command == 'files':
+        print('\n'.join(store.files(args.hash)))
+    elif args.command == 'diff':
+        sys.stdout.write(store.diff(args.hash_a, args.hash_b))
+    elif args.command == 'latest':
+        content = store.latest_good(args.script, args.stage)
+        if content is None:
+            print(f"No archived output for {args.script}/{args.stage}")
+            return 1
+        print(content)
+    elif args.command == 'mark':
+        store.set_status(args.hash, args.status)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,602 @@
+"""
+Code Review Engine
+Rule-based static review of Kotlin, Swift and Python sources
+
+CodeReviewTool used to echo its input back, so review agents spent LLM turns
+on mechanical checks. The rules here catch those locally and return compact
+findings; the LLM reviewer only looks at what the rules cannot judge:
+
+    n-plus-one             repository/API calls inside loops
+    missing-pagination     unbounded List queries, list endpoints without paging, findAll()
+    blocking-in-coroutine  blocking calls inside suspend/async code
+    mainactor-misuse       I/O or redundant hops on @MainActor, DispatchQueue.main.sync
+    oversized-function     functions longer than MAX_FUNCTION_LINES
+    hygiene                print statements, TODO/FIXME, unhashed passwords
+
+Files are reviewed in a process pool once there are more than a handful.
+
+CLI:
+    python -m src.code_review generated_code/backend [--jobs 8] [--format report|json]
+    python -m src.code_review path/to/File.kt --rules n-plus-one,missing-pagination
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.kotlin_alignment import matching_close, strip_source
+from src.workspace import PROJECT_ROOT
+
+LANGUAGES = {'.kt': 'kotlin', '.kts': 'kotlin', '.swift': 'swift', '.py': 'python'}
+EXCLUDED_DIRS = {'build', '.gradle', 'out', '.git', '.venv', 'venv', '__pycache__', 'node_modules',
+                 '.crew_cache', '.crew_artifacts', 'DerivedData', 'Pods'}
+SEVERITIES = ('error', 'warning', 'info')
+
+MAX_FUNCTION_LINES = int(os.getenv('CODE_REVIEW_MAX_FUNCTION_LINES', '60'))
+PARALLEL_THRESHOLD = 8
+MAX_REPORTED_FINDINGS = 40
+
+NOT_COVERED = "naming, API design, security model, business logic and test quality"
+
+LOOP_PATTERNS = {
+    'kotlin': re.compile(
+        r'\b(?:for|while)\s*(?=\()|\bdo\s*(?=\{)|\brepeat\s*(?=\()'
+        r'|\.(?:forEach|forEachIndexed|map|mapIndexed|mapNotNull|flatMap|filter|onEach'
+        r'|associate|associateBy|associateWith|sumOf|any|all|count)\s*(?=\{)'
+    ),
+    'swift': re.compile(
+        r'\bfor\s+[^{\n]+?\bin\b[^{\n]*(?=\{)|\bwhile\b[^{\n]*(?=\{)|\brepeat\s*(?=\{)'
+        r'|\.(?:forEach|map|compactMap|flatMap|filter|reduce)\s*(?:\([^)\n]*\))?\s*(?=\{)'
+    ),
+}
+FUNCTION_PATTERNS = {
+    'kotlin': re.compile(r'\bfun\s+(?:<[^>]*>\s*)?(?:[\w.]+\.)?(\w+)\s*(?=\()'),
+    'swift': re.compile(r'\bfunc\s+(\w+)\s*(?:<[^>]*>)?\s*(?=\()'),
+}
+TYPE_PATTERN = re.compile(r'\b(class|interface|object|struct|actor|enum|extension)\s+(\w+)')
+BODY_START_PATTERN = re.compile(
+    r'\s*(?:(?:async|throws|rethrows)\s*)*(?:(?::|->)\s*[^={}\n]+?)?\s*(?:where\s+[^{}\n]+)?\{'
+)
+PYTHON_BLOCK_PATTERN = re.compile(r'^([ \t]*)(async\s+def|def|for|async\s+for|while)\b[^\n]*:\s*$', re.MULTILINE)
+PYTHON_COMPREHENSION_PATTERN = re.compile(r'[\[({][^\n]*\bfor\s+\w[^\n]*\bin\b')
+
+DATA_ACCESS_CALL = re.compile(
+    r'\b(\w*(?:[Rr]epository|[Rr]epo|[Dd]ao|[Cc]lient|[Aa]pi|[Ss]ession|cursor|db))\??\.'
+    r'((?:find|get|load|fetch|count|exists|delete|save|query|select|execute|insert|update|request|data)\w*)\s*\('
+)
+URL_SESSION_CALL = re.compile(r'\bURLSession\.shared\.(\w+)\s*\(')
+# Loops that are already batched: one query per chunk of ids
+BATCHED_ITERATION = re.compile(r'\b(?:chunked|windowed|batched)\s*\(')
+# A Pageable advanced inside the loop (page = page.next(), pageable = slice.nextPageable())
+ADVANCING_PAGEABLE = re.compile(
+    r'\b(\w+)\s*=\s*(?:\1\.next|\w+\.(?:nextPageable|nextOrLastPageable))\s*\(\s*\)'
+)
+
+BLOCKING_CALLS = {
+    'kotlin': re.compile(
+        r'\bThread\.sleep\s*\(|\brunBlocking\b|\.block(?:First|Last)?\s*\(\s*\)'
+        r'|\brestTemplate\.\w+\s*\(|\.execute\s*\(\s*\)\.body\b|\bFiles\.(?:read\w*|write\w*)\s*\('
+    ),
+    'swift': re.compile(
+        r'\bThread\.sleep\s*\(|(?<![\w.])sleep\s*\(|\.wait\s*\(\s*\)|\b(?:Data|String)\s*\(\s*contentsOf:'
+    ),
+    'python': re.compile(
+        r'\btime\.sleep\s*\(|\brequests\.(?:get|post|put|patch|delete|request)\s*\('
+        r'|\bsubprocess\.(?:run|call|check_output|check_call)\s*\(|\burllib\.request\.urlopen\s*\('
+    ),
+}
+COROUTINE_BUILDER = re.compile(r'\b(?:launch|async|flow|coroutineScope|supervisorScope)\s*(?:\([^)\n]*\))?\s*(?=\{)')
+IO_CONTEXT = re.compile(r'\bwithContext\s*\(\s*Dispatchers\.IO\s*\)\s*(?=\{)')
+
+MAIN_ACTOR_IO = re.compile(
+    r'\b(?:Data|String)\s*\(\s*contentsOf:|\bFileManager\.default\.\w+\s*\(|\bThread\.sleep\s*\('
+    r'|\.wait\s*\(\s*\)|\bURLSession\.shared\.(?:dataTask|downloadTask)\s*\('
+)
+MAIN_HOP = re.compile(r'\bDispatchQueue\.main\.async\b|\bMainActor\.run\b')
+NON_UI_TYPE = re.compile(r'(?:Repository|Service|Client|API|Api|Database|Cache|Manager)$')
+
+PAGING_PARAMETER = re.compile(r'\b(?:Pageable|PageRequest|Limit|page|size|limit|cursor|before|after)\b')
+UNBOUNDED_RETURN = re.compile(r'\s*:\s*(?:ResponseEntity\s*<\s*)?(?:List|Collection|Iterable|Set|MutableList)\s*<')
+BOUNDED_QUERY_NAME = re.compile(r'(?:Top|First)\d*')
+# By-id batch queries: bounded by the ids the caller passes in
+IN_PARAMETER_QUERY = re.compile(r'@Query\b[^@]*\bIN\s*\(?\s*:\w+', re.IGNORECASE)
+
+PRINT_CALL = {
+    'kotlin': re.compile(r'(?<![\w.])(?:println|print)\s*\('),
+    'swift': re.compile(r'(?<![\w.])(?:print|debugPrint)\s*\('),
+    'python': re.compile(r'(?<![\w.])print\s*\('),
+}
+TODO_MARKER = re.compile(r'\b(?:TODO|FIXME)\b')
+PASSWORD = re.compile(r'password', re.IGNORECASE)
+PASSWORD_HASHING = re.compile(r'hash|encode|bcrypt|argon|scrypt|PasswordEncoder|crypt', re.IGNORECASE)
+
+
+class Finding:
+    """One rule violation at a file location"""
+
+    def __init__(self, severity, rule, path, line, message):
+        self.severity = severity
+        self.rule = rule
+        self.path = path
+        self.line = line
+        self.message = message
+
+    def location(self, root=None):
+        path = Path(self.path)
+        if root is not None:
+            try:
+                path = path.relative_to(root)
+            except ValueError:
+                pass
+        return f"{path}:{self.line}"
+
+    def format(self, root=None):
+        return f"{self.severity.upper():<7} {self.location(root)} {self.rule}: {self.message}"
+
+    def to_dict(self):
+        return {'severity': self.severity, 'rule': self.rule, 'path': str(self.path),
+                'line': self.line, 'message': self.message}
+
+
+class Block:
+    """A function, type or loop body as [start, end) offsets into the source"""
+
+    def __init__(self, kind, name, header_start, start, end, prefix=''):
+        self.kind = kind
+        self.name = name
+        self.header_start = header_start
+        self.start = start
+        self.end = end
+        self.prefix = prefix
+
+    def contains(self, offset):
+        return self.start <= offset < self.end
+
+
+def _strip_python(source):
+    """Python counterpart of strip_source: '#' comments and string contents blanked"""
+    code = list(source)
+    i, length = 0, len(source)
+    while i < length:
+        char = source[i]
+        if char == '#':
+            end = source.find('\n', i)
+            end = length if end == -1 else end
+            code[i:end] = ' ' * (end - i)
+            i = end
+        elif source.startswith(('"""', "'''"), i):
+            quote = source[i:i + 3]
+            end = source.find(quote, i + 3)
+            end = length if end == -1 else end
+            code[i + 3:end] = [c if c == '\n' else ' ' for c in source[i + 3:end]]
+            i = end + 3
+        elif char in '"\'':
+            j = i + 1
+            while j < length and source[j] != char and source[j] != '\n':
+                j += 2 if source[j] == '\\' else 1
+            code[i + 1:min(j, length)] = ' ' * (min(j, length) - i - 1)
+            i = j + 1
+        else:
+            i += 1
+    return ''.join(code)
+
+
+class Source:
+    """A file prepared for the rules: comment/string-blanked code plus its blocks"""
+
+    def __init__(self, path, text, language):
+        self.path = str(path)
+        self.text = text
+        self.language = language
+        if language == 'python':
+            self.code = _strip_python(text)
+        else:
+            _, self.code = strip_source(text)
+        self._line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+        self.functions = []
+        self.types = []
+        self.loops = []
+        if language == 'python':
+            self._python_blocks()
+        else:
+            self._brace_blocks()
+
+    def line_of(self, offset):
+        low, high = 0, len(self._line_starts) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._line_starts[middle] <= offset:
+                low = middle
+            else:
+                high = middle - 1
+        return low + 1
+
+    def line_prefix(self, offset):
+        """Code on the line of offset up to offset, plus the annotation lines just above it"""
+        start = self.code.rfind('\n', 0, offset) + 1
+        prefix = [self.code[start:offset]]
+        while start > 0:
+            previous = self.code.rfind('\n', 0, start - 1) + 1
+            line = self.code[previous:start - 1].strip()
+            if not line.startswith('@'):
+                break
+            prefix.insert(0, line)
+            start = previous
+        return ' '.join(prefix)
+
+    def _body_after(self, index):
+        """Offsets of the {...} body starting at (or after a declaration ending at) index"""
+        match = BODY_START_PATTERN.match(self.code, index)
+        if match is None:
+            return None
+        open_index = match.end() - 1
+        return open_index + 1, matching_close(self.code, open_index)
+
+    def _brace_blocks(self):
+        code = self.code
+        for match in FUNCTION_PATTERNS[self.language].finditer(code):
+            close = matching_close(code, match.end())
+            body = self._body_after(close + 1)
+            if body:
+                self.functions.append(Block('function', match.group(1), match.start(), body[0], body[1],
+                                            self.line_prefix(match.start())))
+
+        for match in TYPE_PATTERN.finditer(code):
+            brace = code.find('{', match.end())
+            if brace == -1 or re.search(r'\n\s*\n|\b(?:fun|func|val|var|let)\b', code[match.end():brace]):
+                continue
+            self.types.append(Block('type', match.group(2), match.start(), brace + 1, matching_close(code, brace),
+                                    self.line_prefix(match.start()) + code[match.start():brace]))
+
+        for match in LOOP_PATTERNS[self.language].finditer(code):
+            index = match.end()
+            if code.startswith('(', index):
+                index = matching_close(code, index) + 1
+                rest = code[index:]
+                stripped = rest.lstrip(' \t')
+                if not stripped.startswith('{'):
+                    end = code.find('\n', index)
+                    self.loops.append(Block('loop', match.group(0).strip(), match.start(), index,
+                                            len(code) if end == -1 else end))
+                    continue
+                index += len(rest) - len(stripped)
+            if code.startswith('{', index):
+                self.loops.append(Block('loop', match.group(0).strip(), match.start(), index + 1,
+                                        matching_close(code, index)))
+
+    def _python_blocks(self):
+        code = self.code
+        lines = code.split('\n')
+        for match in PYTHON_BLOCK_PATTERN.finditer(code):
+            indent = len(match.group(1).expandtabs())
+            first_line = self.line_of(match.start())
+            end_line = first_line
+            for number in range(first_line, len(lines)):
+                line = lines[number]
+                if line.strip() and len(line) - len(line.lstrip()) <= indent:
+                    break
+                end_line = number + 1
+            start = self._line_starts[first_line] if first_line < len(self._line_starts) else len(code)
+            end = self._line_starts[end_line] - 1 if end_line < len(self._line_starts) else len(code)
+            keyword = match.group(2)
+            if keyword.endswith('def'):
+                name = re.match(r'\s*(?:async\s+)?def\s+(\w+)', code[match.start():]).group(1)
+                self.functions.append(Block('function', name, match.start(), start, end, keyword))
+            else:
+                self.loops.append(Block('loop', keyword, match.start(), start, end))
+
+        for match in PYTHON_COMPREHENSION_PATTERN.finditer(code):
+            end = code.find('\n', match.start())
+            self.loops.append(Block('loop', 'comprehension', match.start(), match.start(),
+                                    len(code) if end == -1 else end))
+
+    def innermost_function(self, offset):
+        enclosing = [f for f in self.functions if f.contains(offset)]
+        return max(enclosing, key=lambda f: f.start) if enclosing else None
+
+    def test_code(self):
+        parts = Path(self.path).parts
+        return 'test' in parts or 'tests' in parts or Path(self.path).stem.startswith('test_')
+
+
+def _is_async(source, function):
+    if source.language == 'kotlin':
+        return re.search(r'\bsuspend\b', function.prefix) is not None
+    if source.language == 'swift':
+        return re.search(r'\basync\b', source.code[function.header_start:function.start]) is not None
+    return function.prefix.startswith('async')
+
+
+def _loop_header(source, loop):
+    """The receiver chain (following .chained lines upwards) and header of a loop, up to its body"""
+    code = source.code
+    start = code.rfind('\n', 0, loop.header_start) + 1
+    while start > 0 and code[start:loop.header_start + 1].lstrip().startswith('.'):
+        start = code.rfind('\n', 0, start - 1) + 1
+    receiver = code[start:loop.header_start]
+    return receiver[receiver.rfind('{') + 1:] + code[loop.header_start:loop.start]
+
+
+def _loop_cursors(segment):
+    """Names that move a paged query forward on each pass of the loop
+
+    Either a Pageable advanced in the loop, or a keyset cursor taken from the
+    last row of the previous page (last = rows.last(); rows = repo.findAfter(last...)).
+    """
+    cursors = {m.group(1) for m in ADVANCING_PAGEABLE.finditer(segment)}
+    for result in re.finditer(r'\b(\w+)\s*=\s*' + DATA_ACCESS_CALL.pattern, segment):
+        rows = re.escape(result.group(1))
+        cursors.update(re.findall(r'\b(\w+)\s*=\s*' + rows + r'\.(?:last|lastOrNull)\s*\(\s*\)', segment))
+    return cursors
+
+
+def rule_n_plus_one(source):
+    seen = set()
+    for loop in source.loops:
+        segment = source.code[loop.start:loop.end]
+        if BATCHED_ITERATION.search(_loop_header(source, loop)):
+            continue
+        cursors = _loop_cursors(segment)
+        calls = []
+        for m in DATA_ACCESS_CALL.finditer(segment):
+            # One query per page is paging, not N+1, when the call itself takes the advancing cursor
+            arguments = segment[m.end():matching_close(segment, m.end() - 1)]
+            if any(re.search(rf'\b{name}\b', arguments) for name in cursors):
+                continue
+            calls.append((m.start(), f"{m.group(1)}.{m.group(2)}"))
+        calls += [(m.start(), f"URLSession.shared.{m.group(1)}") for m in URL_SESSION_CALL.finditer(segment)]
+        for offset, call in calls:
+            offset += loop.start
+            if offset in seen:
+                continue
+            seen.add(offset)
+            hint = "saveAll/deleteAll" if re.search(r'\.(?:save|delete)', call) else "one batched query (IN / findAllById) or a join"
+            yield Finding('warning', 'n-plus-one', source.path, source.line_of(offset),
+                          f"{call}() runs once per iteration of the loop on line "
+                          f"{source.line_of(loop.header_start)}; use {hint}")
+
+
+def rule_missing_pagination(source):
+    if source.language != 'kotlin' or source.test_code():
+        return
+    code = source.code
+    for type_block in source.types:
+        if not re.search(r'\b\w*Repository\s*<', type_block.prefix):
+            continue
+        previous_end = type_block.start
+        for function in FUNCTION_PATTERNS['kotlin'].finditer(code, type_block.start, type_block.end):
+            close = matching_close(code, function.end())
+            parameters = code[function.end() + 1:close]
+            name = function.group(1)
+            # Annotations between the previous declaration and this one, string contents included
+            annotations = source.text[previous_end:function.start()]
+            previous_end = close + 1
+            if UNBOUNDED_RETURN.match(code, close + 1) and not PAGING_PARAMETER.search(parameters) \
+                    and not BOUNDED_QUERY_NAME.search(name) and not IN_PARAMETER_QUERY.search(annotations):
+                yield Finding('warning', 'missing-pagination', source.path, source.line_of(function.start()),
+                              f"{type_block.name}.{name} returns an unbounded List; take a Pageable/Limit "
+                              f"and return Slice/Page, or use findTop<N>")
+
+    for function in FUNCTION_PATTERNS['kotlin'].finditer(code):
+        if not re.search(r'@GetMapping\b|@RequestMapping\b[^@]*GET', source.line_prefix(function.start())):
+            continue
+        close = matching_close(code, function.end())
+        parameters = code[function.end() + 1:close]
+        if UNBOUNDED_RETURN.match(code, close + 1) and not PAGING_PARAMETER.search(parameters):
+            yield Finding('warning', 'missing-pagination', source.path, source.line_of(function.start()),
+                          f"GET endpoint {function.group(1)} returns a whole List; accept page/size or a cursor")
+
+    for match in re.finditer(r'\.findAll\s*\(\s*\)', code):
+        yield Finding('warning', 'missing-pagination', source.path, source.line_of(match.start()),
+                      "findAll() loads the entire table; page it or query what is needed")
+
+
+def rule_blocking_in_coroutine(source):
+    pattern = BLOCKING_CALLS[source.language]
+    code = source.code
+    label = {'kotlin': 'suspend fun', 'swift': 'async func', 'python': 'async def'}[source.language]
+    scopes = [(f.start, f.end, f"{label} {f.name}") for f in source.functions if _is_async(source, f)]
+    safe = []
+    if source.language == 'kotlin':
+        for match in COROUTINE_BUILDER.finditer(code):
+            scopes.append((match.end() + 1, matching_close(code, match.end()), match.group(0).split('(')[0].strip()))
+        safe = [(m.end() + 1, matching_close(code, m.end())) for m in IO_CONTEXT.finditer(code)]
+
+    reported = set()
+    for start, end, scope in scopes:
+        for match in pattern.finditer(code, start, end):
+            if match.start() in reported or any(s <= match.start() < e for s, e in safe):
+                continue
+            reported.add(match.start())
+            call = match.group(0).rstrip('( ').strip()
+            fix = "withContext(Dispatchers.IO)" if source.language == 'kotlin' else \
+                "an async API or asyncio.to_thread" if source.language == 'python' else "an async API or a detached task"
+            yield Finding('error', 'blocking-in-coroutine', source.path, source.line_of(match.start()),
+                          f"{call} blocks the thread inside {scope}; use {fix}")
+
+
+def rule_mainactor_misuse(source):
+    if source.language != 'swift':
+        return
+    code = source.code
+    for match in re.finditer(r'\bDispatchQueue\.main\.sync\b', code):
+        yield Finding('error', 'mainactor-misuse', source.path, source.line_of(match.start()),
+                      "DispatchQueue.main.sync deadlocks when called on the main thread; use await MainActor.run")
+
+    scopes = [b for b in source.types + source.functions if re.search(r'@MainActor\b', b.prefix)]
+    for block in scopes:
+        if block.kind == 'type' and NON_UI_TYPE.search(block.name):
+            yield Finding('warning', 'mainactor-misuse', source.path, source.line_of(block.header_start),
+                          f"{block.name} is @MainActor but is not UI state; its I/O and parsing run on the main thread")
+        for match in MAIN_ACTOR_IO.finditer(code, block.start, block.end):
+            yield Finding('warning', 'mainactor-misuse', source.path, source.line_of(match.start()),
+                          f"{match.group(0).rstrip('( ')} runs on the main actor in {block.name}; "
+                          f"move it to a nonisolated/async helper")
+        for match in MAIN_HOP.finditer(code, block.start, block.end):
+            yield Finding('info', 'mainactor-misuse', source.path, source.line_of(match.start()),
+                          f"{match.group(0)} inside @MainActor {block.name} is a redundant hop")
+
+
+def rule_oversized_function(source):
+    for function in source.functions:
+        length = source.line_of(function.end) - source.line_of(function.header_start) + 1
+        if length > MAX_FUNCTION_LINES:
+            severity = 'warning' if length > 2 * MAX_FUNCTION_LINES else 'info'
+            yield Finding(severity, 'oversized-function', source.path, source.line_of(function.header_start),
+                          f"{function.name} is {length} lines (limit {MAX_FUNCTION_LINES}); split it")
+
+
+def rule_hygiene(source):
+    if not source.test_code() and source.language != 'python':
+        for match in PRINT_CALL[source.language].finditer(source.code):
+            yield Finding('info', 'hygiene', source.path, source.line_of(match.start()),
+                          "print statement; use the logger")
+    for match in TODO_MARKER.finditer(source.text):
+        yield Finding('info', 'hygiene', source.path, source.line_of(match.start()),
+                      f"unresolved {match.group(0)}")
+    if source.test_code():
+        return
+    for function in source.functions:
+        body = source.code[function.header_start:function.end]
+        if PASSWORD.search(body) and re.search(r'\bpassword\w*\s*=', body, re.IGNORECASE) \
+                and not PASSWORD_HASHING.search(body):
+            yield Finding('warning', 'hygiene', source.path, source.line_of(function.header_start),
+                          f"{function.name} handles a password without hashing/encoding it")
+
+
+RULES = {
+    'n-plus-one': rule_n_plus_one,
+    'missing-pagination': rule_missing_pagination,
+    'blocking-in-coroutine': rule_blocking_in_coroutine,
+    'mainactor-misuse': rule_mainactor_misuse,
+    'oversized-function': rule_oversized_function,
+    'hygiene': rule_hygiene,
+}
+
+
+def guess_language(code):
+    """Language of a pasted snippet"""
+    if re.search(r'^\s*(?:import\s+(?:SwiftUI|Foundation|UIKit)|func\s|struct\s+\w+\s*:\s*View)', code, re.MULTILINE):
+        return 'swift'
+    if re.search(r'^\s*(?:async\s+)?def\s|^\s*import\s+\w+\s*$|^\s*from\s+\S+\s+import\s', code, re.MULTILINE):
+        return 'python'
+    return 'kotlin'
+
+
+def review_source(text, path='<snippet>', language=None, rules=None):
+    """Run the rules over one source text; returns Findings sorted by line"""
+    language = language or LANGUAGES.get(Path(path).suffix) or guess_language(text)
+    source = Source(path, text, language)
+    findings = []
+    for name in rules or RULES:
+        findings.extend(RULES[name](source))
+    return sorted(findings, key=lambda f: (f.line, SEVERITIES.index(f.severity), f.rule))
+
+
+def review_file(path, rules=None):
+    path = Path(path)
+    try:
+        text = path.read_text(encoding='utf-8', errors='replace')
+    except OSError as e:
+        return [Finding('error', 'unreadable', str(path), 0, str(e))]
+    return review_source(text, path, LANGUAGES[path.suffix], rules)
+
+
+def _review_worker(arguments):
+    return review_file(*arguments)
+
+
+def collect_files(targets):
+    """Expand files, directories and globs into reviewable source files"""
+    files = []
+    for target in targets:
+        matches = glob.glob(str(target), recursive=True) if any(c in str(target) for c in '*?[') else [target]
+        for match in matches:
+            path = Path(match)
+            candidates = path.rglob('*') if path.is_dir() else [path]
+            for candidate in candidates:
+                if candidate.suffix not in LANGUAGES or not candidate.is_file():
+                    continue
+                if any(part in EXCLUDED_DIRS or part.endswith('.backup') for part in candidate.parts):
+                    continue
+                files.append(candidate.resolve())
+    return sorted(set(files))
+
+
+class CodeReviewEngine:
+    """Reviews many files with the rule set, in a process pool when it pays off"""
+
+    def __init__(self, jobs=None, rules=None):
+        self.jobs = jobs or int(os.getenv('CODE_REVIEW_JOBS', '0')) or os.cpu_count() or 1
+        self.rules = list(rules or RULES)
+
+    def review_paths(self, targets):
+        files = collect_files(targets)
+        arguments = [(path, self.rules) for path in files]
+        if self.jobs > 1 and len(files) > PARALLEL_THRESHOLD:
+            try:
+                chunk = max(1, len(files) // (self.jobs * 4))
+                with ProcessPoolExecutor(max_workers=min(self.jobs, len(files))) as pool:
+                    results = list(pool.map(_review_worker, arguments, chunksize=chunk))
+                return files, [f for findings in results for f in findings]
+            except (OSError, RuntimeError) as e:
+                print(f"⚠️  Review pool unavailable ({e}); reviewing serially")
+        return files, [f for args in arguments for f in _review_worker(args)]
+
+    def format_report(self, findings, file_count=1, root=PROJECT_ROOT, limit=MAX_REPORTED_FINDINGS):
+        counts = {severity: sum(f.severity == severity for f in findings) for severity in SEVERITIES}
+        summary = ', '.join(f"{counts[s]} {s}{'s' if counts[s] != 1 else ''}" for s in SEVERITIES if counts[s])
+        lines = [f"Code review: {file_count} file(s), {len(findings)} finding(s)" + (f" ({summary})" if summary else "")]
+        ordered = sorted(findings, key=lambda f: (SEVERITIES.index(f.severity), f.path, f.line))
+        lines += [finding.format(root) for finding in ordered[:limit]]
+        if len(ordered) > limit:
+            lines.append(f"... {len(ordered) - limit} more (python -m src.code_review for the full list)")
+        lines.append(f"Rules checked: {', '.join(self.rules)}. Still needs human/LLM review: {NOT_COVERED}.")
+        return '\n'.join(lines)
+
+    def review(self, code_or_path):
+        """Tool entry point: a file, directory or glob is reviewed from disk, anything else as a snippet"""
+        target = code_or_path.strip()
+        looks_like_path = '\n' not in target and len(target) < 1024 and (
+            any(c in target for c in '*?[') or Path(target).exists()
+        )
+        if looks_like_path:
+            files, findings = self.review_paths([target])
+            if files:
+                return self.format_report(findings, len(files))
+        return self.format_report(review_source(code_or_path, rules=self.rules))
+
+
+code_review_engine = CodeReviewEngine()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rule-based review of Kotlin, Swift and Python sources")
+    parser.add_argument('paths', nargs='*', default=[str(PROJECT_ROOT / 'generated_code')])
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--rules', help=f"Comma-separated subset of: {', '.join(RULES)}")
+    parser.add_argument('--format', choices=['report', 'json'], default='report')
+    parser.add_argument('--limit', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    rules = args.rules.split(',') if args.rules else None
+    unknown = [rule for rule in rules or [] if rule not in RULES]
+    if unknown:
+        parser.error(f"unknown rule(s): {', '.join(unknown)}")
+
+    engine = CodeReviewEngine(jobs=args.jobs, rules=rules)
+    files, findings = engine.review_paths(args.paths)
+    if args.format == 'json':
+        print(json.dumps({'files': len(files), 'findings': [f.to_dict() for f in findings]}, indent=2))
+    else:
+        print(engine.format_report(findings, len(files), limit=args.limit))
+    return 1 if any(f.severity == 'error' for f in findings) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
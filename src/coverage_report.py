@@ -0,0 +1,357 @@
+"""
+Coverage Report
+Per-class line/branch coverage from the backend's JaCoCo XML reports
+
+TestCoverageTool used to guess coverage from words in the test source
+("error", "edge", ...). It now reads the JaCoCo report of the relevant
+module instead: the report is regenerated with Gradle only when main/test
+sources or the build file are newer than it, parsed with iterparse (elements
+are cleared as soon as a class or source file is done) and the parsed
+result is cached under the SHA-256 of the report file.
+
+For each class the summary gives line and branch coverage plus the line
+ranges that are not covered, so testing agents can target real gaps.
+
+CLI:
+    python -m src.coverage_report user-service [--class UserService,AuthService]
+    python -m src.coverage_report --refresh --format json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from src.dependency_graph import parse_settings
+from src.profiling import profile_phase
+from src.workspace import PROJECT_ROOT
+
+DEFAULT_BACKEND_DIR = PROJECT_ROOT / 'generated_code' / 'backend'
+DEFAULT_CACHE_DIR = PROJECT_ROOT / '.crew_cache' / 'coverage'
+REPORT_PATH = Path('build') / 'reports' / 'jacoco' / 'test' / 'jacocoTestReport.xml'
+
+# Bump when the parsed format changes so stale cache entries are ignored
+PARSER_VERSION = 1
+
+GRADLE_TIMEOUT = int(os.getenv('COVERAGE_GRADLE_TIMEOUT', '900'))
+IDENTIFIER_PATTERN = re.compile(r'\b[A-Z]\w+\b')
+MODULE_PACKAGE_PATTERN = re.compile(r'\bcom\.twitterclone\.(\w+)')
+
+
+class ClassCoverage:
+    """Line and branch counters plus uncovered lines for one top-level class"""
+
+    def __init__(self, name, source_file, package):
+        self.name = name
+        self.source_file = source_file
+        self.package = package
+        self.line_missed = 0
+        self.line_covered = 0
+        self.branch_missed = 0
+        self.branch_covered = 0
+        self.method_lines = []
+        self.uncovered_lines = []
+        self.partial_branch_lines = []
+
+    @property
+    def simple_name(self):
+        return self.name.rsplit('.', 1)[-1]
+
+    @staticmethod
+    def _ratio(covered, missed):
+        total = covered + missed
+        return covered / total if total else 1.0
+
+    @property
+    def line_ratio(self):
+        return self._ratio(self.line_covered, self.line_missed)
+
+    @property
+    def branch_ratio(self):
+        return self._ratio(self.branch_covered, self.branch_missed)
+
+    def uncovered_ranges(self):
+        """Compress uncovered line numbers into 'a-b' ranges"""
+        ranges = []
+        for line in sorted(self.uncovered_lines):
+            if ranges and line == ranges[-1][1] + 1:
+                ranges[-1][1] = line
+            else:
+                ranges.append([line, line])
+        return [f"{a}-{b}" if a != b else str(a) for a, b in ranges]
+
+    def to_dict(self):
+        return {
+            'name': self.name, 'source_file': self.source_file, 'package': self.package,
+            'line_missed': self.line_missed, 'line_covered': self.line_covered,
+            'branch_missed': self.branch_missed, 'branch_covered': self.branch_covered,
+            'method_lines': self.method_lines, 'uncovered_lines': self.uncovered_lines,
+            'partial_branch_lines': self.partial_branch_lines,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        coverage = cls(data['name'], data['source_file'], data['package'])
+        for key, value in data.items():
+            setattr(coverage, key, value)
+        return coverage
+
+
+def _top_level(class_name):
+    """Fold Kotlin companions, lambdas and inner classes (Outer$inner$1) into Outer"""
+    return class_name.split('$', 1)[0].replace('/', '.')
+
+
+def parse_jacoco(path):
+    """Stream a JaCoCo XML report into {class FQN: ClassCoverage}"""
+    classes = {}
+    file_classes = {}
+    package = None
+    depth = 0
+    current = None
+
+    for event, element in ET.iterparse(str(path), events=('start', 'end')):
+        tag = element.tag
+        if event == 'start':
+            depth += 1
+            if tag == 'package':
+                package = element.get('name', '').replace('/', '.')
+            elif tag == 'class':
+                name = _top_level(element.get('name', ''))
+                source_file = element.get('sourcefilename', '')
+                current = classes.get(name)
+                if current is None:
+                    current = classes[name] = ClassCoverage(name, source_file, package)
+                    file_classes.setdefault((package, source_file), []).append(current)
+            continue
+
+        depth -= 1
+        if tag == 'method' and current is not None and element.get('line'):
+            current.method_lines.append(int(element.get('line')))
+        elif tag == 'counter' and current is not None and depth == 3:
+            # Class-level counters (report > package > class > counter)
+            missed, covered = int(element.get('missed', 0)), int(element.get('covered', 0))
+            if element.get('type') == 'LINE':
+                current.line_missed += missed
+                current.line_covered += covered
+            elif element.get('type') == 'BRANCH':
+                current.branch_missed += missed
+                current.branch_covered += covered
+        elif tag == 'class':
+            current = None
+            element.clear()
+        elif tag == 'sourcefile':
+            _assign_lines(element, file_classes.get((package, element.get('name')), []))
+            element.clear()
+        elif tag == 'package':
+            element.clear()
+
+    for coverage in classes.values():
+        coverage.method_lines.sort()
+    return classes
+
+
+def _assign_lines(sourcefile, classes):
+    """Give each uncovered/partially covered line to the class whose methods start before it"""
+    if not classes:
+        return
+    starts = sorted(((min(c.method_lines) if c.method_lines else 0, c) for c in classes), key=lambda s: s[0])
+
+    def owner(line):
+        chosen = starts[0][1]
+        for start, coverage in starts:
+            if start <= line:
+                chosen = coverage
+        return chosen
+
+    for line in sourcefile.iter('line'):
+        number = int(line.get('nr'))
+        if int(line.get('mi', 0)) and not int(line.get('ci', 0)):
+            owner(number).uncovered_lines.append(number)
+        elif int(line.get('mb', 0)):
+            owner(number).partial_branch_lines.append(number)
+
+
+class CoverageAnalyzer:
+    """Produces, parses and caches JaCoCo reports for backend modules"""
+
+    def __init__(self, backend_dir=DEFAULT_BACKEND_DIR, cache_dir=DEFAULT_CACHE_DIR):
+        self.backend_dir = Path(backend_dir)
+        self.cache_dir = Path(cache_dir)
+
+    def modules(self):
+        settings = self.backend_dir / 'settings.gradle.kts'
+        if settings.exists():
+            return sorted(parse_settings(settings.read_text()))
+        return sorted(p.parent.name for p in self.backend_dir.glob('*/build.gradle.kts'))
+
+    def report_path(self, module):
+        return self.backend_dir / module / REPORT_PATH
+
+    def is_stale(self, module):
+        """True when the report is missing or older than the module's sources or build files"""
+        report = self.report_path(module)
+        if not report.exists():
+            return True
+        inputs = [self.backend_dir / module / 'build.gradle.kts', self.backend_dir / 'build.gradle.kts']
+        inputs += list((self.backend_dir / module / 'src').rglob('*'))
+        newest = max((p.stat().st_mtime for p in inputs if p.is_file()), default=0)
+        return newest > report.stat().st_mtime
+
+    def generate(self, module):
+        """Run the module's tests with JaCoCo; returns (ok, message)"""
+        command = ['./gradlew', f':{module}:test', f':{module}:jacocoTestReport', '--quiet']
+        print(f"🧪 Generating coverage for {module}: {' '.join(command)}")
+        try:
+            with profile_phase(f"gradle :{module}:jacocoTestReport"):
+                result = subprocess.run(command, cwd=self.backend_dir, capture_output=True, text=True,
+                                        timeout=GRADLE_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return False, str(e)
+        if result.returncode != 0 and not self.report_path(module).exists():
+            tail = (result.stderr or result.stdout).strip().splitlines()[-5:]
+            return False, '\n'.join(tail) or f"gradle exited with {result.returncode}"
+        # Failing tests still produce a report; it is worth reading
+        return True, "" if result.returncode == 0 else "some tests failed; coverage reflects the passing run"
+
+    def load(self, module, refresh=False):
+        """Return ({FQN: ClassCoverage}, note) for a module, regenerating the report if needed"""
+        note = ""
+        if refresh or self.is_stale(module):
+            ok, message = self.generate(module)
+            if not ok:
+                if not self.report_path(module).exists():
+                    return {}, f"no coverage report for {module}: {message}"
+                note = f"using the previous report; regeneration failed: {message}"
+            elif message:
+                note = message
+        return self.parse_cached(self.report_path(module)), note
+
+    def parse_cached(self, report):
+        digest = hashlib.sha256(Path(report).read_bytes()).hexdigest()
+        cache_file = self.cache_dir / f"{digest}.json"
+        if cache_file.exists():
+            try:
+                data = json.loads(cache_file.read_text())
+                if data.get('version') == PARSER_VERSION:
+                    return {name: ClassCoverage.from_dict(c) for name, c in data['classes'].items()}
+            except (OSError, ValueError, KeyError):
+                pass
+        classes = parse_jacoco(report)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({
+            'version': PARSER_VERSION,
+            'report': str(report),
+            'classes': {name: c.to_dict() for name, c in classes.items()},
+        }))
+        return classes
+
+    def _module_classes(self):
+        """{simple class name: module} from the modules' main sources"""
+        names = {}
+        for module in self.modules():
+            for path in (self.backend_dir / module / 'src' / 'main').rglob('*.kt'):
+                names[path.stem] = module
+        return names
+
+    def resolve(self, text):
+        """Modules and focus class names mentioned in test code, class names or a module name"""
+        module_classes = self._module_classes()
+        known_modules = self.modules()
+        modules = {m for m in known_modules if m in text}
+        modules |= {f"{name}-service" for name in MODULE_PACKAGE_PATTERN.findall(text)
+                    if f"{name}-service" in known_modules}
+        focus = set()
+        for name in IDENTIFIER_PATTERN.findall(text):
+            if name.endswith('Test'):
+                name = name[:-len('Test')]
+            if name in module_classes:
+                focus.add(name)
+                modules.add(module_classes[name])
+        return sorted(modules or known_modules), focus
+
+    def format_summary(self, classes, focus=(), limit=12):
+        if focus:
+            shown = [c for c in classes.values() if c.simple_name in focus]
+        else:
+            # Worst covered classes first; trivially small classes are not interesting
+            shown = [c for c in classes.values() if c.line_missed + c.line_covered >= 3]
+        shown.sort(key=lambda c: (c.line_ratio, -c.line_missed))
+        lines = []
+        for coverage in shown[:limit]:
+            line = (f"  {coverage.simple_name} ({coverage.source_file}): "
+                    f"lines {coverage.line_ratio:.0%} ({coverage.line_covered}/{coverage.line_covered + coverage.line_missed})")
+            if coverage.branch_covered + coverage.branch_missed:
+                line += (f", branches {coverage.branch_ratio:.0%} "
+                         f"({coverage.branch_covered}/{coverage.branch_covered + coverage.branch_missed})")
+            lines.append(line)
+            ranges = coverage.uncovered_ranges()
+            if ranges:
+                lines.append(f"    uncovered lines: {', '.join(ranges[:15])}" + (" ..." if len(ranges) > 15 else ""))
+            if coverage.partial_branch_lines:
+                lines.append(f"    partly covered branches at: {', '.join(map(str, coverage.partial_branch_lines[:15]))}")
+        if len(shown) > limit:
+            lines.append(f"  ... {len(shown) - limit} more classes")
+        return lines
+
+    def analyze(self, text, refresh=False):
+        """Tool entry point: coverage for the modules and classes the input refers to"""
+        modules, focus = self.resolve(text)
+        output = []
+        for module in modules:
+            classes, note = self.load(module, refresh)
+            if not classes:
+                output.append(f"{module}: {note or 'report contains no classes'}")
+                continue
+            line_covered = sum(c.line_covered for c in classes.values())
+            line_total = line_covered + sum(c.line_missed for c in classes.values())
+            output.append(f"{module}: {line_covered}/{line_total} lines covered "
+                          f"({line_covered / line_total:.0%})" if line_total else f"{module}: no lines")
+            if note:
+                output.append(f"  note: {note}")
+            output.extend(self.format_summary(classes, focus))
+        output.append("Target the uncovered line ranges above with new tests.")
+        return '\n'.join(output)
+
+
+coverage_analyzer = CoverageAnalyzer()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-class coverage from the backend's JaCoCo reports")
+    parser.add_argument('modules', nargs='*', help='Modules to report (default: all in settings.gradle.kts)')
+    parser.add_argument('--class', dest='classes', help='Comma-separated class names to focus on')
+    parser.add_argument('--refresh', action='store_true', help='Regenerate reports even if they are current')
+    parser.add_argument('--report', help='Parse this JaCoCo XML file instead of a module report')
+    parser.add_argument('--backend-dir', default=str(DEFAULT_BACKEND_DIR))
+    parser.add_argument('--format', choices=['report', 'json'], default='report')
+    args = parser.parse_args(argv)
+
+    analyzer = CoverageAnalyzer(args.backend_dir)
+    focus = set(args.classes.split(',')) if args.classes else set()
+    if args.report:
+        results = {Path(args.report).name: (analyzer.parse_cached(args.report), "")}
+    else:
+        results = {module: analyzer.load(module, args.refresh) for module in args.modules or analyzer.modules()}
+
+    if args.format == 'json':
+        print(json.dumps({
+            module: {'note': note, 'classes': {n: c.to_dict() for n, c in classes.items()
+                                               if not focus or c.simple_name in focus}}
+            for module, (classes, note) in results.items()
+        }, indent=2))
+        return 0
+
+    for module, (classes, note) in results.items():
+        print(f"{module}: {len(classes)} classes" + (f" ({note})" if note else ""))
+        print('\n'.join(analyzer.format_summary(classes, focus, limit=len(classes) or 1)))
+    return 0 if all(classes for classes, _ in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
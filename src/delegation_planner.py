@@ -0,0 +1,279 @@
+"""
+Delegation Planner
+Static task -> agent assignment computed once, instead of a hierarchical manager
+
+With Process.hierarchical the manager LLM spends a round trip on every
+delegation decision, and agents with allow_delegation=True can bounce work
+back and forth. The planner assigns work up front from the task list and an
+explicit platform -> agent mapping, then runs the crew sequentially:
+
+- tasks that already name a worker agent keep it
+- umbrella tasks owned by the manager are split into their numbered steps.
+  A step that names platforms (API, iOS, Android) goes to those platforms'
+  agents; an implementation step that names none goes to every mapped
+  platform; design, strategy and review steps stay with the manager, who
+  also does one final integration pass
+- the caller's Task objects are never modified; the crew runs copies
+- every task gets a delegation budget (0 by default, which removes the
+  delegation tools entirely). An agent that overruns it keeps working but
+  loses its delegation tools for its remaining tasks. Agents keep their own
+  allow_delegation setting, the budget only ever narrows it
+- delegations and the time spent in each agent's turns are recorded for the
+  run summary, timed from kickoff (DelegationPlanner.kickoff)
+"""
+
+import re
+import time
+from collections import defaultdict
+
+STEP_PATTERN = re.compile(r'^\s*\d+[.)]\s+(.+?)\s*$', re.MULTILINE)
+
+# Platform keys used in platform_roles, and the words that put a step on that platform
+PLATFORM_PATTERNS = {
+    'api': re.compile(r'\b(?:api|backend|server|spring|jwt)\b', re.IGNORECASE),
+    'ios': re.compile(r'\b(?:ios|swift|swiftui)\b', re.IGNORECASE),
+    'android': re.compile(r'\b(?:android|compose)\b', re.IGNORECASE),
+}
+ALL_PLATFORMS_PATTERN = re.compile(r'\b(?:all|every|each)\s+platforms?\b|\bcross[- ]platform\b', re.IGNORECASE)
+# Steps that shape the work rather than build it; the manager keeps them unless a platform is named
+MANAGER_STEP_PATTERN = re.compile(
+    r'^\s*(?:design|define|plan|review|assess|decide|coordinate)\b|\b(?:strategy|architecture|risk)\b',
+    re.IGNORECASE
+)
+
+DELEGATION_TOOLS = ('delegate work to coworker', 'ask question to coworker')
+
+
+def step_platforms(step):
+    """Platform keys a step names explicitly ('all platforms' names every one)"""
+    if ALL_PLATFORMS_PATTERN.search(step):
+        return list(PLATFORM_PATTERNS)
+    return [platform for platform, pattern in PLATFORM_PATTERNS.items() if pattern.search(step)]
+
+
+class DelegationTracker:
+    """Counts delegation tool calls and wall time per agent, and reports per-task budget overruns"""
+
+    def __init__(self, budget, on_overrun=None):
+        self.budget = budget
+        self.on_overrun = on_overrun
+        self.delegations = defaultdict(int)
+        self.seconds = defaultdict(float)
+        self.overruns = defaultdict(int)
+        self._task_delegations = 0
+        self._last_step = None
+
+    def callback_for(self, role):
+        """Return a step_callback that attributes each step to the given agent role"""
+        def on_step(step):
+            now = time.perf_counter()
+            # Before start() the time since the previous step is unknown, not the time since build
+            if self._last_step is not None:
+                self.seconds[role] += now - self._last_step
+            self._last_step = now
+
+            tool = str(getattr(step, 'tool', '') or '').strip().lower()
+            if tool in DELEGATION_TOOLS:
+                self.delegations[role] += 1
+                self._task_delegations += 1
+                if self._task_delegations > self.budget:
+                    self.overruns[role] += 1
+                    print(f"⚠️  {role} delegated {self._task_delegations} times in one task "
+                          f"(budget {self.budget}); no more delegation for its remaining tasks")
+                    if self.on_overrun is not None:
+                        self.on_overrun(role)
+        return on_step
+
+    def task_callback(self, chained=None):
+        """Return a task_callback that opens a fresh budget for the next task (sequential crews)"""
+        def on_task(output):
+            self._task_delegations = 0
+            if chained is not None:
+                chained(output)
+        return on_task
+
+    def start(self):
+        """Reset the clock and counters; call right before crew.kickoff()"""
+        self._task_delegations = 0
+        self._last_step = time.perf_counter()
+
+
+class DelegationPlanner:
+    """Builds a static assignment plan and a sequential crew that follows it"""
+
+    def __init__(self, agents, manager, platform_roles=None, delegation_budget=0):
+        self.agents = list(agents)
+        self.manager = manager
+        # Only platforms whose agent is on this crew; anything else stays with the manager
+        roles = {agent.role for agent in self.agents}
+        self.platform_roles = {
+            platform: agent for platform, agent in (platform_roles or {}).items() if agent.role in roles
+        }
+        self.delegation_budget = delegation_budget
+        self.plan = []
+        self.planning_seconds = 0.0
+        self.tracker = None
+        self.crew = None
+        self._planned_agents = {}
+
+    def agents_for_step(self, step):
+        """Agents an umbrella task step goes to, by the platforms it names"""
+        platforms = step_platforms(step)
+        if not platforms:
+            if MANAGER_STEP_PATTERN.search(step):
+                return [self.manager]
+            platforms = list(self.platform_roles)
+        agents = [self.platform_roles[p] for p in platforms if p in self.platform_roles]
+        return agents or [self.manager]
+
+    def build_plan(self, tasks):
+        """Assign every task (or umbrella task step) to an agent once"""
+        started = time.perf_counter()
+        plan = []
+
+        for task in tasks:
+            steps = STEP_PATTERN.findall(task.description)
+            owned_by_manager = task.agent is None or task.agent.role == self.manager.role
+
+            if not owned_by_manager or len(steps) < 2 or not self.platform_roles:
+                plan.append({'task': task, 'agent': task.agent or self.manager, 'steps': steps, 'split': False})
+                continue
+
+            # Group the umbrella task's steps by assigned agent, in first-appearance order
+            groups = {}
+            for step in steps:
+                for agent in self.agents_for_step(step):
+                    groups.setdefault(agent.role, {'agent': agent, 'steps': []})['steps'].append(step)
+            if len(groups) == 1:
+                agent = next(iter(groups.values()))['agent']
+                plan.append({'task': task, 'agent': agent, 'steps': steps, 'split': False})
+                continue
+
+            for group in groups.values():
+                plan.append({'task': task, 'agent': group['agent'], 'steps': group['steps'], 'split': True})
+            plan.append({'task': task, 'agent': self.manager, 'steps': [], 'split': True, 'integration': True})
+
+        self.plan = plan
+        self.planning_seconds = time.perf_counter() - started
+        return plan
+
+    def _planned_agent(self, agent, tracker):
+        from crewai import Agent
+
+        if agent.role not in self._planned_agents:
+            self._planned_agents[agent.role] = Agent(
+                role=agent.role,
+                goal=agent.goal,
+                backstory=agent.backstory,
+                tools=agent.tools,
+                verbose=agent.verbose,
+                llm=agent.llm,
+                max_iter=agent.max_iter,
+                allow_delegation=agent.allow_delegation and self.delegation_budget > 0,
+                step_callback=tracker.callback_for(agent.role),
+            )
+        return self._planned_agents[agent.role]
+
+    def _revoke_delegation(self, role):
+        # Takes effect from the agent's next task; the current one finishes normally
+        agent = self._planned_agents.get(role)
+        if agent is not None:
+            agent.allow_delegation = False
+
+    def build_crew(self, tasks, **crew_kwargs):
+        """Return a sequential crew that executes the precomputed plan on copies of the tasks"""
+        from crewai import Crew, Process, Task
+
+        plan = self.build_plan(tasks)
+        self.tracker = DelegationTracker(self.delegation_budget, on_overrun=self._revoke_delegation)
+        self._planned_agents = {}
+        planned_tasks = []
+        # Planned tasks per source task; the last one stands in for the source in later tasks' context
+        planned_for = defaultdict(list)
+
+        budget_note = (
+            f"\n\nDelegation budget for this task: at most {self.delegation_budget} delegation(s)."
+            if self.delegation_budget > 0 else ""
+        )
+
+        for entry in plan:
+            source = entry['task']
+            agent = self._planned_agent(entry['agent'], self.tracker)
+
+            if not entry['split']:
+                description = source.description + budget_note
+                expected_output = source.expected_output
+                context = [planned_for[id(t)][-1] if planned_for[id(t)] else t for t in source.context or []]
+            elif entry.get('integration'):
+                description = (
+                    f"Integrate the work your team produced for the following assignment into one "
+                    f"coherent deliverable. Resolve inconsistencies between platforms.\n{source.description}"
+                )
+                expected_output = source.expected_output
+                context = list(planned_for[id(source)])
+            else:
+                step_list = '\n'.join(f"{i}. {step}" for i, step in enumerate(entry['steps'], 1))
+                description = (
+                    f"You own this part of a larger assignment:\n{step_list}\n\n"
+                    f"Full assignment for reference:\n{source.description}{budget_note}"
+                )
+                expected_output = f"Deliverables for: {'; '.join(entry['steps'])}"
+                context = list(planned_for[id(source)])
+
+            planned = Task(
+                description=description,
+                expected_output=expected_output,
+                agent=agent,
+                tools=source.tools,
+                context=context or None,
+            )
+            planned_for[id(source)].append(planned)
+            planned_tasks.append(planned)
+
+        crew_kwargs.pop('process', None)
+        crew_kwargs.pop('manager_agent', None)
+        task_callback = self.tracker.task_callback(crew_kwargs.pop('task_callback', None))
+        self.crew = Crew(
+            agents=list(self._planned_agents.values()),
+            tasks=planned_tasks,
+            process=Process.sequential,
+            task_callback=task_callback,
+            **crew_kwargs
+        )
+        return self.crew
+
+    def kickoff(self, **kwargs):
+        """Kick off the planned crew, timing agent turns from this moment"""
+        if self.crew is None:
+            raise RuntimeError("build_crew() must be called before kickoff()")
+        self.tracker.start()
+        return self.crew.kickoff(**kwargs)
+
+    def describe_plan(self):
+        """Return the assignment plan as printable lines"""
+        lines = []
+        for entry in self.plan:
+            if entry.get('integration'):
+                lines.append(f"  • {entry['agent'].role}: integration pass")
+            elif entry['split']:
+                lines.append(f"  • {entry['agent'].role}: {len(entry['steps'])} step(s) - {entry['steps'][0][:60]}")
+            else:
+                lines.append(f"  • {entry['agent'].role}: {entry['task'].description.strip().splitlines()[0][:60]}")
+        return '\n'.join(lines)
+
+    def report(self):
+        """Return delegation counts and time per agent for the run summary"""
+        if self.tracker is None:
+            return "Delegation plan: not built"
+
+        manager_role = self.manager.role
+        lines = [
+            f"Delegation plan: {len(self.plan)} assignments planned in {self.planning_seconds * 1000:.1f}ms",
+            f"  manager ({manager_role}) turn time: {self.tracker.seconds.get(manager_role, 0.0):.1f}s",
+        ]
+        for role in sorted(set(self.tracker.seconds) | set(self.tracker.delegations)):
+            lines.append(
+                f"  {role}: delegations={self.tracker.delegations.get(role, 0)} "
+                f"overruns={self.tracker.overruns.get(role, 0)} time={self.tracker.seconds.get(role, 0.0):.1f}s"
+            )
+        return '\n'.join(lines)
@@ -0,0 +1,385 @@
+"""
+Dependency Graph
+Package and module dependency graph of the generated Kotlin backend
+
+Cycles between common, user-service and post-service (004p, 004r) used to
+surface only as a failed ./gradlew :common:compileKotlin. This analyzer
+builds the graph from the sources instead:
+
+- package -> package edges from every .kt import of a project class
+- module -> module edges from project(":...") entries in build.gradle.kts
+
+and reports module and package cycles, imports of modules that are not
+declared Gradle dependencies, modules missing from settings.gradle.kts and
+layering violations (common must not depend on a service; controller ->
+service -> repository/mapper -> entity/dto inside a module). Parsed files
+are cached by content hash, so re-checking an unchanged tree only hashes it.
+
+CLI:
+    python -m src.dependency_graph [backend_dir] [--json] [--dot]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from src.kotlin_alignment import AlignmentIssue, strip_source
+from src.workspace import PROJECT_ROOT
+
+DEFAULT_BACKEND_DIR = PROJECT_ROOT / 'generated_code' / 'backend'
+DEFAULT_CACHE_PATH = PROJECT_ROOT / '.crew_cache' / 'dependency_graph.json'
+CACHE_VERSION = 1
+
+EXCLUDED_DIRS = {'build', '.gradle', 'out'}
+PROJECT_PACKAGE = 'com.twitterclone'
+
+# Modules may only depend on modules in a strictly lower layer
+MODULE_LAYERS = {'common': 0}
+DEFAULT_MODULE_LAYER = 1
+
+# Packages (by last segment) may only import packages in the same or a lower layer
+PACKAGE_LAYERS = {
+    'controller': 3, 'config': 3,
+    'service': 2, 'security': 2,
+    'mapper': 1, 'repository': 1,
+    'entity': 0, 'dto': 0, 'exception': 0, 'util': 0,
+}
+
+PROJECT_DEPENDENCY_PATTERN = re.compile(
+    r'^[ \t]*(\w+)\s*\(\s*project\s*\(\s*(?:path\s*=\s*)?"(:[\w:.-]+)"', re.MULTILINE
+)
+INCLUDE_PATTERN = re.compile(r'^\s*include\s*\(([^)]*)\)', re.MULTILINE)
+
+
+def parse_kotlin_dependencies(source):
+    """Return the package and the project imports (fully qualified) of a Kotlin file"""
+    text, _ = strip_source(source)
+    package = re.search(r'^\s*package\s+([\w.]+)', text, re.MULTILINE)
+    imports = []
+    for match in re.finditer(r'^[ \t]*import\s+([\w.]+)(\.\*)?', text, re.MULTILINE):
+        if match.group(1).startswith(PROJECT_PACKAGE + '.'):
+            imports.append([match.group(1), bool(match.group(2)), text.count('\n', 0, match.start()) + 1])
+    return {'package': package.group(1) if package else '', 'imports': imports}
+
+
+def parse_gradle_dependencies(source):
+    """Return [(configuration, module)] for every project(":module") dependency"""
+    text, _ = strip_source(source)
+    return [
+        [match.group(1), match.group(2).lstrip(':').replace(':', '/'), text.count('\n', 0, match.start()) + 1]
+        for match in PROJECT_DEPENDENCY_PATTERN.finditer(text)
+    ]
+
+
+def parse_settings(source):
+    """Return the module names included in settings.gradle.kts"""
+    text, _ = strip_source(source)
+    modules = []
+    for match in INCLUDE_PATTERN.finditer(text):
+        modules.extend(name.lstrip(':').replace(':', '/') for name in re.findall(r'"([^"]+)"', match.group(1)))
+    return modules
+
+
+def strongly_connected_components(graph):
+    """Tarjan's algorithm; returns components with more than one node or a self loop"""
+    index_of, low, stack, on_stack = {}, {}, [], set()
+    components = []
+    counter = [0]
+
+    def visit(node):
+        index_of[node] = low[node] = counter[0]
+        counter[0] += 1
+        stack.append(node)
+        on_stack.add(node)
+        for neighbour in graph.get(node, ()):
+            if neighbour not in index_of:
+                visit(neighbour)
+                low[node] = min(low[node], low[neighbour])
+            elif neighbour in on_stack:
+                low[node] = min(low[node], index_of[neighbour])
+        if low[node] == index_of[node]:
+            component = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.append(member)
+                if member == node:
+                    break
+            if len(component) > 1 or node in graph.get(node, ()):
+                components.append(sorted(component))
+
+    for node in sorted(graph):
+        if node not in index_of:
+            visit(node)
+    return components
+
+
+def find_cycle(graph, component):
+    """Return one concrete cycle (as a node path) inside a strongly connected component"""
+    members = set(component)
+    start = component[0]
+    previous = {start: None}
+    queue = [start]
+    while queue:
+        node = queue.pop(0)
+        for neighbour in sorted(graph.get(node, ())):
+            if neighbour not in members:
+                continue
+            if neighbour == start:
+                path = [node]
+                while previous[path[-1]] is not None:
+                    path.append(previous[path[-1]])
+                return list(reversed(path)) + [start]
+            if neighbour not in previous:
+                previous[neighbour] = node
+                queue.append(neighbour)
+    return [start, start]
+
+
+class DependencyGraph:
+    """Builds the package and module graphs of a Gradle multi-module Kotlin backend"""
+
+    def __init__(self, backend_dir=DEFAULT_BACKEND_DIR, cache_path=DEFAULT_CACHE_PATH):
+        self.backend_dir = Path(backend_dir)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.files = {}
+        self.settings_modules = []
+        self.gradle_edges = defaultdict(dict)
+        self.package_modules = defaultdict(set)
+        self.package_edges = defaultdict(lambda: defaultdict(list))
+        self.module_edges = defaultdict(set)
+        self.issues = []
+        self.stats = {'files': 0, 'parsed': 0, 'cached': 0, 'seconds': 0.0}
+        self._cache = self._load_cache()
+        self._used = {}
+
+    def _load_cache(self):
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return data.get('files', {}) if data.get('version') == CACHE_VERSION else {}
+
+    def _save_cache(self):
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Only entries for the current tree are kept, so the cache never grows stale
+        self.cache_path.write_text(json.dumps({'version': CACHE_VERSION, 'files': self._used}))
+
+    def _parsed(self, path, parser):
+        data = path.read_bytes()
+        key = f"{parser.__name__}:{hashlib.sha256(data).hexdigest()}"
+        entry = self._cache.get(key)
+        self.stats['files'] += 1
+        if entry is None:
+            entry = parser(data.decode('utf-8', errors='replace'))
+            self.stats['parsed'] += 1
+        else:
+            self.stats['cached'] += 1
+        self._used[key] = entry
+        return entry
+
+    def _module_of(self, path):
+        parts = path.relative_to(self.backend_dir).parts
+        return parts[0] if len(parts) > 1 else ''
+
+    def _skipped(self, path):
+        parts = path.relative_to(self.backend_dir).parts
+        return any(part in EXCLUDED_DIRS or part.endswith('.backup') for part in parts)
+
+    def build(self):
+        """Scan settings, build scripts and sources; returns self"""
+        started = time.perf_counter()
+        settings = self.backend_dir / 'settings.gradle.kts'
+        if settings.exists():
+            self.settings_modules = self._parsed(settings, parse_settings)
+
+        for build_file in sorted(self.backend_dir.glob('*/build.gradle.kts')):
+            if self._skipped(build_file):
+                continue
+            module = self._module_of(build_file)
+            self.gradle_edges[module] = {}
+            for configuration, dependency, line in self._parsed(build_file, parse_gradle_dependencies):
+                self.gradle_edges[module][dependency] = (configuration, line)
+
+        for path in sorted(self.backend_dir.rglob('*.kt')):
+            if self._skipped(path):
+                continue
+            entry = self._parsed(path, parse_kotlin_dependencies)
+            module = self._module_of(path)
+            self.files[path] = dict(entry, module=module)
+            self.package_modules[entry['package']].add(module)
+
+        known_packages = set(self.package_modules)
+        for path, entry in self.files.items():
+            for name, wildcard, line in entry['imports']:
+                target = name if wildcard else name.rsplit('.', 1)[0]
+                while target and target not in known_packages:
+                    # Nested classes: com.x.Outer.Inner lives in com.x
+                    target = target.rsplit('.', 1)[0] if '.' in target else ''
+                if not target or target == entry['package']:
+                    continue
+                self.package_edges[entry['package']][target].append((path, line))
+                for dependency in self.package_modules[target]:
+                    if dependency != entry['module']:
+                        self.module_edges[entry['module']].add(dependency)
+
+        self._save_cache()
+        self.stats['seconds'] = time.perf_counter() - started
+        return self
+
+    def module_graph(self):
+        """Module graph: declared Gradle edges plus edges implied by imports"""
+        graph = defaultdict(set)
+        for module, dependencies in self.gradle_edges.items():
+            graph[module].update(dependencies)
+        for module, dependencies in self.module_edges.items():
+            graph[module].update(dependencies)
+        return graph
+
+    def _add(self, severity, kind, path, line, message, **details):
+        self.issues.append(AlignmentIssue(severity, kind, path, line, message, details))
+
+    def _first_import(self, source_module, target_module):
+        for package, targets in self.package_edges.items():
+            for target, sites in targets.items():
+                if target_module in self.package_modules[target]:
+                    for path, line in sites:
+                        if self.files[path]['module'] == source_module:
+                            return path, line
+        return self.backend_dir / source_module / 'build.gradle.kts', 1
+
+    def check(self):
+        """Detect cycles and layering violations; returns the list of issues"""
+        started = time.perf_counter()
+        if not self.files and not self.gradle_edges:
+            self.build()
+        self.issues = []
+        graph = self.module_graph()
+
+        for component in strongly_connected_components(graph):
+            cycle = find_cycle(graph, component)
+            path, line = self._first_import(cycle[0], cycle[1]) if len(cycle) > 1 else (self.backend_dir, 1)
+            self._add('error', 'module-cycle', path, line,
+                      f"module cycle: {' -> '.join(cycle)}", cycle=cycle)
+
+        for module, dependencies in sorted(graph.items()):
+            layer = MODULE_LAYERS.get(module, DEFAULT_MODULE_LAYER)
+            for dependency in sorted(dependencies):
+                if dependency == module:
+                    continue
+                if MODULE_LAYERS.get(dependency, DEFAULT_MODULE_LAYER) >= layer:
+                    path, line = self._first_import(module, dependency)
+                    self._add('error', 'module-layering', path, line,
+                              f"{module} depends on {dependency}, which is not in a lower layer",
+                              module=module, dependency=dependency)
+
+        for module, dependencies in sorted(self.module_edges.items()):
+            for dependency in sorted(dependencies - set(self.gradle_edges.get(module, {}))):
+                path, line = self._first_import(module, dependency)
+                self._add('error', 'undeclared-dependency', path, line,
+                          f"{module} imports {dependency} but its build.gradle.kts has no "
+                          f"implementation(project(\":{dependency}\"))",
+                          module=module, dependency=dependency)
+
+        if self.settings_modules:
+            depended_on = {d for dependencies in graph.values() for d in dependencies}
+            for module in sorted(depended_on | set(self.gradle_edges)):
+                if module and module not in self.settings_modules:
+                    severity = 'error' if module in depended_on else 'warning'
+                    self._add(severity, 'module-not-included', self.backend_dir / 'settings.gradle.kts', 1,
+                              f"{module} is not included in settings.gradle.kts", module=module)
+
+        package_graph = {package: set(targets) for package, targets in self.package_edges.items()}
+        for component in strongly_connected_components(package_graph):
+            cycle = find_cycle(package_graph, component)
+            path, line = self.package_edges[cycle[0]][cycle[1]][0]
+            self._add('warning', 'package-cycle', path, line,
+                      f"package cycle: {' -> '.join(p.rsplit('.', 1)[-1] for p in cycle)}",
+                      cycle=cycle)
+
+        for package, targets in sorted(self.package_edges.items()):
+            layer = PACKAGE_LAYERS.get(package.rsplit('.', 1)[-1])
+            for target, sites in sorted(targets.items()):
+                target_layer = PACKAGE_LAYERS.get(target.rsplit('.', 1)[-1])
+                if layer is None or target_layer is None or target_layer <= layer:
+                    continue
+                path, line = sites[0]
+                self._add('warning', 'package-layering', path, line,
+                          f"{package.rsplit('.', 1)[-1]} imports {target.rsplit('.', 1)[-1]} "
+                          f"({package} -> {target})", source=package, target=target)
+
+        self.stats['seconds'] += time.perf_counter() - started
+        return self.issues
+
+    def errors(self):
+        return [issue for issue in self.issues if issue.severity == 'error']
+
+    def format_report(self):
+        """Human readable summary of the graph and its problems"""
+        graph = self.module_graph()
+        lines = [
+            f"Dependency graph: {len(set(graph) | set(self.gradle_edges))} modules, {len(self.package_edges)} packages with "
+            f"imports, {self.stats['files']} files ({self.stats['cached']} cached) in "
+            f"{self.stats['seconds'] * 1000:.1f}ms"
+        ]
+        for module in sorted(set(graph) | set(self.gradle_edges)):
+            lines.append(f"  {module or '(root)'} -> {', '.join(sorted(graph.get(module, ()))) or '-'}")
+        icons = {'error': '❌', 'warning': '⚠️ ', 'info': 'ℹ️ '}
+        for issue in sorted(self.issues, key=lambda i: (i.severity != 'error', str(i.path), i.line)):
+            lines.append(f"  {icons[issue.severity]} {issue.location(self.backend_dir)}  {issue.message}")
+        if not self.issues:
+            lines.append("  ✅ No cycles or layering violations")
+        return '\n'.join(lines)
+
+    def to_dot(self):
+        """Module + package graph in Graphviz dot format"""
+        lines = ['digraph backend {', '  rankdir=LR;']
+        modules = sorted({module for modules in self.package_modules.values() for module in modules})
+        for module in modules:
+            lines.append(f'  subgraph "cluster_{module}" {{ label="{module}";')
+            for package in sorted(p for p, owners in self.package_modules.items() if module in owners):
+                lines.append(f'    "{package}";')
+            lines.append('  }')
+        for package, targets in sorted(self.package_edges.items()):
+            for target in sorted(targets):
+                lines.append(f'  "{package}" -> "{target}";')
+        lines.append('}')
+        return '\n'.join(lines)
+
+
+def validate_layout(backend_dir=DEFAULT_BACKEND_DIR, cache_path=DEFAULT_CACHE_PATH):
+    """Build and check the graph; returns (ok, graph) so callers can refuse to run Gradle"""
+    graph = DependencyGraph(backend_dir, cache_path).build()
+    graph.check()
+    return not graph.errors(), graph
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check module and package dependencies of the backend")
+    parser.add_argument('backend_dir', nargs='?', default=str(DEFAULT_BACKEND_DIR))
+    parser.add_argument('--json', action='store_true', help='Print issues as JSON')
+    parser.add_argument('--dot', action='store_true', help='Print the package graph as Graphviz dot')
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args(argv)
+
+    ok, graph = validate_layout(args.backend_dir, None if args.no_cache else DEFAULT_CACHE_PATH)
+    if args.json:
+        print(json.dumps([issue.to_dict(graph.backend_dir) for issue in graph.issues], indent=2))
+    elif args.dot:
+        print(graph.to_dot())
+    else:
+        print(graph.format_report())
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
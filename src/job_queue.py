@@ -0,0 +1,383 @@
+"""
+Job Queue
+SQLite (WAL) queue of stage jobs and a multi-process worker pool
+
+Running the generator for several workspaces meant launching scripts by
+hand, and concurrent runs fought over the same generated_code/ paths. Jobs
+(workspace, stage, priority, retries) now go into a shared SQLite database
+and `./crew queue workers -n N` pulls them across N processes:
+
+- a workspace is locked while one of its jobs runs, so two jobs never touch
+  the same generated_code/ tree; jobs of one workspace run in enqueue order
+- failed jobs are retried with exponential backoff; when a job finally fails
+  the rest of its batch in that workspace is skipped
+- a provider governor caps how many jobs call the LLM provider at once,
+  spaces out job starts and, when a job hits a rate limit, pauses every
+  worker for a cooldown instead of letting them all retry into the limit.
+  A rate-limited run does not use up an attempt, up to a per-job cap
+
+Locks carry a heartbeat; a lock whose worker died is released and its job
+requeued by the next worker that looks for work. A worker that lost its lock
+that way cannot touch the lock or the job once it finishes.
+
+CLI:
+    ./crew queue add 004a..004h --root ../variant-a --root ../variant-b --priority 5
+    ./crew queue workers -n 4 --drain
+    ./crew queue list [--status failed]
+    ./crew queue retry <job id> | ./crew queue cancel <job id>
+"""
+
+import json
+import multiprocessing
+import os
+import re
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from src.workspace import REPO_ROOT
+
+DEFAULT_DB_PATH = Path(os.getenv('CREW_QUEUE_DB', REPO_ROOT / '.crew_queue' / 'jobs.sqlite'))
+
+POLL_INTERVAL = 2.0
+HEARTBEAT_INTERVAL = 15.0
+LOCK_TIMEOUT = 120.0
+RETRY_BASE_DELAY = 30.0
+RATE_LIMIT_COOLDOWN = float(os.getenv('CREW_RATE_LIMIT_COOLDOWN', '90'))
+MAX_RATE_LIMIT_RETRIES = int(os.getenv('CREW_MAX_RATE_LIMIT_RETRIES', '5'))
+PROVIDER_CONCURRENCY = int(os.getenv('CREW_PROVIDER_CONCURRENCY', '0'))
+PROVIDER_START_INTERVAL = float(os.getenv('CREW_PROVIDER_START_INTERVAL', '2'))
+
+RATE_LIMIT_PATTERN = re.compile(r'RateLimitError|rate[ _-]?limit|\b429\b|Too Many Requests|overloaded', re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch TEXT NOT NULL,
+    workspace TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 1,
+    rate_limits INTEGER NOT NULL DEFAULT 0,
+    not_before REAL NOT NULL DEFAULT 0,
+    options TEXT NOT NULL DEFAULT '{}',
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    worker TEXT,
+    returncode INTEGER,
+    log_path TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, priority DESC, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_workspace ON jobs (workspace, status);
+CREATE TABLE IF NOT EXISTS workspace_locks (
+    workspace TEXT PRIMARY KEY,
+    job_id INTEGER NOT NULL,
+    worker TEXT NOT NULL,
+    acquired_at REAL NOT NULL,
+    heartbeat REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS governor (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    cooldown_until REAL NOT NULL DEFAULT 0,
+    last_start REAL NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO governor (id) VALUES (1);
+"""
+
+STATUSES = ('queued', 'running', 'done', 'failed', 'skipped', 'cancelled')
+
+
+def connect(db_path=DEFAULT_DB_PATH):
+    """Open the queue database in WAL mode; every worker process uses its own connection"""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    db.row_factory = sqlite3.Row
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA busy_timeout=30000")
+    db.executescript(SCHEMA)
+    # Databases created before rate-limited runs were counted
+    if 'rate_limits' not in {row['name'] for row in db.execute("PRAGMA table_info(jobs)")}:
+        db.execute("ALTER TABLE jobs ADD COLUMN rate_limits INTEGER NOT NULL DEFAULT 0")
+    return db
+
+
+class JobQueue:
+    """Enqueue, claim and settle stage jobs"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, provider_concurrency=PROVIDER_CONCURRENCY,
+                 start_interval=PROVIDER_START_INTERVAL):
+        self.db_path = Path(db_path)
+        self.db = connect(self.db_path)
+        self.provider_concurrency = provider_concurrency
+        self.start_interval = start_interval
+
+    def _transaction(self):
+        # BEGIN IMMEDIATE takes the write lock up front, so two workers can never claim the same job
+        self.db.execute("BEGIN IMMEDIATE")
+
+    def enqueue(self, workspaces, stages, priority=0, retries=0, options=None):
+        """Queue every stage for every workspace; returns the batch id"""
+        batch = f"{time.strftime('%Y%m%d_%H%M%S')}-{os.getpid()}"
+        now = time.time()
+        rows = [(batch, str(Path(workspace).resolve()), stage, priority, retries + 1,
+                 json.dumps(options or {}), now)
+                for workspace in workspaces for stage in stages]
+        self._transaction()
+        try:
+            self.db.executemany(
+                "INSERT INTO jobs (batch, workspace, stage, priority, max_attempts, options, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+        return batch
+
+    def _release_stale_locks(self, now):
+        stale = self.db.execute(
+            "SELECT workspace, job_id FROM workspace_locks WHERE heartbeat < ?", (now - LOCK_TIMEOUT,)
+        ).fetchall()
+        for lock in stale:
+            self.db.execute("DELETE FROM workspace_locks WHERE workspace = ?", (lock['workspace'],))
+            self.db.execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL, error = 'worker lost; requeued' "
+                "WHERE id = ? AND status = 'running'", (lock['job_id'],)
+            )
+
+    def _governor_allows(self, now):
+        governor = self.db.execute("SELECT cooldown_until, last_start FROM governor WHERE id = 1").fetchone()
+        if now < governor['cooldown_until'] or now - governor['last_start'] < self.start_interval:
+            return False
+        if self.provider_concurrency:
+            running = self.db.execute("SELECT COUNT(*) FROM jobs WHERE status = 'running'").fetchone()[0]
+            if running >= self.provider_concurrency:
+                return False
+        return True
+
+    def claim(self, worker):
+        """Atomically take the next runnable job and lock its workspace; returns the job row or None"""
+        now = time.time()
+        self._transaction()
+        try:
+            self._release_stale_locks(now)
+            job = None
+            if self._governor_allows(now):
+                locked = {row[0] for row in self.db.execute("SELECT workspace FROM workspace_locks")}
+                seen = set()
+                for candidate in self.db.execute(
+                    "SELECT * FROM jobs WHERE status = 'queued' ORDER BY priority DESC, id"
+                ):
+                    # Only the head of each workspace's queue may start, so stages keep their order
+                    if candidate['workspace'] in seen:
+                        continue
+                    seen.add(candidate['workspace'])
+                    if candidate['workspace'] not in locked and candidate['not_before'] <= now:
+                        job = candidate
+                        break
+            if job is not None:
+                self.db.execute(
+                    "INSERT INTO workspace_locks (workspace, job_id, worker, acquired_at, heartbeat) "
+                    "VALUES (?, ?, ?, ?, ?)", (job['workspace'], job['id'], worker, now, now)
+                )
+                self.db.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ?, worker = ? "
+                    "WHERE id = ?", (now, worker, job['id'])
+                )
+                self.db.execute("UPDATE governor SET last_start = ? WHERE id = 1", (now,))
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+        if job is None:
+            return None
+        return self.db.execute("SELECT * FROM jobs WHERE id = ?", (job['id'],)).fetchone()
+
+    def heartbeat(self, job):
+        """Refresh the job's workspace lock; False when the lock is no longer this worker's"""
+        return self.db.execute(
+            "UPDATE workspace_locks SET heartbeat = ? WHERE workspace = ? AND job_id = ? AND worker = ?",
+            (time.time(), job['workspace'], job['id'], job['worker'])
+        ).rowcount > 0
+
+    def finish(self, job, returncode, log_path=None, rate_limited=False, error=None):
+        """Record a job's outcome, scheduling a retry or skipping the rest of its batch
+
+        Returns the job's new status, or 'lost' when its lock was released as stale and the job
+        requeued (and maybe claimed by another worker) meanwhile; nothing is recorded then.
+        """
+        now = time.time()
+        self._transaction()
+        try:
+            self.db.execute("DELETE FROM workspace_locks WHERE workspace = ? AND job_id = ? AND worker = ?",
+                            (job['workspace'], job['id'], job['worker']))
+            owned = self.db.execute("SELECT 1 FROM jobs WHERE id = ? AND worker = ? AND status = 'running'",
+                                    (job['id'], job['worker'])).fetchone()
+            if owned is None:
+                self.db.execute("COMMIT")
+                return 'lost'
+            if returncode == 0:
+                status, not_before = 'done', 0
+            elif rate_limited and job['rate_limits'] < MAX_RATE_LIMIT_RETRIES:
+                # Rate limits are the provider's state, not the job's: pause everyone, keep the attempt.
+                # Past the cap the run counts as a normal failure, so a job that always trips it ends
+                status, not_before = 'queued', now + RATE_LIMIT_COOLDOWN
+                self.db.execute("UPDATE governor SET cooldown_until = MAX(cooldown_until, ?) WHERE id = 1",
+                                (not_before,))
+                self.db.execute("UPDATE jobs SET attempts = attempts - 1, rate_limits = rate_limits + 1 "
+                                "WHERE id = ?", (job['id'],))
+            elif job['attempts'] < job['max_attempts']:
+                status, not_before = 'queued', now + RETRY_BASE_DELAY * 2 ** (job['attempts'] - 1)
+            else:
+                status, not_before = 'failed', 0
+                self.db.execute(
+                    "UPDATE jobs SET status = 'skipped', error = ? WHERE batch = ? AND workspace = ? "
+                    "AND status = 'queued' AND id > ?",
+                    (f"job {job['id']} ({job['stage']}) failed", job['batch'], job['workspace'], job['id'])
+                )
+            self.db.execute(
+                "UPDATE jobs SET status = ?, not_before = ?, finished_at = ?, returncode = ?, log_path = ?, "
+                "error = ? WHERE id = ? AND worker = ?",
+                (status, not_before, now, returncode, str(log_path) if log_path else None, error, job['id'],
+                 job['worker'])
+            )
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+        return status
+
+    def pending(self):
+        return self.db.execute("SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'running')").fetchone()[0]
+
+    def jobs(self, status=None, limit=50):
+        if status:
+            return self.db.execute("SELECT * FROM jobs WHERE status = ? ORDER BY id DESC LIMIT ?",
+                                   (status, limit)).fetchall()
+        return self.db.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+
+    def counts(self):
+        return {row['status']: row['n'] for row in
+                self.db.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status")}
+
+    def retry(self, job_id):
+        """Requeue a failed, skipped or cancelled job with a fresh attempt budget"""
+        return self.db.execute(
+            "UPDATE jobs SET status = 'queued', attempts = 0, rate_limits = 0, not_before = 0, error = NULL "
+            "WHERE id = ? AND status IN ('failed', 'skipped', 'cancelled')", (job_id,)
+        ).rowcount
+
+    def cancel(self, job_id=None):
+        """Cancel one queued job, or every queued job when job_id is None"""
+        if job_id is None:
+            return self.db.execute("UPDATE jobs SET status = 'cancelled' WHERE status = 'queued'").rowcount
+        return self.db.execute("UPDATE jobs SET status = 'cancelled' WHERE id = ? AND status = 'queued'",
+                               (job_id,)).rowcount
+
+
+def _rate_limited(log_path):
+    """True when the tail of a failed job's log shows a provider rate limit"""
+    try:
+        with open(log_path, 'rb') as log:
+            log.seek(0, os.SEEK_END)
+            log.seek(max(log.tell() - 20000, 0))
+            tail = log.read().decode('utf-8', errors='replace')
+    except OSError:
+        return False
+    return RATE_LIMIT_PATTERN.search(tail) is not None
+
+
+def run_job(queue, job, worker):
+    """Run one claimed job through the pipeline runner, heartbeating its workspace lock"""
+    from src.pipeline import PipelineRunner, discover_stages
+
+    stages = {stage.name: stage for stage in discover_stages()}
+    stage = stages.get(job['stage'])
+    if stage is None:
+        return queue.finish(job, 127, error=f"stage {job['stage']} not found")
+
+    options = json.loads(job['options'])
+    runner = PipelineRunner([job['workspace']], replay=options.get('replay', False),
+                            cache=options.get('cache', True), profile=options.get('profile', False), quiet=True)
+    runner.run_id = f"queue_{job['id']}_{job['attempts']}"
+
+    stop = threading.Event()
+
+    def beat():
+        # sqlite3 connections are bound to the thread that opened them, so open one here
+        heartbeat_queue = JobQueue(queue.db_path)
+        try:
+            while not stop.wait(HEARTBEAT_INTERVAL):
+                if not heartbeat_queue.heartbeat(job):
+                    print(f"⚠️  [{worker}] job {job['id']} lost its workspace lock", flush=True)
+                    return
+        finally:
+            heartbeat_queue.db.close()
+
+    thread = threading.Thread(target=beat, daemon=True)
+    thread.start()
+    try:
+        result = runner.run_stage(stage, Path(job['workspace']))
+    except Exception as e:
+        return queue.finish(job, 1, error=str(e))
+    finally:
+        stop.set()
+        thread.join()
+
+    rate_limited = not result.ok and _rate_limited(result.log_path)
+    status = queue.finish(job, result.returncode, result.log_path, rate_limited,
+                          error="rate limited" if rate_limited else None)
+    print(f"📋 [{worker}] job {job['id']} {job['stage']} → {status}", flush=True)
+    return status
+
+
+def worker_loop(db_path=DEFAULT_DB_PATH, name=None, drain=False,
+                provider_concurrency=PROVIDER_CONCURRENCY, start_interval=PROVIDER_START_INTERVAL):
+    """Claim and run jobs until stopped (or, with drain, until nothing is queued or running)"""
+    name = name or f"{socket.gethostname()}:{os.getpid()}"
+    queue = JobQueue(db_path, provider_concurrency, start_interval)
+    print(f"👷 Worker {name} started", flush=True)
+    while True:
+        job = queue.claim(name)
+        if job is not None:
+            run_job(queue, job, name)
+            continue
+        if drain and queue.pending() == 0:
+            print(f"👷 Worker {name}: queue drained", flush=True)
+            return
+        time.sleep(POLL_INTERVAL)
+
+
+def run_workers(count, db_path=DEFAULT_DB_PATH, drain=False, provider_concurrency=None,
+                start_interval=PROVIDER_START_INTERVAL):
+    """Start count worker processes and wait for them"""
+    # Default the provider cap to the pool size so a bigger pool does not silently multiply load
+    provider_concurrency = count if provider_concurrency is None else provider_concurrency
+    processes = [
+        multiprocessing.Process(
+            target=worker_loop,
+            # The pid keeps names unique across pools started on the same host
+            args=(str(db_path), f"{socket.gethostname()}:{os.getpid()}:w{index}", drain, provider_concurrency,
+                  start_interval),
+        )
+        for index in range(count)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+    return [process.exitcode for process in processes]
@@ -0,0 +1,248 @@
+"""
+Knowledge Base Digests
+Compact, cached summaries of the TwitterClone_*_Phase*.md planning documents
+
+Later stages used to paste (or FileReadTool) whole phase documents into prompts.
+This module parses a markdown document once into a section tree, extracts the
+key decisions under each heading and caches the result on disk keyed by the
+SHA-256 of the document content. Tasks then ask for the granularity they need:
+
+    outline    - heading tree only (down to max_depth)
+    decisions  - headings plus the top key decisions under each one (default)
+    detailed   - every heading, lead sentence and all extracted decisions
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from src.workspace import PROJECT_ROOT
+
+DEFAULT_CACHE_DIR = PROJECT_ROOT / ".crew_cache" / "digests"
+
+# Bump when the extraction rules change so stale cache entries are ignored
+DIGEST_VERSION = 1
+
+LEVELS = ("outline", "decisions", "detailed")
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+BULLET_PATTERN = re.compile(r'^\s*(?:[-*+]|\d+[.)])\s+(.*)$')
+BOLD_LEAD_PATTERN = re.compile(r'^\*\*(.+?)\*\*:?\s*(.*)$')
+
+# Words that usually mark a decision rather than background prose
+DECISION_KEYWORDS = (
+    'use', 'using', 'utiliz', 'implement', 'adopt', 'choose', 'chosen', 'decid',
+    'will', 'must', 'should', 'require', 'store', 'deploy', 'cache', 'jwt',
+    'postgres', 'redis', 'kafka', 'docker', 'kubernetes', 'spring', 'kotlin',
+    'swiftui', 'compose', 'websocket', 'index', 'partition', 'shard',
+)
+
+
+def _clean_inline(text):
+    """Strip markdown emphasis, links and code ticks from a line"""
+    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    text = text.replace('**', '').replace('__', '').replace('`', '')
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _first_sentence(text, limit=160):
+    """Return the first sentence of a paragraph, truncated to limit characters"""
+    sentence = re.split(r'(?<=[.!?])\s', text, maxsplit=1)[0]
+    if len(sentence) > limit:
+        sentence = sentence[:limit - 3].rstrip() + '...'
+    return sentence
+
+
+def _is_decision(text):
+    lowered = text.lower()
+    return any(keyword in lowered for keyword in DECISION_KEYWORDS)
+
+
+def parse_sections(markdown):
+    """Parse markdown into a flat list of sections with heading level and body lines"""
+    sections = []
+    current = {'level': 0, 'title': '(preamble)', 'lines': []}
+    in_code_block = False
+
+    for line in markdown.splitlines():
+        if line.strip().startswith('```'):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            continue
+
+        match = HEADING_PATTERN.match(line)
+        if match:
+            sections.append(current)
+            current = {'level': len(match.group(1)), 'title': _clean_inline(match.group(2)), 'lines': []}
+        else:
+            current['lines'].append(line)
+
+    sections.append(current)
+    return [s for s in sections if s['level'] > 0 or any(l.strip() for l in s['lines'])]
+
+
+def extract_decisions(lines, max_decisions=5):
+    """Pick the bullet points and bold-led statements that read like decisions"""
+    candidates = []
+    for line in lines:
+        bullet = BULLET_PATTERN.match(line)
+        text = bullet.group(1) if bullet else line.strip()
+        if not text:
+            continue
+
+        bold = BOLD_LEAD_PATTERN.match(text)
+        if bold and bold.group(2):
+            text = f"{bold.group(1).rstrip(':')}: {bold.group(2)}"
+        elif not bullet:
+            continue
+
+        text = _first_sentence(_clean_inline(text))
+        if text and _is_decision(text) and text not in candidates:
+            candidates.append(text)
+
+    return candidates[:max_decisions]
+
+
+def build_digest(markdown, max_decisions=5):
+    """Build the hierarchical digest for a markdown document"""
+    sections = []
+    for section in parse_sections(markdown):
+        paragraph = ' '.join(
+            l.strip() for l in section['lines']
+            if l.strip() and not BULLET_PATTERN.match(l)
+        )
+        sections.append({
+            'level': section['level'],
+            'title': section['title'],
+            'lead': _first_sentence(_clean_inline(paragraph)) if paragraph else '',
+            'decisions': extract_decisions(section['lines'], max_decisions),
+        })
+
+    return {
+        'version': DIGEST_VERSION,
+        'source_chars': len(markdown),
+        'sections': sections,
+    }
+
+
+def _shorten(text, limit):
+    return text if len(text) <= limit else text[:limit - 3].rstrip() + '...'
+
+
+def render_digest(digest, level='decisions', max_chars=None, max_depth=3):
+    """Render a digest as compact markdown at the requested granularity"""
+    if level not in LEVELS:
+        raise ValueError(f"Unknown digest level '{level}', expected one of {LEVELS}")
+
+    lines = []
+    for section in digest['sections']:
+        if section['level'] == 0:
+            if level == 'detailed' and section['lead']:
+                lines.append(section['lead'])
+            continue
+
+        if level != 'detailed' and section['level'] > max_depth:
+            continue
+
+        indent = '  ' * (section['level'] - 1)
+        lines.append(f"{indent}- {section['title']}")
+
+        if level == 'outline':
+            continue
+        if level == 'detailed' and section['lead']:
+            lines.append(f"{indent}  > {section['lead']}")
+
+        if level == 'detailed':
+            decisions = section['decisions']
+        else:
+            decisions = [_shorten(d, 100) for d in section['decisions'][:2]]
+        for decision in decisions:
+            lines.append(f"{indent}  * {decision}")
+
+    text = '\n'.join(lines)
+    if max_chars and len(text) > max_chars:
+        text = text[:max_chars].rsplit('\n', 1)[0] + '\n  ... (digest truncated)'
+    return text
+
+
+class KnowledgeDigestBuilder:
+    """Builds and caches digests of markdown documents keyed by content hash"""
+
+    def __init__(self, project_root=PROJECT_ROOT, cache_dir=DEFAULT_CACHE_DIR):
+        self.project_root = Path(project_root)
+        self.cache_dir = Path(cache_dir)
+        self.stats = {'hits': 0, 'misses': 0, 'source_chars': 0, 'digest_chars': 0}
+
+    def _resolve(self, document):
+        path = Path(document)
+        if not path.is_absolute():
+            path = self.project_root / path
+        return path
+
+    def get_digest(self, document):
+        """Return the digest for a document, building it only if its content changed"""
+        content = self._resolve(document).read_text(encoding='utf-8')
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        cache_file = self.cache_dir / f"{content_hash}.json"
+
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'r') as f:
+                    digest = json.load(f)
+                if digest.get('version') == DIGEST_VERSION:
+                    self.stats['hits'] += 1
+                    return digest
+            except (OSError, ValueError):
+                pass
+
+        self.stats['misses'] += 1
+        digest = build_digest(content)
+        digest['content_hash'] = content_hash
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(digest, f)
+        tmp_file.replace(cache_file)
+        return digest
+
+    def summarize(self, document, level='decisions', max_chars=None, max_depth=3):
+        """Return the rendered digest for a single document"""
+        digest = self.get_digest(document)
+        text = render_digest(digest, level, max_chars, max_depth)
+        self.stats['source_chars'] += digest['source_chars']
+        self.stats['digest_chars'] += len(text)
+        return text
+
+    def summarize_many(self, documents, level='decisions', max_chars_per_doc=None):
+        """Return one prompt-ready block covering several documents, skipping missing ones"""
+        blocks = []
+        for document in documents:
+            path = self._resolve(document)
+            if not path.exists():
+                continue
+            blocks.append(f"### {path.name}\n{self.summarize(path, level, max_chars_per_doc)}")
+        return '\n\n'.join(blocks)
+
+    def report(self):
+        """Return a one-line summary of cache usage and prompt size savings"""
+        saved = self.stats['source_chars'] - self.stats['digest_chars']
+        return (
+            f"Digests: {self.stats['hits']} cached, {self.stats['misses']} built, "
+            f"{self.stats['source_chars']:,} -> {self.stats['digest_chars']:,} chars "
+            f"(~{saved // 4:,} tokens saved)"
+        )
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m src.knowledge_digest <document.md> [outline|decisions|detailed]")
+        sys.exit(1)
+
+    builder = KnowledgeDigestBuilder()
+    print(builder.summarize(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else 'decisions'))
+    print(f"\n{builder.report()}")
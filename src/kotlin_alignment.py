@@ -0,0 +1,674 @@
+"""
+Kotlin Alignment Checker
+Static entity / DTO / mapper field alignment across the backend modules
+
+The 004q -> 004r -> 004s fix chain spent whole crew runs discovering that
+User.kt, the two UserDto definitions and UserDtoMapper.kt disagreed. This
+module finds the same problems locally in milliseconds:
+
+- constructor calls of data classes with unknown, missing or mistyped named
+  arguments (the "Cannot find a parameter" / "No value passed" errors)
+- mapper reads of entity properties that do not exist ("Unresolved reference")
+- entity vs <Entity>Dto field drift, and DTOs defined differently in two modules
+- imports of classes that do not exist or live in a module the importer
+  cannot see (common may only use common; a service may use itself and common)
+
+Only when it reports errors does a fix script need an agent, and then
+fix_prompt() hands the agent the concrete diff instead of a discovery task.
+
+CLI:
+    python -m src.kotlin_alignment [backend_dir] [--json] [--prompt]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from src.workspace import PROJECT_ROOT
+
+DEFAULT_BACKEND_DIR = PROJECT_ROOT / 'generated_code' / 'backend'
+
+EXCLUDED_DIRS = {'build', '.gradle', 'out'}
+SHARED_MODULE = 'common'
+PROJECT_PACKAGE = 'com.twitterclone'
+
+CLASS_PATTERN = re.compile(
+    r'\b((?:(?:data|enum|abstract|open|sealed|inner|private|internal|public)\s+)*)(?:class|interface|object)\s+(\w+)'
+)
+ANNOTATION_PATTERN = re.compile(r'@(?:field:|get:|param:)?(\w+)')
+FUNCTION_PATTERN = re.compile(r'\bfun\s+(?:<[^>]*>\s*)?(?:[\w.]+\.)?(\w+)\s*\(')
+RECEIVER_ACCESS_PATTERN = re.compile(r'^(\w+)\??\.(\w+)$')
+COLUMN_NAME_PATTERN = re.compile(r'@Column\s*\([^)]*\bname\s*=\s*"([^"]+)"')
+
+
+def _blank(chars, start, end):
+    for i in range(start, end):
+        if chars[i] != '\n':
+            chars[i] = ' '
+
+
+def strip_source(source):
+    """Return (text, code): comments blanked, and comments plus string contents blanked
+
+    Both keep every offset and newline of the original, so positions and line
+    numbers found in either map straight back to the file.
+    """
+    text = list(source)
+    code = list(source)
+    i, length = 0, len(source)
+    while i < length:
+        if source.startswith('//', i):
+            end = source.find('\n', i)
+            end = length if end == -1 else end
+            _blank(text, i, end)
+            _blank(code, i, end)
+            i = end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = length if end == -1 else end + 2
+            _blank(text, i, end)
+            _blank(code, i, end)
+            i = end
+        elif source.startswith('"""', i):
+            end = source.find('"""', i + 3)
+            end = length if end == -1 else end
+            _blank(code, i + 3, end)
+            i = end + 3
+        elif source[i] in '"\'':
+            quote, j = source[i], i + 1
+            while j < length and source[j] != quote and source[j] != '\n':
+                j += 2 if source[j] == '\\' else 1
+            _blank(code, i + 1, min(j, length))
+            i = j + 1
+        else:
+            i += 1
+    return ''.join(text), ''.join(code)
+
+
+def matching_close(code, open_index):
+    """Index of the bracket closing the one at open_index (code must have strings blanked)"""
+    pairs = {'(': ')', '[': ']', '{': '}'}
+    stack = []
+    for i in range(open_index, len(code)):
+        char = code[i]
+        if char in pairs:
+            stack.append(pairs[char])
+        elif stack and char == stack[-1]:
+            stack.pop()
+            if not stack:
+                return i
+    return len(code) - 1
+
+
+def split_top_level(code, start, end):
+    """Split code[start:end] at top-level commas; returns (start, end) spans"""
+    spans = []
+    depth = 0
+    segment_start = start
+    for i in range(start, end):
+        char = code[i]
+        if char in '([{':
+            depth += 1
+        elif char in ')]}':
+            depth -= 1
+        elif char == '<' and i + 1 < end and (code[i + 1].isalnum() or code[i + 1] in '*?'):
+            depth += 1
+        elif char == '>' and depth > 0 and code[i - 1] != '-':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            spans.append((segment_start, i))
+            segment_start = i + 1
+    if code[segment_start:end].strip():
+        spans.append((segment_start, end))
+    return spans
+
+
+def _strip_annotations(text):
+    """Remove leading annotations (with balanced arguments) and return (annotations, rest)"""
+    annotations = []
+    rest = text.lstrip()
+    while rest.startswith('@'):
+        match = ANNOTATION_PATTERN.match(rest)
+        if not match:
+            break
+        annotations.append(match.group(1))
+        end = match.end()
+        after = rest[end:].lstrip()
+        if after.startswith('('):
+            offset = len(rest) - len(after)
+            end = matching_close(rest, offset) + 1
+        rest = rest[end:].lstrip()
+    return annotations, rest
+
+
+def _split_default(declaration):
+    """Split 'Type = default' at the first top-level '=' into (type, has_default)"""
+    depth = 0
+    for i, char in enumerate(declaration):
+        if char in '(<[{':
+            depth += 1
+        elif char in ')>]}':
+            depth -= 1
+        elif char == '=' and depth == 0 and declaration[i + 1:i + 2] != '=':
+            return declaration[:i], True
+    return declaration, False
+
+
+class Field:
+    """A constructor parameter or body property of a Kotlin class"""
+
+    def __init__(self, name, type_name, has_default, is_property, annotations, line, column=None):
+        self.name = name
+        self.type = ' '.join(type_name.split())
+        self.has_default = has_default
+        self.is_property = is_property
+        self.annotations = annotations
+        self.line = line
+        self.column = column
+
+    @property
+    def nullable(self):
+        return self.type.endswith('?')
+
+    @property
+    def base_type(self):
+        return self.type.rstrip('?').split('.')[-1]
+
+    def to_dict(self):
+        return {'name': self.name, 'type': self.type, 'has_default': self.has_default, 'line': self.line}
+
+
+class KotlinClass:
+    """Fields, annotations and supertypes of one class declaration"""
+
+    def __init__(self, name, package, path, module, line, modifiers, annotations):
+        self.name = name
+        self.package = package
+        self.path = path
+        self.module = module
+        self.line = line
+        self.modifiers = modifiers
+        self.annotations = annotations
+        self.params = []
+        self.properties = []
+        self.supertypes = []
+
+    @property
+    def fqn(self):
+        return f"{self.package}.{self.name}" if self.package else self.name
+
+    @property
+    def is_data(self):
+        return 'data' in self.modifiers
+
+    @property
+    def is_entity(self):
+        return 'Entity' in self.annotations
+
+    def param(self, name):
+        return next((field for field in self.params if field.name == name), None)
+
+    def signature(self):
+        return f"{self.name}(" + ', '.join(
+            f"{field.name}: {field.type}{' = …' if field.has_default else ''}" for field in self.params
+        ) + ")"
+
+
+class KotlinFile:
+    """Parsed view of one .kt file"""
+
+    def __init__(self, path, module, source):
+        self.path = path
+        self.module = module
+        self.source = source
+        self.text, self.code = strip_source(source)
+        package = re.search(r'^\s*package\s+([\w.]+)', self.text, re.MULTILINE)
+        self.package = package.group(1) if package else ''
+        self.imports = {}
+        self.wildcard_imports = []
+        for match in re.finditer(r'^\s*import\s+([\w.]+)(\.\*)?(?:\s+as\s+(\w+))?', self.text, re.MULTILINE):
+            if match.group(2):
+                self.wildcard_imports.append(match.group(1))
+            else:
+                self.imports[match.group(3) or match.group(1).split('.')[-1]] = match.group(1)
+        self._line_starts = [0] + [m.end() for m in re.finditer('\n', source)]
+        self.classes = self._parse_classes()
+
+    def line_of(self, offset):
+        low, high = 0, len(self._line_starts) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._line_starts[middle] <= offset:
+                low = middle
+            else:
+                high = middle - 1
+        return low + 1
+
+    def _parse_field(self, start, end, annotations_prefix=()):
+        annotations, rest = _strip_annotations(self.text[start:end])
+        match = re.match(
+            r'((?:(?:override|open|private|protected|internal|public|lateinit|const|vararg)\s+)*)(val|var)?\s*(\w+)\s*:\s*(.+)$',
+            rest, re.DOTALL
+        )
+        if not match:
+            return None
+        type_name, has_default = _split_default(match.group(4))
+        raw = self.text[start:end]
+        column = COLUMN_NAME_PATTERN.search(raw)
+        name_offset = start + raw.find(match.group(3), len(raw) - len(rest))
+        return Field(
+            match.group(3), type_name.strip(), has_default, bool(match.group(2)),
+            list(annotations_prefix) + annotations, self.line_of(name_offset),
+            column.group(1) if column else None
+        )
+
+    def _parse_classes(self):
+        classes = []
+        previous_end = 0
+        for match in CLASS_PATTERN.finditer(self.code):
+            if match.start() < previous_end:
+                continue
+            annotations = ANNOTATION_PATTERN.findall(self.code[previous_end:match.start()])
+            cls = KotlinClass(
+                match.group(2), self.package, self.path, self.module,
+                self.line_of(match.start()), match.group(1).split(), annotations
+            )
+            index = match.end()
+            generics = re.match(r'\s*<', self.code[index:])
+            if generics:
+                depth = 0
+                for index in range(index, len(self.code)):
+                    depth += {'<': 1, '>': -1}.get(self.code[index], 0)
+                    if depth == 0 and self.code[index] == '>':
+                        index += 1
+                        break
+
+            constructor = re.match(r'\s*(?:(?:private|protected|internal|public)\s+)?(?:constructor\s*)?\(', self.code[index:])
+            if constructor:
+                open_index = index + constructor.end() - 1
+                close_index = matching_close(self.code, open_index)
+                for start, end in split_top_level(self.code, open_index + 1, close_index):
+                    field = self._parse_field(start, end)
+                    if field:
+                        cls.params.append(field)
+                index = close_index + 1
+
+            header_end = len(self.code)
+            brace = self.code.find('{', index)
+            next_line = re.compile(r'\n\s*\n|\n\s*(?:@|class\b|data\b|object\b|fun\b|enum\b|interface\b)').search(self.code, index)
+            if next_line and (brace == -1 or next_line.start() < brace):
+                header_end = next_line.start()
+                brace = -1
+            elif brace != -1:
+                header_end = brace
+
+            supertypes = re.match(r'\s*:\s*(.+)', self.code[index:header_end], re.DOTALL)
+            if supertypes:
+                for start, end in split_top_level(supertypes.group(1), 0, len(supertypes.group(1))):
+                    name = re.match(r'\s*([\w.]+)', supertypes.group(1)[start:end])
+                    if name:
+                        cls.supertypes.append(name.group(1).split('.')[-1])
+
+            previous_end = header_end
+            if brace != -1:
+                body_end = matching_close(self.code, brace)
+                cls.properties = self._body_properties(brace + 1, body_end)
+                previous_end = body_end + 1
+            classes.append(cls)
+        return classes
+
+    def _body_properties(self, start, end):
+        """Properties declared directly in a class body (not inside functions or nested blocks)"""
+        properties = []
+        depth = 0
+        statement_start = start
+        for i in range(start, end + 1):
+            char = self.code[i] if i < end else '\n'
+            if char in '({[':
+                depth += 1
+            elif char in ')}]':
+                depth -= 1
+            elif char == '\n' and depth == 0:
+                segment = self.code[statement_start:i].strip()
+                if segment.startswith('@') and not re.search(r'\b(val|var)\b', segment):
+                    # Annotation lines belong to the declaration that follows
+                    continue
+                if re.search(r'\b(val|var)\s+\w+\s*:', segment) and not re.search(r'\bfun\b', segment):
+                    field = self._parse_field(statement_start, i)
+                    if field and field.is_property:
+                        properties.append(field)
+                statement_start = i + 1
+        return properties
+
+
+class AlignmentIssue:
+    """One finding; severity is 'error' (will not compile), 'warning' or 'info'"""
+
+    def __init__(self, severity, kind, path, line, message, details=None):
+        self.severity = severity
+        self.kind = kind
+        self.path = path
+        self.line = line
+        self.message = message
+        self.details = details or {}
+
+    def location(self, root=None):
+        path = Path(self.path)
+        if root is not None:
+            try:
+                path = path.relative_to(root)
+            except ValueError:
+                pass
+        return f"{path}:{self.line}"
+
+    def to_dict(self, root=None):
+        return {'severity': self.severity, 'kind': self.kind, 'location': self.location(root),
+                'message': self.message, **self.details}
+
+
+class AlignmentChecker:
+    """Indexes every class in the backend modules and checks their alignment"""
+
+    def __init__(self, backend_dir=DEFAULT_BACKEND_DIR, include_tests=True):
+        self.backend_dir = Path(backend_dir)
+        self.include_tests = include_tests
+        self.files = []
+        self.classes = {}
+        self.by_name = {}
+        self.issues = []
+        self.seconds = 0.0
+
+    def _module_of(self, path):
+        relative = path.relative_to(self.backend_dir)
+        return relative.parts[0] if len(relative.parts) > 1 else ''
+
+    def _source_files(self):
+        for path in sorted(self.backend_dir.rglob('*.kt')):
+            parts = path.relative_to(self.backend_dir).parts
+            if any(part in EXCLUDED_DIRS or part.endswith('.backup') for part in parts):
+                continue
+            if not self.include_tests and 'test' in parts:
+                continue
+            yield path
+
+    def load(self):
+        for path in self._source_files():
+            kotlin_file = KotlinFile(path, self._module_of(path), path.read_text(encoding='utf-8', errors='replace'))
+            self.files.append(kotlin_file)
+            for cls in kotlin_file.classes:
+                self.classes[cls.fqn] = cls
+                self.by_name.setdefault(cls.name, []).append(cls)
+        return self
+
+    def resolve(self, name, kotlin_file):
+        """Resolve a simple class name as the compiler would: imports, same package, wildcards"""
+        if name in kotlin_file.imports:
+            return self.classes.get(kotlin_file.imports[name])
+        same_package = self.classes.get(f"{kotlin_file.package}.{name}" if kotlin_file.package else name)
+        if same_package:
+            return same_package
+        for package in kotlin_file.wildcard_imports:
+            cls = self.classes.get(f"{package}.{name}")
+            if cls:
+                return cls
+        candidates = self.by_name.get(name, [])
+        return candidates[0] if len(candidates) == 1 else None
+
+    def all_properties(self, cls, seen=None):
+        """Constructor properties and body properties, including those of known supertypes"""
+        seen = seen or set()
+        if cls.fqn in seen:
+            return {}
+        seen.add(cls.fqn)
+        properties = {}
+        for supertype in cls.supertypes:
+            for candidate in self.by_name.get(supertype, []):
+                properties.update(self.all_properties(candidate, seen))
+        for field in cls.properties + [field for field in cls.params if field.is_property]:
+            properties[field.name] = field
+        return properties
+
+    def _add(self, severity, kind, path, line, message, **details):
+        self.issues.append(AlignmentIssue(severity, kind, path, line, message, details))
+
+    def check(self):
+        """Run every check; returns the list of AlignmentIssue"""
+        started = time.perf_counter()
+        if not self.files:
+            self.load()
+        self.issues = []
+        self._functions = {
+            f"{kotlin_file.package}.{match.group(1)}"
+            for kotlin_file in self.files for match in FUNCTION_PATTERN.finditer(kotlin_file.code)
+        }
+        for kotlin_file in self.files:
+            self._check_imports(kotlin_file)
+            self._check_constructor_calls(kotlin_file)
+        self._check_entity_dto_pairs()
+        self._check_duplicate_dtos()
+        self.seconds = time.perf_counter() - started
+        return self.issues
+
+    def _enclosing_parameters(self, kotlin_file, offset):
+        """name -> type for the parameters of the function that encloses offset"""
+        parameters = {}
+        for match in FUNCTION_PATTERN.finditer(kotlin_file.code, 0, offset):
+            open_index = match.end() - 1
+            close_index = matching_close(kotlin_file.code, open_index)
+            parameters = {}
+            for start, end in split_top_level(kotlin_file.code, open_index + 1, close_index):
+                field = kotlin_file._parse_field(start, end)
+                if field:
+                    parameters[field.name] = field.type
+        return parameters
+
+    def _check_imports(self, kotlin_file):
+        packages = {cls.package for cls in self.classes.values()}
+        for alias, fqn in kotlin_file.imports.items():
+            if not fqn.startswith(PROJECT_PACKAGE + '.'):
+                continue
+            line = kotlin_file.line_of(kotlin_file.text.find(fqn))
+            cls = self.classes.get(fqn)
+            if cls is None:
+                if fqn in self._functions:
+                    continue
+                if fqn.rsplit('.', 1)[0] in packages or fqn in packages:
+                    self._add('error', 'unresolved-import', kotlin_file.path, line,
+                              f"import {fqn}: no such class in the backend modules", target=fqn)
+                continue
+            if cls.module in (kotlin_file.module, SHARED_MODULE):
+                continue
+            self._add('error', 'cross-module-import', kotlin_file.path, line,
+                      f"import {fqn}: {kotlin_file.module} cannot depend on {cls.module}",
+                      target=fqn, module=kotlin_file.module, dependency=cls.module)
+
+    def _check_constructor_calls(self, kotlin_file):
+        data_class_names = {name for name, classes in self.by_name.items() if any(c.is_data for c in classes)}
+        if not data_class_names:
+            return
+        pattern = re.compile(r'(?<![\w.])(' + '|'.join(sorted(map(re.escape, data_class_names))) + r')\s*\(')
+        for match in pattern.finditer(kotlin_file.code):
+            before = kotlin_file.code[max(match.start() - 12, 0):match.start()]
+            if re.search(r'\b(class|fun|object|interface)\s+$', before):
+                continue
+            target = self.resolve(match.group(1), kotlin_file)
+            if target is None or not target.is_data:
+                continue
+
+            open_index = match.end() - 1
+            close_index = matching_close(kotlin_file.code, open_index)
+            arguments = split_top_level(kotlin_file.code, open_index + 1, close_index)
+            named = {}
+            positional = 0
+            for start, end in arguments:
+                argument = re.match(r'\s*(\w+)\s*=(?!=)\s*(.*?)\s*$', kotlin_file.text[start:end], re.DOTALL)
+                if argument:
+                    named[argument.group(1)] = (argument.group(2), kotlin_file.line_of(start))
+                else:
+                    positional += 1
+            if positional:
+                continue
+
+            call_line = kotlin_file.line_of(match.start())
+            for name, (_, line) in named.items():
+                if target.param(name) is None:
+                    self._add('error', 'unknown-parameter', kotlin_file.path, line,
+                              f"{target.name}({name} = …): no parameter named '{name}' in {target.fqn}",
+                              target=target.fqn, parameter=name)
+            for param in target.params:
+                if param.name not in named and not param.has_default:
+                    self._add('error', 'missing-argument', kotlin_file.path, call_line,
+                              f"{target.name}(…): no value passed for '{param.name}: {param.type}'",
+                              target=target.fqn, parameter=param.name)
+                elif param.name not in named and not target.is_entity:
+                    self._add('info', 'unmapped-field', kotlin_file.path, call_line,
+                              f"{target.name}(…): '{param.name}' is not mapped and keeps its default",
+                              target=target.fqn, parameter=param.name)
+
+            parameters = self._enclosing_parameters(kotlin_file, match.start())
+            for name, (expression, line) in named.items():
+                param = target.param(name)
+                access = RECEIVER_ACCESS_PATTERN.match(expression)
+                if param is None or access is None or access.group(1) not in parameters:
+                    continue
+                receiver_type = parameters[access.group(1)].rstrip('?')
+                source_class = self.resolve(receiver_type, kotlin_file)
+                if source_class is None:
+                    continue
+                source = self.all_properties(source_class).get(access.group(2))
+                if source is None:
+                    self._add('error', 'unresolved-property', kotlin_file.path, line,
+                              f"{expression}: {source_class.name} has no property '{access.group(2)}'",
+                              source=source_class.fqn, property=access.group(2), target=target.fqn)
+                elif source.base_type != param.base_type:
+                    self._add('error', 'type-mismatch', kotlin_file.path, line,
+                              f"{name} = {expression}: {source.type} passed where {param.type} is expected",
+                              source=source_class.fqn, target=target.fqn, parameter=name)
+                elif source.nullable and not param.nullable:
+                    self._add('error', 'nullability-mismatch', kotlin_file.path, line,
+                              f"{name} = {expression}: nullable {source.type} passed to non-null {param.type}",
+                              source=source_class.fqn, target=target.fqn, parameter=name)
+
+    def _check_entity_dto_pairs(self):
+        for entity in [cls for cls in self.classes.values() if cls.is_entity]:
+            entity_fields = self.all_properties(entity)
+            for dto in self.by_name.get(f"{entity.name}Dto", []):
+                for param in dto.params:
+                    source = entity_fields.get(param.name)
+                    if source is None:
+                        self._add('warning', 'dto-field-without-source', dto.path, param.line,
+                                  f"{dto.fqn}.{param.name} has no counterpart in entity {entity.name}",
+                                  entity=entity.fqn, dto=dto.fqn, field=param.name)
+                    elif source.base_type != param.base_type:
+                        self._add('warning', 'entity-dto-type-drift', dto.path, param.line,
+                                  f"{dto.fqn}.{param.name}: {param.type} but {entity.name}.{param.name} is {source.type}",
+                                  entity=entity.fqn, dto=dto.fqn, field=param.name)
+                for name, source in entity_fields.items():
+                    if dto.param(name) is None:
+                        self._add('info', 'entity-field-not-exposed', entity.path, source.line,
+                                  f"{entity.name}.{name} is not exposed by {dto.fqn}",
+                                  entity=entity.fqn, dto=dto.fqn, field=name)
+
+    def _check_duplicate_dtos(self):
+        for name, classes in self.by_name.items():
+            data_classes = [cls for cls in classes if cls.is_data]
+            if len(data_classes) < 2:
+                continue
+            first = data_classes[0]
+            for other in data_classes[1:]:
+                first_fields = {field.name: field.type for field in first.params}
+                other_fields = {field.name: field.type for field in other.params}
+                if first_fields == other_fields:
+                    continue
+                self._add('warning', 'diverging-definitions', other.path, other.line,
+                          f"{name} is defined differently in {first.module or first.package} and "
+                          f"{other.module or other.package}",
+                          only_in_first=sorted(set(first_fields) - set(other_fields)),
+                          only_in_second=sorted(set(other_fields) - set(first_fields)),
+                          type_differences=sorted(
+                              f"{field}: {first_fields[field]} vs {other_fields[field]}"
+                              for field in set(first_fields) & set(other_fields)
+                              if first_fields[field] != other_fields[field]
+                          ),
+                          first=first.fqn, second=other.fqn)
+
+    def errors(self, kinds=None):
+        """Error-level issues, optionally limited to the given kinds"""
+        return [issue for issue in self.issues
+                if issue.severity == 'error' and (kinds is None or issue.kind in kinds)]
+
+    def format_report(self, min_severity='warning'):
+        """Human readable report, most severe first"""
+        order = {'error': 0, 'warning': 1, 'info': 2}
+        shown = [i for i in self.issues if order[i.severity] <= order[min_severity]]
+        counts = {severity: sum(1 for i in self.issues if i.severity == severity) for severity in order}
+        lines = [
+            f"Alignment check: {len(self.classes)} classes in {len(self.files)} files, "
+            f"{counts['error']} errors, {counts['warning']} warnings, {counts['info']} info "
+            f"({self.seconds * 1000:.1f}ms)"
+        ]
+        icons = {'error': '❌', 'warning': '⚠️ ', 'info': 'ℹ️ '}
+        for issue in sorted(shown, key=lambda i: (order[i.severity], str(i.path), i.line)):
+            lines.append(f"  {icons[issue.severity]} {issue.location(self.backend_dir)}  {issue.message}")
+            for key in ('only_in_first', 'only_in_second', 'type_differences'):
+                if issue.details.get(key):
+                    lines.append(f"       {key.replace('_', ' ')}: {', '.join(issue.details[key])}")
+        return '\n'.join(lines)
+
+    def fix_prompt(self, kinds=None):
+        """The concrete diff an agent needs to fix the errors, or '' when there is nothing to fix"""
+        errors = self.errors(kinds)
+        if not errors:
+            return ''
+        involved = []
+        for issue in errors:
+            for key in ('target', 'source'):
+                cls = self.classes.get(issue.details.get(key))
+                if cls is not None and cls not in involved:
+                    involved.append(cls)
+
+        lines = ["STATIC ALIGNMENT CHECK FOUND THESE COMPILE ERRORS (fix exactly these):"]
+        for issue in errors:
+            lines.append(f"- {issue.location(self.backend_dir)}: {issue.message}")
+        lines.append("")
+        lines.append("CURRENT DECLARATIONS:")
+        for cls in involved:
+            lines.append(f"- {cls.fqn} ({Path(cls.path).relative_to(self.backend_dir)})")
+            if cls.params:
+                lines.append(f"    constructor: {cls.signature()}")
+            properties = self.all_properties(cls)
+            if properties:
+                lines.append("    properties: " + ', '.join(f"{n}: {f.type}" for n, f in properties.items()))
+        return '\n'.join(lines)
+
+
+def check_alignment(backend_dir=DEFAULT_BACKEND_DIR, include_tests=True):
+    """Load, check and return an AlignmentChecker"""
+    checker = AlignmentChecker(backend_dir, include_tests)
+    checker.check()
+    return checker
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check Kotlin entity / DTO / mapper alignment")
+    parser.add_argument('backend_dir', nargs='?', default=str(DEFAULT_BACKEND_DIR))
+    parser.add_argument('--json', action='store_true', help='Print issues as JSON')
+    parser.add_argument('--prompt', action='store_true', help='Print the agent fix prompt for the errors')
+    parser.add_argument('--all', action='store_true', help='Include info-level findings')
+    args = parser.parse_args(argv)
+
+    checker = check_alignment(args.backend_dir)
+    if args.json:
+        print(json.dumps([issue.to_dict(checker.backend_dir) for issue in checker.issues], indent=2))
+    elif args.prompt:
+        print(checker.fix_prompt() or "No alignment errors")
+    else:
+        print(checker.format_report('info' if args.all else 'warning'))
+    return 1 if checker.errors() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
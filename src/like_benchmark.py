@@ -0,0 +1,73 @@
+"""
+Like Benchmark
+Throughput of POST/DELETE /api/posts/{id}/like under hot-post contention
+
+Likes are an INSERT ... ON CONFLICT DO NOTHING on (post_id, user_id) plus an
+in-place like_count increment, so concurrent likes on one post serialize only
+on that post's row. The benchmark creates one post, then --users distinct
+users (each with its own minted JWT) like it --repeat times each from
+--concurrency threads. It reports likes/sec and latency percentiles, checks
+that likeCount equals the number of users, and does the same for unlikes
+(expecting 0).
+
+CLI:
+    python -m src.like_benchmark --users 500 --repeat 2 --concurrency 32
+    python -m src.like_benchmark --base-url http://localhost:8082
+"""
+
+import argparse
+import sys
+import time
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+from src.timeline_benchmark import DEFAULT_BASE_URL, TimelineBenchmark, format_row
+
+
+def run_phase(clients, post_id, method, repeat, concurrency):
+    """Each client sends `repeat` like (POST) or unlike (DELETE) requests; returns latencies in ms"""
+    def send(client):
+        started = time.perf_counter()
+        client.request(method, f"/api/posts/{post_id}/like")
+        return (time.perf_counter() - started) * 1000
+
+    jobs = [client for client in clients for _ in range(repeat)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(send, jobs))
+    return latencies, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure like/unlike throughput on a single hot post")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--users', type=int, default=200, help='Distinct users liking the post')
+    parser.add_argument('--repeat', type=int, default=2, help='Requests per user; repeats must be no-ops')
+    parser.add_argument('--concurrency', type=int, default=32)
+    args = parser.parse_args(argv)
+
+    author = TimelineBenchmark(args.base_url, 'like-bench-author')
+    clients = [TimelineBenchmark(args.base_url, f"like-bench-{n}") for n in range(args.users)]
+    failed = False
+    try:
+        post_id = author.request('POST', '/api/posts', {'content': 'Hot post for the like benchmark'})['id']
+        print(f"🔥 Post {post_id}: {args.users} users x {args.repeat} requests, concurrency {args.concurrency}")
+        for method, label, expected in (('POST', 'like', args.users), ('DELETE', 'unlike', 0)):
+            latencies, seconds = run_phase(clients, post_id, method, args.repeat, args.concurrency)
+            count = author.request('GET', f"/api/posts/{post_id}")['likeCount']
+            print(format_row(f"{label} ({len(latencies) / seconds:,.0f} req/s)", latencies))
+            if count != expected:
+                print(f"❌ likeCount after {label}: {count}, expected {expected}")
+                failed = True
+    except urllib.error.URLError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    if failed:
+        return 1
+    print("✅ Counters consistent after concurrent likes and unlikes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
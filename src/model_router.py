@@ -0,0 +1,175 @@
+"""
+Model Router
+Per-agent model tiers, escalation on failed validation and per-tier run metrics
+
+Usage:
+    retro_lead = model_router.route_agent(technical_lead, task_type='retrospective')
+
+    # Each agent on its ROLE_TIERS tier (reviewers and analysts on the cheap one)
+    crew = model_router.build_crew([develop_task, review_task], verbose=True)
+
+    result, passed = model_router.kickoff_with_escalation(
+        build_crew=lambda tier: model_router.build_crew(discovery_tasks, tier=tier, verbose=True),
+        validate=lambda result: 'SPEC_START' in str(result),
+        start_tier='cheap',
+        label='timeline discovery',
+    )
+    print(model_router.report())
+"""
+
+import time
+
+from config.model_routing import (
+    DEFAULT_TIER,
+    ESCALATION_ORDER,
+    MODEL_TIERS,
+    ROLE_TIERS,
+    TASK_TYPE_TIERS,
+)
+
+
+def _usage_tokens(crew):
+    """Return (prompt_tokens, completion_tokens) from a crew after kickoff"""
+    metrics = getattr(crew, 'usage_metrics', None)
+    if metrics is None:
+        return 0, 0
+    if isinstance(metrics, dict):
+        return metrics.get('prompt_tokens', 0), metrics.get('completion_tokens', 0)
+    return getattr(metrics, 'prompt_tokens', 0) or 0, getattr(metrics, 'completion_tokens', 0) or 0
+
+
+class ModelRouter:
+    """Assigns model tiers to agents and records latency and cost per tier"""
+
+    def __init__(self, tiers=MODEL_TIERS, role_tiers=ROLE_TIERS, task_type_tiers=TASK_TYPE_TIERS,
+                 default_tier=DEFAULT_TIER, escalation_order=ESCALATION_ORDER):
+        self.tiers = tiers
+        self.role_tiers = role_tiers
+        self.task_type_tiers = task_type_tiers
+        self.default_tier = default_tier
+        self.escalation_order = escalation_order
+        self.records = []
+
+    def tier_for(self, role=None, task_type=None):
+        """Resolve the tier for a task type or agent role"""
+        if task_type and task_type in self.task_type_tiers:
+            return self.task_type_tiers[task_type]
+        if role:
+            lowered = role.lower()
+            for fragment, tier in self.role_tiers.items():
+                if fragment in lowered:
+                    return tier
+        return self.default_tier
+
+    def model_for(self, role=None, task_type=None, tier=None):
+        """Return the model name to pass as an Agent's llm"""
+        return self.tiers[tier or self.tier_for(role, task_type)]['model']
+
+    def next_tier(self, tier):
+        """Return the next stronger tier, or None if already at the top"""
+        if tier not in self.escalation_order:
+            return None
+        index = self.escalation_order.index(tier)
+        return self.escalation_order[index + 1] if index + 1 < len(self.escalation_order) else None
+
+    def route_agent(self, agent, task_type=None, tier=None):
+        """Return a copy of a shared agent that runs on the routed model tier"""
+        from crewai import Agent
+
+        return Agent(
+            role=agent.role,
+            goal=agent.goal,
+            backstory=agent.backstory,
+            tools=agent.tools,
+            verbose=agent.verbose,
+            allow_delegation=agent.allow_delegation,
+            max_iter=agent.max_iter,
+            llm=self.model_for(agent.role, task_type, tier),
+        )
+
+    def build_crew(self, tasks, tier=None, **crew_kwargs):
+        """Return a sequential crew over tasks with each distinct agent routed once
+
+        With a tier every agent runs on it (the escalation path); without one each
+        agent gets the tier its role maps to in ROLE_TIERS. The tasks are re-pointed
+        at the routed agents.
+        """
+        from crewai import Crew, Process
+
+        routed_agents = {}
+        for task in tasks:
+            if task.agent.role not in routed_agents:
+                routed_agents[task.agent.role] = self.route_agent(task.agent, tier=tier)
+            task.agent = routed_agents[task.agent.role]
+
+        return Crew(
+            agents=list(routed_agents.values()),
+            tasks=list(tasks),
+            process=Process.sequential,
+            **crew_kwargs
+        )
+
+    def kickoff(self, crew, tier, label='crew'):
+        """Run a crew and record latency, tokens and estimated cost for its tier"""
+        started = time.perf_counter()
+        try:
+            return crew.kickoff()
+        finally:
+            prompt_tokens, completion_tokens = _usage_tokens(crew)
+            pricing = self.tiers[tier]
+            self.records.append({
+                'label': label,
+                'tier': tier,
+                'model': pricing['model'],
+                'seconds': time.perf_counter() - started,
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'cost': (prompt_tokens / 1000 * pricing['input_cost_per_1k']
+                         + completion_tokens / 1000 * pricing['output_cost_per_1k']),
+            })
+
+    def kickoff_with_escalation(self, build_crew, validate, start_tier='cheap', label='crew'):
+        """Run on start_tier and escalate one tier at a time until validate(result) passes
+
+        Returns (result, passed) for the last attempt.
+        """
+        tier = start_tier
+        while True:
+            result = self.kickoff(build_crew(tier), tier, label)
+            if validate(result):
+                return result, True
+
+            escalated = self.next_tier(tier)
+            if escalated is None:
+                print(f"⚠️  {label}: validation failed on top tier '{tier}', keeping last result")
+                return result, False
+
+            print(f"🔼 {label}: validation failed on '{tier}', escalating to '{escalated}'")
+            self.records[-1]['escalated'] = True
+            tier = escalated
+
+    def report(self):
+        """Return the per-tier latency and cost table for the run report"""
+        if not self.records:
+            return "Model routing: no routed crew runs recorded"
+
+        totals = {}
+        for record in self.records:
+            tier = totals.setdefault(record['tier'], {'runs': 0, 'seconds': 0.0, 'tokens': 0, 'cost': 0.0, 'escalations': 0})
+            tier['runs'] += 1
+            tier['seconds'] += record['seconds']
+            tier['tokens'] += record['prompt_tokens'] + record['completion_tokens']
+            tier['cost'] += record['cost']
+            tier['escalations'] += 1 if record.get('escalated') else 0
+
+        lines = ["Model routing:"]
+        for name, tier in totals.items():
+            lines.append(
+                f"  {name:<9} {self.tiers[name]['model']:<14} runs={tier['runs']} "
+                f"latency={tier['seconds']:.1f}s tokens={tier['tokens']:,} "
+                f"cost=${tier['cost']:.4f} escalations={tier['escalations']}"
+            )
+        return '\n'.join(lines)
+
+
+model_router = ModelRouter()
@@ -0,0 +1,324 @@
+"""
+Patch Engine
+Applies unified diffs and search/replace blocks emitted by fix-up agents
+
+Fix-up scripts used to ask agents for whole files or whole structs, so most
+of a fix run was spent generating unchanged code. Agents now emit only the
+changed hunks in one of two formats (see PATCH_FORMAT_INSTRUCTIONS):
+
+- unified diff hunks (--- / +++ / @@ headers)
+- search/replace blocks (<<<<<<< SEARCH / ======= / >>>>>>> REPLACE)
+
+Each hunk is located exactly first, then with whitespace-insensitive
+matching, then fuzzily (difflib ratio) near the line the hunk claims. A hunk
+that cannot be placed is a conflict; callers decide whether to fall back to
+a full rewrite.
+"""
+
+import difflib
+import re
+from pathlib import Path
+
+FUZZY_THRESHOLD = 0.85
+
+PATCH_FORMAT_INSTRUCTIONS = """
+**OUTPUT FORMAT - CHANGED LINES ONLY:**
+Do NOT output the whole file. Output one search/replace block per change:
+
+FILE: <file name>
+<<<<<<< SEARCH
+<exact existing lines, including 2-3 unchanged lines of context>
+=======
+<the same lines with your change applied>
+>>>>>>> REPLACE
+
+A unified diff (--- a/<file>, +++ b/<file>, @@ hunks) is also accepted.
+Copy the SEARCH lines from the current file exactly as shown.
+"""
+
+SEARCH_REPLACE_PATTERN = re.compile(
+    r'(?:^FILE:\s*(?P<path>\S+)\s*\n)?^<{5,9} SEARCH\s*\n(?P<search>.*?)^={5,9}\s*\n(?P<replace>.*?)^>{5,9} REPLACE\s*$',
+    re.MULTILINE | re.DOTALL
+)
+HUNK_HEADER_PATTERN = re.compile(r'^@@ -(\d+)(?:,\d+)? \+\d+(?:,\d+)? @@')
+
+
+class PatchConflict(ValueError):
+    """Raised when a hunk cannot be placed in the target file"""
+
+
+class Edit:
+    """One hunk: replace old_lines with new_lines, ideally near hint (0-based line)"""
+
+    def __init__(self, old_lines, new_lines, path=None, hint=None):
+        self.old_lines = old_lines
+        self.new_lines = new_lines
+        self.path = path
+        self.hint = hint
+
+
+class PatchResult:
+    """Outcome of applying a patch to one file"""
+
+    def __init__(self, content, applied, match_modes):
+        self.content = content
+        self.applied = applied
+        self.match_modes = match_modes
+
+
+def _split(text):
+    return text.split('\n')[:-1] if text.endswith('\n') else text.split('\n')
+
+
+def _strip_path(path):
+    path = path.strip()
+    if path.startswith(('a/', 'b/')):
+        path = path[2:]
+    return None if path in ('/dev/null', '') else path
+
+
+def parse_search_replace(text):
+    """Return Edits for every search/replace block in text"""
+    return [
+        Edit(_split(match.group('search')), _split(match.group('replace')), path=match.group('path'))
+        for match in SEARCH_REPLACE_PATTERN.finditer(text)
+    ]
+
+
+def parse_unified_diff(text):
+    """Return Edits for every @@ hunk in text (fences and prose around the diff are ignored)"""
+    edits = []
+    path = None
+    hunk = None
+
+    def close():
+        if hunk is not None and (hunk.old_lines or hunk.new_lines):
+            edits.append(hunk)
+
+    for line in text.split('\n'):
+        if line.startswith('+++ '):
+            close()
+            hunk = None
+            path = _strip_path(line[4:].split('\t')[0])
+            continue
+        if line.startswith('--- '):
+            close()
+            hunk = None
+            continue
+        header = HUNK_HEADER_PATTERN.match(line)
+        if header:
+            close()
+            hunk = Edit([], [], path=path, hint=int(header.group(1)) - 1)
+            continue
+        if hunk is None:
+            continue
+        if line.startswith('```'):
+            close()
+            hunk = None
+        elif line.startswith('-'):
+            hunk.old_lines.append(line[1:])
+        elif line.startswith('+'):
+            hunk.new_lines.append(line[1:])
+        elif line.startswith(' '):
+            hunk.old_lines.append(line[1:])
+            hunk.new_lines.append(line[1:])
+        elif line == '':
+            # Agents routinely drop the leading space of blank context lines
+            hunk.old_lines.append('')
+            hunk.new_lines.append('')
+        elif not line.startswith('\\'):
+            close()
+            hunk = None
+    close()
+
+    # Trailing blank "context" picked up from the prose after a hunk is not part of it
+    for edit in edits:
+        while edit.old_lines and edit.new_lines and edit.old_lines[-1] == '' and edit.new_lines[-1] == '':
+            edit.old_lines.pop()
+            edit.new_lines.pop()
+    return edits
+
+
+def parse_patch(text):
+    """Parse search/replace blocks, falling back to unified diff hunks"""
+    return parse_search_replace(text) or parse_unified_diff(text)
+
+
+def _closest(candidates, hint):
+    if hint is None:
+        return candidates[0]
+    return min(candidates, key=lambda index: abs(index - hint))
+
+
+def _locate(lines, old_lines, hint):
+    """Return (index, mode) of the best place for old_lines in lines"""
+    size = len(old_lines)
+    windows = range(len(lines) - size + 1)
+
+    exact = [i for i in windows if lines[i:i + size] == old_lines]
+    if exact:
+        return _closest(exact, hint), 'exact'
+
+    stripped_old = [line.strip() for line in old_lines]
+    stripped = [line.strip() for line in lines]
+    loose = [i for i in windows if stripped[i:i + size] == stripped_old]
+    if loose:
+        return _closest(loose, hint), 'whitespace'
+
+    target = '\n'.join(stripped_old)
+    matcher = difflib.SequenceMatcher(autojunk=False)
+    matcher.set_seq2(target)
+    best, best_ratio = None, FUZZY_THRESHOLD
+    for i in windows:
+        matcher.set_seq1('\n'.join(stripped[i:i + size]))
+        if matcher.real_quick_ratio() < best_ratio or matcher.quick_ratio() < best_ratio:
+            continue
+        ratio = matcher.ratio()
+        if ratio > best_ratio or (ratio == best_ratio and best is not None and _closest([best, i], hint) == i):
+            best, best_ratio = i, ratio
+    if best is not None:
+        return best, f'fuzzy {best_ratio:.2f}'
+    return None, None
+
+
+def _reindent(new_lines, old_lines, matched_lines):
+    """Shift new_lines by the indentation difference between the hunk and the file"""
+    for old, actual in zip(old_lines, matched_lines):
+        if old.strip():
+            old_indent = old[:len(old) - len(old.lstrip())]
+            actual_indent = actual[:len(actual) - len(actual.lstrip())]
+            break
+    else:
+        return new_lines
+    if old_indent == actual_indent:
+        return new_lines
+
+    shifted = []
+    for line in new_lines:
+        if line.startswith(old_indent):
+            shifted.append(actual_indent + line[len(old_indent):])
+        else:
+            shifted.append(line)
+    return shifted
+
+
+def apply_edits(content, edits):
+    """Apply edits in order and return a PatchResult; raises PatchConflict"""
+    trailing_newline = content.endswith('\n')
+    lines = _split(content)
+    offset = 0
+    modes = []
+
+    for number, edit in enumerate(edits, 1):
+        hint = edit.hint + offset if edit.hint is not None else None
+        if not edit.old_lines:
+            if hint is None:
+                raise PatchConflict(f"Hunk {number} has no context and no line number")
+            index, mode = min(max(hint, 0), len(lines)), 'insert'
+        else:
+            index, mode = _locate(lines, edit.old_lines, hint)
+            if index is None:
+                preview = next((line.strip() for line in edit.old_lines if line.strip()), '')
+                raise PatchConflict(f"Hunk {number} does not match the file (near: {preview[:60]!r})")
+
+        matched = lines[index:index + len(edit.old_lines)]
+        new_lines = edit.new_lines if mode == 'exact' else _reindent(edit.new_lines, edit.old_lines, matched)
+        lines[index:index + len(edit.old_lines)] = new_lines
+        offset += len(new_lines) - len(edit.old_lines)
+        modes.append(mode)
+
+    patched = '\n'.join(lines) + ('\n' if trailing_newline else '')
+    return PatchResult(patched, len(edits), modes)
+
+
+def edits_for(edits, target_path):
+    """Keep edits addressed to target_path (by name) plus edits with no file name"""
+    name = Path(target_path).name
+    return [edit for edit in edits if edit.path is None or Path(edit.path).name == name]
+
+
+class PatchApplier:
+    """Applies agent patches to files, with an optional full-rewrite fallback on conflict"""
+
+    def __init__(self):
+        self.records = []
+
+    def apply(self, target_path, agent_output, rewrite=None):
+        """Patch target_path from agent_output; returns True if the file was updated
+
+        rewrite(current_content, reason) is only called when the output has no
+        usable hunks or a hunk conflicts; it returns full new content or None.
+        """
+        path = Path(target_path)
+        if not path.exists():
+            print(f"❌ {path.name} not found")
+            return False
+
+        current = path.read_text()
+        output = str(agent_output)
+        edits = edits_for(parse_patch(output), path)
+
+        reason = None
+        if not edits:
+            reason = "no patch hunks in agent output"
+        else:
+            try:
+                result = apply_edits(current, edits)
+            except PatchConflict as e:
+                reason = str(e)
+
+        if reason is None:
+            if result.content == current:
+                print(f"ℹ️  Patch for {path.name} made no changes")
+            else:
+                path.write_text(result.content)
+                print(f"🩹 Patched {path.name}: {result.applied} hunk(s) ({', '.join(result.match_modes)})")
+            self._record(path, output, current, 'patch')
+            return True
+
+        print(f"⚠️  Patch for {path.name} not applied: {reason}")
+        if rewrite is None:
+            self._record(path, output, current, 'conflict')
+            return False
+
+        print(f"📝 Falling back to a full rewrite of {path.name}")
+        rewritten = rewrite(current, reason)
+        if not rewritten:
+            self._record(path, output, current, 'conflict')
+            return False
+        path.write_text(rewritten)
+        self._record(path, output, current, 'rewrite')
+        return True
+
+    def _record(self, path, output, current, mode):
+        self.records.append({'file': path.name, 'mode': mode, 'output_chars': len(output), 'file_chars': len(current)})
+
+    def report(self):
+        """Return emitted vs file size per patched file for the run summary"""
+        if not self.records:
+            return "Patches: none applied"
+        lines = ["Patches:"]
+        for record in self.records:
+            ratio = record['output_chars'] / record['file_chars'] if record['file_chars'] else 0
+            lines.append(
+                f"  {record['file']}: {record['mode']}, agent emitted {record['output_chars']:,} chars "
+                f"for a {record['file_chars']:,} char file ({ratio:.0%})"
+            )
+        return '\n'.join(lines)
+
+
+def file_excerpt(path, pattern=None, context=3):
+    """Return the current file (or the region matching pattern) for a patch task prompt"""
+    content = Path(path).read_text()
+    if pattern is None:
+        return content
+    match = re.search(pattern, content, re.DOTALL | re.MULTILINE)
+    if match is None:
+        return content
+    lines = content.split('\n')
+    start = content.count('\n', 0, match.start())
+    end = content.count('\n', 0, match.end())
+    return '\n'.join(lines[max(start - context, 0):end + context + 1])
+
+
+patch_applier = PatchApplier()
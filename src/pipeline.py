@@ -0,0 +1,323 @@
+"""
+Pipeline
+Single entry point that discovers and runs the numbered stage scripts
+
+The stages (001_planning_stage_1.py ... 019_fix_timeline_navigation.py) are
+discovered from the repository root and run as subprocesses against a
+workspace (CREW_PROJECT_ROOT), so one checkout can drive several workspaces.
+Within a workspace stages keep their numeric order unless --unordered is
+given; different workspaces always run side by side, up to --jobs at once.
+
+Each run writes one log per stage under <workspace>/.crew_runs/<run id>/.
+
+CLI:
+    ./crew list [004a..004h]
+    ./crew run 004a..004h --jobs 4
+    ./crew run 015,016 --replay --root ../workspace-a --root ../workspace-b
+    ./crew run 004q --profile --trace
+    ./crew queue add 004a..004h --root ../variant-a --root ../variant-b (see src/job_queue.py)
+"""
+
+import ast
+import fnmatch
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from src import job_queue
+from src.workspace import PROJECT_ROOT, REPO_ROOT
+
+STAGE_PATTERN = re.compile(r'^(\d{3}[a-z]?)_\w+\.py$')
+
+app = typer.Typer(help="Discover and run the crew pipeline stages", no_args_is_help=True)
+queue_app = typer.Typer(help="Queue stage jobs and run them with a worker pool", no_args_is_help=True)
+app.add_typer(queue_app, name='queue')
+
+
+class Stage:
+    """One numbered stage script"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.name = self.path.stem
+        self.number = STAGE_PATTERN.match(self.path.name).group(1)
+
+    @property
+    def title(self):
+        try:
+            docstring = ast.get_docstring(ast.parse(self.path.read_text()))
+        except (OSError, SyntaxError):
+            docstring = None
+        return docstring.strip().split('\n')[0] if docstring else ''
+
+
+def discover_stages(directory=REPO_ROOT):
+    """Return the stage scripts in directory, in pipeline order"""
+    return [Stage(path) for path in sorted(Path(directory).glob('*.py')) if STAGE_PATTERN.match(path.name)]
+
+
+def _matches(stage, item):
+    if any(char in item for char in '*?['):
+        return fnmatch.fnmatch(stage.name, item)
+    return stage.name.startswith(item)
+
+
+def select_stages(stages, selection):
+    """Resolve 'a..b' ranges, prefixes and globs (comma separated) into stages, in pipeline order"""
+    chosen = set()
+    for item in (part.strip() for spec in selection for part in spec.split(',')):
+        if not item:
+            continue
+        # Shell-expanded globs arrive as file names
+        item = Path(item).name[:-3] if item.endswith('.py') else item
+        if item == 'all':
+            chosen.update(stage.name for stage in stages)
+        elif '..' in item:
+            first, last = item.split('..', 1)
+            starts = [i for i, stage in enumerate(stages) if not first or _matches(stage, first)]
+            ends = [i for i, stage in enumerate(stages) if not last or _matches(stage, last)]
+            if not starts or not ends or starts[0] > ends[-1]:
+                raise ValueError(f"Range '{item}' does not match any stages")
+            chosen.update(stage.name for stage in stages[starts[0]:ends[-1] + 1])
+        else:
+            matched = [stage.name for stage in stages if _matches(stage, item)]
+            if not matched:
+                raise ValueError(f"'{item}' does not match any stage")
+            chosen.update(matched)
+    return [stage for stage in stages if stage.name in chosen]
+
+
+class StageResult:
+    """Outcome of one stage run in one workspace"""
+
+    def __init__(self, stage, root, returncode, seconds, log_path):
+        self.stage = stage
+        self.root = root
+        self.returncode = returncode
+        self.seconds = seconds
+        self.log_path = log_path
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+
+class PipelineRunner:
+    """Runs stages as subprocesses, one lane per workspace (or per stage when unordered)"""
+
+    def __init__(self, roots, jobs=1, unordered=False, keep_going=False, replay=False, cache=True,
+                 trace=False, profile=False, quiet=False):
+        self.roots = [Path(root).resolve() for root in roots]
+        self.jobs = max(1, jobs)
+        self.unordered = unordered
+        self.keep_going = keep_going
+        self.replay = replay
+        self.cache = cache
+        self.trace = trace
+        self.profile = profile
+        self.quiet = quiet
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._print_lock = threading.Lock()
+
+    def environment(self, root):
+        env = dict(os.environ)
+        env['CREW_PROJECT_ROOT'] = str(root)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get('PYTHONPATH')]))
+        env['PYTHONUNBUFFERED'] = '1'
+        env.setdefault('CREW_ARTIFACT_DIR', str(root / '.crew_artifacts'))
+        if self.replay:
+            env['CREW_REUSE_OUTPUTS'] = '1'
+        else:
+            env.pop('CREW_REUSE_OUTPUTS', None)
+        if self.cache:
+            env.setdefault('CREW_READ_CACHE_DIR', str(root / '.crew_cache' / 'reads'))
+        else:
+            env.pop('CREW_READ_CACHE_DIR', None)
+        if self.profile:
+            env['CREW_PROFILE_DIR'] = str(root / '.crew_profiles' / self.run_id)
+        return env
+
+    def command(self, stage, root):
+        return [sys.executable, str(stage.path)]
+
+    def _echo(self, line):
+        with self._print_lock:
+            print(line, flush=True)
+
+    def run_stage(self, stage, root):
+        log_dir = root / '.crew_runs' / self.run_id
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_path = log_dir / f"{stage.name}.log"
+        label = stage.name if len(self.roots) == 1 else f"{root.name}:{stage.name}"
+        stream = self.trace or (self.jobs == 1 and len(self.roots) == 1 and not self.quiet)
+
+        self._echo(f"▶️  {label}")
+        started = time.perf_counter()
+        with open(log_path, 'w') as log:
+            process = subprocess.Popen(self.command(stage, root), cwd=root, env=self.environment(root),
+                                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            for line in process.stdout:
+                log.write(line)
+                if stream:
+                    self._echo(line.rstrip('\n') if self.jobs == 1 and len(self.roots) == 1
+                               else f"[{label}] {line.rstrip()}")
+            returncode = process.wait()
+        seconds = time.perf_counter() - started
+
+        status = "✅" if returncode == 0 else f"❌ exit {returncode}"
+        self._echo(f"{status} {label} ({seconds:.1f}s, log: {log_path})")
+        return StageResult(stage, root, returncode, seconds, log_path)
+
+    def run_lane(self, lane):
+        results = []
+        for stage, root in lane:
+            result = self.run_stage(stage, root)
+            results.append(result)
+            if not result.ok and not self.keep_going:
+                break
+        return results
+
+    def lanes(self, stages):
+        if self.unordered:
+            return [[(stage, root)] for root in self.roots for stage in stages]
+        return [[(stage, root) for stage in stages] for root in self.roots]
+
+    def run(self, stages):
+        lanes = self.lanes(stages)
+        if self.jobs == 1 or len(lanes) == 1:
+            return [result for lane in lanes for result in self.run_lane(lane)]
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            return [result for results in pool.map(self.run_lane, lanes) for result in results]
+
+
+def _load_selection(selection):
+    stages = discover_stages()
+    try:
+        return select_stages(stages, selection) if selection else stages
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(2)
+
+
+@app.command('list')
+def list_stages(selection: Optional[List[str]] = typer.Argument(None, help="Stages, e.g. 004a..004h or 015,016")):
+    """List the discovered stages (optionally only a selection)."""
+    for stage in _load_selection(selection):
+        typer.echo(f"{stage.number:<5} {stage.name:<45} {stage.title}")
+
+
+@app.command()
+def run(
+    selection: List[str] = typer.Argument(..., help="Stages: 004a..004h, 015,016, 007a*, all"),
+    root: List[Path] = typer.Option([PROJECT_ROOT], '--root', '-r', help="Workspace root; repeat for several"),
+    jobs: int = typer.Option(1, '--jobs', '-j', help="Stages/workspaces to run at once"),
+    unordered: bool = typer.Option(False, help="Let stages of one workspace run concurrently"),
+    keep_going: bool = typer.Option(False, help="Continue a workspace after a failed stage"),
+    replay: bool = typer.Option(False, help="Reuse archived good outputs instead of calling the LLM"),
+    cache: bool = typer.Option(True, help="Persist the file read cache in <root>/.crew_cache/reads"),
+    trace: bool = typer.Option(False, help="Stream every stage's output, prefixed with its name"),
+    profile: bool = typer.Option(False, help="Profile non-LLM phases into <root>/.crew_profiles/<run id>/ (see src/profiling.py)"),
+    dry_run: bool = typer.Option(False, help="Only show what would run"),
+):
+    """Run a selection of stages in one or more workspaces."""
+    stages = _load_selection(selection)
+    missing = [str(r) for r in root if not Path(r).is_dir()]
+    if missing:
+        typer.echo(f"❌ Workspace not found: {', '.join(missing)}", err=True)
+        raise typer.Exit(2)
+
+    runner = PipelineRunner(root, jobs, unordered, keep_going, replay, cache, trace, profile)
+    typer.echo(f"🚀 Run {runner.run_id}: {len(stages)} stage(s) x {len(runner.roots)} workspace(s), jobs={runner.jobs}")
+    for lane in runner.lanes(stages):
+        typer.echo("   " + " → ".join(stage.name for stage, _ in lane) + f"  [{lane[0][1]}]")
+    if runner.jobs > 1 and len(runner.lanes(stages)) == 1:
+        typer.echo("ℹ️  One workspace runs its stages in order; use --unordered or several --root to use --jobs")
+    if dry_run:
+        return
+
+    results = runner.run(stages)
+    failed = [r for r in results if not r.ok]
+    skipped = len(stages) * len(runner.roots) - len(results)
+    typer.echo(f"\n📊 {len(results) - len(failed)} passed, {len(failed)} failed, {skipped} skipped "
+               f"in {sum(r.seconds for r in results):.1f}s of stage time")
+    for result in failed:
+        typer.echo(f"   ❌ {result.stage.name} ({result.root}): {result.log_path}")
+    raise typer.Exit(1 if failed else 0)
+
+
+@queue_app.command('add')
+def queue_add(
+    selection: List[str] = typer.Argument(..., help="Stages: 004a..004h, 015,016, 007a*, all"),
+    root: List[Path] = typer.Option([PROJECT_ROOT], '--root', '-r', help="Workspace root; repeat for several"),
+    priority: int = typer.Option(0, help="Higher runs first"),
+    retries: int = typer.Option(1, help="Extra attempts after a failure"),
+    replay: bool = typer.Option(False, help="Reuse archived good outputs instead of calling the LLM"),
+    cache: bool = typer.Option(True, help="Persist the file read cache in <root>/.crew_cache/reads"),
+    profile: bool = typer.Option(False, help="Profile non-LLM phases of each job (see src/profiling.py)"),
+):
+    """Queue the selected stages for every workspace."""
+    stages = _load_selection(selection)
+    missing = [str(r) for r in root if not Path(r).is_dir()]
+    if missing:
+        typer.echo(f"❌ Workspace not found: {', '.join(missing)}", err=True)
+        raise typer.Exit(2)
+    queue = job_queue.JobQueue()
+    batch = queue.enqueue(root, [stage.name for stage in stages], priority, retries,
+                          {'replay': replay, 'cache': cache, 'profile': profile})
+    typer.echo(f"📥 Batch {batch}: {len(stages) * len(root)} job(s) queued in {queue.db_path}")
+
+
+@queue_app.command('workers')
+def queue_workers(
+    count: int = typer.Option(os.cpu_count() or 1, '--count', '-n', help="Worker processes"),
+    drain: bool = typer.Option(False, help="Exit once nothing is queued or running"),
+    provider_concurrency: Optional[int] = typer.Option(
+        None, help="Jobs allowed to call the LLM provider at once (default: CREW_PROVIDER_CONCURRENCY or -n)"),
+    start_interval: float = typer.Option(job_queue.PROVIDER_START_INTERVAL, help="Minimum seconds between job starts"),
+):
+    """Run a pool of worker processes that pull jobs from the queue."""
+    concurrency = provider_concurrency if provider_concurrency is not None else (job_queue.PROVIDER_CONCURRENCY or None)
+    exit_codes = job_queue.run_workers(count, drain=drain, provider_concurrency=concurrency,
+                                       start_interval=start_interval)
+    raise typer.Exit(0 if all(code == 0 for code in exit_codes) else 1)
+
+
+@queue_app.command('list')
+def queue_list(
+    status: Optional[str] = typer.Option(None, help=f"Filter: {', '.join(job_queue.STATUSES)}"),
+    limit: int = typer.Option(50),
+):
+    """Show jobs, newest first, with a count per status."""
+    queue = job_queue.JobQueue()
+    counts = queue.counts()
+    typer.echo("  ".join(f"{name}={counts.get(name, 0)}" for name in job_queue.STATUSES))
+    for job in queue.jobs(status, limit):
+        typer.echo(f"{job['id']:>5}  {job['status']:<9} p{job['priority']:<3} {job['attempts']}/{job['max_attempts']}  "
+                   f"{job['stage']:<40} {Path(job['workspace']).name:<20} {job['error'] or ''}")
+
+
+@queue_app.command('retry')
+def queue_retry(job_id: int):
+    """Requeue a failed, skipped or cancelled job."""
+    if not job_queue.JobQueue().retry(job_id):
+        typer.echo(f"❌ Job {job_id} is not failed, skipped or cancelled", err=True)
+        raise typer.Exit(1)
+
+
+@queue_app.command('cancel')
+def queue_cancel(job_id: Optional[int] = typer.Argument(None, help="Job to cancel (default: all queued jobs)")):
+    """Cancel queued jobs."""
+    typer.echo(f"🛑 {job_queue.JobQueue().cancel(job_id)} job(s) cancelled")
+
+
+if __name__ == "__main__":
+    app()
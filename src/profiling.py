@@ -0,0 +1,272 @@
+"""
+Profiling
+Per-phase cProfile and sampled-stack profiles for the non-LLM parts of a stage
+
+Most of a stage's wall time is spent waiting on the LLM, so a whole-process
+cProfile mostly shows socket reads. The work we own - the apply_* file
+writers, the *_fallback generators, Gradle subprocess calls and the YAML
+scans in scripts/ - is marked as a phase with @profiled or profile_phase().
+
+Profiling is off unless CREW_PROFILE_DIR is set (./crew run --profile sets it
+to <workspace>/.crew_profiles/<run id>). Each phase call then writes, under
+<dir>/<stage>/:
+
+- <phase>.<n>.prof       cProfile stats (snakeviz, python -m pstats)
+- <phase>.<n>.collapsed  stacks sampled every CREW_PROFILE_INTERVAL seconds
+                         (default 0.005) in collapsed format
+- stage.collapsed        all phases merged, phase name as the root frame,
+                         ready for flamegraph.pl / speedscope
+- summary.json           per-phase calls and wall time against the stage total
+
+CREW_PROFILE_MODE picks 'cprofile', 'sample' or 'both' (default). Nested
+phases are folded into the outermost one.
+
+CLI:
+    python -m src.profiling .crew_profiles/<run id> [--top 15]
+    python -m src.profiling .crew_profiles/<run id> --collapsed > all.collapsed
+"""
+
+import argparse
+import atexit
+import cProfile
+import functools
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+MODES = ('cprofile', 'sample', 'both')
+SAFE_NAME = re.compile(r'[^\w.-]+')
+
+
+def _stage_name():
+    script = Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else ''
+    return script if script and script != '-c' else f"python-{os.getpid()}"
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval into collapsed-stack counts"""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(name='crew-profile-sampler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                # Leave out the decorator/context manager frames of this module
+                if frame.f_code.co_filename != __file__:
+                    stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return self.stacks
+
+
+class PhaseProfiler:
+    """Writes per-phase profiles for the current stage when CREW_PROFILE_DIR is set"""
+
+    def __init__(self, output_dir=None, mode=None, interval=None):
+        output_dir = output_dir or os.getenv('CREW_PROFILE_DIR')
+        self.output_dir = Path(output_dir) / _stage_name() if output_dir else None
+        self.mode = mode or os.getenv('CREW_PROFILE_MODE', 'both')
+        if self.mode not in MODES:
+            raise ValueError(f"CREW_PROFILE_MODE must be one of {', '.join(MODES)}, not {self.mode!r}")
+        self.interval = float(interval or os.getenv('CREW_PROFILE_INTERVAL', '0.005'))
+        self.started = time.perf_counter()
+        self.phases = defaultdict(lambda: {'calls': 0, 'seconds': 0.0})
+        self.merged = Counter()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._registered = False
+
+    @property
+    def enabled(self):
+        return self.output_dir is not None
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled or getattr(self._local, 'active', None):
+            yield
+            return
+
+        self._local.active = name
+        profile = sampler = None
+        if self.mode in ('cprofile', 'both'):
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler (e.g. python -m cProfile) owns the hook; keep sampling
+                profile = None
+        if self.mode in ('sample', 'both'):
+            sampler = StackSampler(threading.get_ident(), self.interval)
+            sampler.start()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            if profile:
+                profile.disable()
+            stacks = sampler.stop() if sampler else Counter()
+            self._local.active = None
+            self._record(name, seconds, profile, stacks)
+
+    def _record(self, name, seconds, profile, stacks):
+        with self._lock:
+            stats = self.phases[name]
+            stats['calls'] += 1
+            stats['seconds'] += seconds
+            call_number = stats['calls']
+            for stack, count in stacks.items():
+                self.merged[f"{name};{stack}"] += count
+            if not self._registered:
+                atexit.register(self.write_summary)
+                self._registered = True
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        base = self.output_dir / f"{SAFE_NAME.sub('_', name)}.{call_number}"
+        if profile:
+            profile.dump_stats(f"{base}.prof")
+        if stacks:
+            Path(f"{base}.collapsed").write_text(
+                ''.join(f"{stack} {count}\n" for stack, count in stacks.most_common()))
+
+    def write_summary(self):
+        if not self.enabled or not self.phases:
+            return
+        total = time.perf_counter() - self.started
+        profiled = sum(stats['seconds'] for stats in self.phases.values())
+        summary = {
+            'stage': self.output_dir.name,
+            'mode': self.mode,
+            'total_seconds': round(total, 3),
+            'profiled_seconds': round(profiled, 3),
+            'phases': {name: {'calls': stats['calls'], 'seconds': round(stats['seconds'], 3)}
+                       for name, stats in sorted(self.phases.items(), key=lambda item: -item[1]['seconds'])},
+        }
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / 'summary.json').write_text(json.dumps(summary, indent=2))
+        if self.merged:
+            (self.output_dir / 'stage.collapsed').write_text(
+                ''.join(f"{stack} {count}\n" for stack, count in self.merged.most_common()))
+
+        print(f"\n⏱️  Profiled phases for {self.output_dir.name} ({self.output_dir}):")
+        for name, stats in summary['phases'].items():
+            print(f"   {stats['seconds']:8.2f}s  {stats['calls']:3d}x  {name}")
+        print(f"   {max(total - profiled, 0):8.2f}s       everything else (LLM calls, imports, I/O waits)")
+
+
+def profiled(phase=None):
+    """Decorator: run the function as a profiled phase, named after the function by default"""
+    def decorator(func):
+        name = phase or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase_profiler.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    # Allow bare @profiled as well as @profiled('name')
+    if callable(phase):
+        func, phase = phase, None
+        return decorator(func)
+    return decorator
+
+
+def profile_phase(name):
+    """Context manager form of @profiled for blocks such as a Gradle subprocess call"""
+    return phase_profiler.phase(name)
+
+
+def collapsed_stacks(run_dir):
+    """Merge every stage.collapsed under a run directory, stage name as the root frame"""
+    merged = Counter()
+    for path in sorted(Path(run_dir).glob('*/stage.collapsed')):
+        for line in path.read_text().splitlines():
+            stack, _, count = line.rpartition(' ')
+            if stack and count.isdigit():
+                merged[f"{path.parent.name};{stack}"] += int(count)
+    return merged
+
+
+def format_run(run_dir, top=15):
+    lines = []
+    for stage_dir in sorted(p for p in Path(run_dir).iterdir() if p.is_dir()):
+        summary_path = stage_dir / 'summary.json'
+        if not summary_path.exists():
+            continue
+        summary = json.loads(summary_path.read_text())
+        lines.append(f"📁 {summary['stage']}: {summary['profiled_seconds']:.2f}s profiled "
+                     f"of {summary['total_seconds']:.2f}s")
+        for name, stats in summary['phases'].items():
+            lines.append(f"   {stats['seconds']:8.2f}s  {stats['calls']:3d}x  {name}")
+        profiles = [str(p) for p in sorted(stage_dir.glob('*.prof'))]
+        if profiles and top:
+            stats = pstats.Stats(*profiles, stream=_LineCollector(lines))
+            stats.sort_stats('cumulative').print_stats(top)
+    return '\n'.join(lines) if lines else f"No profiles under {run_dir}"
+
+
+class _LineCollector:
+    """File-like sink that appends pstats output to a list of lines"""
+
+    def __init__(self, lines):
+        self.lines = lines
+        self._partial = ''
+
+    def write(self, text):
+        self._partial += text
+        *complete, self._partial = self._partial.split('\n')
+        self.lines.extend(f"   {line}" for line in complete if line.strip())
+
+    def flush(self):
+        pass
+
+
+# Singleton instance
+phase_profiler = PhaseProfiler()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise per-phase stage profiles")
+    parser.add_argument('run_dir', help='A .crew_profiles/<run id> directory')
+    parser.add_argument('--top', type=int, default=15, help='Functions to list per stage by cumulative time')
+    parser.add_argument('--collapsed', action='store_true', help='Print merged collapsed stacks for flamegraph.pl')
+    args = parser.parse_args(argv)
+
+    if not Path(args.run_dir).is_dir():
+        print(f"❌ Not a directory: {args.run_dir}", file=sys.stderr)
+        return 2
+    if args.collapsed:
+        for stack, count in collapsed_stacks(args.run_dir).most_common():
+            print(f"{stack} {count}")
+    else:
+        print(format_run(args.run_dir, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+Read Cache
+Size-bounded LRU cache for file and directory reads made by agent tools
+
+Entries are validated against a cheap filesystem signature (mtime + size for
+files, directory mtimes for listings), so an edited file is re-read on the
+next access while unchanged files are served from memory. A directory's
+signature is reused for a couple of seconds instead of re-walking the tree on
+every listing. With a persist_dir the cache also survives between crew runs;
+that directory is kept under a size cap, least recently used files first, and
+entries older than a maximum age are dropped.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Directories that never belong in an agent-facing listing
+EXCLUDED_DIRS = {'.venv', 'venv', '__pycache__', '.git', 'node_modules', '.gradle', 'build', '.crew_cache'}
+
+
+def file_signature(path):
+    """Return (mtime_ns, size) for a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def directory_signature(path):
+    """Return a signature that changes whenever an entry is added, removed or renamed"""
+    signature = []
+    for root, dirs, _ in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS)
+        try:
+            signature.append(os.stat(root).st_mtime_ns)
+        except OSError:
+            return None
+    return signature or None
+
+
+class ReadCache:
+    """LRU cache of tool reads bounded by entry count and total characters"""
+
+    def __init__(self, max_entries=256, max_chars=8_000_000, persist_dir=None,
+                 persist_max_bytes=256_000_000, persist_max_age=7 * 24 * 3600, signature_ttl=2.0):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        self.persist_max_bytes = persist_max_bytes
+        self.persist_max_age = persist_max_age
+        self.signature_ttl = signature_ttl
+        self._entries = OrderedDict()
+        self._total_chars = 0
+        self._dir_signatures = {}
+        self._persist_bytes = None
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'chars_served': 0, 'chars_truncated': 0}
+
+    def _persist_path(self, key):
+        digest = hashlib.sha1(json.dumps(key).encode('utf-8')).hexdigest()
+        return self.persist_dir / f"{digest}.json"
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._total_chars > self.max_chars):
+            _, (_, value) = self._entries.popitem(last=False)
+            self._total_chars -= len(value)
+            self.stats['evictions'] += 1
+
+    def _directory_signature(self, path):
+        # Listings are requested in bursts; walking the tree once per burst is enough
+        now = time.monotonic()
+        checked = self._dir_signatures.get(path)
+        if checked is not None and now - checked[0] < self.signature_ttl:
+            return checked[1]
+        signature = directory_signature(path)
+        self._dir_signatures[path] = (now, signature)
+        return signature
+
+    def _prune_persist_dir(self):
+        """Drop expired persisted entries, then the least recently used until under the size cap"""
+        files = []
+        for path in self.persist_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        cutoff = time.time() - self.persist_max_age
+        total = sum(size for _, size, _ in files)
+        for mtime, size, path in files:
+            if mtime >= cutoff and total <= self.persist_max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            self.stats['evictions'] += 1
+        self._persist_bytes = total
+
+    def get(self, key, signature):
+        """Return the cached value for key if its signature still matches"""
+        entry = self._entries.get(key)
+        if entry is None and self.persist_dir:
+            entry = self._load(key)
+
+        if entry is not None and entry[0] == signature:
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            self.stats['chars_served'] += len(entry[1])
+            return entry[1]
+
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, key, signature, value):
+        """Store a value; values larger than the whole cache are not kept"""
+        if key in self._entries:
+            self._total_chars -= len(self._entries.pop(key)[1])
+        if len(value) > self.max_chars:
+            return
+
+        self._entries[key] = (signature, value)
+        self._total_chars += len(value)
+        self._evict()
+
+        if self.persist_dir:
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+            if self._persist_bytes is None:
+                self._prune_persist_dir()
+            path = self._persist_path(key)
+            previous = path.stat().st_size if path.exists() else 0
+            with open(path, 'w') as f:
+                json.dump({'signature': signature, 'value': value}, f)
+            self._persist_bytes += path.stat().st_size - previous
+            if self._persist_bytes > self.persist_max_bytes:
+                self._prune_persist_dir()
+
+    def _load(self, key):
+        path = self._persist_path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.persist_max_age:
+                path.unlink()
+                return None
+            with open(path, 'r') as f:
+                data = json.load(f)
+            # The file's mtime is its last use, which is what the size cap evicts by
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        entry = (data['signature'], data['value'])
+        self._entries[key] = entry
+        self._total_chars += len(entry[1])
+        self._evict()
+        return entry
+
+    def read_file(self, file_path, start_line=1, line_count=None, max_chars=None):
+        """Read a file (or a line slice of it) through the cache"""
+        path = os.path.abspath(file_path)
+        signature = file_signature(path)
+        if signature is None:
+            return f"Error: File not found at path: {file_path}"
+
+        key = ('file', path)
+        content = self.get(key, signature)
+        if content is None:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                content = f.read()
+            self.put(key, signature, content)
+
+        if (start_line or 1) > 1 or line_count:
+            lines = content.splitlines(keepends=True)
+            start = max((start_line or 1) - 1, 0)
+            end = start + line_count if line_count else None
+            content = ''.join(lines[start:end])
+
+        return self._truncate(content, max_chars)
+
+    def list_directory(self, directory, max_chars=None):
+        """List the files under a directory through the cache"""
+        path = os.path.abspath(directory)
+        signature = self._directory_signature(path)
+        if signature is None:
+            return f"Error: Directory not found at path: {directory}"
+
+        key = ('dir', path)
+        listing = self.get(key, signature)
+        if listing is None:
+            files = []
+            for root, dirs, filenames in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS)
+                for filename in sorted(filenames):
+                    files.append(os.path.relpath(os.path.join(root, filename), path))
+            listing = "File paths: \n- " + "\n- ".join(files)
+            self.put(key, signature, listing)
+
+        return self._truncate(listing, max_chars)
+
+    def _truncate(self, text, max_chars):
+        if max_chars and len(text) > max_chars:
+            self.stats['chars_truncated'] += len(text) - max_chars
+            return text[:max_chars] + f"\n... [truncated {len(text) - max_chars:,} chars; use start_line/line_count to read more]"
+        return text
+
+    def report(self):
+        """Return a one-line summary of cache effectiveness for the run summary"""
+        return (
+            f"Read cache: {self.stats['hits']} hits, {self.stats['misses']} misses, "
+            f"{self.stats['evictions']} evictions, {self.stats['chars_served']:,} chars served from memory, "
+            f"{self.stats['chars_truncated']:,} chars truncated"
+        )
@@ -0,0 +1,146 @@
+"""
+Read Throughput Benchmark
+Rows/sec served by the paged list endpoints of post-service and user-service
+
+The list reads select straight into DTOs (constructor projections) and return
+Slice instead of Page, so a page costs one query: no COUNT(*), no entity
+hydration and, for users, no password hash. This benchmark keeps that honest:
+it hammers every list endpoint with --concurrency threads, counts the rows in
+each response and reports rows/sec next to the latency percentiles.
+
+Results can be saved (--save) and compared against a previous run
+(--baseline); the run fails when any endpoint's rows/sec drops by more than
+--max-regression.
+
+Requests to both services carry a locally minted JWT (see timeline_benchmark);
+they share jwt.secret.
+
+CLI:
+    python -m src.read_throughput_benchmark --seed 2000 --save /tmp/reads-before.json
+    python -m src.read_throughput_benchmark --baseline /tmp/reads-before.json --max-regression 0.1
+    python -m src.read_throughput_benchmark --skip-users --requests 500 --concurrency 32
+    python -m src.read_throughput_benchmark --users-url http://localhost:8081 --query ali
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.timeline_benchmark import DEFAULT_BASE_URL, PAGE_SIZE, TimelineBenchmark, format_row, percentile
+
+DEFAULT_USERS_URL = os.getenv('USER_SERVICE_URL', 'http://localhost:8081')
+
+# (label, service, path); {user_id} is the post-service id of the benchmark user
+POST_ENDPOINTS = [
+    ('posts by user (slice)', 'posts', f"/api/posts/user/{{user_id}}?size={PAGE_SIZE}&page=0"),
+    ('public timeline', 'posts', f"/api/timeline/public?size={PAGE_SIZE}"),
+    ('user timeline', 'posts', f"/api/timeline/user/{{user_id}}?size={PAGE_SIZE}"),
+]
+USER_ENDPOINTS = [
+    ('active users (slice)', 'users', f"/api/users?size={PAGE_SIZE}&page=0"),
+    ('user search (slice)', 'users', f"/api/users/search?q={{query}}&size={PAGE_SIZE}"),
+    ('username autocomplete', 'users', f"/api/users/autocomplete?prefix={{query}}&limit={PAGE_SIZE}"),
+]
+
+
+def count_rows(body):
+    """Rows in a Slice ('content'), a TimelinePage ('posts') or a plain list"""
+    if isinstance(body, list):
+        return len(body)
+    if isinstance(body, dict):
+        for key in ('content', 'posts'):
+            if isinstance(body.get(key), list):
+                return len(body[key])
+    return 0
+
+
+def measure(client, path, requests, concurrency):
+    """Latencies in ms, total rows returned and wall-clock seconds for `requests` GETs"""
+    def timed(_):
+        started = time.perf_counter()
+        rows = count_rows(client.request('GET', path))
+        return (time.perf_counter() - started) * 1000, rows
+
+    # Warm up connection pools, JIT and the plan cache before timing
+    for _ in range(min(10, requests)):
+        timed(None)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed, range(requests)))
+    seconds = time.perf_counter() - started
+    return [latency for latency, _ in results], sum(rows for _, rows in results), seconds
+
+
+def compare(results, baseline, max_regression):
+    """Labels whose rows/sec fell more than max_regression below the baseline"""
+    regressions = []
+    for label, result in results.items():
+        before = baseline.get(label, {}).get('rows_per_sec')
+        if before and result['rows_per_sec'] < before * (1 - max_regression):
+            regressions.append((label, before, result['rows_per_sec']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure rows/sec of the paged list endpoints")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help='post-service URL')
+    parser.add_argument('--users-url', default=DEFAULT_USERS_URL, help='user-service URL')
+    parser.add_argument('--username', default='read-bench')
+    parser.add_argument('--query', default='a', help='Search term and autocomplete prefix for user-service')
+    parser.add_argument('--seed', type=int, default=0, help='Create this many posts first')
+    parser.add_argument('--requests', type=int, default=200, help='Timed requests per endpoint')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--skip-users', action='store_true', help='Do not measure user-service endpoints')
+    parser.add_argument('--save', type=Path, help='Write the results as JSON')
+    parser.add_argument('--baseline', type=Path, help='Compare against results saved by an earlier run')
+    parser.add_argument('--max-regression', type=float, default=0.1,
+                        help='Fail when rows/sec drops by more than this fraction of the baseline')
+    args = parser.parse_args(argv)
+
+    results = {}
+    try:
+        clients = {'posts': TimelineBenchmark(args.base_url, args.username)}
+        endpoints = list(POST_ENDPOINTS)
+        if not args.skip_users:
+            clients['users'] = TimelineBenchmark(args.users_url, args.username)
+            endpoints += USER_ENDPOINTS
+        if args.seed:
+            clients['posts'].seed(args.seed, args.concurrency)
+
+        print(f"📏 {args.requests} requests per endpoint, concurrency {args.concurrency}, page size {PAGE_SIZE}")
+        for label, service, path in endpoints:
+            client = clients[service]
+            latencies, rows, seconds = measure(client, path.format(user_id=client.user_id, query=args.query),
+                                               args.requests, args.concurrency)
+            results[label] = {
+                'rows_per_sec': rows / seconds,
+                'requests_per_sec': len(latencies) / seconds,
+                'rows': rows,
+                'p99_ms': percentile(latencies, 99),
+            }
+            print(format_row(f"{label} ({rows / seconds:,.0f} rows/s)", latencies))
+    except urllib.error.URLError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+        print(f"💾 Saved results to {args.save}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.max_regression)
+        for label, before, after in regressions:
+            print(f"❌ {label}: {after:,.0f} rows/s vs {before:,.0f} in the baseline")
+        if regressions:
+            return 1
+        print(f"✅ No endpoint lost more than {args.max_regression:.0%} rows/s against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
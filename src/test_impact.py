@@ -0,0 +1,259 @@
+"""
+Test Impact
+Selects the backend tests affected by a set of changed files
+
+A generator stage usually rewrites a handful of files, but the follow-up
+steps ran every suite. The selector maps each test class to the production
+classes it reaches (imports and same-package references, followed
+transitively, plus an optional recorded coverage map) and returns the
+smallest set of Gradle --tests filters for the changed files:
+
+- a changed production class selects the tests that reach it
+- @SpringBootTest tests load the whole context, so any main source or
+  resource change in their module selects them
+- a module's build.gradle.kts or test resources select all of its tests;
+  root build files select everything
+
+CLI:
+    python -m src.test_impact user-service/src/main/kotlin/.../User.kt
+    python -m src.test_impact --since HEAD~1 --format args
+    python -m src.test_impact --artifact <hash-prefix>
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from src.kotlin_alignment import EXCLUDED_DIRS, KotlinFile
+from src.workspace import PROJECT_ROOT
+
+DEFAULT_BACKEND_DIR = PROJECT_ROOT / 'generated_code' / 'backend'
+DEFAULT_COVERAGE_MAP = PROJECT_ROOT / '.crew_cache' / 'test_coverage_map.json'
+
+ROOT_BUILD_FILES = {'build.gradle.kts', 'settings.gradle.kts', 'gradle.properties'}
+CONTEXT_ANNOTATIONS = {'SpringBootTest', 'WebMvcTest', 'DataJpaTest', 'Testcontainers'}
+IDENTIFIER_PATTERN = re.compile(r'\b[A-Z]\w*')
+
+
+def load_coverage_map(path=DEFAULT_COVERAGE_MAP):
+    """Return {test class FQN: [production class FQN or file path]} recorded from coverage runs"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def changed_files_since(ref, cwd=PROJECT_ROOT):
+    """Files changed since a git ref, including uncommitted and untracked files"""
+    changed = set()
+    for command in (['git', 'diff', '--name-only', ref], ['git', 'ls-files', '--others', '--exclude-standard']):
+        result = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"{' '.join(command)} failed")
+        changed.update(line for line in result.stdout.splitlines() if line)
+    return sorted(Path(cwd) / name for name in changed)
+
+
+class TestImpactSelector:
+    """Maps test classes to the production classes they reach"""
+
+    def __init__(self, backend_dir=DEFAULT_BACKEND_DIR, coverage_map=None):
+        self.backend_dir = Path(backend_dir).resolve()
+        self.coverage_map = coverage_map if coverage_map is not None else load_coverage_map()
+        self.files = {}
+        self.class_files = {}
+        self.package_classes = defaultdict(dict)
+        self.references = {}
+        self.tests = {}
+        self.module_reach = {}
+        self._load()
+
+    def _module_of(self, path):
+        parts = path.relative_to(self.backend_dir).parts
+        return parts[0] if len(parts) > 1 else ''
+
+    def _load(self):
+        for path in sorted(self.backend_dir.rglob('*.kt')):
+            parts = path.relative_to(self.backend_dir).parts
+            if any(part in EXCLUDED_DIRS or part.endswith('.backup') for part in parts):
+                continue
+            kotlin_file = KotlinFile(path, self._module_of(path), path.read_text(encoding='utf-8', errors='replace'))
+            kotlin_file.is_test = 'test' in parts
+            self.files[path] = kotlin_file
+            for cls in kotlin_file.classes:
+                self.class_files[cls.fqn] = path
+                self.package_classes[kotlin_file.package][cls.name] = path
+
+        for path, kotlin_file in self.files.items():
+            self.references[path] = self._direct_references(kotlin_file) - {path}
+
+        # Everything a module's main code reaches ends up in its Spring context
+        self.module_reach = defaultdict(set)
+        for path, kotlin_file in self.files.items():
+            if not kotlin_file.is_test:
+                self.module_reach[kotlin_file.module] |= self._reachable(path)
+
+        for path, kotlin_file in self.files.items():
+            if not kotlin_file.is_test:
+                continue
+            for cls in kotlin_file.classes:
+                if 'abstract' in cls.modifiers or not re.search(r'@Test\b', kotlin_file.code):
+                    continue
+                self.tests[cls.fqn] = {
+                    'module': kotlin_file.module,
+                    'path': path,
+                    'loads_context': self._loads_context(cls, kotlin_file),
+                    'reaches': self._reachable(path),
+                }
+
+    def _direct_references(self, kotlin_file):
+        referenced = set()
+        for fqn in kotlin_file.imports.values():
+            if fqn in self.class_files:
+                referenced.add(self.class_files[fqn])
+        visible = dict(self.package_classes.get(kotlin_file.package, {}))
+        for package in kotlin_file.wildcard_imports:
+            visible.update(self.package_classes.get(package, {}))
+        for name in set(IDENTIFIER_PATTERN.findall(kotlin_file.code)):
+            if name in visible:
+                referenced.add(visible[name])
+        return referenced
+
+    def _reachable(self, start):
+        seen = {start}
+        stack = [start]
+        while stack:
+            for referenced in self.references.get(stack.pop(), ()):
+                if referenced not in seen:
+                    seen.add(referenced)
+                    stack.append(referenced)
+        return seen
+
+    def _loads_context(self, cls, kotlin_file):
+        if CONTEXT_ANNOTATIONS & set(cls.annotations):
+            return True
+        # Annotations inherited from a test base class such as IntegrationTestBase
+        for supertype in cls.supertypes:
+            for path in self.references.get(kotlin_file.path, ()):
+                for base in self.files[path].classes:
+                    if base.name == supertype and CONTEXT_ANNOTATIONS & set(base.annotations):
+                        return True
+        return False
+
+    def _coverage_files(self, test_fqn):
+        covered = set()
+        for entry in self.coverage_map.get(test_fqn, ()):
+            if entry in self.class_files:
+                covered.add(self.class_files[entry])
+            else:
+                path = Path(entry)
+                covered.add((path if path.is_absolute() else self.backend_dir / path).resolve())
+        return covered
+
+    def select(self, changed_files):
+        """Return ({module: sorted test FQNs}, {test FQN: reason}) for the changed files"""
+        selected = {}
+        for changed in changed_files:
+            path = Path(changed)
+            path = (path if path.is_absolute() else self.backend_dir / path).resolve()
+            try:
+                parts = path.relative_to(self.backend_dir).parts
+            except ValueError:
+                continue
+            if any(part.endswith('.backup') for part in parts):
+                continue
+            module = parts[0] if len(parts) > 1 else ''
+            name = path.name
+
+            for test, info in self.tests.items():
+                if test in selected:
+                    continue
+                same_module = module == info['module']
+                reason = None
+                if not module and name in ROOT_BUILD_FILES:
+                    reason = f"root build file {name} changed"
+                elif same_module and name == 'build.gradle.kts' and len(parts) == 2:
+                    reason = f"{module}/build.gradle.kts changed"
+                elif same_module and 'test' in parts and 'resources' in parts:
+                    reason = f"test resource {name} changed"
+                elif path in info['reaches']:
+                    reason = f"references {name}" if path != info['path'] else "test changed"
+                elif path in self._coverage_files(test):
+                    reason = f"covers {name}"
+                elif info['loads_context'] and (
+                    path in self.module_reach[info['module']] or (same_module and 'main' in parts)
+                ):
+                    reason = f"loads the Spring context and {name} changed"
+                if reason:
+                    selected[test] = reason
+
+        by_module = defaultdict(list)
+        for test in sorted(selected):
+            by_module[self.tests[test]['module']].append(test)
+        return dict(by_module), selected
+
+    def gradle_commands(self, changed_files):
+        """Gradle argument lists, one per module; a module whose every test is selected runs unfiltered"""
+        by_module, _ = self.select(changed_files)
+        commands = []
+        for module, tests in sorted(by_module.items()):
+            module_tests = [t for t, info in self.tests.items() if info['module'] == module]
+            arguments = [f":{module}:test"]
+            if len(tests) < len(module_tests):
+                for test in tests:
+                    arguments += ['--tests', test]
+            commands.append(arguments)
+        return commands
+
+    def format_report(self, changed_files):
+        by_module, reasons = self.select(changed_files)
+        total = len(self.tests)
+        lines = [f"Test impact: {len(reasons)} of {total} test classes affected by {len(changed_files)} changed file(s)"]
+        for module, tests in sorted(by_module.items()):
+            for test in tests:
+                lines.append(f"  {module}: {test.rsplit('.', 1)[-1]} ({reasons[test]})")
+        return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Select the backend tests affected by changed files")
+    parser.add_argument('files', nargs='*', help='Changed files (absolute, or relative to the backend dir)')
+    parser.add_argument('--since', help='Use files changed since this git ref')
+    parser.add_argument('--artifact', help='Use the files extracted by an archived stage output')
+    parser.add_argument('--backend-dir', default=str(DEFAULT_BACKEND_DIR))
+    parser.add_argument('--coverage-map', default=str(DEFAULT_COVERAGE_MAP))
+    parser.add_argument('--format', choices=['report', 'args', 'json'], default='report',
+                        help="'args' prints one Gradle argument line per module")
+    args = parser.parse_args(argv)
+
+    changed = [Path(f) for f in args.files]
+    if args.since:
+        changed += changed_files_since(args.since)
+    if args.artifact:
+        from src.artifact_store import ArtifactStore
+        changed += [Path(f) for f in ArtifactStore().files(args.artifact)]
+
+    selector = TestImpactSelector(args.backend_dir, load_coverage_map(args.coverage_map))
+    if args.format == 'args':
+        for command in selector.gradle_commands(changed):
+            print(' '.join(command))
+    elif args.format == 'json':
+        by_module, reasons = selector.select(changed)
+        print(json.dumps({'modules': by_module, 'reasons': reasons,
+                          'commands': selector.gradle_commands(changed)}, indent=2))
+    else:
+        print(selector.format_report(changed))
+        for command in selector.gradle_commands(changed):
+            print(f"  ./gradlew {' '.join(command)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""
+Timeline Benchmark
+Load benchmark for the post-service cursor timeline: page 1 vs. a deep page
+
+The timelines moved from OFFSET pages plus COUNT(*) to keyset pagination on
+(created_at, id). Latency should then be flat however deep a client scrolls.
+The benchmark:
+
+1. optionally seeds posts through POST /api/posts (--seed N)
+2. walks the user timeline via nextCursor to collect the cursor of every page
+   up to --deep-page
+3. hammers page 1 and the deep page with --concurrency threads, and for
+   contrast the OFFSET endpoint /api/posts/user/{id}?page=N at the same depth
+4. prints p50/p95/p99 and fails when the deep page's p99 is more than
+   --max-ratio times page 1's
+
+Requests are signed with a locally minted HS512 JWT using the service's
+jwt.secret (JWT_SECRET, default: the dev secret in application.yml).
+
+CLI:
+    python -m src.timeline_benchmark --seed 10000
+    python -m src.timeline_benchmark --base-url http://localhost:8082 --deep-page 500 --requests 400
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_BASE_URL = os.getenv('POST_SERVICE_URL', 'http://localhost:8082')
+DEFAULT_SECRET = os.getenv(
+    'JWT_SECRET',
+    'myVerySecretKeyThatShouldBeAtLeast512BitsLongForHS512AlgorithmSoItNeedsToBeReallyReallyLongToMeetTheRequirements',
+)
+PAGE_SIZE = 20
+
+
+def _b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def mint_token(username, user_id, secret=DEFAULT_SECRET, ttl_seconds=3600):
+    """HS512 JWT equivalent to the ones the user-service issues, with the user id in the uid claim"""
+    now = int(time.time())
+    header = _b64url(json.dumps({'alg': 'HS512', 'typ': 'JWT'}).encode())
+    payload = _b64url(json.dumps({'sub': username, 'uid': str(user_id), 'iat': now,
+                                  'exp': now + ttl_seconds}).encode())
+    signature = hmac.new(secret.encode(), f"{header}.{payload}".encode(), hashlib.sha512).digest()
+    return f"{header}.{payload}.{_b64url(signature)}"
+
+
+def name_uuid(name):
+    """Java's UUID.nameUUIDFromBytes; a stable id for a benchmark user that user-service never issued"""
+    digest = bytearray(hashlib.md5(name.encode()).digest())
+    digest[6] = (digest[6] & 0x0f) | 0x30
+    digest[8] = (digest[8] & 0x3f) | 0x80
+    return uuid.UUID(bytes=bytes(digest))
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class TimelineBenchmark:
+    """Drives the post-service timeline endpoints and records request latencies"""
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, username='timeline-bench', secret=DEFAULT_SECRET, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.username = username
+        self.user_id = name_uuid(username)
+        self.token = mint_token(username, self.user_id, secret)
+        self.timeout = timeout
+
+    def request(self, method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(f"{self.base_url}{path}", data=data, method=method, headers={
+            'Authorization': f"Bearer {self.token}",
+            'Content-Type': 'application/json',
+        })
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read() or b'null')
+
+    def seed(self, count, concurrency=16):
+        def create(n):
+            self.request('POST', '/api/posts', {'content': f"Timeline benchmark post {n}"})
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(create, range(count)))
+        print(f"🌱 Seeded {count} posts for {self.username} in {time.perf_counter() - started:.1f}s")
+
+    def timeline_path(self, cursor=None):
+        path = f"/api/timeline/user/{self.user_id}?size={PAGE_SIZE}"
+        return f"{path}&cursor={cursor}" if cursor else path
+
+    def collect_cursors(self, deep_page):
+        """Cursor for every page from 1 to deep_page (page 1 has none)"""
+        cursors = [None]
+        while len(cursors) < deep_page:
+            page = self.request('GET', self.timeline_path(cursors[-1]))
+            if not page.get('hasMore'):
+                raise RuntimeError(f"Timeline ends after page {len(cursors)}; seed at least "
+                                   f"{deep_page * PAGE_SIZE} posts (--seed)")
+            cursors.append(page['nextCursor'])
+        return cursors
+
+    def measure(self, path, requests, concurrency):
+        def timed(_):
+            started = time.perf_counter()
+            self.request('GET', path)
+            return (time.perf_counter() - started) * 1000
+        # Warm up connection pools, JIT and the plan cache before timing
+        for _ in range(min(10, requests)):
+            timed(None)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(timed, range(requests)))
+
+
+def format_row(label, samples):
+    return (f"   {label:<28} p50 {percentile(samples, 50):7.1f}ms  p95 {percentile(samples, 95):7.1f}ms  "
+            f"p99 {percentile(samples, 99):7.1f}ms  mean {statistics.fmean(samples):7.1f}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare timeline latency at page 1 and a deep page")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--username', default='timeline-bench', help='Posts are created and read as this user')
+    parser.add_argument('--seed', type=int, default=0, help='Create this many posts first')
+    parser.add_argument('--deep-page', type=int, default=500)
+    parser.add_argument('--requests', type=int, default=200, help='Timed requests per page')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--max-ratio', type=float, default=1.5,
+                        help='Fail when deep-page p99 exceeds page-1 p99 by more than this factor')
+    parser.add_argument('--skip-offset', action='store_true', help='Do not measure the OFFSET endpoint')
+    args = parser.parse_args(argv)
+
+    benchmark = TimelineBenchmark(args.base_url, args.username)
+    try:
+        if args.seed:
+            benchmark.seed(args.seed, args.concurrency)
+        cursors = benchmark.collect_cursors(args.deep_page)
+        print(f"📏 {args.requests} requests per page, concurrency {args.concurrency}, page size {PAGE_SIZE}")
+        first = benchmark.measure(benchmark.timeline_path(), args.requests, args.concurrency)
+        deep = benchmark.measure(benchmark.timeline_path(cursors[-1]), args.requests, args.concurrency)
+        rows = [("cursor page 1", first), (f"cursor page {args.deep_page}", deep)]
+        if not args.skip_offset:
+            offset_path = f"/api/posts/user/{benchmark.user_id}?size={PAGE_SIZE}&page="
+            rows.append(("offset page 1", benchmark.measure(f"{offset_path}0", args.requests, args.concurrency)))
+            rows.append((f"offset page {args.deep_page}",
+                         benchmark.measure(f"{offset_path}{args.deep_page - 1}", args.requests, args.concurrency)))
+    except (urllib.error.URLError, RuntimeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    for label, samples in rows:
+        print(format_row(label, samples))
+
+    ratio = percentile(deep, 99) / max(percentile(first, 99), 1e-6)
+    if ratio > args.max_ratio:
+        print(f"❌ Cursor p99 at page {args.deep_page} is {ratio:.2f}x page 1 (limit {args.max_ratio}x)")
+        return 1
+    print(f"✅ Cursor p99 at page {args.deep_page} is {ratio:.2f}x page 1 (limit {args.max_ratio}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
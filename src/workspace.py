@@ -0,0 +1,15 @@
+"""
+Workspace
+Resolves the project root that stage scripts read from and write to
+
+Stage scripts used to hardcode the original author's checkout path. They now
+build every path from PROJECT_ROOT, which is CREW_PROJECT_ROOT when set (the
+pipeline CLI sets it per workspace) and this repository otherwise, so several
+workspaces can be processed from one checkout.
+"""
+
+import os
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = Path(os.getenv('CREW_PROJECT_ROOT', REPO_ROOT)).resolve()
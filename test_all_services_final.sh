@@ -3,7 +3,7 @@
 echo "🚀 FINAL INTEGRATION TEST - ALL SERVICES" 
 echo "========================================"
 
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 
 echo "🧹 Cleaning all builds..."
 ./gradlew clean
@@ -22,16 +22,37 @@ fi
 echo "✅ All services compiled successfully"
 echo ""
 
+# With IMPACT_SINCE set (e.g. IMPACT_SINCE=HEAD~1) each service only runs the
+# tests affected by files changed since that ref
+if [ -n "$IMPACT_SINCE" ]; then
+    IMPACTED_TESTS=$(cd ../.. && python3 -m src.test_impact --since "$IMPACT_SINCE" --format args)
+fi
+
+run_service_tests() {
+    local module=$1
+    if [ -z "$IMPACT_SINCE" ]; then
+        ./gradlew :$module:test --tests '*IntegrationTest*' --quiet
+        return $?
+    fi
+    local gradle_args
+    gradle_args=$(echo "$IMPACTED_TESTS" | grep "^:$module:test")
+    if [ -z "$gradle_args" ]; then
+        echo "ℹ️  No $module tests affected since $IMPACT_SINCE"
+        return 0
+    fi
+    ./gradlew $gradle_args --quiet
+}
+
 echo "🧪 Testing User Service Integration Tests..."
 echo "--------------------------------------------"
-./gradlew :user-service:test --tests '*IntegrationTest*' --quiet
+run_service_tests user-service
 
 USER_RESULT=$?
 
 echo ""
 echo "🧪 Testing Post Service Integration Tests..."
 echo "--------------------------------------------"  
-./gradlew :post-service:test --tests '*IntegrationTest*' --quiet
+run_service_tests post-service
 
 POST_RESULT=$?
 
@@ -1,4 +1,4 @@
 #!/bin/bash
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 echo "Running clean build..."
 ./gradlew clean build --stacktrace
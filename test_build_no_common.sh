@@ -1,5 +1,5 @@
 #!/bin/bash
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 
 echo "🧹 Cleaning previous builds..."
 ./gradlew clean
@@ -1,5 +1,5 @@
 #!/bin/bash
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 echo "Testing common module build..."
 ./gradlew :common:build --stacktrace
 echo "Build result: $?"
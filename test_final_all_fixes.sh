@@ -3,7 +3,7 @@
 echo "🎯 Testing Final 401 Fix"
 echo "========================"
 
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 
 echo "🧹 Cleaning build..."
 ./gradlew clean
@@ -3,7 +3,7 @@
 echo "🧪 Testing Integration Tests After Configuration Fix"
 echo "===================================================="
 
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 
 # Clean build directories first
 echo "🧹 Cleaning build directories..."
@@ -3,7 +3,7 @@
 echo "🔨 Testing Gradle Build Fix"
 echo "==========================="
 
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 
 echo "🧹 Cleaning all builds..."
 ./gradlew clean
@@ -7,7 +7,7 @@ echo "🧪 Running Twitter Clone Integration Tests..."
 echo "============================================="
 
 # Navigate to backend directory
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 
 # Check if we're in the right place
 if [ ! -f "gradlew" ]; then
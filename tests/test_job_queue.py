@@ -0,0 +1,111 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from src import job_queue
+from src.job_queue import JobQueue, run_job
+
+
+class SlowRunner:
+    """Stands in for PipelineRunner: runs every stage for a fixed time and succeeds"""
+
+    seconds = 0.0
+
+    def __init__(self, roots, **kwargs):
+        self.run_id = None
+
+    def run_stage(self, stage, root):
+        time.sleep(self.seconds)
+        return SimpleNamespace(ok=True, returncode=0, log_path=None)
+
+
+class JobQueueLockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / 'jobs.sqlite'
+        self.workspace = Path(self.tmp.name) / 'workspace'
+        self.queue = JobQueue(self.db_path, start_interval=0)
+
+    def tearDown(self):
+        self.queue.db.close()
+        self.tmp.cleanup()
+
+    def status_of(self, job_id):
+        return self.queue.db.execute("SELECT status, worker FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def test_job_longer_than_lock_timeout_keeps_its_lock(self):
+        self.queue.enqueue([self.workspace], ['004a'])
+        job = self.queue.claim('worker-a')
+        SlowRunner.seconds = 1.5
+        stages = [SimpleNamespace(name='004a')]
+
+        with mock.patch.object(job_queue, 'LOCK_TIMEOUT', 0.5), \
+                mock.patch.object(job_queue, 'HEARTBEAT_INTERVAL', 0.1), \
+                mock.patch('src.pipeline.PipelineRunner', SlowRunner), \
+                mock.patch('src.pipeline.discover_stages', return_value=stages):
+            done = threading.Event()
+            stolen = []
+
+            def other_worker():
+                # A second worker keeps looking for work (and for stale locks) while the job runs
+                other = JobQueue(self.db_path, start_interval=0)
+                while not done.is_set() and not stolen:
+                    job_b = other.claim('worker-b')
+                    if job_b is not None:
+                        stolen.append(job_b['id'])
+                    time.sleep(0.1)
+                other.db.close()
+
+            thread = threading.Thread(target=other_worker)
+            thread.start()
+            try:
+                status = run_job(self.queue, job, 'worker-a')
+            finally:
+                done.set()
+                thread.join()
+
+        self.assertEqual(stolen, [])
+        self.assertEqual(status, 'done')
+        self.assertEqual(tuple(self.status_of(job['id'])), ('done', 'worker-a'))
+
+    def test_finish_after_losing_the_lock_leaves_the_new_owner_alone(self):
+        self.queue.enqueue([self.workspace], ['004a'])
+        job = self.queue.claim('worker-a')
+        # worker-a stops heartbeating; worker-b requeues the job and claims it
+        self.queue.db.execute("UPDATE workspace_locks SET heartbeat = 0")
+        other = JobQueue(self.db_path, start_interval=0)
+        reclaimed = other.claim('worker-b')
+        other.db.close()
+        self.assertEqual(reclaimed['id'], job['id'])
+
+        self.assertEqual(self.queue.finish(job, 1), 'lost')
+        self.assertFalse(self.queue.heartbeat(job))
+        self.assertEqual(tuple(self.status_of(job['id'])), ('running', 'worker-b'))
+        lock = self.queue.db.execute("SELECT worker FROM workspace_locks").fetchone()
+        self.assertEqual(lock['worker'], 'worker-b')
+
+        self.assertEqual(self.queue.finish(reclaimed, 0), 'done')
+
+    def test_rate_limited_retries_stop_refunding_the_attempt_after_the_cap(self):
+        self.queue.enqueue([self.workspace], ['004a'])
+        statuses = []
+        with mock.patch.object(job_queue, 'MAX_RATE_LIMIT_RETRIES', 2):
+            for _ in range(3):
+                # Skip the cooldown and retry delay so the job can be claimed straight away
+                self.queue.db.execute("UPDATE governor SET cooldown_until = 0")
+                self.queue.db.execute("UPDATE jobs SET not_before = 0")
+                job = self.queue.claim('worker-a')
+                statuses.append(self.queue.finish(job, 1, rate_limited=True, error="rate limited"))
+
+        self.assertEqual(statuses, ['queued', 'queued', 'failed'])
+        row = self.queue.db.execute("SELECT attempts, rate_limits FROM jobs").fetchone()
+        self.assertEqual(tuple(row), (1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,21 +3,27 @@
 Simple script to verify Spring Boot configuration is fixed and run integration tests
 """
 
+import os
 import subprocess
 import sys
-from pathlib import Path
+
+from src.dependency_graph import validate_layout
+from src.profiling import profile_phase
+from src.test_impact import TestImpactSelector, changed_files_since
+from src.workspace import PROJECT_ROOT
 
 def run_command(command, cwd, description):
     """Run a command and return the result"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(
-            command,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minutes timeout
-        )
+        with profile_phase(description):
+            result = subprocess.run(
+                command,
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=300  # 5 minutes timeout
+            )
         return result
     except subprocess.TimeoutExpired:
         print(f"❌ {description} timed out")
@@ -30,7 +36,7 @@ def main():
     print("🚀 Spring Boot Integration Test Verification")
     print("=" * 50)
     
-    backend_dir = Path("/Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend")
+    backend_dir = PROJECT_ROOT / "generated_code" / "backend"
     
     if not backend_dir.exists():
         print("❌ Backend directory not found!")
@@ -40,6 +46,13 @@ def main():
         print("❌ Gradle wrapper not found!")
         sys.exit(1)
     
+    # Reject a broken module layout before spending minutes in Gradle
+    layout_ok, dependency_graph = validate_layout(backend_dir)
+    print(dependency_graph.format_report())
+    if not layout_ok:
+        print("❌ Module dependency check failed - fix the layout before building")
+        sys.exit(1)
+    
     # Step 1: Clean build
     clean_result = run_command(
         ["./gradlew", "clean"],
@@ -70,9 +83,21 @@ def main():
     else:
         print("✅ Compilation successful")
     
-    # Step 3: Run integration tests
+    # Step 3: Run integration tests (only the affected ones when IMPACT_SINCE is set, e.g. HEAD~1)
+    test_command = ["./gradlew", ":user-service:test", "--tests", "*IntegrationTest*", "--info"]
+    impact_since = os.getenv('IMPACT_SINCE')
+    if impact_since:
+        selector = TestImpactSelector(backend_dir)
+        changed = changed_files_since(impact_since)
+        print(selector.format_report(changed))
+        commands = [c for c in selector.gradle_commands(changed) if c[0] == ":user-service:test"]
+        if not commands:
+            print(f"✅ No user-service tests affected since {impact_since}")
+            return
+        test_command = ["./gradlew"] + commands[0] + ["--info"]
+    
     test_result = run_command(
-        ["./gradlew", ":user-service:test", "--tests", "*IntegrationTest*", "--info"],
+        test_command,
         backend_dir,
         "Running user-service integration tests"
     )
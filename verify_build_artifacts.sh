@@ -3,7 +3,7 @@
 echo "📦 Checking Build Artifacts"
 echo "==========================="
 
-cd /Users/garethhallberg/Desktop/twitter-clone-crewai/generated_code/backend
+cd "${CREW_PROJECT_ROOT:-$(dirname "$0")}/generated_code/backend"
 
 if [ -f "user-service/build/libs/user-service-1.0.0.jar" ]; then
     echo "✅ User service JAR created successfully"